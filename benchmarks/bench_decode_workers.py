@@ -0,0 +1,145 @@
+"""Crawl throughput against decode worker count.
+
+A stand-in server in a child process answers ``GET /markets`` with
+pre-rendered pages from ``fixtures.py``, so serving a page costs almost
+nothing and the crawl is bound by client-side decoding. ``--streams``
+cursor crawls run concurrently on one ``AsyncKalshiClient``. Each crawl is
+timed with decoding inline (0 workers) and with a ``DecodeExecutor`` of each
+worker count. Models are returned by ``get_markets``; columns by
+``aiter_column_pages`` for a few fields.
+
+Usage: python benchmarks/bench_decode_workers.py [--workers 0,1,2,4] [--pages 20]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from fixtures import markets_payload
+
+from kalshi_client import AsyncKalshiClient, DecodeExecutor, KalshiConfig, aiter_column_pages
+
+COLUMNS = ("ticker", "yes_bid", "yes_ask", "volume", "close_time")
+
+
+def serve(page_size: int, pages: int, ready: multiprocessing.Queue) -> None:
+    payload = markets_payload(page_size)
+    bodies = {}
+    for page in range(pages):
+        payload["cursor"] = str(page + 1) if page + 1 < pages else ""
+        bodies[str(page)] = json.dumps(payload).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            cursor = parse_qs(urlsplit(self.path).query).get("cursor", ["0"])[0]
+            body = bodies[cursor]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+async def crawl(client: AsyncKalshiClient, streams: int, page_size: int, columns: bool) -> int:
+    async def stream() -> int:
+        items, cursor = 0, None
+        if columns:
+            async for page in aiter_column_pages(client, "markets", COLUMNS, limit=page_size):
+                items += len(page)
+            return items
+        while True:
+            page = await client.get_markets(limit=page_size, cursor=cursor)
+            items += len(page)
+            if not page.cursor:
+                return items
+            cursor = page.cursor
+
+    return sum(await asyncio.gather(*(stream() for _ in range(streams))))
+
+
+def measure(config: KalshiConfig, workers: int, args: argparse.Namespace, columns: bool) -> dict:
+    decoder = DecodeExecutor(workers, min_size=0) if workers else None
+
+    async def run() -> tuple[float, float, int]:
+        async with AsyncKalshiClient(config, decoder=decoder) as client:
+            # Warm-up crawl starts the worker processes and opens connections
+            await crawl(client, args.streams, args.page_size, columns)
+            cpu, start = time.process_time(), time.perf_counter()
+            items = await crawl(client, args.streams, args.page_size, columns)
+            return time.perf_counter() - start, time.process_time() - cpu, items
+
+    try:
+        elapsed, cpu, items = asyncio.run(run())
+    finally:
+        if decoder is not None:
+            decoder.close()
+    return {
+        "items_per_s": items / elapsed,
+        "pages_per_s": items / args.page_size / elapsed,
+        "parent_cpu": cpu / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default=f"0,1,2,4,{os.cpu_count()}")
+    parser.add_argument("--streams", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+    worker_counts = sorted({int(n) for n in args.workers.split(",")})
+
+    ready = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=serve, args=(args.page_size, args.pages, ready), daemon=True
+    )
+    server.start()
+    try:
+        port = ready.get(timeout=60)
+        config = KalshiConfig(
+            api_key="local",
+            api_secret="local",
+            base_url=f"http://127.0.0.1:{port}",
+            max_concurrency=args.streams,
+        )
+        results = {}
+        print(
+            f"{'output':<8} {'workers':>7} {'items/s':>10} {'pages/s':>8} {'speedup':>8} "
+            f"{'parent cpu':>10}"
+        )
+        for output in ("models", "columns"):
+            baseline = None
+            for workers in worker_counts:
+                result = measure(config, workers, args, columns=output == "columns")
+                baseline = baseline or result["items_per_s"]
+                results[f"{output}[{workers}]"] = result
+                print(
+                    f"{output:<8} {workers:>7} {result['items_per_s']:>10.0f} "
+                    f"{result['pages_per_s']:>8.1f} {result['items_per_s'] / baseline:>7.2f}x "
+                    f"{result['parent_cpu']:>9.0%}"
+                )
+    finally:
+        server.terminate()
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
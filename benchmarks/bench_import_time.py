@@ -0,0 +1,97 @@
+"""Cold import time of the package, measured with ``python -X importtime``.
+
+Each statement runs in a fresh interpreter. The reported time is the sum of
+the cumulative times of the top-level imports the statement triggers, with
+interpreter startup (``site`` etc.) excluded; the median over ``--runs`` is
+compared against its threshold and the script exits with status 1 if any is
+exceeded, so it can gate CI.
+
+Usage: python benchmarks/bench_import_time.py [--runs 7] [--max "import kalshi_client=30"]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Statement -> maximum median import time in milliseconds (None: report only).
+# httpx and pydantic alone take about 120 ms; the sync client stays clear of
+# asyncio, sqlite3 and pydantic-settings, which would add about 40 ms more
+THRESHOLDS: dict[str, float | None] = {
+    "import kalshi_client": 30.0,
+    "import kalshi_client.models": 30.0,
+    "import httpx, pydantic": None,
+    "from kalshi_client import KalshiClient": 220.0,
+    "from kalshi_client import AsyncKalshiClient": None,
+}
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Top-level module -> cumulative import time in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(statement: str, startup: set[str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        times = _import_times(statement)
+        samples.append(sum(us for name, us in times.items() if name not in startup) / 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument(
+        "--max",
+        action="append",
+        default=[],
+        metavar="STATEMENT=MS",
+        help="Override a threshold, e.g. 'from kalshi_client import KalshiClient=250'",
+    )
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    thresholds = dict(THRESHOLDS)
+    for override in args.max:
+        statement, _, limit = override.rpartition("=")
+        thresholds[statement.strip()] = float(limit)
+
+    startup = set(_import_times("pass"))
+    results = {}
+    failures = []
+    for statement, limit in thresholds.items():
+        median = measure(statement, startup, args.runs)
+        results[statement] = {"median_ms": median, "max_ms": limit}
+        flag = ""
+        if limit is not None and median > limit:
+            failures.append(statement)
+            flag = " !"
+        if not args.json:
+            limit_text = f"{limit:.1f}" if limit is not None else "-"
+            print(f"{statement:<46} {median:>8.1f} ms  (max {limit_text}){flag}")
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    if failures:
+        print(f"{len(failures)} import(s) over threshold: {', '.join(failures)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Overhead of request metrics: ClientMetrics.record alone and the full request path.
+
+Requests go to an in-process ``httpx.MockTransport``, so the difference
+between the two request-path rows is the cost metrics add per request.
+
+Usage: python benchmarks/bench_metrics_overhead.py [--requests N]
+"""
+
+import argparse
+import time
+
+from fixtures import mock_client
+
+from kalshi_client import ClientMetrics
+
+
+def per_call_us(func, n: int, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for i in range(n):
+            func(i)
+        best = min(best, (time.perf_counter() - start) / n * 1e6)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    metrics = ClientMetrics()
+    tickers = [f"MKT-{i}" for i in range(100)]
+    record_us = per_call_us(
+        lambda i: metrics.record("GET", f"/markets/{tickers[i % 100]}", 0.001 * (i % 50), 10, 500),
+        args.requests * 10,
+    )
+
+    routes = {"/portfolio/balance": {"balance": 1}}
+    plain = mock_client(routes)
+    instrumented = mock_client(routes, enable_metrics=True)
+    plain_us = per_call_us(lambda i: plain._request("GET", "/portfolio/balance"), args.requests)
+    instrumented_us = per_call_us(
+        lambda i: instrumented._request("GET", "/portfolio/balance"), args.requests
+    )
+
+    print(f"{'ClientMetrics.record':<32} {record_us:8.2f} us/call")
+    print(f"{'_request without metrics':<32} {plain_us:8.2f} us/call")
+    print(f"{'_request with metrics':<32} {instrumented_us:8.2f} us/call")
+    print(
+        f"{'overhead':<32} {instrumented_us - plain_us:8.2f} us/call "
+        f"({(instrumented_us - plain_us) / plain_us:+.1%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Client-side overhead per order: create_order vs OrderTemplate.send.
+
+Requests go to an in-process ``httpx.MockTransport`` that returns a canned
+acknowledgement, so the numbers exclude the network and measure only what
+the client does per order (payload, signing, encoding, response parsing).
+
+Usage: python benchmarks/bench_order_overhead.py [--orders N]
+"""
+
+import argparse
+import statistics
+import time
+
+from fixtures import ORDER_ACK, mock_client
+
+
+def measure(send, orders: int, repeats: int = 5) -> tuple[float, float]:
+    """Best and median (over ``repeats`` runs) mean microseconds per order."""
+    for i in range(min(orders, 200)):
+        send(i)
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for i in range(orders):
+            send(i)
+        runs.append((time.perf_counter() - start) / orders * 1e6)
+    return min(runs), statistics.median(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=2000)
+    args = parser.parse_args()
+
+    client = mock_client({"/portfolio/orders": ORDER_ACK})
+    template = client.order_template(
+        "ECON-GDP-24",
+        "buy",
+        "yes",
+        time_in_force="gtc",
+        self_trade_prevention_type="cancel_resting",
+    )
+    encode_only = client.order_template("ECON-GDP-24", "buy", "yes", time_in_force="gtc")
+
+    cases = {
+        "create_order": lambda i: client.create_order(
+            ticker="ECON-GDP-24",
+            action="buy",
+            side="yes",
+            type="limit",
+            count=10,
+            yes_price=1 + i % 99,
+            client_order_id=f"c{i}",
+            time_in_force="gtc",
+            self_trade_prevention_type="cancel_resting",
+        ),
+        "template.send": lambda i: template.send(1 + i % 99, 10, client_order_id=f"c{i}"),
+        "template.build (encode only)": lambda i: encode_only.build(1 + i % 99, 10, f"c{i}"),
+    }
+
+    print(f"{'case':<30} {'best us/order':>14} {'median us/order':>16}")
+    for name, send in cases.items():
+        best, median = measure(send, args.orders)
+        print(f"{name:<30} {best:>14.1f} {median:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Contention on a SharedTokenBucket as the number of processes grows.
+
+Two runs per process count:
+
+* overhead: every process calls ``try_acquire`` in a loop on a bucket that
+  never runs dry, so each call pays only for locking and the state update;
+  reports total acquires/s and the per-call latency (mean and p99).
+* budget: every process calls ``acquire`` on a bucket of ``--rate`` tokens/s
+  for ``--duration`` seconds from empty; reports how many tokens were
+  granted against the budget (``rate * duration``).
+
+An in-process ``TokenBucket`` gives the single-process baseline.
+
+Usage: python benchmarks/bench_shared_rate_limit.py [--processes 1,2,4,8,16,32,48]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+
+from kalshi_client.rate_limit import RateLimiter, SharedTokenBucket, TokenBucket
+
+
+def hammer(bucket: RateLimiter, duration: float, start, begin, results) -> None:
+    # Every 16th call is timed, which keeps the result small
+    calls, latencies = 0, []
+    perf_counter = time.perf_counter
+    start.wait()
+    end = perf_counter() + duration
+    while (now := perf_counter()) < end:
+        bucket.try_acquire()
+        calls += 1
+        if not calls % 16:
+            latencies.append(perf_counter() - now)
+    results.put((calls, latencies))
+
+
+def spend(bucket: RateLimiter, duration: float, start, begin, results) -> None:
+    # One window for all processes: time.monotonic is shared across the host. A
+    # process preempted after computing ``left`` can be granted a token refilled
+    # after the window, so grants count only when the wait ends inside it (plus
+    # one token interval of oversleep).
+    granted = 0
+    start.wait()
+    end = begin.value + duration
+    slack = 1 / bucket.rate
+    while (left := end - time.monotonic()) > 0:
+        if bucket.acquire(timeout=left) and time.monotonic() <= end + slack:
+            granted += 1
+    results.put(granted)
+
+
+def run(context, target, bucket: RateLimiter, processes: int, duration: float) -> list:
+    start = context.Event()
+    begin = context.Value("d", 0.0)
+    results = context.Queue()
+    workers = [
+        context.Process(target=target, args=(bucket, duration, start, begin, results))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    # Start from an empty bucket, so the budget is exactly rate * duration
+    bucket.try_acquire(max(0.0, bucket.tokens))
+    begin.value = time.monotonic()
+    start.set()
+    outcomes = [results.get(timeout=duration + 60) for _ in workers]
+    for worker in workers:
+        worker.join()
+    return outcomes
+
+
+def overhead(outcomes: list[tuple[int, list[float]]], duration: float) -> dict:
+    latencies = sorted(latency for _, sampled in outcomes for latency in sampled)
+    return {
+        "acquires_per_s": sum(calls for calls, _ in outcomes) / duration,
+        "mean_us": statistics.fmean(latencies) * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99)] * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", default="1,2,4,8,16,32,48")
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--rate", type=float, default=200.0)
+    parser.add_argument("--start-method", default=None, help="fork, spawn or forkserver")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+    context = multiprocessing.get_context(args.start_method)
+    counts = [int(n) for n in args.processes.split(",")]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.bucket")
+        baseline = overhead(
+            run(context, hammer, TokenBucket(1e12), 1, args.duration), args.duration
+        )
+        results["token_bucket[1]"] = baseline
+        print(f"{'bucket':<22} {'acquires/s':>11} {'mean us':>8} {'p99 us':>8} {'granted':>13}")
+        print(
+            f"{'TokenBucket x1':<22} {baseline['acquires_per_s']:>11.0f} "
+            f"{baseline['mean_us']:>8.2f} {baseline['p99_us']:>8.2f}"
+        )
+        for processes in counts:
+            with SharedTokenBucket(path, rate=1e12) as bucket:
+                outcomes = run(context, hammer, bucket, processes, args.duration)
+            cost = overhead(outcomes, args.duration)
+            with SharedTokenBucket(path, rate=args.rate, capacity=args.rate / 10) as bucket:
+                granted = sum(run(context, spend, bucket, processes, args.duration))
+            budget = args.rate * args.duration
+            results[f"shared[{processes}]"] = {**cost, "granted": granted, "budget": budget}
+            print(
+                f"{f'SharedTokenBucket x{processes}':<22} {cost['acquires_per_s']:>11.0f} "
+                f"{cost['mean_us']:>8.2f} {cost['p99_us']:>8.2f} "
+                f"{granted:>6}/{budget:<6.0f}"
+            )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare two benchmark result files written by run.py.
+
+Exits with status 1 if any case's median time regressed by more than the
+threshold, so it can gate CI.
+
+Usage: python benchmarks/compare.py base.json head.json [--threshold 0.10]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="Allowed median slowdown (0.10 = 10%%)"
+    )
+    args = parser.parse_args()
+
+    base = json.loads(args.base.read_text())
+    head = json.loads(args.head.read_text())
+    print(f"base {base['meta'].get('commit')}  head {head['meta'].get('commit')}")
+    print(f"{'case':<36} {'base us':>10} {'head us':>10} {'change':>8} {'peak KiB':>18}")
+
+    regressions = []
+    for name, result in head["results"].items():
+        previous = base["results"].get(name)
+        if previous is None:
+            print(f"{name:<36} {'-':>10} {result['median']:>10.1f} {'new':>8}")
+            continue
+        change = result["median"] / previous["median"] - 1
+        memory = f"{previous['peak_kib']:.0f} -> {result['peak_kib']:.0f}"
+        flag = " !" if change > args.threshold else ""
+        print(
+            f"{name:<36} {previous['median']:>10.1f} {result['median']:>10.1f} "
+            f"{change:>+8.1%} {memory:>18}{flag}"
+        )
+        if change > args.threshold:
+            regressions.append(name)
+
+    if regressions:
+        print(
+            f"\n{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
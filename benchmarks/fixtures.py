@@ -0,0 +1,158 @@
+"""Deterministic API payloads and an offline client for the benchmarks.
+
+Payloads mirror the shape of recorded production responses. Set
+``KALSHI_BENCH_FIXTURES`` to a directory containing recorded ``markets.json``,
+``trades.json`` or ``orderbook.json`` responses to benchmark against those
+instead of the generated ones.
+"""
+
+import json
+import os
+import random
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import httpx
+
+from kalshi_client import KalshiClient, KalshiConfig
+
+_BASE_TIME = datetime(2024, 6, 1, tzinfo=UTC)
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _recorded(name: str) -> dict | None:
+    directory = os.environ.get("KALSHI_BENCH_FIXTURES")
+    if not directory:
+        return None
+    path = Path(directory) / name
+    return json.loads(path.read_bytes()) if path.exists() else None
+
+
+def market(i: int, rng: random.Random) -> dict:
+    yes_bid = rng.randint(1, 97)
+    return {
+        "ticker": f"KXSERIES-24DEC{i:05d}-T{rng.randint(1, 500)}",
+        "event_ticker": f"KXSERIES-24DEC{i // 10:05d}",
+        "market_type": "binary",
+        "title": f"Will the indicator be above {rng.randint(1, 500)} on Dec {i % 28 + 1}?",
+        "subtitle": f"Above {rng.randint(1, 500)}",
+        "yes_sub_title": "Above",
+        "no_sub_title": "Not above",
+        "open_time": _iso(_BASE_TIME - timedelta(days=rng.randint(1, 90))),
+        "close_time": _iso(_BASE_TIME + timedelta(days=rng.randint(1, 180))),
+        "expected_expiration_time": _iso(_BASE_TIME + timedelta(days=181)),
+        "expiration_time": _iso(_BASE_TIME + timedelta(days=190)),
+        "status": "active",
+        "response_price_cents": 0,
+        "can_close_early": rng.random() < 0.5,
+        "category": "Economics",
+        "risk_limit_cents": 2500000,
+        "strike_type": "greater",
+        "floor_strike": rng.randint(1, 500) + 0.5,
+        "last_price": rng.randint(1, 99),
+        "volume": rng.randint(0, 1_000_000),
+        "volume_24h": rng.randint(0, 50_000),
+        "liquidity": rng.randint(0, 10_000_000),
+        "open_interest": rng.randint(0, 500_000),
+        "previous_yes_price": rng.randint(1, 99),
+        "previous_price": rng.randint(1, 99),
+        "yes_bid": yes_bid,
+        "yes_ask": yes_bid + 2,
+        "no_bid": 98 - yes_bid,
+        "no_ask": 100 - yes_bid,
+    }
+
+
+def markets_payload(n: int, seed: int = 1) -> dict:
+    recorded = _recorded("markets.json")
+    if recorded is not None:
+        markets = (recorded["markets"] * (n // max(1, len(recorded["markets"])) + 1))[:n]
+        return {"markets": markets, "cursor": recorded.get("cursor", "")}
+    rng = random.Random(seed)
+    return {"markets": [market(i, rng) for i in range(n)], "cursor": "bench-cursor"}
+
+
+def trades_payload(n: int, seed: int = 2) -> dict:
+    recorded = _recorded("trades.json")
+    if recorded is not None:
+        trades = (recorded["trades"] * (n // max(1, len(recorded["trades"])) + 1))[:n]
+        return {"trades": trades, "cursor": recorded.get("cursor", "")}
+    rng = random.Random(seed)
+    trades = []
+    for i in range(n):
+        yes_price = rng.randint(1, 99)
+        trades.append(
+            {
+                "trade_id": f"{rng.getrandbits(128):032x}",
+                "ticker": f"KXSERIES-24DEC{rng.randint(0, 999):05d}-T100",
+                "taker_side": rng.choice(("yes", "no")),
+                "yes_price": yes_price,
+                "no_price": 100 - yes_price,
+                "count": rng.randint(1, 500),
+                "created_time": _iso(_BASE_TIME + timedelta(seconds=i)),
+            }
+        )
+    return {"trades": trades, "cursor": "bench-cursor"}
+
+
+def orderbook_payload(seed: int = 3) -> dict:
+    recorded = _recorded("orderbook.json")
+    if recorded is not None:
+        return recorded
+    rng = random.Random(seed)
+    return {
+        "orderbook": {
+            side: [{"price": price, "quantity": rng.randint(1, 5000)} for price in range(1, 100)]
+            for side in ("yes", "no")
+        }
+    }
+
+
+ORDER_ACK = {
+    "order": {
+        "order_id": "order123",
+        "user_id": "user456",
+        "ticker": "ECON-GDP-24",
+        "status": "resting",
+        "action": "buy",
+        "side": "yes",
+        "type": "limit",
+        "yes_price": 60,
+        "count": 10,
+        "yes_filled_count": 0,
+        "no_filled_count": 0,
+        "created_time": "2024-01-01T00:00:00Z",
+    }
+}
+
+
+def mock_client(
+    routes: dict[str, dict] | Callable[[httpx.Request], httpx.Response], **config: object
+) -> KalshiClient:
+    """Client whose requests are answered in-process.
+
+    Args:
+        routes: Response body per URL path suffix (encoded once up front), or a handler
+        **config: Extra ``KalshiConfig`` fields
+    """
+    if callable(routes):
+        handler = routes
+    else:
+        encoded = {suffix: json.dumps(body).encode() for suffix, body in routes.items()}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            for suffix, body in encoded.items():
+                if request.url.path.endswith(suffix):
+                    status = 201 if request.method == "POST" else 200
+                    return httpx.Response(
+                        status, content=body, headers={"Content-Type": "application/json"}
+                    )
+            return httpx.Response(404)
+
+    client = KalshiClient(config=KalshiConfig(api_key="bench", api_secret="bench", **config))
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
@@ -0,0 +1,209 @@
+"""Offline benchmark suite for the client hot paths.
+
+Every request is answered in-process by ``httpx.MockTransport`` from the
+payloads in ``fixtures.py``, so results reflect client-side cost only and are
+comparable across commits on the same machine. Each case reports per-op
+timings and, from a separate ``tracemalloc`` pass, peak and retained memory.
+
+Usage:
+    python benchmarks/run.py --output results.json [--filter get_markets] [--quick]
+    python benchmarks/compare.py base.json results.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from fixtures import ORDER_ACK, markets_payload, mock_client, orderbook_payload, trades_payload
+
+from kalshi_client.models import ObjectList
+
+Case = Callable[[], Callable[[], object]]
+MAX_ITERATIONS = 1_000_000
+CASES: dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    """Register a benchmark; the decorated function does the setup and returns the op to time."""
+
+    def register(setup: Case) -> Case:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+for _n in (100, 1000, 10000):
+
+    @case(f"get_markets[{_n}]")
+    def _get_markets(n: int = _n):
+        client = mock_client({"/markets": markets_payload(n)})
+        return lambda: client.get_markets(limit=n)
+
+
+for _n in (100, 1000):
+
+    @case(f"get_trades[page={_n}]")
+    def _get_trades(n: int = _n):
+        client = mock_client({"/markets/trades": trades_payload(n)})
+        return lambda: client.get_trades(limit=n)
+
+
+@case("get_market_order_book[full_depth]")
+def _get_order_book():
+    client = mock_client({"/orderbook": orderbook_payload()})
+    return lambda: client.get_market_order_book("KXSERIES-24DEC00001-T100")
+
+
+@case("create_order")
+def _create_order():
+    client = mock_client({"/portfolio/orders": ORDER_ACK})
+    return lambda: client.create_order(
+        ticker="ECON-GDP-24",
+        action="buy",
+        side="yes",
+        type="limit",
+        count=10,
+        yes_price=60,
+        time_in_force="gtc",
+    )
+
+
+@case("order_template.send")
+def _template_send():
+    client = mock_client({"/portfolio/orders": ORDER_ACK})
+    template = client.order_template("ECON-GDP-24", "buy", "yes", time_in_force="gtc")
+    return lambda: template.send(60, 10)
+
+
+@case("sign_headers")
+def _sign_headers():
+    client = mock_client({})
+    body = {
+        "ticker": "ECON-GDP-24",
+        "action": "buy",
+        "side": "yes",
+        "type": "limit",
+        "count": 10,
+        "yes_price": 60,
+    }
+    return lambda: client._get_headers("POST", "/portfolio/orders", body)
+
+
+@case("objectlist_iteration[10000]")
+def _objectlist_iteration():
+    client = mock_client({"/markets": markets_payload(10000)})
+    markets = client.get_markets(limit=10000)
+    items = ObjectList(items=markets.items, cursor=markets.cursor)
+    return lambda: sum(market.volume for market in items)
+
+
+def calibrate(op: Callable[[], object], target: float) -> int:
+    iterations = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= target or iterations >= MAX_ITERATIONS:
+            return iterations
+        iterations = max(iterations * 2, int(iterations * target / max(elapsed, 1e-9)))
+
+
+def measure(op: Callable[[], object], repeats: int, target: float) -> dict:
+    op()  # warm-up: imports, schema builds, connection setup
+    iterations = calibrate(op, target)
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                op()
+            samples.append((time.perf_counter() - start) / iterations * 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = op()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        "unit": "us",
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "iterations": iterations,
+        "repeats": repeats,
+        "ops_per_sec": 1e6 / min(samples),
+        "peak_kib": (peak - before) / 1024,
+        "retained_kib": (after - before) / 1024,
+    }
+
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--filter", default="", help="Only run cases containing this text")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--target", type=float, default=0.2, help="Seconds per repeat")
+    parser.add_argument("--quick", action="store_true", help="3 repeats of ~50ms")
+    args = parser.parse_args()
+    if args.quick:
+        args.repeats, args.target = 3, 0.05
+
+    results = {}
+    print(f"{'case':<36} {'min us':>12} {'median us':>12} {'peak KiB':>10}", file=sys.stderr)
+    for name, setup in CASES.items():
+        if args.filter not in name:
+            continue
+        result = measure(setup(), args.repeats, args.target)
+        results[name] = result
+        print(
+            f"{name:<36} {result['min']:>12.1f} {result['median']:>12.1f} "
+            f"{result['peak_kib']:>10.1f}",
+            file=sys.stderr,
+        )
+
+    report = {"meta": metadata(), "results": results}
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,134 @@
-from .configs.kalshi_configs import KalshiConfig
-from .exceptions import KalshiAPIError, KalshiAuthError
-from .kalshi_client import KalshiClient
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
-__all__ = ["KalshiClient", "KalshiConfig", "KalshiAPIError", "KalshiAuthError"]
+
+# Public name -> submodule defining it. Submodules (and httpx, pydantic and
+# pydantic-settings with them) are imported on first access, so importing the
+# package itself is cheap.
+_EXPORTS = {
+    "KalshiClient": ".kalshi_client",
+    "AsyncKalshiClient": ".async_client",
+    "KalshiConfig": ".configs.kalshi_configs",
+    "KalshiAPIError": ".exceptions",
+    "KalshiAuthError": ".exceptions",
+    "KalshiCircuitOpenError": ".exceptions",
+    "KalshiDeadlineExceededError": ".exceptions",
+    "ClientMetrics": ".metrics",
+    "Bar": ".bars",
+    "TimeBars": ".bars",
+    "VolumeBars": ".bars",
+    "TickBars": ".bars",
+    "TradeColumns": ".bars",
+    "CircuitBreakers": ".circuit_breaker",
+    "DecodeExecutor": ".decode",
+    "iter_column_pages": ".decode",
+    "aiter_column_pages": ".decode",
+    "AsyncEngine": ".engine",
+    "HedgePolicy": ".hedging",
+    "MarketPoller": ".poller",
+    "OrderTemplate": ".order_template",
+    "PortfolioState": ".portfolio",
+    "TokenBucket": ".rate_limit",
+    "SharedTokenBucket": ".rate_limit",
+    "RateLimiter": ".rate_limit",
+    "TradeTape": ".tape",
+    "TradeTapeWriter": ".tape",
+    "Priority": ".scheduler",
+    "PriorityDispatcher": ".scheduler",
+    "AsyncPriorityDispatcher": ".async_client",
+    "request_priority": ".scheduler",
+    "RecordingTransport": ".transport",
+    "AsyncRecordingTransport": ".transport",
+    "ReplayTransport": ".transport",
+    "iter_pages": ".pagination",
+    "paginate": ".pagination",
+    "aiter_pages": ".pagination",
+    "apaginate": ".pagination",
+    "FileCheckpoint": ".checkpoint",
+    "SQLiteCheckpoint": ".checkpoint",
+    "dedup_key": ".checkpoint",
+}
+
+__all__ = [
+    "KalshiClient",
+    "AsyncKalshiClient",
+    "KalshiConfig",
+    "KalshiAPIError",
+    "KalshiAuthError",
+    "KalshiCircuitOpenError",
+    "KalshiDeadlineExceededError",
+    "ClientMetrics",
+    "Bar",
+    "TimeBars",
+    "VolumeBars",
+    "TickBars",
+    "TradeColumns",
+    "CircuitBreakers",
+    "DecodeExecutor",
+    "iter_column_pages",
+    "aiter_column_pages",
+    "AsyncEngine",
+    "HedgePolicy",
+    "MarketPoller",
+    "OrderTemplate",
+    "PortfolioState",
+    "TokenBucket",
+    "SharedTokenBucket",
+    "RateLimiter",
+    "TradeTape",
+    "TradeTapeWriter",
+    "Priority",
+    "PriorityDispatcher",
+    "AsyncPriorityDispatcher",
+    "request_priority",
+    "RecordingTransport",
+    "AsyncRecordingTransport",
+    "ReplayTransport",
+    "iter_pages",
+    "paginate",
+    "aiter_pages",
+    "apaginate",
+    "FileCheckpoint",
+    "SQLiteCheckpoint",
+    "dedup_key",
+]
+
+if TYPE_CHECKING:
+    from .async_client import AsyncKalshiClient, AsyncPriorityDispatcher
+    from .bars import Bar, TickBars, TimeBars, TradeColumns, VolumeBars
+    from .checkpoint import FileCheckpoint, SQLiteCheckpoint, dedup_key
+    from .circuit_breaker import CircuitBreakers
+    from .configs.kalshi_configs import KalshiConfig
+    from .decode import DecodeExecutor, aiter_column_pages, iter_column_pages
+    from .engine import AsyncEngine
+    from .exceptions import (
+        KalshiAPIError,
+        KalshiAuthError,
+        KalshiCircuitOpenError,
+        KalshiDeadlineExceededError,
+    )
+    from .hedging import HedgePolicy
+    from .kalshi_client import KalshiClient
+    from .metrics import ClientMetrics
+    from .order_template import OrderTemplate
+    from .pagination import aiter_pages, apaginate, iter_pages, paginate
+    from .poller import MarketPoller
+    from .portfolio import PortfolioState
+    from .rate_limit import RateLimiter, SharedTokenBucket, TokenBucket
+    from .scheduler import Priority, PriorityDispatcher, request_priority
+    from .tape import TradeTape, TradeTapeWriter
+    from .transport import AsyncRecordingTransport, RecordingTransport, ReplayTransport
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
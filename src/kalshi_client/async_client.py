@@ -0,0 +1,872 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .circuit_breaker import CircuitBreakers
+from .configs.kalshi_configs import KalshiConfig
+from .deadlines import TimeoutTypes, time_left
+from .exceptions import KalshiAPIError, KalshiDeadlineExceededError, KalshiServerError
+from .follow import TRANSIENT_ERRORS, TradeFollower, in_order
+from .hedging import HedgePolicy
+from .kalshi_client import BaseKalshiClient
+from .ledger import InFlightOrder, new_client_order_id
+from .metrics import ClientMetrics
+from .models import (
+    Event,
+    Market,
+    ObjectList,
+    Order,
+    OrderBook,
+    OrderCancelledResponse,
+    OrderCreatedResponse,
+    Position,
+    Trade,
+)
+from .pagination import apaginate
+from .rate_limit import RateLimiter
+from .scheduler import DispatchState, Priority, classify
+from .tracing import (
+    RequestTrace,
+    adopt_attempts,
+    attempt_scope,
+    trace_phase,
+    traced,
+    use_scope,
+)
+
+if TYPE_CHECKING:
+    from .decode import DecodeExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def _params(**params: Any) -> dict[str, Any]:
+    return {name: value for name, value in params.items() if value is not None}
+
+
+class AsyncPriorityDispatcher(DispatchState):
+    """asyncio counterpart of ``PriorityDispatcher``, for ``AsyncKalshiClient``."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rate_limiter: RateLimiter | None = None,
+        *,
+        class_limits: Mapping[Priority, int] | None = None,
+        queue_limits: Mapping[Priority, int] | None = None,
+        metrics: ClientMetrics | None = None,
+    ):
+        super().__init__(
+            max_concurrency,
+            rate_limiter,
+            class_limits=class_limits,
+            queue_limits=queue_limits,
+            metrics=metrics,
+        )
+        self._cond = asyncio.Condition()
+
+    async def acquire(self, priority: Priority, timeout: float | None = None) -> None:
+        end = None if timeout is None else time.monotonic() + timeout
+        async with self._cond:
+            ticket = self._enqueue(priority)
+            try:
+                while True:
+                    admitted, wait = self._try_admit(priority, ticket)
+                    if admitted:
+                        break
+                    with contextlib.suppress(TimeoutError):
+                        async with asyncio.timeout(self._bounded_wait(wait, end)):
+                            await self._cond.wait()
+            except BaseException:
+                self._discard(priority, ticket)
+                self._cond.notify_all()
+                raise
+            self._cond.notify_all()
+
+    async def release(self, priority: Priority) -> None:
+        async with self._cond:
+            self._release(priority)
+            self._cond.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            await self.release(priority)
+
+
+class AsyncKalshiClient(BaseKalshiClient):
+    """asyncio counterpart of ``KalshiClient`` with the same endpoint methods.
+
+    Rate limiting, ``config.max_concurrency``, metrics, tracing and the order
+    ledger behave as in the sync client; batch methods run concurrently on the
+    event loop instead of a thread pool.
+
+    Example:
+        async with AsyncKalshiClient() as client:
+            markets = await client.get_markets(limit=100)
+    """
+
+    def __init__(  # noqa: PLR0913 - the options after config are keyword-only
+        self,
+        config: KalshiConfig | None = None,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        metrics: ClientMetrics | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        dispatcher: AsyncPriorityDispatcher | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        decoder: "DecodeExecutor | None" = None,
+    ):
+        super().__init__(
+            config,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+            hedge_policy=hedge_policy,
+            circuit_breakers=circuit_breakers,
+            decoder=decoder,
+        )
+        self.client = httpx.AsyncClient(timeout=self.config.timeout, transport=transport)
+        self._concurrency = asyncio.Semaphore(self.config.max_concurrency)
+        if dispatcher is None and self.config.priority_scheduling:
+            dispatcher = AsyncPriorityDispatcher(
+                self.config.max_concurrency, self.rate_limiter, metrics=self.metrics
+            )
+        self.dispatcher = dispatcher
+        # Dedicated pool for the order path; None routes it through ``self.client``
+        self.trading_client: httpx.AsyncClient | None = None
+        self._trading_concurrency = self._concurrency
+        if self.config.trading_connections:
+            self.trading_client = httpx.AsyncClient(
+                timeout=self.config.timeout, transport=transport, limits=self._trading_limits()
+            )
+            self._trading_concurrency = asyncio.Semaphore(self.config.trading_connections)
+        self._keepalive_task: asyncio.Task | None = None
+
+    async def _request(  # noqa: PLR0913 - the options after params are keyword-only
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        *,
+        json: dict | None = None,
+        content: bytes | None = None,
+        signed_body: str | None = None,
+        hedge: bool = True,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> httpx.Response:
+        if (
+            hedge
+            and self.hedge_policy is not None
+            and method == "GET"
+            and self.hedge_policy.applies(endpoint)
+        ):
+            return await self._hedged_get(endpoint, params, timeout, deadline)
+        call = self._begin(method, endpoint, deadline)
+        client, concurrency = self._route(endpoint)
+        priority = None
+        if self.dispatcher is not None:
+            priority = classify(method, endpoint)
+        elif self.rate_limiter is not None:
+            with trace_phase("rate_limit"):
+                if (
+                    deadline is not None
+                    and self.rate_limiter.time_until_available() > deadline - time.monotonic()
+                ):
+                    error = KalshiDeadlineExceededError(
+                        "Deadline exceeded while waiting for the rate limiter"
+                    )
+                    self._abandon(call, error)
+                    raise error
+                wait = self.rate_limiter.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+        call.start = call.sent = time.perf_counter()
+        response = None
+        try:
+            with trace_phase("queue"):
+                await self._acquire_slots(concurrency, priority, deadline)
+            try:
+                request_kwargs = self._prepare(
+                    call, client, params, json, content, signed_body, timeout, deadline
+                )
+                response = await client.request(
+                    method=method, url=f"{self.base_url}{endpoint}", **request_kwargs
+                )
+            finally:
+                await self._release_slots(concurrency, priority)
+            self._raise_for_status(response)
+        except Exception as e:
+            self._finish(call, response, e)
+            raise
+        except BaseException as e:
+            self._abandon(call, e)
+            raise
+
+        self._finish(call, response)
+        return response
+
+    async def _acquire_slots(
+        self,
+        concurrency: asyncio.Semaphore | None,
+        priority: Priority | None,
+        deadline: float | None,
+    ) -> None:
+        """Async version of ``KalshiClient._acquire_slots``."""
+        if concurrency is not None:
+            try:
+                async with asyncio.timeout(time_left(deadline, "a request slot")):
+                    await concurrency.acquire()
+            except TimeoutError:
+                raise KalshiDeadlineExceededError(
+                    "Deadline exceeded while waiting for a request slot"
+                ) from None
+        if self.dispatcher is not None:
+            try:
+                await self.dispatcher.acquire(priority, time_left(deadline, "a request slot"))
+            except BaseException:
+                if concurrency is not None:
+                    concurrency.release()
+                raise
+
+    async def _release_slots(
+        self, concurrency: asyncio.Semaphore | None, priority: Priority | None
+    ) -> None:
+        if self.dispatcher is not None:
+            await self.dispatcher.release(priority)
+        if concurrency is not None:
+            concurrency.release()
+
+    async def _hedged_get(
+        self,
+        endpoint: str,
+        params: dict | None,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> httpx.Response:
+        """Send a GET, racing a duplicate against it once the hedge delay passes.
+
+        The first successful response wins and the other attempt is cancelled.
+        """
+        policy = self.hedge_policy
+        delay = policy.begin(endpoint)
+        args = (endpoint, params, timeout, deadline)
+        if delay is None:
+            return await self._timed_get(*args)
+        # Each attempt is traced in its own scope, adopted by the caller's afterwards
+        scopes: dict[asyncio.Future, list[RequestTrace] | None] = {}
+
+        def attempt() -> asyncio.Future:
+            scope = attempt_scope()
+            task = asyncio.ensure_future(self._timed_get(*args, scope))
+            scopes[task] = scope
+            return task
+
+        used = None
+        try:
+            primary = attempt()
+            done, _ = await asyncio.wait([primary], timeout=delay)
+            if done or not policy.try_hedge(self.rate_limiter):
+                used = primary
+                return await primary
+            hedge = attempt()
+            pending = {primary, hedge}
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            policy.record_win()
+                        used = task
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in scopes:
+                task.cancel()
+            adopt_attempts(scopes.values(), scopes.get(used))
+
+    async def _timed_get(
+        self,
+        endpoint: str,
+        params: dict | None,
+        timeout: TimeoutTypes,
+        deadline: float | None,
+        scope: list[RequestTrace] | None = None,
+    ) -> httpx.Response:
+        start = time.perf_counter()
+        with use_scope(scope):
+            response = await self._request(
+                "GET", endpoint, params=params, hedge=False, timeout=timeout, deadline=deadline
+            )
+        self.hedge_policy.record(endpoint, time.perf_counter() - start)
+        return response
+
+    async def warm_up(self, n_connections: int = 1, *, market_data: bool = False) -> None:
+        """Open connections ahead of the first order; see ``KalshiClient.warm_up``."""
+        requests = self._warm_up_requests(n_connections, market_data)
+        await asyncio.gather(
+            *(self._request("GET", endpoint, params) for endpoint, params in requests)
+        )
+
+    def start_keepalive(self, interval: float, n_connections: int = 1) -> None:
+        """Run the order-path heartbeat as a task on the running event loop.
+
+        See ``KalshiClient.start_keepalive``; ``__aenter__`` starts it when
+        ``config.keepalive_interval`` is set.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if n_connections < 1:
+            raise ValueError("n_connections must be at least 1")
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+        self._keepalive_task = asyncio.get_running_loop().create_task(
+            self._keepalive(interval, n_connections), name="kalshi-keepalive"
+        )
+
+    async def stop_keepalive(self) -> None:
+        task, self._keepalive_task = self._keepalive_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _keepalive(self, interval: float, n_connections: int) -> None:
+        while True:
+            idle = time.monotonic() - self._trading_last_used
+            if idle < interval:
+                await asyncio.sleep(interval - idle)
+                continue
+            try:
+                await self.warm_up(n_connections)
+            except (KalshiAPIError, httpx.HTTPError) as e:
+                # See KalshiClient._keepalive; also yields to the rest of the loop
+                logger.warning("Keep-alive request failed: %s", e)
+                await asyncio.sleep(interval)
+
+    @staticmethod
+    def _object_list[T](
+        response: httpx.Response, key: str, model: Callable[..., T], limit: int | None
+    ) -> ObjectList[T]:
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            items = [model(**item) for item in data.get(key, [])]
+        return ObjectList(
+            items=items, cursor=data.get("cursor"), has_more=len(items) == limit if limit else False
+        )
+
+    async def _decoded_list[T](
+        self, response: httpx.Response, key: str, model: Callable[..., T], limit: int | None
+    ) -> ObjectList[T]:
+        # Bulk pages are decoded off the event loop when the client has a decoder
+        if self.decoder is None:
+            return self._object_list(response, key, model, limit)
+        with trace_phase("decode"):
+            return await self.decoder.adecode(key, response.content, limit)
+
+    # Market Data Endpoints
+    @traced
+    async def get_events(  # noqa: PLR0913 - one parameter per query field
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        status: str | None = None,
+        series_ticker: str | None = None,
+        with_nested_markets: bool | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> ObjectList[Event]:
+        params = _params(
+            limit=limit,
+            cursor=cursor,
+            status=status,
+            series_ticker=series_ticker,
+            with_nested_markets=with_nested_markets,
+        )
+        response = await self._request(
+            "GET", "/events", params=params, timeout=timeout, deadline=deadline
+        )
+        return await self._decoded_list(response, "events", Event, limit)
+
+    @traced
+    async def get_event(
+        self,
+        event_ticker: str,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> Event:
+        response = await self._request(
+            "GET", f"/events/{event_ticker}", timeout=timeout, deadline=deadline
+        )
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            event = Event(**data["event"])
+        return event
+
+    @traced
+    async def get_markets(  # noqa: PLR0913, PLR0917 - one parameter per query field
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        event_ticker: str | None = None,
+        series_ticker: str | None = None,
+        max_close_ts: int | None = None,
+        min_close_ts: int | None = None,
+        status: str | None = None,
+        tickers: list[str] | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> ObjectList[Market]:
+        params = _params(
+            limit=limit,
+            cursor=cursor,
+            event_ticker=event_ticker,
+            series_ticker=series_ticker,
+            max_close_ts=max_close_ts,
+            min_close_ts=min_close_ts,
+            status=status,
+            tickers=",".join(tickers) if tickers is not None else None,
+        )
+        response = await self._request(
+            "GET", "/markets", params=params, timeout=timeout, deadline=deadline
+        )
+        return await self._decoded_list(response, "markets", Market, limit)
+
+    @traced
+    async def get_market(
+        self,
+        ticker: str,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> Market:
+        response = await self._request(
+            "GET", f"/markets/{ticker}", timeout=timeout, deadline=deadline
+        )
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            market = Market(**data["market"])
+        return market
+
+    @traced
+    async def get_market_order_book(
+        self,
+        ticker: str,
+        depth: int | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> OrderBook:
+        response = await self._request(
+            "GET",
+            f"/markets/{ticker}/orderbook",
+            params=_params(depth=depth),
+            timeout=timeout,
+            deadline=deadline,
+        )
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            orderbook = OrderBook(**data["orderbook"])
+        return orderbook
+
+    # Trading Data Endpoints
+    @traced
+    async def get_trades(  # noqa: PLR0913 - one parameter per query field
+        self,
+        ticker: str | None = None,
+        min_ts: int | None = None,
+        max_ts: int | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> ObjectList[Trade]:
+        params = _params(ticker=ticker, min_ts=min_ts, max_ts=max_ts, limit=limit, cursor=cursor)
+        response = await self._request(
+            "GET", "/markets/trades", params=params, timeout=timeout, deadline=deadline
+        )
+        return await self._decoded_list(response, "trades", Trade, limit)
+
+    async def follow_trades(  # noqa: PLR0913 - the options after poll_interval are keyword-only
+        self,
+        tickers: Iterable[str] | None = None,
+        poll_interval: float = 1.0,
+        *,
+        min_interval: float = 0.1,
+        max_interval: float = 10.0,
+        since: datetime | None = None,
+        page_size: int = 1000,
+        dedupe_window: int = 10_000,
+    ) -> AsyncIterator[Trade]:
+        """Yield public trades as they happen; see ``KalshiClient.follow_trades``.
+
+        Tickers are polled concurrently.
+        """
+        follower = TradeFollower(
+            tickers,
+            poll_interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            since=since,
+            dedupe_window=dedupe_window,
+        )
+        while True:
+            started = time.monotonic()
+            try:
+                keys = list(follower.high_water)
+                fresh_lists = await self._catch_up_all(follower, keys, page_size)
+                batches = dict(zip(keys, fresh_lists, strict=True))
+            except TRANSIENT_ERRORS as e:
+                logger.warning("Trade poll failed: %s", e)
+                await asyncio.sleep(follower.backoff())
+                continue
+            for key, fresh in batches.items():
+                follower.commit(key, fresh)
+            trades = in_order(batches.values())
+            interval = follower.observe(len(trades))
+            for trade in trades:
+                yield trade
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    async def _catch_up_all(
+        self, follower: TradeFollower, keys: list[str | None], page_size: int
+    ) -> list[list[Trade]]:
+        tasks = [asyncio.create_task(self._catch_up(follower, key, page_size)) for key in keys]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            # A failed poll stops its siblings instead of leaving them to send requests
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _catch_up(
+        self, follower: TradeFollower, key: str | None, page_size: int
+    ) -> list[Trade]:
+        fresh: list[Trade] = []
+        cursor = None
+        while True:
+            page = await self.get_trades(limit=page_size, cursor=cursor, **follower.params(key))
+            new, caught_up = follower.sift(key, page)
+            fresh += new
+            if caught_up:
+                return fresh
+            cursor = page.cursor
+
+    # Account Endpoints
+    @traced
+    async def get_balance(
+        self,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> int:
+        response = await self._request(
+            "GET", "/portfolio/balance", timeout=timeout, deadline=deadline
+        )
+        with trace_phase("decode"):
+            data = response.json()
+        return data["balance"]
+
+    @traced
+    async def get_orders(  # noqa: PLR0913, PLR0917 - one parameter per query field
+        self,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+        min_ts: int | None = None,
+        max_ts: int | None = None,
+        status: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> ObjectList[Order]:
+        params = _params(
+            ticker=ticker,
+            event_ticker=event_ticker,
+            min_ts=min_ts,
+            max_ts=max_ts,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+        )
+        response = await self._request(
+            "GET", "/portfolio/orders", params=params, timeout=timeout, deadline=deadline
+        )
+        return self._object_list(response, "orders", Order, limit)
+
+    @traced
+    async def create_order(  # noqa: PLR0913, PLR0917 - one parameter per order field
+        self,
+        ticker: str,
+        action: str,
+        side: str,
+        type: str,
+        count: int,
+        yes_price: int | None = None,
+        no_price: int | None = None,
+        buy_max_cost: int | None = None,
+        client_order_id: str | None = None,
+        expiration_ts: int | None = None,
+        order_group_id: str | None = None,
+        post_only: bool | None = None,
+        self_trade_prevention_type: str | None = None,
+        sell_position_capped: bool | None = None,
+        sell_position_floor: int | None = None,
+        time_in_force: str | None = None,
+        retries: int = 0,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> OrderCreatedResponse:
+        """Create a new order. See ``KalshiClient.create_order`` for the arguments."""
+        if client_order_id is None and self.config.generate_client_order_ids:
+            client_order_id = new_client_order_id()
+
+        data = {
+            "ticker": ticker,
+            "action": action,
+            "side": side,
+            "type": type,
+            "count": count,
+            **_params(
+                yes_price=yes_price,
+                no_price=no_price,
+                buy_max_cost=buy_max_cost,
+                client_order_id=client_order_id,
+                expiration_ts=expiration_ts,
+                order_group_id=order_group_id,
+                post_only=post_only,
+                self_trade_prevention_type=self_trade_prevention_type,
+                sell_position_capped=sell_position_capped,
+                sell_position_floor=sell_position_floor,
+                time_in_force=time_in_force,
+            ),
+        }
+        return await self._submit_order(
+            ticker,
+            client_order_id,
+            retries,
+            send=lambda: self._request(
+                "POST", "/portfolio/orders", json=data, timeout=timeout, deadline=deadline
+            ),
+            deadline=deadline,
+        )
+
+    async def _submit_order(
+        self,
+        ticker: str,
+        client_order_id: str | None,
+        retries: int,
+        *,
+        send: Callable[[], Awaitable[httpx.Response]],
+        deadline: float | None = None,
+    ) -> OrderCreatedResponse:
+        """Async version of ``KalshiClient._submit_order``."""
+        if client_order_id is None:
+            response = await send()
+            return self._order_created(response.status_code, self._parse_order_id(response), None)
+
+        entry = self.order_ledger.begin(client_order_id, ticker)
+        while True:
+            try:
+                response = await send()
+            except (httpx.TransportError, KalshiServerError) as e:
+                if not self._may_resubmit(entry, retries, deadline, e):
+                    raise
+                order = await self._lookup_order(entry, e, deadline)
+                if order is not None:
+                    self.order_ledger.resolve(client_order_id)
+                    return self._order_created(None, order.order_id, client_order_id)
+                self.order_ledger.begin(client_order_id, ticker)
+            except KalshiAPIError as e:
+                if self._is_resent_duplicate(entry, e):
+                    order = await self._lookup_order(entry, e, deadline)
+                    if order is not None:
+                        self.order_ledger.resolve(client_order_id)
+                        return self._order_created(None, order.order_id, client_order_id)
+                    self.order_ledger.mark_unknown(client_order_id, e)
+                    raise
+                self.order_ledger.resolve(client_order_id)
+                raise
+            else:
+                self.order_ledger.resolve(client_order_id)
+                return self._order_created(
+                    response.status_code, self._parse_order_id(response), client_order_id
+                )
+
+    async def _lookup_order(
+        self, entry: InFlightOrder, error: Exception, deadline: float | None
+    ) -> Order | None:
+        """Async version of ``KalshiClient._lookup_order``."""
+        lookup_error = None
+        for delay in self._order_lookup_delays(deadline):
+            await asyncio.sleep(delay)
+            try:
+                order = await self._find_order(
+                    entry.ticker, entry.client_order_id, entry.submitted_at, deadline
+                )
+            except (httpx.TransportError, KalshiServerError) as e:
+                lookup_error = e
+                continue
+            except (KalshiAPIError, httpx.HTTPError) as e:
+                lookup_error = e
+                break
+            if order is not None:
+                return order
+            lookup_error = None
+        if lookup_error is not None:
+            self.order_ledger.mark_unknown(entry.client_order_id, error)
+            raise error from lookup_error
+        return None
+
+    async def _find_order(
+        self, ticker: str, client_order_id: str, since: float, deadline: float | None = None
+    ) -> Order | None:
+        params = self._order_lookup_params(ticker, since)
+        async for order in apaginate(self.get_orders, deadline=deadline, **params):
+            if order.client_order_id == client_order_id:
+                return order
+        return None
+
+    @traced
+    async def cancel_order(
+        self,
+        order_id: str,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> OrderCancelledResponse:
+        response = await self._request(
+            "DELETE", f"/portfolio/orders/{order_id}", timeout=timeout, deadline=deadline
+        )
+        return OrderCancelledResponse(
+            success=True,
+            message=f"Order {order_id} cancelled successfully",
+            status_code=response.status_code,
+            order_id=order_id,
+        )
+
+    async def create_orders(
+        self, orders: Iterable[Mapping[str, Any]], *, deadline: float | None = None
+    ) -> list[OrderCreatedResponse | KalshiAPIError | httpx.HTTPError]:
+        """Create several orders concurrently, reporting a result or exception per order.
+
+        ``deadline`` applies to every order that does not set its own.
+        """
+        return await self._fan_out(
+            lambda order: self.create_order(**{"deadline": deadline, **order}), orders
+        )
+
+    async def cancel_orders(
+        self,
+        order_ids: Iterable[str],
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> list[OrderCancelledResponse | KalshiAPIError | httpx.HTTPError]:
+        """Cancel several orders concurrently, reporting a result per order id."""
+        return await self._fan_out(
+            lambda order_id: self.cancel_order(order_id, timeout=timeout, deadline=deadline),
+            order_ids,
+        )
+
+    async def cancel_all_orders(
+        self,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> list[OrderCancelledResponse | KalshiAPIError | httpx.HTTPError]:
+        """Cancel every resting order, optionally restricted to a market or event.
+
+        ``deadline`` bounds the listing and the cancels together.
+        """
+        order_ids = [
+            order.order_id
+            async for order in apaginate(
+                self.get_orders,
+                ticker=ticker,
+                event_ticker=event_ticker,
+                status="resting",
+                limit=1000,
+                timeout=timeout,
+                deadline=deadline,
+            )
+        ]
+        return await self.cancel_orders(order_ids, timeout=timeout, deadline=deadline)
+
+    @staticmethod
+    async def _fan_out[I, R](
+        func: Callable[[I], Awaitable[R]], items: Iterable[I]
+    ) -> list[R | KalshiAPIError | httpx.HTTPError]:
+        async def call(item: I) -> R | KalshiAPIError | httpx.HTTPError:
+            try:
+                return await func(item)
+            except (KalshiAPIError, httpx.HTTPError) as e:
+                return e
+
+        return list(await asyncio.gather(*(call(item) for item in items)))
+
+    @traced
+    async def get_positions(  # noqa: PLR0913 - one parameter per query field
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        settlement_status: str | None = None,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> ObjectList[Position]:
+        params = _params(
+            limit=limit,
+            cursor=cursor,
+            settlement_status=settlement_status,
+            ticker=ticker,
+            event_ticker=event_ticker,
+        )
+        response = await self._request(
+            "GET", "/portfolio/positions", params=params, timeout=timeout, deadline=deadline
+        )
+        return self._object_list(response, "event_positions", Position, limit)
+
+    async def __aenter__(self):
+        if self.config.keepalive_interval and self._keepalive_task is None:
+            self.start_keepalive(self.config.keepalive_interval)
+        return self
+
+    async def aclose(self) -> None:
+        await self.stop_keepalive()
+        if self.trading_client is not None:
+            await self.trading_client.aclose()
+        await self.client.aclose()
+        if self._owns_decoder:
+            await asyncio.to_thread(self.decoder.close)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -0,0 +1,421 @@
+"""Incremental trade bars: time (OHLCV candles), volume and tick bars.
+
+Aggregators keep one open bar per ticker and return bars as they close, so
+candles can be built live from ``follow_trades`` without holding the tape.
+Prices are yes prices in cents.
+
+Example:
+    candles = TimeBars(timedelta(minutes=1))
+    for bar in candles.stream(client.follow_trades(["KXBTC-25DEC31"])):
+        print(bar.start, bar.open, bar.high, bar.low, bar.close, bar.volume)
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate, pairwise
+from operator import mul
+from typing import Any
+
+from .models import Trade
+
+
+@dataclass(slots=True)
+class Bar:
+    """Summary of a ticker's trades over one bar.
+
+    ``start`` and ``end`` are the bar's period for time bars and its first and
+    last trade times for volume and tick bars.
+    """
+
+    ticker: str
+    start: datetime
+    end: datetime
+    open: int
+    high: int
+    low: int
+    close: int
+    volume: int
+    trades: int
+    notional: int
+
+    @property
+    def vwap(self) -> float:
+        """Volume-weighted average yes price, in cents."""
+        return self.notional / self.volume if self.volume else float(self.close)
+
+
+@dataclass(slots=True)
+class TradeColumns:
+    """One ticker's trades as parallel columns (sequences or NumPy arrays), oldest first.
+
+    The batch input of aggregators.
+    """
+
+    times: Sequence[float]
+    yes_prices: Sequence[int]
+    counts: Sequence[int]
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Trade]) -> "TradeColumns":
+        """Columns of ``trades`` sorted by time, e.g. from ``paginate(client.get_trades, ...)``."""
+        ordered = sorted(trades, key=lambda trade: trade.created_time)
+        return cls(
+            [trade.created_time.timestamp() for trade in ordered],
+            [trade.yes_price for trade in ordered],
+            [trade.count for trade in ordered],
+        )
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+
+# High, low, volume and notional of the rows of one bar in a batch
+_Summary = tuple[int, int, int, int]
+
+
+def _optional_numpy() -> Any | None:
+    try:
+        import numpy  # noqa: PLC0415 - optional, and slow to import
+    except ImportError:
+        return None
+    return numpy
+
+
+def _summaries(
+    prices: Sequence[int], counts: Sequence[int], starts: list[int], n: int
+) -> Iterator[_Summary]:
+    for lo, hi in pairwise([*starts, n]):
+        segment_prices = prices[lo:hi]
+        segment_counts = counts[lo:hi]
+        yield (
+            max(segment_prices),
+            min(segment_prices),
+            sum(segment_counts),
+            sum(map(mul, segment_prices, segment_counts)),
+        )
+
+
+def _array_summaries(np: Any, prices: Any, counts: Any, starts: list[int]) -> Iterator[_Summary]:
+    if not starts:
+        return iter(())
+    return zip(
+        np.maximum.reduceat(prices, starts).tolist(),
+        np.minimum.reduceat(prices, starts).tolist(),
+        np.add.reduceat(counts, starts).tolist(),
+        np.add.reduceat(prices * counts, starts).tolist(),
+        strict=True,
+    )
+
+
+@dataclass(slots=True)
+class _OpenBar:
+    key: int
+    first: float
+    last: float
+    open: int
+    high: int
+    low: int
+    close: int
+    volume: int
+    trades: int
+    notional: int
+
+
+class BarAggregator(ABC):
+    """Per-ticker bar state shared by ``TimeBars``, ``VolumeBars`` and ``TickBars``.
+
+    ``update`` does constant work per trade. ``update_batch`` takes a block of
+    one ticker's trades as columns, finds the bar boundaries and summarizes
+    each bar with slice-wide reductions. With NumPy installed both steps are
+    array operations, leaving only per-bar work in Python; without it the
+    boundaries take one pass over the block.
+    """
+
+    def __init__(self) -> None:
+        self._open: dict[str, _OpenBar] = {}
+
+    def update(self, trade: Trade) -> list[Bar]:
+        """Add one trade and return the bars it closed."""
+        ticker = trade.ticker
+        ts = trade.created_time.timestamp()
+        price = trade.yes_price
+        closed = []
+        bar = self._open.get(ticker)
+        if bar is not None and self._starts_new_bar(bar, ts):
+            closed.append(self._close(ticker))
+            bar = None
+        if bar is None:
+            bar = self._open[ticker] = _OpenBar(
+                self._key(ts), ts, ts, price, price, price, price, 0, 0, 0
+            )
+        else:
+            bar.last = ts
+            bar.high = max(bar.high, price)
+            bar.low = min(bar.low, price)
+            bar.close = price
+        bar.volume += trade.count
+        bar.trades += 1
+        bar.notional += price * trade.count
+        if self._is_full(bar):
+            closed.append(self._close(ticker))
+        return closed
+
+    def update_many(self, trades: Iterable[Trade]) -> list[Bar]:
+        return [bar for trade in trades for bar in self.update(trade)]
+
+    def update_batch(self, ticker: str, columns: TradeColumns) -> list[Bar]:
+        """Add a block of ``ticker``'s trades and return the bars it closed.
+
+        Gives the same bars as calling ``update`` once per trade.
+        """
+        times, prices, counts = columns.times, columns.yes_prices, columns.counts
+        n = len(times)
+        if not n:
+            return []
+        bar = self._open.pop(ticker, None)
+        np = _optional_numpy()
+        if np is None:
+            bounds = [0, *self._cuts(bar, times, counts), n]
+        else:
+            times = np.asarray(times, dtype=np.float64)
+            prices = np.asarray(prices, dtype=np.int64)
+            counts = np.asarray(counts, dtype=np.int64)
+            bounds = [0, *self._array_cuts(np, bar, times, counts), n]
+        # Bars that close before the block's first row leave empty segments
+        starts = [lo for lo, hi in pairwise(bounds) if hi > lo]
+        if np is None:
+            summaries = _summaries(prices, counts, starts, n)
+        else:
+            summaries = _array_summaries(np, prices, counts, starts)
+        closed = []
+        for lo, hi in pairwise(bounds):
+            if hi > lo:
+                bar = self._fold(bar, times, prices, lo, hi, next(summaries))
+            if bar is not None and (hi < n or self._is_full(bar)):
+                closed.append(self._to_bar(ticker, bar))
+                bar = None
+        if bar is not None:
+            self._open[ticker] = bar
+        return closed
+
+    def stream(self, trades: Iterable[Trade]) -> Iterator[Bar]:
+        """Yield bars as ``trades`` close them, e.g. from ``client.follow_trades()``."""
+        for trade in trades:
+            yield from self.update(trade)
+
+    async def astream(self, trades: AsyncIterable[Trade]) -> AsyncIterator[Bar]:
+        """Async counterpart of ``stream``."""
+        async for trade in trades:
+            for bar in self.update(trade):
+                yield bar
+
+    def current(self, ticker: str) -> Bar | None:
+        """The open bar of ``ticker`` so far, if it has one."""
+        bar = self._open.get(ticker)
+        return None if bar is None else self._to_bar(ticker, bar)
+
+    def flush(self) -> list[Bar]:
+        """Close and return every open bar, e.g. at the end of a backfill."""
+        return [self._close(ticker) for ticker in list(self._open)]
+
+    def _close(self, ticker: str) -> Bar:
+        return self._to_bar(ticker, self._open.pop(ticker))
+
+    def _to_bar(self, ticker: str, bar: _OpenBar) -> Bar:
+        start, end = self._span(bar)
+        return Bar(
+            ticker=ticker,
+            start=datetime.fromtimestamp(start, UTC),
+            end=datetime.fromtimestamp(end, UTC),
+            open=bar.open,
+            high=bar.high,
+            low=bar.low,
+            close=bar.close,
+            volume=bar.volume,
+            trades=bar.trades,
+            notional=bar.notional,
+        )
+
+    def _fold(  # noqa: PLR0913, PLR0917 - the rows of a batch and their summary
+        self,
+        bar: _OpenBar | None,
+        times: Sequence[float],
+        prices: Sequence[int],
+        lo: int,
+        hi: int,
+        summary: _Summary,
+    ) -> _OpenBar:
+        high, low, volume, notional = summary
+        # Plain numbers whether the columns are sequences or NumPy arrays
+        first, last = float(times[lo]), float(times[hi - 1])
+        close = int(prices[hi - 1])
+        if bar is None:
+            return _OpenBar(
+                self._key(first),
+                first,
+                last,
+                int(prices[lo]),
+                high,
+                low,
+                close,
+                volume,
+                hi - lo,
+                notional,
+            )
+        bar.last = last
+        bar.high = max(bar.high, high)
+        bar.low = min(bar.low, low)
+        bar.close = close
+        bar.volume += volume
+        bar.trades += hi - lo
+        bar.notional += notional
+        return bar
+
+    # Bar rules of each aggregator
+    def _key(self, ts: float) -> int:
+        return 0
+
+    @abstractmethod
+    def _starts_new_bar(self, bar: _OpenBar, ts: float) -> bool:
+        """Whether a trade at ``ts`` closes ``bar`` before it is added."""
+
+    @abstractmethod
+    def _is_full(self, bar: _OpenBar) -> bool:
+        """Whether ``bar`` closes after the trade just added to it."""
+
+    @abstractmethod
+    def _cuts(
+        self, bar: _OpenBar | None, times: Sequence[float], counts: Sequence[int]
+    ) -> list[int]:
+        """Row indices at which a bar closes before the row is added, ascending."""
+
+    def _array_cuts(self, np: Any, bar: _OpenBar | None, times: Any, counts: Any) -> list[int]:
+        """``_cuts`` of NumPy columns."""
+        return self._cuts(bar, times, counts)
+
+    def _span(self, bar: _OpenBar) -> tuple[float, float]:
+        return bar.first, bar.last
+
+
+class TimeBars(BarAggregator):
+    """OHLCV candles over fixed periods aligned to the epoch (e.g. whole minutes).
+
+    A candle closes when its ticker's first trade of a later period arrives, or
+    through ``close_due`` once its period has passed. A late trade from an
+    earlier period is added to the open candle.
+
+    Args:
+        interval: Candle length, as a ``timedelta`` or in seconds
+    """
+
+    def __init__(self, interval: timedelta | float):
+        super().__init__()
+        seconds = interval.total_seconds() if isinstance(interval, timedelta) else interval
+        if seconds <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = seconds
+
+    def close_due(self, now: datetime | None = None) -> list[Bar]:
+        """Close and return the candles whose period ended by ``now`` (the current time)."""
+        limit = (now or datetime.now(UTC)).timestamp()
+        due = [
+            ticker for ticker, bar in self._open.items() if (bar.key + 1) * self.interval <= limit
+        ]
+        return [self._close(ticker) for ticker in due]
+
+    def _key(self, ts: float) -> int:
+        return math.floor(ts / self.interval)
+
+    def _starts_new_bar(self, bar: _OpenBar, ts: float) -> bool:
+        return self._key(ts) > bar.key
+
+    def _is_full(self, bar: _OpenBar) -> bool:
+        return False
+
+    def _cuts(
+        self, bar: _OpenBar | None, times: Sequence[float], counts: Sequence[int]
+    ) -> list[int]:
+        interval = self.interval
+        first = bar.key if bar is not None else math.floor(times[0] / interval)
+        # Latest period seen before each row, and after the last one
+        periods = list(accumulate((math.floor(ts / interval) for ts in times), max, initial=first))
+        return [i for i in range(len(times)) if periods[i + 1] != periods[i]]
+
+    def _array_cuts(self, np: Any, bar: _OpenBar | None, times: Any, counts: Any) -> list[int]:
+        periods = np.floor(times / self.interval)
+        first = bar.key if bar is not None else periods[0]
+        latest = np.maximum.accumulate(np.concatenate(([first], periods)))
+        return np.flatnonzero(latest[1:] != latest[:-1]).tolist()
+
+    def _span(self, bar: _OpenBar) -> tuple[float, float]:
+        start = bar.key * self.interval
+        return start, start + self.interval
+
+
+class VolumeBars(BarAggregator):
+    """Bars that close on the trade bringing their volume to at least ``size`` contracts.
+
+    Trades are not split, so a bar can exceed ``size``.
+    """
+
+    def __init__(self, size: int):
+        super().__init__()
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+
+    def _starts_new_bar(self, bar: _OpenBar, ts: float) -> bool:
+        return False
+
+    def _is_full(self, bar: _OpenBar) -> bool:
+        return bar.volume >= self.size
+
+    def _cuts(
+        self, bar: _OpenBar | None, times: Sequence[float], counts: Sequence[int]
+    ) -> list[int]:
+        cuts = []
+        volume = bar.volume if bar is not None else 0
+        for i, count in enumerate(counts, 1):
+            volume += count
+            if volume >= self.size:
+                cuts.append(i)
+                volume = 0
+        return cuts
+
+    def _array_cuts(self, np: Any, bar: _OpenBar | None, times: Any, counts: Any) -> list[int]:
+        # One binary search per bar over the running volume
+        volumes = np.cumsum(counts)
+        cuts = []
+        # Running volume at which the open bar is empty (negative if it holds some already)
+        base = -bar.volume if bar is not None else 0
+        while True:
+            row = int(np.searchsorted(volumes, base + self.size))
+            if row >= len(volumes):
+                return cuts
+            cuts.append(row + 1)
+            base = int(volumes[row])
+
+
+class TickBars(BarAggregator):
+    """Bars of ``size`` trades each."""
+
+    def __init__(self, size: int):
+        super().__init__()
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+
+    def _starts_new_bar(self, bar: _OpenBar, ts: float) -> bool:
+        return False
+
+    def _is_full(self, bar: _OpenBar) -> bool:
+        return bar.trades >= self.size
+
+    def _cuts(
+        self, bar: _OpenBar | None, times: Sequence[float], counts: Sequence[int]
+    ) -> list[int]:
+        first = self.size - (bar.trades if bar is not None else 0)
+        return list(range(first, len(times) + 1, self.size))
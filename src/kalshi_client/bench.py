@@ -0,0 +1,429 @@
+"""Load generator for the Kalshi API client.
+
+Drives concurrent workers through ``KalshiClient`` (threads) or
+``AsyncKalshiClient`` (tasks) with a weighted mix of operations and reports
+throughput, latency quantiles, error rates and client CPU use.
+
+Usage:
+    python -m kalshi_client.bench --workers 16 --duration 30 --mix markets=2,orderbook=4,order=1
+    python -m kalshi_client.bench --url https://demo-api.kalshi.co/trade-api/v2 --async
+
+Without ``--url`` a ``kalshi_client.testing`` server is started in a child
+process, so its CPU use is not counted against the client.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from .async_client import AsyncKalshiClient
+from .configs.kalshi_configs import KalshiConfig
+from .kalshi_client import KalshiClient
+from .metrics import LatencyHistogram
+
+DEFAULT_MIX = "markets=2,orderbook=4,trades=2,order=2"
+QUANTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99, "p999": 0.999}
+
+# One step of an operation: (endpoint label, client method name, keyword arguments).
+# Operations are generators so the same definition runs on the sync and async clients;
+# the driver sends each call's result back in.
+Call = tuple[str, str, dict[str, Any]]
+Operation = Callable[["_Worker"], Generator[Call, Any, None]]
+
+
+@dataclass
+class _Worker:
+    rng: random.Random
+    tickers: list[str]
+    page_size: int
+    cursor: str | None = None
+
+
+def _markets(worker: _Worker) -> Generator[Call, Any, None]:
+    page = yield "GET /markets", "get_markets", {"limit": worker.page_size, "cursor": worker.cursor}
+    worker.cursor = page.cursor or None
+
+
+def _market(worker: _Worker) -> Generator[Call, Any, None]:
+    yield "GET /markets/{ticker}", "get_market", {"ticker": worker.rng.choice(worker.tickers)}
+
+
+def _orderbook(worker: _Worker) -> Generator[Call, Any, None]:
+    ticker = worker.rng.choice(worker.tickers)
+    yield "GET /markets/{ticker}/orderbook", "get_market_order_book", {"ticker": ticker}
+
+
+def _trades(worker: _Worker) -> Generator[Call, Any, None]:
+    yield "GET /markets/trades", "get_trades", {"limit": worker.page_size}
+
+
+def _events(worker: _Worker) -> Generator[Call, Any, None]:
+    yield "GET /events", "get_events", {"limit": worker.page_size}
+
+
+def _balance(worker: _Worker) -> Generator[Call, Any, None]:
+    yield "GET /portfolio/balance", "get_balance", {}
+
+
+def _orders(worker: _Worker) -> Generator[Call, Any, None]:
+    yield "GET /portfolio/orders", "get_orders", {"limit": worker.page_size}
+
+
+def _positions(worker: _Worker) -> Generator[Call, Any, None]:
+    yield "GET /portfolio/positions", "get_positions", {"limit": worker.page_size}
+
+
+def _order(worker: _Worker) -> Generator[Call, Any, None]:
+    """Rest a 1-cent YES bid, then cancel it."""
+    order = {
+        "ticker": worker.rng.choice(worker.tickers),
+        "action": "buy",
+        "side": "yes",
+        "type": "limit",
+        "count": 1,
+        "yes_price": 1,
+    }
+    created = yield "POST /portfolio/orders", "create_order", order
+    yield "DELETE /portfolio/orders/{order_id}", "cancel_order", {"order_id": created.order_id}
+
+
+OPERATIONS: dict[str, Operation] = {
+    "markets": _markets,
+    "market": _market,
+    "orderbook": _orderbook,
+    "trades": _trades,
+    "events": _events,
+    "balance": _balance,
+    "orders": _orders,
+    "positions": _positions,
+    "order": _order,
+}
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parse ``"markets=2,orderbook=4"`` into operation weights."""
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}; choose from {', '.join(OPERATIONS)}")
+        try:
+            weights[name] = float(weight) if weight else 1.0
+        except ValueError as e:
+            raise ValueError(f"Invalid weight for {name!r}: {weight!r}") from e
+        if weights[name] < 0:
+            raise ValueError(f"Weight for {name!r} must not be negative")
+    if not any(weights.values()):
+        raise ValueError("At least one operation needs a positive weight")
+    return weights
+
+
+@dataclass
+class EndpointResult:
+    requests: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+
+@dataclass
+class LoadReport:
+    """Results of a load run; latencies are in seconds."""
+
+    mode: str
+    workers: int
+    duration: float
+    cpu_seconds: float
+    endpoints: dict[str, EndpointResult]
+
+    @property
+    def requests(self) -> int:
+        return sum(result.requests for result in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(result.error_count for result in self.endpoints.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "duration": self.duration,
+            "requests": self.requests,
+            "requests_per_second": self.requests / self.duration if self.duration else 0.0,
+            "errors": self.errors,
+            "cpu_seconds": self.cpu_seconds,
+            "cpu_utilization": self.cpu_seconds / self.duration if self.duration else 0.0,
+            "endpoints": {
+                endpoint: {
+                    "requests": result.requests,
+                    "requests_per_second": result.requests / self.duration
+                    if self.duration
+                    else 0.0,
+                    "errors": dict(result.errors),
+                    "error_rate": result.error_count / result.requests if result.requests else 0.0,
+                    "latency": {name: result.latency.quantile(q) for name, q in QUANTILES.items()}
+                    | {"max": result.latency.max},
+                }
+                for endpoint, result in sorted(self.endpoints.items())
+            },
+        }
+
+    def format(self) -> str:
+        header = f"{'endpoint':<38} {'requests':>9} {'rps':>9} {'errors':>7}" + "".join(
+            f" {name + ' ms':>9}" for name in QUANTILES
+        )
+        lines = [header]
+        for endpoint, result in sorted(self.endpoints.items()):
+            error_rate = result.error_count / result.requests if result.requests else 0.0
+            lines.append(
+                f"{endpoint:<38} {result.requests:>9} {result.requests / self.duration:>9.1f} "
+                f"{error_rate:>7.2%}"
+                + "".join(f" {result.latency.quantile(q) * 1e3:>9.2f}" for q in QUANTILES.values())
+            )
+        lines.append(
+            f"{'total':<38} {self.requests:>9} {self.requests / self.duration:>9.1f} "
+            f"{self.errors / self.requests if self.requests else 0.0:>7.2%}"
+        )
+        errors: dict[str, int] = {}
+        for result in self.endpoints.values():
+            for name, count in result.errors.items():
+                errors[name] = errors.get(name, 0) + count
+        if errors:
+            lines.append("errors: " + ", ".join(f"{n}={c}" for n, c in sorted(errors.items())))
+        lines.append(
+            f"{self.mode}, {self.workers} workers, {self.duration:.1f}s; client CPU "
+            f"{self.cpu_seconds:.2f}s ({self.cpu_seconds / self.duration:.0%} of one core)"
+        )
+        return "\n".join(lines)
+
+
+class _Recorder:
+    def __init__(self, record_after: float):
+        self.record_after = record_after
+        self.endpoints: dict[str, EndpointResult] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, start: float, end: float, error: Exception | None) -> None:
+        if start < self.record_after:
+            return
+        with self._lock:
+            result = self.endpoints.setdefault(endpoint, EndpointResult())
+            result.requests += 1
+            result.latency.record(end - start)
+            if error is not None:
+                name = type(error).__name__
+                result.errors[name] = result.errors.get(name, 0) + 1
+
+
+def _choose(rng: random.Random, mix: Mapping[str, float]) -> Operation:
+    return OPERATIONS[rng.choices(list(mix), weights=list(mix.values()))[0]]
+
+
+def _sync_worker(
+    client: KalshiClient,
+    worker: _Worker,
+    mix: Mapping[str, float],
+    recorder: _Recorder,
+    deadline: float,
+) -> None:
+    while time.perf_counter() < deadline:
+        steps = _choose(worker.rng, mix)(worker)
+        result = None
+        try:
+            while True:
+                endpoint, method, kwargs = steps.send(result)
+                start = time.perf_counter()
+                try:
+                    result = getattr(client, method)(**kwargs)
+                except Exception as e:
+                    recorder.record(endpoint, start, time.perf_counter(), e)
+                    break
+                recorder.record(endpoint, start, time.perf_counter(), None)
+        except StopIteration:
+            pass
+
+
+async def _async_worker(
+    client: AsyncKalshiClient,
+    worker: _Worker,
+    mix: Mapping[str, float],
+    recorder: _Recorder,
+    deadline: float,
+) -> None:
+    while time.perf_counter() < deadline:
+        steps = _choose(worker.rng, mix)(worker)
+        result = None
+        try:
+            while True:
+                endpoint, method, kwargs = steps.send(result)
+                start = time.perf_counter()
+                try:
+                    result = await getattr(client, method)(**kwargs)
+                except Exception as e:
+                    recorder.record(endpoint, start, time.perf_counter(), e)
+                    break
+                recorder.record(endpoint, start, time.perf_counter(), None)
+        except StopIteration:
+            pass
+
+
+def run(  # noqa: PLR0913 - the options after config are keyword-only
+    config: KalshiConfig,
+    *,
+    workers: int = 8,
+    duration: float = 10.0,
+    warmup: float = 1.0,
+    mix: str | Mapping[str, float] = DEFAULT_MIX,
+    use_async: bool = False,
+    page_size: int = 100,
+    seed: int = 0,
+    tickers: list[str] | None = None,
+) -> LoadReport:
+    """Run a load test against ``config.api_url`` and return the results.
+
+    Args:
+        config: Client configuration; ``max_concurrency`` and ``rate_limit`` apply as usual
+        workers: Concurrent worker threads (or tasks with ``use_async``)
+        duration: Seconds to measure for, after the warm-up
+        warmup: Seconds to run before measuring
+        mix: Operation weights, as a mapping or ``"name=weight,..."``
+        use_async: Drive ``AsyncKalshiClient`` from one event loop instead of threads
+        page_size: ``limit`` for paginated endpoints
+        seed: Seed for the operation and ticker choices
+        tickers: Markets to target (default: the first 1000 listed by the server)
+    """
+    weights = parse_mix(mix) if isinstance(mix, str) else dict(mix)
+    if tickers is None:
+        with KalshiClient(config=config) as client:
+            tickers = [market.ticker for market in client.get_markets(limit=1000)]
+    if not tickers:
+        raise RuntimeError(f"No markets found at {config.api_url}")
+    worker_states = [_Worker(random.Random(seed + i), tickers, page_size) for i in range(workers)]
+
+    cpu_start = time.process_time()
+    record_after = time.perf_counter() + warmup
+    deadline = record_after + duration
+    recorder = _Recorder(record_after)
+    if use_async:
+
+        async def main() -> None:
+            async with AsyncKalshiClient(config=config) as client:
+                await asyncio.gather(
+                    *(_async_worker(client, w, weights, recorder, deadline) for w in worker_states)
+                )
+
+        asyncio.run(main())
+    else:
+        with KalshiClient(config=config) as client:
+            threads = [
+                threading.Thread(
+                    target=_sync_worker,
+                    args=(client, w, weights, recorder, deadline),
+                    name=f"kalshi-bench-{i}",
+                )
+                for i, w in enumerate(worker_states)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    elapsed = time.perf_counter() - record_after
+    # Process CPU over the whole run, scaled to the measured window
+    cpu_seconds = (time.process_time() - cpu_start) * elapsed / (elapsed + warmup)
+    return LoadReport(
+        mode="async" if use_async else "threads",
+        workers=workers,
+        duration=elapsed,
+        cpu_seconds=cpu_seconds,
+        endpoints=recorder.endpoints,
+    )
+
+
+def _spawn_local_server(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    command = [
+        sys.executable,
+        "-m",
+        "kalshi_client.testing",
+        "--port",
+        "0",
+        "--latency",
+        str(args.server_latency),
+        "--seed",
+        str(args.seed),
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line:
+        process.kill()
+        raise RuntimeError("Local server failed to start")
+    return process, line.rsplit(" ", 1)[-1].strip()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m kalshi_client.bench", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--url", help="API base URL (default: start a local simulated server)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Unmeasured seconds first")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Operations: {', '.join(OPERATIONS)}")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Use asyncio")
+    parser.add_argument("--max-concurrency", type=int, help="Client limit (default: workers)")
+    parser.add_argument("--rate-limit", type=float, help="Client requests per second")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--server-latency", type=float, default=0.0, help="Local server only")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = None
+    url = args.url
+    if url is None:
+        server, url = _spawn_local_server(args)
+    try:
+        config = KalshiConfig(
+            api_key=os.environ.get("KALSHI_API_KEY", "bench"),
+            api_secret=os.environ.get("KALSHI_API_SECRET", "bench"),
+            base_url=url,
+            max_concurrency=args.max_concurrency or args.workers,
+            rate_limit=args.rate_limit,
+        )
+        report = run(
+            config,
+            workers=args.workers,
+            duration=args.duration,
+            warmup=args.warmup,
+            mix=mix,
+            use_async=args.use_async,
+            page_size=args.page_size,
+            seed=args.seed,
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
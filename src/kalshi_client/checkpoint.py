@@ -0,0 +1,203 @@
+"""Durable progress of long pagination crawls.
+
+With ``checkpoint=`` set, ``iter_pages``/``paginate`` (and their async
+counterparts) record the query, the cursor of the next page and page and
+item counts each time the caller has finished with a page. A crawl run with
+``resume=True`` continues after the last page it confirmed. The first page
+after a resume may have been partly or fully delivered before the crash
+(at-least-once delivery), so sinks should upsert by ``dedup_key(item)``.
+The checkpoint is cleared once the crawl completes, so the next run starts
+from the beginning.
+
+Example:
+    checkpoint = SQLiteCheckpoint("crawl.db")
+    for trade in paginate(client.get_trades, limit=1000, checkpoint=checkpoint, resume=True):
+        store.upsert(dedup_key(trade), trade)
+"""
+
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Protocol
+
+from pydantic import BaseModel
+
+# Natural id fields of API objects, checked in order
+ID_FIELDS = ("trade_id", "order_id", "ticker", "event_ticker")
+
+# Call options that do not change which items a query returns
+_NOT_QUERY = frozenset({"cursor", "timeout", "deadline"})
+
+
+def dedup_key(item: BaseModel) -> str:
+    """Stable id of an API object (trade, order, market, position or event)."""
+    for field in ID_FIELDS:
+        value = getattr(item, field, None)
+        if value is not None:
+            return str(value)
+    raise ValueError(f"{type(item).__name__} has none of the id fields {ID_FIELDS}")
+
+
+def query_key(fetch: Callable[..., Any], params: dict[str, Any]) -> str:
+    """Checkpoint key of a query: the endpoint method's name and its query parameters."""
+    name = getattr(fetch, "__name__", None)
+    if name is None:
+        raise ValueError("pass checkpoint_key= for a fetch function without a __name__")
+    query = {name: value for name, value in params.items() if name not in _NOT_QUERY}
+    return f"{name}:{json.dumps(query, sort_keys=True, default=str)}"
+
+
+class Checkpoint(Protocol):
+    """Storage for crawl progress, one JSON-serializable state per query key."""
+
+    def load(self, key: str) -> dict[str, Any] | None: ...
+
+    def save(self, key: str, state: dict[str, Any]) -> None: ...
+
+    def clear(self, key: str) -> None: ...
+
+
+class FileCheckpoint:
+    """Checkpoints in a JSON file, replaced atomically on every save.
+
+    Each save writes a temporary file in the same directory, fsyncs it and
+    renames it over ``path``, so a crash leaves either the old or the new
+    checkpoint, never a torn one.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, state: dict[str, Any]) -> None:
+        with self._lock:
+            data = self._read()
+            data[key] = state
+            self._write(data)
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, data: dict[str, Any]) -> None:
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        # Persist the rename itself; not possible on every platform
+        with contextlib.suppress(OSError):
+            fd = os.open(self.path.parent, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+
+class SQLiteCheckpoint:
+    """Checkpoints in a SQLite table; each save is one committed transaction.
+
+    Args:
+        path: Database file (created if missing)
+        table: Table holding the checkpoints
+    """
+
+    def __init__(self, path: str | os.PathLike[str], table: str = "pagination_checkpoints"):
+        if not table.isidentifier():
+            raise ValueError(f"invalid table name: {table!r}")
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA synchronous = FULL")
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, state TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT state FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def save(self, key: str, state: dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, state, updated_at) VALUES (?, ?, ?)",
+                (key, json.dumps(state, default=str), time.time()),
+            )
+
+    def clear(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class PageProgress:
+    """Progress of one checkpointed crawl, as used by the pagination helpers.
+
+    Args:
+        checkpoint: Where progress is saved
+        key: Checkpoint key of the query
+        params: Query parameters, saved for inspection
+        resume: Start after the last confirmed page of a previous run, if any
+        cursor: Starting cursor when not resuming
+    """
+
+    def __init__(
+        self,
+        checkpoint: Checkpoint,
+        key: str,
+        params: dict[str, Any],
+        resume: bool,
+        cursor: str | None,
+    ):
+        self.checkpoint = checkpoint
+        self.key = key
+        self.params = {name: value for name, value in params.items() if name not in _NOT_QUERY}
+        state = checkpoint.load(key) if resume else None
+        self.resumed = state is not None
+        self.cursor = state["cursor"] if state else cursor
+        self.pages = state["pages"] if state else 0
+        self.items = state["items"] if state else 0
+
+    def confirm(self, items: int, next_cursor: str | None, last: bool) -> None:
+        """Record a page the caller has finished with; clear the checkpoint after the last."""
+        self.pages += 1
+        self.items += items
+        self.cursor = next_cursor
+        if last:
+            self.checkpoint.clear(self.key)
+            return
+        self.checkpoint.save(
+            self.key,
+            {
+                "params": self.params,
+                "cursor": next_cursor,
+                "pages": self.pages,
+                "items": self.items,
+                "updated_at": time.time(),
+            },
+        )
@@ -0,0 +1,227 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any
+
+import httpx
+
+from .exceptions import (
+    KalshiCircuitOpenError,
+    KalshiDeadlineExceededError,
+    KalshiQueueFullError,
+    KalshiServerError,
+)
+from .metrics import ClientMetrics
+
+# Outcomes that count against the exchange's health; other API errors (4xx)
+# mean the exchange answered normally
+FAILURES = (httpx.TransportError, KalshiServerError)
+# Outcomes that say nothing about the exchange either way
+IGNORED = (KalshiQueueFullError, KalshiDeadlineExceededError)
+
+GROUPS = ("market_data", "portfolio", "orders")
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+# Exported as the ``circuit_state`` gauge
+_GAUGE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+def endpoint_group(method: str, endpoint: str) -> str:
+    """Breaker group of a request: ``orders``, ``portfolio`` or ``market_data``."""
+    if endpoint.startswith("/portfolio"):
+        if endpoint.startswith("/portfolio/orders") and method in ("POST", "DELETE"):
+            return "orders"
+        return "portfolio"
+    return "market_data"
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker over a rolling window of request outcomes.
+
+    While closed, every request's outcome is kept for ``window`` seconds.
+    Once at least ``min_requests`` are in the window and the share of
+    failures (timeouts, connection errors, 5xx) reaches ``failure_threshold``
+    or the share of calls slower than ``slow_call_duration`` reaches
+    ``slow_call_threshold``, the breaker opens. While open, requests fail
+    immediately with ``KalshiCircuitOpenError``. After ``reset_timeout``
+    seconds it is half-open: up to ``half_open_probes`` requests go through,
+    and the breaker closes once that many have succeeded or opens again on
+    the first failure.
+
+    Args:
+        name: Group name, used in errors and metric labels
+        failure_threshold: Failure ratio that opens the breaker
+        slow_call_threshold: Slow-call ratio that opens the breaker
+        slow_call_duration: Seconds after which a call counts as slow
+        min_requests: Outcomes needed in the window before the breaker can open
+        window: Length of the rolling window, in seconds
+        reset_timeout: Seconds the breaker stays open before probing
+        half_open_probes: Concurrent probes, and successes needed to close
+        metrics: Receives the ``circuit_state`` gauge (0 closed, 1 half-open, 2 open)
+        clock: Monotonic clock, injectable for tests
+    """
+
+    def __init__(  # noqa: PLR0913 - the options after name are keyword-only
+        self,
+        name: str,
+        *,
+        failure_threshold: float = 0.5,
+        slow_call_threshold: float = 0.8,
+        slow_call_duration: float = 5.0,
+        min_requests: int = 20,
+        window: float = 30.0,
+        reset_timeout: float = 10.0,
+        half_open_probes: int = 1,
+        metrics: ClientMetrics | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if half_open_probes < 1:
+            raise ValueError("half_open_probes must be at least 1")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_duration = slow_call_duration
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.metrics = metrics
+        self.rejected = 0
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._outcomes: deque[tuple[float, bool, bool]] = deque()
+        self._failures = 0
+        self._slow = 0
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+        self._publish()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state(self._clock())
+
+    def allow(self) -> bool:
+        """Admit a request, or raise ``KalshiCircuitOpenError``.
+
+        Returns:
+            Whether the request is a half-open probe; pass it back to ``record``
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state is CircuitState.CLOSED:
+                return False
+            if state is CircuitState.HALF_OPEN and self._probes < self.half_open_probes:
+                self._probes += 1
+                return True
+            self.rejected += 1
+            retry_after = max(0.0, self._opened_at + self.reset_timeout - now)
+        raise KalshiCircuitOpenError(self.name, retry_after)
+
+    def record(
+        self, duration: float, error: BaseException | None = None, probe: bool = False
+    ) -> None:
+        """Record the outcome of a request admitted by ``allow``."""
+        ignored = error is not None and (
+            isinstance(error, IGNORED) or not isinstance(error, Exception)
+        )
+        failed = isinstance(error, FAILURES)
+        slow = duration >= self.slow_call_duration
+        with self._lock:
+            now = self._clock()
+            if probe:
+                self._probes = max(0, self._probes - 1)
+                if ignored or self._state is not CircuitState.HALF_OPEN:
+                    return
+                if failed or slow:
+                    self._open(now)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    self._close()
+                return
+            if ignored or self._state is not CircuitState.CLOSED:
+                return
+            self._outcomes.append((now, failed, slow))
+            self._failures += failed
+            self._slow += slow
+            self._prune(now)
+            total = len(self._outcomes)
+            if total >= self.min_requests and (
+                self._failures >= self.failure_threshold * total
+                or self._slow >= self.slow_call_threshold * total
+            ):
+                self._open(now)
+
+    def reset(self) -> None:
+        """Close the breaker and forget the window."""
+        with self._lock:
+            self._close()
+
+    def _current_state(self, now: float) -> CircuitState:
+        if self._state is CircuitState.OPEN and now >= self._opened_at + self.reset_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+            self._probe_successes = 0
+            self._publish()
+        return self._state
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.window
+        while self._outcomes and self._outcomes[0][0] < horizon:
+            _, failed, slow = self._outcomes.popleft()
+            self._failures -= failed
+            self._slow -= slow
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._publish()
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._failures = self._slow = 0
+        self._publish()
+
+    def _publish(self) -> None:
+        if self.metrics is not None:
+            self.metrics.set_gauge("circuit_state", _GAUGE_VALUES[self._state], group=self.name)
+
+
+class CircuitBreakers:
+    """One ``CircuitBreaker`` per endpoint group (market data, portfolio, orders).
+
+    Args:
+        metrics: Receives every breaker's ``circuit_state`` gauge
+        **options: Passed to every ``CircuitBreaker``
+    """
+
+    def __init__(self, metrics: ClientMetrics | None = None, **options: Any):
+        self.breakers = {
+            group: CircuitBreaker(group, metrics=metrics, **options) for group in GROUPS
+        }
+
+    def __getitem__(self, group: str) -> CircuitBreaker:
+        return self.breakers[group]
+
+    def for_request(self, method: str, endpoint: str) -> CircuitBreaker:
+        return self.breakers[endpoint_group(method, endpoint)]
+
+    def states(self) -> dict[str, CircuitState]:
+        return {group: breaker.state for group, breaker in self.breakers.items()}
+
+    def reset(self) -> None:
+        for breaker in self.breakers.values():
+            breaker.reset()
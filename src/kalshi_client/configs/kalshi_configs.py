@@ -17,6 +17,58 @@ class KalshiConfig(BaseSettings):
         default=30.0,
         description="Request timeout in seconds"
     )
+    max_concurrency: int = Field(
+        default=10,
+        description="Maximum number of requests in flight at once"
+    )
+    trading_connections: int | None = Field(
+        default=None,
+        description="Size of a dedicated connection pool for /portfolio requests (shared if unset)"
+    )
+    keepalive_interval: float | None = Field(
+        default=None,
+        description="Seconds of order-path idleness before a heartbeat request (disabled if unset)"
+    )
+    priority_scheduling: bool = Field(
+        default=False,
+        description="Admit requests by priority: cancels, creates, portfolio, market data, bulk"
+    )
+    hedge_delay: float | None = Field(
+        default=None,
+        description="Seconds before a slow market or order book GET is sent again"
+    )
+    hedge_quantile: float | None = Field(
+        default=None,
+        description="Hedge those GETs once slower than this quantile of recent latencies"
+    )
+    async_engine: bool = Field(
+        default=False,
+        description="Run KalshiClient requests on a background asyncio event loop"
+    )
+    decode_workers: int | None = Field(
+        default=None,
+        description="Decode large list responses in this many worker processes (inline if unset)"
+    )
+    circuit_breaker: bool = Field(
+        default=False,
+        description="Fail fast per endpoint group while the exchange is erroring or slow"
+    )
+    rate_limit: float | None = Field(
+        default=None,
+        description="Maximum requests per second (unlimited if unset)"
+    )
+    rate_limit_file: str | None = Field(
+        default=None,
+        description="Share the rate_limit budget with every process using this bucket file"
+    )
+    enable_metrics: bool = Field(
+        default=False,
+        description="Collect per-endpoint request metrics on the client"
+    )
+    generate_client_order_ids: bool = Field(
+        default=True,
+        description="Generate a client_order_id for orders created without one"
+    )
 
     model_config = {
         "env_prefix": "KALSHI_",
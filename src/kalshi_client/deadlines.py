@@ -0,0 +1,62 @@
+"""Per-call timeouts and deadlines.
+
+Every endpoint method takes ``timeout=`` and ``deadline=``. ``timeout`` (seconds
+or an ``httpx.Timeout``) replaces ``config.timeout`` for each request the call
+sends. ``deadline`` is an absolute ``time.monotonic()`` value that bounds the
+whole call: rate-limit and pool waits, every page of ``paginate``, and order
+retries all stop once it has passed, and the per-phase httpx timeouts of each
+request are clamped to the time left.
+
+Example:
+    deadline = time.monotonic() + 2.0
+    markets = list(paginate(client.get_markets, limit=1000, deadline=deadline))
+"""
+
+import time
+
+import httpx
+
+from .exceptions import KalshiDeadlineExceededError
+
+TimeoutTypes = float | httpx.Timeout | None
+
+
+def time_left(deadline: float | None, waiting_for: str = "") -> float | None:
+    """Seconds until ``deadline`` (None without one).
+
+    Raises:
+        KalshiDeadlineExceededError: If the deadline has passed
+    """
+    if deadline is None:
+        return None
+    left = deadline - time.monotonic()
+    if left <= 0:
+        suffix = f" while waiting for {waiting_for}" if waiting_for else ""
+        raise KalshiDeadlineExceededError(f"Deadline exceeded{suffix}")
+    return left
+
+
+def request_timeout(
+    default: httpx.Timeout, timeout: TimeoutTypes, deadline: float | None
+) -> httpx.Timeout | None:
+    """The httpx timeout of one request, or None to keep the client's default.
+
+    Each phase (connect, read, write, pool) is the per-call ``timeout`` or the
+    client default, capped at the time left before ``deadline``.
+    """
+    if timeout is None and deadline is None:
+        return None
+    base = default if timeout is None else httpx.Timeout(timeout)
+    left = time_left(deadline)
+    if left is None:
+        return base
+    return httpx.Timeout(
+        connect=_cap(base.connect, left),
+        read=_cap(base.read, left),
+        write=_cap(base.write, left),
+        pool=_cap(base.pool, left),
+    )
+
+
+def _cap(phase: float | None, left: float) -> float:
+    return left if phase is None else min(phase, left)
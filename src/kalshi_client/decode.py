@@ -0,0 +1,225 @@
+"""Decode bulk responses in worker processes.
+
+During a large crawl, ``json.loads`` plus model validation of each page holds
+the GIL longer than receiving the page does, so one core saturates while the
+network idles. A client created with ``decoder=DecodeExecutor(n)`` (or
+``config.decode_workers``) sends the raw bodies of ``get_events``,
+``get_markets`` and ``get_trades`` responses to a process pool. Workers
+parse and validate the pages and pickle the models back. The calling thread
+(or the async client's event loop) keeps receiving pages while workers decode.
+
+Unpickling validated models still costs the parent about half as much as
+decoding the page itself. ``iter_column_pages`` asks workers for selected
+fields as columns instead, which are several times cheaper to send back.
+
+Responses smaller than ``min_size`` bytes are decoded in the calling process,
+where pickling would cost more than it saves.
+
+Example:
+    with DecodeExecutor(4) as decoder, KalshiClient(decoder=decoder) as client:
+        for page in iter_column_pages(client, "markets", ("ticker", "yes_bid"), limit=1000):
+            store(page.columns)
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+from collections.abc import AsyncIterator, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .models import Event, Market, ObjectList, Trade
+
+if TYPE_CHECKING:
+    from .async_client import AsyncKalshiClient
+    from .kalshi_client import KalshiClient
+
+# Page kind -> (endpoint, model of the items under that key)
+PAGE_KINDS: dict[str, tuple[str, type]] = {
+    "events": ("/events", Event),
+    "markets": ("/markets", Market),
+    "trades": ("/markets/trades", Trade),
+}
+
+
+@dataclass(slots=True)
+class ColumnPage:
+    """One page of validated items as columns: field name -> values in item order."""
+
+    columns: dict[str, list[Any]]
+    cursor: str | None
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def rows(self) -> list[dict[str, Any]]:
+        names = list(self.columns)
+        return [
+            dict(zip(names, values, strict=True))
+            for values in zip(*self.columns.values(), strict=True)
+        ]
+
+
+def decode_page(
+    kind: str, content: bytes, fields: Sequence[str] | None = None
+) -> tuple[Any, str | None]:
+    """Parse and validate a page: its models (or ``fields`` as columns) and its cursor.
+
+    Runs in the worker processes, and inline for small responses.
+    """
+    _, model = PAGE_KINDS[kind]
+    data = json.loads(content)
+    items = [model(**item) for item in data.get(kind, [])]
+    if fields is None:
+        return items, data.get("cursor")
+    return {name: [getattr(item, name) for item in items] for name in fields}, data.get("cursor")
+
+
+def _default_context() -> multiprocessing.context.BaseContext:
+    # Forking a process that runs client threads can deadlock the child
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class DecodeExecutor:
+    """Process pool that decodes response pages for one or more clients.
+
+    Args:
+        workers: Worker processes (``os.cpu_count()`` if unset)
+        min_size: Responses smaller than this many bytes are decoded inline
+        executor: Pool to use instead of creating one, e.g. a shared
+            ``ProcessPoolExecutor``; it is not shut down by ``close``
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        min_size: int = 64 * 1024,
+        executor: Executor | None = None,
+    ):
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.min_size = min_size
+        self._owns_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=_default_context()
+        )
+
+    def decode(self, kind: str, content: bytes, limit: int | None = None) -> ObjectList[Any]:
+        """Validated items of a page, as the endpoint method would return them."""
+        items, cursor = self._run(kind, content, None)
+        return _object_list(items, cursor, limit)
+
+    def columns(self, kind: str, content: bytes, fields: Sequence[str] | None = None) -> ColumnPage:
+        """Validated ``fields`` (all model fields by default) of a page, as columns."""
+        columns, cursor = self._run(kind, content, _fields(kind, fields))
+        return ColumnPage(columns, cursor)
+
+    async def adecode(self, kind: str, content: bytes, limit: int | None = None) -> ObjectList[Any]:
+        """Async counterpart of ``decode``; the event loop keeps running meanwhile."""
+        items, cursor = await self._arun(kind, content, None)
+        return _object_list(items, cursor, limit)
+
+    async def acolumns(
+        self, kind: str, content: bytes, fields: Sequence[str] | None = None
+    ) -> ColumnPage:
+        columns, cursor = await self._arun(kind, content, _fields(kind, fields))
+        return ColumnPage(columns, cursor)
+
+    def _run(self, kind: str, content: bytes, fields: Sequence[str] | None) -> Any:
+        if len(content) < self.min_size:
+            return decode_page(kind, content, fields)
+        return self.executor.submit(decode_page, kind, content, fields).result()
+
+    async def _arun(self, kind: str, content: bytes, fields: Sequence[str] | None) -> Any:
+        if len(content) < self.min_size:
+            return decode_page(kind, content, fields)
+        return await asyncio.wrap_future(self.executor.submit(decode_page, kind, content, fields))
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+
+    def __enter__(self) -> "DecodeExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _fields(kind: str, fields: Sequence[str] | None) -> tuple[str, ...]:
+    model = PAGE_KINDS[kind][1]
+    if fields is None:
+        return tuple(model.model_fields)
+    if not fields:
+        raise ValueError("fields must not be empty")
+    unknown = set(fields) - set(model.model_fields)
+    if unknown:
+        raise ValueError(f"{model.__name__} has no fields {sorted(unknown)}")
+    return tuple(fields)
+
+
+def _object_list(items: list[Any], cursor: str | None, limit: int | None) -> ObjectList[Any]:
+    return ObjectList(items=items, cursor=cursor, has_more=len(items) == limit if limit else False)
+
+
+def iter_column_pages(
+    client: "KalshiClient",
+    kind: str,
+    fields: Sequence[str] | None = None,
+    **params: Any,
+) -> Iterator[ColumnPage]:
+    """Yield every page of ``kind`` (``"events"``, ``"markets"`` or ``"trades"``) as columns.
+
+    Pages are decoded by the client's ``decoder``, or inline without one.
+
+    Args:
+        client: Client sending the requests
+        kind: Which list endpoint to crawl
+        fields: Model fields to return (all by default)
+        **params: Query parameters of the endpoint; ``cursor`` sets the starting page,
+            ``timeout`` and ``deadline`` are passed to every request
+    """
+    endpoint = PAGE_KINDS[kind][0]
+    fields = _fields(kind, fields)
+    timeout, deadline = params.pop("timeout", None), params.pop("deadline", None)
+    while True:
+        response = client._request(
+            "GET", endpoint, params=params, timeout=timeout, deadline=deadline
+        )
+        if client.decoder is None:
+            page = ColumnPage(*decode_page(kind, response.content, fields))
+        else:
+            page = client.decoder.columns(kind, response.content, fields)
+        yield page
+        if not page.cursor or not page:
+            return
+        params["cursor"] = page.cursor
+
+
+async def aiter_column_pages(
+    client: "AsyncKalshiClient",
+    kind: str,
+    fields: Sequence[str] | None = None,
+    **params: Any,
+) -> AsyncIterator[ColumnPage]:
+    """Async counterpart of ``iter_column_pages`` for ``AsyncKalshiClient``."""
+    endpoint = PAGE_KINDS[kind][0]
+    fields = _fields(kind, fields)
+    timeout, deadline = params.pop("timeout", None), params.pop("deadline", None)
+    while True:
+        response = await client._request(
+            "GET", endpoint, params=params, timeout=timeout, deadline=deadline
+        )
+        if client.decoder is None:
+            page = ColumnPage(*decode_page(kind, response.content, fields))
+        else:
+            page = await client.decoder.acolumns(kind, response.content, fields)
+        yield page
+        if not page.cursor or not page:
+            return
+        params["cursor"] = page.cursor
@@ -0,0 +1,210 @@
+from collections.abc import Iterable, Mapping
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from .models import KalshiBaseModel, Market, OrderBook, OrderBookLevel, Position
+
+DeltaKind = Literal["market", "orderbook", "position"]
+DeltaOp = Literal["new", "update", "delete"]
+
+
+class SnapshotDelta(KalshiBaseModel):
+    """Compact change record between two snapshots of the same record.
+
+    ``changes`` holds only the new values of fields that changed. For order books
+    it maps ``"yes"``/``"no"`` to ``{price: quantity}``, where a quantity of 0
+    means the level was removed.
+    """
+
+    kind: DeltaKind
+    key: str
+    op: DeltaOp
+    changes: dict[str, Any] = Field(default_factory=dict)
+
+
+def field_changes(old: Mapping[str, Any], new: Mapping[str, Any]) -> dict[str, tuple[Any, Any]]:
+    """Map each field whose value differs between two dumps to ``(old, new)``."""
+    changes = {
+        field: (old.get(field), value)
+        for field, value in new.items()
+        if field not in old or old[field] != value
+    }
+    for field in old.keys() - new.keys():
+        changes[field] = (old[field], None)
+    return changes
+
+
+def _levels(levels: Iterable[OrderBookLevel | Mapping[str, int]]) -> dict[int, int]:
+    result = {}
+    for level in levels:
+        if isinstance(level, Mapping):
+            result[level["price"]] = level["quantity"]
+        else:
+            result[level.price] = level.quantity
+    return result
+
+
+def level_changes(old: Mapping[int, int], new: Mapping[int, int]) -> dict[int, int]:
+    """Price-level delta: new quantity per changed price, 0 for removed levels."""
+    changes = {price: qty for price, qty in new.items() if old.get(price) != qty}
+    for price in old.keys() - new.keys():
+        changes[price] = 0
+    return changes
+
+
+def diff_market(old: Market | None, new: Market) -> SnapshotDelta | None:
+    return _diff_model("market", new.ticker, old, new)
+
+
+def diff_position(old: Position | None, new: Position) -> SnapshotDelta | None:
+    return _diff_model("position", new.ticker, old, new)
+
+
+def diff_order_book(ticker: str, old: OrderBook | None, new: OrderBook) -> SnapshotDelta | None:
+    new_book = {"yes": _levels(new.yes), "no": _levels(new.no)}
+    if old is None:
+        return SnapshotDelta(kind="orderbook", key=ticker, op="new", changes=new_book)
+    old_book = {"yes": _levels(old.yes), "no": _levels(old.no)}
+    return _book_delta(ticker, old_book, new_book)
+
+
+def _diff_model(
+    kind: DeltaKind, key: str, old: BaseModel | None, new: BaseModel
+) -> SnapshotDelta | None:
+    new_dump = new.model_dump(mode="json")
+    if old is None:
+        return SnapshotDelta(kind=kind, key=key, op="new", changes=new_dump)
+    changes = field_changes(old.model_dump(mode="json"), new_dump)
+    if not changes:
+        return None
+    return SnapshotDelta(
+        kind=kind, key=key, op="update", changes={f: v for f, (_, v) in changes.items()}
+    )
+
+
+def _book_delta(
+    ticker: str, old: Mapping[str, dict[int, int]], new: Mapping[str, dict[int, int]]
+) -> SnapshotDelta | None:
+    changes = {}
+    for side in ("yes", "no"):
+        side_changes = level_changes(old[side], new[side])
+        if side_changes:
+            changes[side] = side_changes
+    if not changes:
+        return None
+    return SnapshotDelta(kind="orderbook", key=ticker, op="update", changes=changes)
+
+
+def apply_delta(snapshot: dict[str, Any] | None, delta: SnapshotDelta) -> dict[str, Any] | None:
+    """Apply a delta to a plain-dict replica and return the new replica."""
+    if delta.op == "delete":
+        return None
+    if delta.op == "new" or snapshot is None:
+        if delta.kind == "orderbook":
+            return {
+                side: {int(price): qty for price, qty in levels.items()}
+                for side, levels in delta.changes.items()
+            }
+        return dict(delta.changes)
+    if delta.kind == "orderbook":
+        result = {side: dict(levels) for side, levels in snapshot.items()}
+        for side, levels in delta.changes.items():
+            book_side = result.setdefault(side, {})
+            for price, qty in levels.items():
+                if qty:
+                    book_side[int(price)] = qty
+                else:
+                    book_side.pop(int(price), None)
+        return result
+    return {**snapshot, **delta.changes}
+
+
+class SnapshotDiffer:
+    """Keeps the last snapshot per ticker and emits deltas for successive polls.
+
+    Records are compared by their serialized JSON bytes first, so unchanged
+    records cost a byte comparison instead of a field-by-field walk. ``diff_raw``
+    takes the raw per-record payloads straight off the wire and only validates
+    the ones whose bytes changed.
+
+    Args:
+        kind: Record kind, one of ``"market"``, ``"orderbook"`` or ``"position"``
+    """
+
+    _models: dict[str, type[BaseModel]] = {
+        "market": Market,
+        "orderbook": OrderBook,
+        "position": Position,
+    }
+
+    def __init__(self, kind: DeltaKind):
+        if kind not in self._models:
+            raise ValueError(f"Unknown snapshot kind: {kind}")
+        self.kind = kind
+        self._model = self._models[kind]
+        self._raw: dict[str, bytes] = {}
+        self._state: dict[str, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._state
+
+    def snapshot(self, key: str) -> dict[str, Any] | None:
+        return self._state.get(key)
+
+    def update(self, key: str, record: BaseModel) -> SnapshotDelta | None:
+        raw = record.__pydantic_serializer__.to_json(record)
+        if self._raw.get(key) == raw:
+            return None
+        return self._update(key, raw, record)
+
+    def update_raw(self, key: str, payload: bytes) -> SnapshotDelta | None:
+        if self._raw.get(key) == payload:
+            return None
+        return self._update(key, payload, self._model.model_validate_json(payload))
+
+    def diff(self, records: Iterable[BaseModel]) -> list[SnapshotDelta]:
+        """Diff a batch of markets or positions keyed by their ticker."""
+        deltas = []
+        for record in records:
+            delta = self.update(record.ticker, record)
+            if delta is not None:
+                deltas.append(delta)
+        return deltas
+
+    def diff_raw(self, payloads: Mapping[str, bytes]) -> list[SnapshotDelta]:
+        deltas = []
+        for key, payload in payloads.items():
+            delta = self.update_raw(key, payload)
+            if delta is not None:
+                deltas.append(delta)
+        return deltas
+
+    def remove(self, key: str) -> SnapshotDelta | None:
+        self._raw.pop(key, None)
+        if self._state.pop(key, None) is None:
+            return None
+        return SnapshotDelta(kind=self.kind, key=key, op="delete")
+
+    def _update(self, key: str, raw: bytes, record: BaseModel) -> SnapshotDelta | None:
+        if self.kind == "orderbook":
+            new_state = {"yes": _levels(record.yes), "no": _levels(record.no)}
+        else:
+            new_state = record.model_dump(mode="json")
+        old_state = self._state.get(key)
+        self._raw[key] = raw
+        self._state[key] = new_state
+
+        if old_state is None:
+            return SnapshotDelta(kind=self.kind, key=key, op="new", changes=new_state)
+        if self.kind == "orderbook":
+            return _book_delta(key, old_state, new_state)
+        changes = field_changes(old_state, new_state)
+        if not changes:
+            return None
+        return SnapshotDelta(
+            kind=self.kind, key=key, op="update", changes={f: v for f, (_, v) in changes.items()}
+        )
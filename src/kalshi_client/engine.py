@@ -0,0 +1,121 @@
+"""Background event loop that lets synchronous code run requests on asyncio.
+
+A ``KalshiClient`` created with ``engine=`` (or ``config.async_engine``)
+sends its requests through an ``AsyncKalshiClient`` on the engine's loop, so
+any number of calling threads share one ``httpx.AsyncClient`` instead of
+each blocking a worker thread per request. Blocking methods still block the
+caller; ``submit_*`` methods return ``concurrent.futures.Future`` objects and
+``map`` runs a method over many inputs concurrently on the loop.
+
+Several clients can share one engine; an engine created by a client from its
+config is closed with that client.
+
+Example:
+    with KalshiClient(engine=AsyncEngine()) as client:
+        markets = client.map(client.get_market, tickers)
+        book = client.submit_get_market_order_book(tickers[0])
+        print(book.result().yes)
+"""
+
+import asyncio
+import contextvars
+import threading
+from collections.abc import Coroutine, Iterable
+from concurrent.futures import Future
+from typing import Any
+
+
+async def _in_context[T](coro: Coroutine[Any, Any, T], context: contextvars.Context) -> T:
+    # Run in the caller's context so request_priority() and trace scopes apply
+    return await asyncio.get_running_loop().create_task(coro, context=context)
+
+
+async def _gather(coros: list[Coroutine[Any, Any, Any]]) -> list:
+    return await asyncio.gather(*coros, return_exceptions=True)
+
+
+class AsyncEngine:
+    """An asyncio event loop running in a daemon thread.
+
+    Args:
+        name: Name of the loop thread
+    """
+
+    def __init__(self, name: str = "kalshi-engine"):
+        self.loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def submit[T](self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule ``coro`` on the loop and return a future of its result.
+
+        Cancelling the future cancels the coroutine.
+        """
+        if not self.running:
+            coro.close()
+            raise RuntimeError("the engine is closed")
+        context = contextvars.copy_context()
+        return asyncio.run_coroutine_threadsafe(_in_context(coro, context), self.loop)
+
+    def run[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the loop and wait for its result.
+
+        Raises:
+            RuntimeError: If called from the loop thread, which would deadlock
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("blocking call from the engine's own event loop")
+        future = self.submit(coro)
+        try:
+            return future.result()
+        except BaseException:
+            # e.g. KeyboardInterrupt in the caller: do not leave the request running
+            future.cancel()
+            raise
+
+    def run_all(self, coros: Iterable[Coroutine[Any, Any, Any]]) -> list:
+        """Run ``coros`` concurrently on the loop and wait for all of them.
+
+        Returns their outcomes in order, with the exception in place of the
+        result of any that failed.
+        """
+        return self.run(_gather(list(coros)))
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop the loop, cancelling anything still running on it, and join the thread."""
+        if not self.running:
+            return
+        self.loop.call_soon_threadsafe(self._cancel_all)
+        self._thread.join(timeout)
+
+    def _cancel_all(self) -> None:
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        if not tasks:
+            self.loop.stop()
+            return
+        gathered = asyncio.gather(*tasks, return_exceptions=True)
+        gathered.add_done_callback(lambda _: self.loop.stop())
+
+    def __enter__(self) -> "AsyncEngine":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
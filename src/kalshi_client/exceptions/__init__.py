@@ -1,5 +1,8 @@
 from .api_errors import KalshiAPIError
 from .auth_errors import KalshiAuthError
+from .circuit_errors import KalshiCircuitOpenError
+from .deadline_errors import KalshiDeadlineExceededError
+from .queue_errors import KalshiQueueFullError
 from .rate_limit_errors import KalshiRateLimitError
 from .resource_errors import KalshiNotFoundError
 from .server_errors import KalshiServerError
@@ -12,4 +15,7 @@ __all__ = [
     "KalshiValidationError",
     "KalshiNotFoundError",
     "KalshiServerError",
+    "KalshiQueueFullError",
+    "KalshiCircuitOpenError",
+    "KalshiDeadlineExceededError",
 ]
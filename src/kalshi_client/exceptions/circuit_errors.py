@@ -0,0 +1,8 @@
+from .api_errors import KalshiAPIError
+
+
+class KalshiCircuitOpenError(KalshiAPIError):
+    def __init__(self, group: str, retry_after: float = 0.0):
+        super().__init__(f"Circuit open for {group} requests; retry in {retry_after:.1f}s")
+        self.group = group
+        self.retry_after = retry_after
@@ -0,0 +1,6 @@
+from .api_errors import KalshiAPIError
+
+
+class KalshiDeadlineExceededError(KalshiAPIError):
+    def __init__(self, message: str = "Deadline exceeded before the request was sent"):
+        super().__init__(message)
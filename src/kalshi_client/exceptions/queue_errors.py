@@ -0,0 +1,6 @@
+from .api_errors import KalshiAPIError
+
+
+class KalshiQueueFullError(KalshiAPIError):
+    def __init__(self, message: str = "Request queue is full"):
+        super().__init__(message)
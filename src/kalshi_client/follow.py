@@ -0,0 +1,126 @@
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+
+import httpx
+
+from .exceptions import KalshiRateLimitError, KalshiServerError
+from .models import ObjectList, Trade
+
+# Errors a follower rides out by polling again later
+TRANSIENT_ERRORS = (KalshiRateLimitError, KalshiServerError, httpx.TransportError)
+
+# Weight of the latest poll in the smoothed trade rate
+_RATE_SMOOTHING = 0.3
+
+
+class TradeFollower:
+    """Polling state of ``follow_trades``: high-water marks, seen trades and the interval.
+
+    Each followed ticker (``None`` for the whole tape) has a high-water mark,
+    the newest ``created_time`` seen. A poll asks for ``min_ts`` at that mark;
+    ``min_ts`` is in whole seconds, so trades from the mark's second come back
+    and are dropped by a ring of the last ``dedupe_window`` trade ids. Pages
+    arrive newest first, so paging stops at the first trade that is already
+    known, and a burst is paged through until the follower has caught up.
+
+    The polling interval follows the observed trade rate, smoothed over
+    polls: about one expected trade per poll, kept between ``min_interval``
+    and ``max_interval``.
+
+    Args:
+        tickers: Markets to follow (the whole tape if None)
+        poll_interval: Interval before a trade rate has been observed, in seconds
+        min_interval: Shortest polling interval, in seconds
+        max_interval: Longest polling interval, in seconds
+        since: Oldest trade time to yield (now if None)
+        dedupe_window: Trade ids remembered for deduplication
+        clock: Monotonic clock, injectable for tests
+    """
+
+    def __init__(  # noqa: PLR0913 - the options after poll_interval are keyword-only
+        self,
+        tickers: Iterable[str] | None = None,
+        poll_interval: float = 1.0,
+        *,
+        min_interval: float = 0.1,
+        max_interval: float = 10.0,
+        since: datetime | None = None,
+        dedupe_window: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("min_interval must be positive and not exceed max_interval")
+        if dedupe_window < 1:
+            raise ValueError("dedupe_window must be at least 1")
+        since = since or datetime.now(UTC)
+        keys: list[str | None] = [None] if tickers is None else list(dict.fromkeys(tickers))
+        self.high_water: dict[str | None, datetime] = dict.fromkeys(keys, since)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min(max(poll_interval, min_interval), max_interval)
+        self.rate: float | None = None
+        self._recent: deque[str] = deque()
+        self._seen: set[str] = set()
+        self._dedupe_window = dedupe_window
+        self._clock = clock
+        self._last_poll: float | None = None
+
+    def params(self, key: str | None) -> dict[str, int | str]:
+        """Query parameters of the next ``get_trades`` call for ``key``."""
+        params: dict[str, int | str] = {"min_ts": int(self.high_water[key].timestamp())}
+        if key is not None:
+            params["ticker"] = key
+        return params
+
+    def sift(self, key: str | None, page: ObjectList[Trade]) -> tuple[list[Trade], bool]:
+        """Split a page into unseen trades, and whether ``key`` has caught up.
+
+        Trades are returned newest first, as on the page.
+        """
+        mark = self.high_water[key]
+        fresh = []
+        for trade in page:
+            if trade.trade_id in self._seen or trade.created_time < mark:
+                return fresh, True
+            fresh.append(trade)
+        return fresh, not page.cursor or not page
+
+    def commit(self, key: str | None, fresh: list[Trade]) -> None:
+        """Remember the trades of a completed poll of ``key`` and advance its mark."""
+        for trade in fresh:
+            if trade.trade_id in self._seen:
+                continue
+            self._seen.add(trade.trade_id)
+            self._recent.append(trade.trade_id)
+            if len(self._recent) > self._dedupe_window:
+                self._seen.discard(self._recent.popleft())
+        if fresh:
+            self.high_water[key] = max(self.high_water[key], *(t.created_time for t in fresh))
+
+    def observe(self, new_trades: int) -> float:
+        """Fold a poll's trade count into the rate and return the next interval."""
+        now = self._clock()
+        if self._last_poll is not None and now > self._last_poll:
+            rate = new_trades / (now - self._last_poll)
+            if self.rate is None:
+                self.rate = rate
+            else:
+                self.rate += _RATE_SMOOTHING * (rate - self.rate)
+            self.interval = self.max_interval if self.rate <= 0 else 1 / self.rate
+            self.interval = min(max(self.interval, self.min_interval), self.max_interval)
+        self._last_poll = now
+        return self.interval
+
+    def backoff(self) -> float:
+        """Interval to wait after a transient error."""
+        self.interval = min(self.max_interval, self.interval * 2)
+        return self.interval
+
+
+def in_order(batches: Iterable[list[Trade]]) -> list[Trade]:
+    """Merge newest-first batches from one poll into a single oldest-first list."""
+    trades = [trade for batch in batches for trade in reversed(batch)]
+    trades.sort(key=lambda trade: trade.created_time)
+    return trades
@@ -0,0 +1,111 @@
+import threading
+from collections import deque
+from collections.abc import Iterable
+
+from .metrics import normalize_endpoint
+from .rate_limit import RateLimiter
+
+# Reads on the quoting path; other endpoints can be opted in by normalized path
+DEFAULT_HEDGED_ENDPOINTS = frozenset({"/markets/{ticker}", "/markets/{ticker}/orderbook"})
+
+
+class HedgePolicy:
+    """When to send a duplicate of a slow idempotent GET.
+
+    A GET to one of ``endpoints`` that has not completed after the hedge delay
+    is sent a second time, on another pooled connection, and whichever
+    response arrives first is used. The delay is ``delay`` when given,
+    otherwise the ``quantile`` of the endpoint's last ``window`` latencies;
+    until ``min_samples`` latencies have been seen the endpoint is not hedged.
+
+    Load amplification is bounded by a credit budget: every hedgeable request
+    earns ``max_ratio`` credit, up to ``burst``, and every hedge spends one, so
+    over time hedges stay below ``max_ratio`` of requests. Hedges go through
+    the client's rate limiter like any other request, and none is sent while
+    the limiter has no spare token.
+
+    Args:
+        delay: Fixed hedge delay in seconds (derived from latencies if None)
+        quantile: Latency quantile used as the delay when ``delay`` is None
+        endpoints: Normalized endpoints to hedge, e.g. ``"/markets/{ticker}"``
+        window: Latencies kept per endpoint
+        min_samples: Latencies needed before a derived delay is used
+        min_delay: Lower bound of a derived delay, in seconds
+        max_ratio: Hedges per request allowed over time
+        burst: Maximum unspent hedge credit
+    """
+
+    def __init__(  # noqa: PLR0913 - the options after delay are keyword-only
+        self,
+        delay: float | None = None,
+        *,
+        quantile: float = 0.95,
+        endpoints: Iterable[str] = DEFAULT_HEDGED_ENDPOINTS,
+        window: int = 200,
+        min_samples: int = 20,
+        min_delay: float = 0.001,
+        max_ratio: float = 0.1,
+        burst: float = 10.0,
+    ):
+        if delay is not None and delay < 0:
+            raise ValueError("delay must not be negative")
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+        if max_ratio <= 0:
+            raise ValueError("max_ratio must be positive")
+        self.delay = delay
+        self.quantile = quantile
+        self.endpoints = frozenset(endpoints)
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.burst = burst
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+        self._credit = burst
+        self._latencies: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def applies(self, endpoint: str) -> bool:
+        return normalize_endpoint(endpoint) in self.endpoints
+
+    def begin(self, endpoint: str) -> float | None:
+        """Account for a hedgeable request and return its hedge delay (None: don't hedge)."""
+        with self._lock:
+            self.requests += 1
+            self._credit = min(self.burst, self._credit + self.max_ratio)
+            if self.delay is not None:
+                return self.delay
+            latencies = self._latencies.get(normalize_endpoint(endpoint))
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            ordered = sorted(latencies)
+        value = ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+        return max(self.min_delay, value)
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of one attempt (primary or hedge)."""
+        key = normalize_endpoint(endpoint)
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.window)
+            latencies.append(seconds)
+
+    def try_hedge(self, rate_limiter: RateLimiter | None = None) -> bool:
+        """Spend hedge credit if there is enough, and a rate token is spare."""
+        if rate_limiter is not None and rate_limiter.time_until_available() > 0:
+            return False
+        with self._lock:
+            if self._credit < 1:
+                return False
+            self._credit -= 1
+            self.hedges += 1
+            return True
+
+    def record_win(self) -> None:
+        """Note that the hedge answered before the primary."""
+        with self._lock:
+            self.wins += 1
@@ -1,18 +1,34 @@
 import base64
+import contextvars
 import hashlib
+import inspect
+import logging
+import threading
 import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
-from .configs.kalshi_configs import KalshiConfig
+from .circuit_breaker import CircuitBreaker, CircuitBreakers
+from .deadlines import TimeoutTypes, request_timeout, time_left
 from .exceptions import (
     KalshiAPIError,
     KalshiAuthError,
+    KalshiDeadlineExceededError,
     KalshiNotFoundError,
     KalshiRateLimitError,
     KalshiServerError,
     KalshiValidationError,
 )
+from .follow import TRANSIENT_ERRORS, TradeFollower, in_order
+from .hedging import HedgePolicy
+from .ledger import InFlightOrder, OrderLedger, new_client_order_id
+from .metrics import ClientMetrics
 from .models import (
     Event,
     Market,
@@ -24,20 +40,150 @@ from .models import (
     Position,
     Trade,
 )
+from .order_template import OrderTemplate
+from .pagination import paginate
+from .rate_limit import RateLimiter, SharedTokenBucket, TokenBucket
+from .scheduler import Priority, PriorityDispatcher, classify
+from .tracing import (
+    RequestTrace,
+    TraceCollector,
+    adopt_attempts,
+    attempt_scope,
+    collect_traces,
+    start_trace,
+    trace_phase,
+    traced,
+    use_scope,
+)
+
+if TYPE_CHECKING:
+    from .async_client import AsyncKalshiClient
+    from .configs.kalshi_configs import KalshiConfig
+    from .decode import DecodeExecutor
+    from .engine import AsyncEngine
 
 # HTTP Status Code Constants
 HTTP_BAD_REQUEST = 400
 HTTP_UNAUTHORIZED = 401
 HTTP_NOT_FOUND = 404
+HTTP_CONFLICT = 409
 HTTP_TOO_MANY_REQUESTS = 429
 HTTP_INTERNAL_SERVER_ERROR = 500
 
+# Requests under this prefix (orders, balance, positions) use the trading pool
+TRADING_PREFIX = "/portfolio"
+
+# Pauses before each lookup of an order whose submission failed ambiguously:
+# an accepted order can take a moment to appear in GET /portfolio/orders
+ORDER_LOOKUP_DELAYS = (0.0, 0.1, 0.3)
+# Seconds before its local submission time that an order is searched from,
+# so a local clock ahead of the exchange's created_time cannot hide it
+ORDER_LOOKUP_SKEW = 300
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _Call:
+    """Breaker probe, trace and timings of one request through either client's pipeline."""
 
-class KalshiClient:
-    def __init__(self, config: KalshiConfig | None = None):
-        self.config = config or KalshiConfig()
+    method: str
+    endpoint: str
+    breaker: CircuitBreaker | None = None
+    probe: bool = False
+    trace: RequestTrace | None = None
+    start: float = 0.0
+    sent: float = 0.0
+
+
+class BaseKalshiClient:
+    """Configuration, signing, error mapping and instrumentation shared by the sync and async clients."""
+
+    def __init__(  # noqa: PLR0913 - the options after config are keyword-only
+        self,
+        config: "KalshiConfig | None" = None,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        metrics: ClientMetrics | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        decoder: "DecodeExecutor | None" = None,
+    ):
+        if config is None:
+            # Deferred with the engine and checkpoints: pydantic-settings imports asyncio
+            from .configs.kalshi_configs import KalshiConfig  # noqa: PLC0415
+
+            config = KalshiConfig()
+        self.config = config
         self.base_url = self.config.api_url
-        self.client = httpx.Client(timeout=self.config.timeout)
+        if rate_limiter is None and self.config.rate_limit:
+            if self.config.rate_limit_file:
+                rate_limiter = SharedTokenBucket(
+                    self.config.rate_limit_file, self.config.rate_limit
+                )
+            else:
+                rate_limiter = TokenBucket(self.config.rate_limit)
+        self.rate_limiter = rate_limiter
+        self.order_ledger = OrderLedger()
+        if metrics is None and self.config.enable_metrics:
+            metrics = ClientMetrics()
+        self.metrics = metrics
+        if hedge_policy is None and (
+            self.config.hedge_delay is not None or self.config.hedge_quantile is not None
+        ):
+            hedge_policy = HedgePolicy(
+                self.config.hedge_delay, quantile=self.config.hedge_quantile or 0.95
+            )
+        self.hedge_policy = hedge_policy
+        if circuit_breakers is None and self.config.circuit_breaker:
+            circuit_breakers = CircuitBreakers(metrics)
+        self.circuit_breakers = circuit_breakers
+        # A decoder created from the config is shut down with the client
+        self._owns_decoder = decoder is None and bool(self.config.decode_workers)
+        if self._owns_decoder:
+            from .decode import DecodeExecutor  # noqa: PLC0415 - only used with decode workers
+
+            decoder = DecodeExecutor(self.config.decode_workers)
+        self.decoder = decoder
+        self.trace_hooks: list[Callable[[RequestTrace], None]] = []
+        self._trading_last_used = 0.0
+
+    def _trading_limits(self) -> httpx.Limits:
+        # Idle trading connections stay open until the server closes them; the
+        # keep-alive heartbeat stops that from happening while the client is quiet
+        connections = self.config.trading_connections
+        return httpx.Limits(
+            max_connections=connections,
+            max_keepalive_connections=connections,
+            keepalive_expiry=None,
+        )
+
+    def _warm_up_requests(
+        self, n_connections: int, market_data: bool
+    ) -> list[tuple[str, dict | None]]:
+        if n_connections < 1:
+            raise ValueError("n_connections must be at least 1")
+        requests: list[tuple[str, dict | None]] = [("/portfolio/balance", None)] * n_connections
+        if market_data and self.config.trading_connections:
+            requests += [("/markets", {"limit": 1})] * n_connections
+        return requests
+
+    def add_trace_hook(self, hook: Callable[[RequestTrace], None]) -> None:
+        """Call ``hook(trace)`` with the phase timings of every request made from now on."""
+        self.trace_hooks.append(hook)
+
+    def remove_trace_hook(self, hook: Callable[[RequestTrace], None]) -> None:
+        self.trace_hooks.remove(hook)
+
+    def trace(self) -> AbstractContextManager[TraceCollector]:
+        """Collect the ``RequestTrace`` of every request made inside the block.
+
+        Example:
+            with client.trace() as traces:
+                client.create_order(...)
+            print(traces.traces[0].durations)
+        """
+        return collect_traces(self.trace_hooks)
 
     def _generate_signature(self, timestamp: str, method: str, path: str, body: str = "") -> str:
         msg_string = f"{timestamp}{method}{path}{body}"
@@ -48,7 +194,9 @@ class KalshiClient:
         ).decode("utf-8")
         return signature
 
-    def _get_headers(self, method: str, path: str, body: dict | None = None) -> dict[str, str]:
+    def _get_headers(
+        self, method: str, path: str, body: dict | str | None = None
+    ) -> dict[str, str]:
         timestamp = str(int(time.time() * 1000))
         body_str = "" if body is None else str(body)
 
@@ -60,24 +208,8 @@ class KalshiClient:
         }
         return headers
 
-    def _request(
-        self,
-        method: str,
-        endpoint: str,
-        params: dict | None = None,
-        json: dict | None = None
-    ) -> httpx.Response:
-        url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers(method.upper(), endpoint, json)
-
-        response = self.client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            params=params,
-            json=json,
-        )
-
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
         if response.status_code == HTTP_BAD_REQUEST:
             raise KalshiValidationError(f"Validation error: {response.text}")
         elif response.status_code == HTTP_UNAUTHORIZED:
@@ -92,19 +224,521 @@ class KalshiClient:
             raise KalshiAPIError(
                 f"API error: {response.text}",
                 status_code=response.status_code,
-                response_text=response.text
+                response_text=response.text,
+            )
+
+    # Request pipeline steps shared by the sync and async ``_request``
+    def _begin(self, method: str, endpoint: str, deadline: float | None) -> _Call:
+        """Check the deadline and the endpoint's breaker, then start tracing the request."""
+        time_left(deadline)
+        call = _Call(method, endpoint)
+        if self.circuit_breakers is not None:
+            call.breaker = self.circuit_breakers.for_request(method, endpoint)
+            call.probe = call.breaker.allow()
+        call.trace = start_trace(method, endpoint)
+        if endpoint.startswith(TRADING_PREFIX):
+            self._trading_last_used = time.monotonic()
+        return call
+
+    def _route(self, endpoint: str) -> tuple[Any, Any]:
+        """HTTP client and concurrency limit of an endpoint: the trading pair for ``/portfolio``.
+
+        A dispatcher replaces the shared limit (None is returned for it) but not
+        the cap of a dedicated trading pool.
+        """
+        if self.trading_client is not None and endpoint.startswith(TRADING_PREFIX):
+            return self.trading_client, self._trading_concurrency
+        return self.client, self._concurrency if self.dispatcher is None else None
+
+    def _prepare(  # noqa: PLR0913, PLR0917 - the request options, passed straight through
+        self,
+        call: _Call,
+        client: httpx.Client | httpx.AsyncClient,
+        params: dict | None,
+        json: dict | None,
+        content: bytes | None,
+        signed_body: str | None,
+        timeout: TimeoutTypes,
+        deadline: float | None,
+    ) -> dict[str, Any]:
+        """Keyword arguments of ``client.request``, signed once a request slot is held."""
+        request_kwargs: dict[str, Any] = {"params": params}
+        if content is None:
+            request_kwargs["json"] = json
+        else:
+            # Pre-encoded body: signed_body is the text the body would have been signed as
+            request_kwargs["content"] = content
+            json = signed_body
+        if call.trace is not None:
+            on_event = (
+                call.trace.aon_httpcore_event
+                if isinstance(client, httpx.AsyncClient)
+                else call.trace.on_httpcore_event
+            )
+            request_kwargs["extensions"] = {"trace": on_event}
+        per_request = request_timeout(client.timeout, timeout, deadline)
+        if per_request is not None:
+            request_kwargs["timeout"] = per_request
+        with trace_phase("sign"):
+            request_kwargs["headers"] = self._get_headers(call.method.upper(), call.endpoint, json)
+        call.sent = time.perf_counter()
+        return request_kwargs
+
+    def _finish(
+        self, call: _Call, response: httpx.Response | None, error: Exception | None = None
+    ) -> None:
+        """Record a request's outcome with its breaker, trace and metrics."""
+        if call.breaker is not None:
+            call.breaker.record(time.perf_counter() - call.sent, error, call.probe)
+        if call.trace is not None:
+            if error is not None:
+                call.trace.error = type(error).__name__
+            call.trace.status_code = getattr(response, "status_code", None)
+            call.trace.finish_network()
+        if self.metrics is not None:
+            self._record_metrics(call.method, call.endpoint, call.start, response, error)
+
+    @staticmethod
+    def _abandon(call: _Call, error: BaseException) -> None:
+        """Release the breaker probe of a request given up before it was sent (or cancelled)."""
+        if call.breaker is not None:
+            call.breaker.record(0.0, error, call.probe)
+
+    def _record_metrics(
+        self,
+        method: str,
+        endpoint: str,
+        start: float,
+        response: httpx.Response | None,
+        error: BaseException | None = None,
+    ) -> None:
+        duration = time.perf_counter() - start
+        bytes_sent = bytes_received = 0
+        if response is not None:
+            bytes_sent = len(response.request.content)
+            bytes_received = len(response.content)
+        self.metrics.record(method.upper(), endpoint, duration, bytes_sent, bytes_received, error)
+
+    # Order submission steps shared by the sync and async ``_submit_order``
+    def _may_resubmit(
+        self, entry: InFlightOrder, retries: int, deadline: float | None, error: BaseException
+    ) -> bool:
+        """Whether an order with an unknown outcome may be looked up and resent.
+
+        If not, it is left ``"unknown"`` in the ledger.
+        """
+        if entry.attempts > retries or (deadline is not None and time.monotonic() >= deadline):
+            self.order_ledger.mark_unknown(entry.client_order_id, error)
+            return False
+        return True
+
+    @staticmethod
+    def _order_lookup_delays(deadline: float | None) -> Iterator[float]:
+        """Pauses before each lookup of an order; retries stop short of ``deadline``."""
+        for attempt, delay in enumerate(ORDER_LOOKUP_DELAYS):
+            if attempt and deadline is not None and time.monotonic() + delay >= deadline:
+                return
+            yield delay
+
+    @staticmethod
+    def _is_resent_duplicate(entry: InFlightOrder, error: KalshiAPIError) -> bool:
+        """Whether ``error`` rejects a resend because an earlier attempt created the order."""
+        return error.status_code == HTTP_CONFLICT and entry.attempts > 1
+
+    @staticmethod
+    def _order_lookup_params(ticker: str, since: float) -> dict[str, Any]:
+        """``get_orders`` parameters covering every order of ``ticker`` since ``since``."""
+        return {"ticker": ticker, "min_ts": int(since) - ORDER_LOOKUP_SKEW, "limit": 1000}
+
+    @staticmethod
+    def _parse_order_id(response: httpx.Response) -> str:
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            order = Order(**data["order"])
+        return order.order_id
+
+    @staticmethod
+    def _order_created(
+        status_code: int | None, order_id: str | None, client_order_id: str | None
+    ) -> OrderCreatedResponse:
+        return OrderCreatedResponse(
+            success=True,
+            message="Order created successfully",
+            status_code=status_code,
+            order_id=order_id,
+            client_order_id=client_order_id,
+        )
+
+
+def _submitter(name: str) -> Callable[..., Future]:
+    def submit(self: "KalshiClient", *args: Any, **kwargs: Any) -> Future:
+        return self.submit(getattr(self, name), *args, **kwargs)
+
+    submit.__name__ = submit.__qualname__ = f"submit_{name}"
+    submit.__doc__ = f"Start ``{name}`` and return a ``Future`` of its result (see ``submit``)."
+    return submit
+
+
+def _outcomes(futures: list[Future]) -> list:
+    outcomes = []
+    for future in futures:
+        try:
+            outcomes.append(future.result())
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+
+def _mark_worker(worker: threading.local) -> None:
+    # Takes the client's thread-local, not the client, so idle workers keep no reference to it
+    worker.active = True
+
+
+class KalshiClient(BaseKalshiClient):
+    def __init__(  # noqa: PLR0913 - the options after config are keyword-only
+        self,
+        config: "KalshiConfig | None" = None,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        metrics: ClientMetrics | None = None,
+        transport: httpx.BaseTransport | None = None,
+        dispatcher: PriorityDispatcher | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        engine: "AsyncEngine | None" = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+        decoder: "DecodeExecutor | None" = None,
+    ):
+        super().__init__(
+            config,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+            hedge_policy=hedge_policy,
+            circuit_breakers=circuit_breakers,
+            decoder=decoder,
+        )
+        self.client = httpx.Client(timeout=self.config.timeout, transport=transport)
+        self._concurrency = threading.BoundedSemaphore(self.config.max_concurrency)
+        # With an engine, requests go through an AsyncKalshiClient on its loop
+        # (see ``kalshi_client.engine``); the engine is closed with the client
+        # only if the client created it
+        self._owns_engine = engine is None and self.config.async_engine
+        if self._owns_engine:
+            from .engine import AsyncEngine  # noqa: PLC0415
+
+            engine = AsyncEngine()
+        self.engine = engine
+        self.async_client: AsyncKalshiClient | None = None
+        if engine is not None:
+            if dispatcher is not None:
+                raise ValueError(
+                    "a PriorityDispatcher cannot schedule engine requests; "
+                    "set config.priority_scheduling instead"
+                )
+            self.async_client = self._engine_client(async_transport)
+        # When set, the dispatcher replaces the rate limiter and the shared
+        # concurrency limit; a dedicated trading pool keeps its own cap
+        elif dispatcher is None and self.config.priority_scheduling:
+            dispatcher = PriorityDispatcher(
+                self.config.max_concurrency, self.rate_limiter, metrics=self.metrics
+            )
+        self.dispatcher = dispatcher
+        # Dedicated pool for the order path; None routes it through ``self.client``
+        self.trading_client: httpx.Client | None = None
+        self._trading_concurrency = self._concurrency
+        if self.config.trading_connections:
+            self.trading_client = httpx.Client(
+                timeout=self.config.timeout, transport=transport, limits=self._trading_limits()
+            )
+            self._trading_concurrency = threading.BoundedSemaphore(self.config.trading_connections)
+        self._executor: ThreadPoolExecutor | None = None
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._worker = threading.local()
+        self._keepalive_thread: threading.Thread | None = None
+        self._keepalive_stop = threading.Event()
+        if self.config.keepalive_interval:
+            self.start_keepalive(self.config.keepalive_interval)
+
+    def _engine_client(self, transport: httpx.AsyncBaseTransport | None) -> "AsyncKalshiClient":
+        from .async_client import AsyncKalshiClient  # noqa: PLC0415 - it imports this module
+
+        # Shares the limiter, metrics, breakers, decoder, ledger and trace hooks of this client
+        client = AsyncKalshiClient(
+            self.config,
+            rate_limiter=self.rate_limiter,
+            metrics=self.metrics,
+            transport=transport,
+            hedge_policy=self.hedge_policy,
+            circuit_breakers=self.circuit_breakers,
+            decoder=self.decoder,
+        )
+        client.order_ledger = self.order_ledger
+        client.trace_hooks = self.trace_hooks
+        return client
+
+    def _request(  # noqa: PLR0913 - the options after params are keyword-only
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        *,
+        json: dict | None = None,
+        content: bytes | None = None,
+        signed_body: str | None = None,
+        hedge: bool = True,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> httpx.Response:
+        if self.async_client is not None:
+            if endpoint.startswith(TRADING_PREFIX):
+                self._trading_last_used = time.monotonic()
+            return self.engine.run(
+                self.async_client._request(
+                    method,
+                    endpoint,
+                    params,
+                    json=json,
+                    content=content,
+                    signed_body=signed_body,
+                    hedge=hedge,
+                    timeout=timeout,
+                    deadline=deadline,
+                )
             )
+        if (
+            hedge
+            and self.hedge_policy is not None
+            and method == "GET"
+            and self.hedge_policy.applies(endpoint)
+        ):
+            return self._hedged_get(endpoint, params, timeout, deadline)
+        call = self._begin(method, endpoint, deadline)
+        client, concurrency = self._route(endpoint)
+        priority = None
+        if self.dispatcher is not None:
+            priority = classify(method, endpoint)
+        elif self.rate_limiter is not None:
+            with trace_phase("rate_limit"):
+                left = None if deadline is None else deadline - time.monotonic()
+                if not self.rate_limiter.acquire(timeout=left):
+                    error = KalshiDeadlineExceededError(
+                        "Deadline exceeded while waiting for the rate limiter"
+                    )
+                    self._abandon(call, error)
+                    raise error
+
+        call.start = call.sent = time.perf_counter()
+        response = None
+        try:
+            with trace_phase("queue"):
+                self._acquire_slots(concurrency, priority, deadline)
+            try:
+                request_kwargs = self._prepare(
+                    call, client, params, json, content, signed_body, timeout, deadline
+                )
+                response = client.request(
+                    method=method, url=f"{self.base_url}{endpoint}", **request_kwargs
+                )
+            finally:
+                self._release_slots(concurrency, priority)
+            self._raise_for_status(response)
+        except Exception as e:
+            self._finish(call, response, e)
+            raise
+        except BaseException as e:
+            self._abandon(call, e)
+            raise
+
+        self._finish(call, response)
+        return response
+
+    def _acquire_slots(
+        self,
+        concurrency: threading.BoundedSemaphore | None,
+        priority: Priority | None,
+        deadline: float | None,
+    ) -> None:
+        """Take the endpoint's concurrency slot, then the dispatcher's (either may be absent)."""
+        left = time_left(deadline, "a request slot")
+        if concurrency is not None and not concurrency.acquire(timeout=left):
+            raise KalshiDeadlineExceededError("Deadline exceeded while waiting for a request slot")
+        if self.dispatcher is not None:
+            try:
+                self.dispatcher.acquire(priority, time_left(deadline, "a request slot"))
+            except BaseException:
+                if concurrency is not None:
+                    concurrency.release()
+                raise
+
+    def _release_slots(
+        self, concurrency: threading.BoundedSemaphore | None, priority: Priority | None
+    ) -> None:
+        if self.dispatcher is not None:
+            self.dispatcher.release(priority)
+        if concurrency is not None:
+            concurrency.release()
 
+    def _hedged_get(
+        self,
+        endpoint: str,
+        params: dict | None,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> httpx.Response:
+        """Send a GET, racing a duplicate against it once the hedge delay passes.
+
+        Both attempts run on the hedge pool. A synchronous request cannot be
+        interrupted, so the slower attempt is left to finish in the background
+        and its response discarded.
+        """
+        policy = self.hedge_policy
+        delay = policy.begin(endpoint)
+        args = (endpoint, params, timeout, deadline)
+        if delay is None:
+            return self._timed_get(*args)
+        executor = self._get_hedge_executor()
+        # Each attempt is traced in its own scope, adopted by the caller's afterwards
+        scopes: dict[Future, list[RequestTrace] | None] = {}
+
+        def attempt() -> Future:
+            scope = attempt_scope()
+            future = executor.submit(contextvars.copy_context().run, self._timed_get, *args, scope)
+            scopes[future] = scope
+            return future
+
+        used = None
+        try:
+            primary = attempt()
+            if wait([primary], timeout=delay).done or not policy.try_hedge(self.rate_limiter):
+                used = primary
+                return primary.result()
+            hedge = attempt()
+            pending = {primary, hedge}
+            error = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        if future is hedge:
+                            policy.record_win()
+                        used = future
+                        return future.result()
+                    error = error or future.exception()
+            raise error
+        finally:
+            adopt_attempts(scopes.values(), scopes.get(used))
+
+    def _timed_get(
+        self,
+        endpoint: str,
+        params: dict | None,
+        timeout: TimeoutTypes,
+        deadline: float | None,
+        scope: list[RequestTrace] | None = None,
+    ) -> httpx.Response:
+        start = time.perf_counter()
+        with use_scope(scope):
+            response = self._request(
+                "GET", endpoint, params=params, hedge=False, timeout=timeout, deadline=deadline
+            )
+        self.hedge_policy.record(endpoint, time.perf_counter() - start)
         return response
 
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=2 * self.config.max_concurrency,
+                    thread_name_prefix="kalshi-hedge",
+                )
+            return self._hedge_executor
+
+    def warm_up(self, n_connections: int = 1, *, market_data: bool = False) -> None:
+        """Open connections ahead of the first order so it skips DNS, TCP and TLS setup.
+
+        Sends ``n_connections`` concurrent ``GET /portfolio/balance`` requests
+        through the order path, leaving up to that many connections open in its
+        pool. With ``market_data`` and a dedicated trading pool, the shared pool
+        is primed the same way with ``GET /markets?limit=1``. Warm-up requests
+        count against the rate limiter and show up in metrics.
+
+        Raises:
+            KalshiAPIError: If a warm-up request fails, e.g. with bad credentials
+        """
+        requests = self._warm_up_requests(n_connections, market_data)
+        if len(requests) == 1:
+            self._request("GET", *requests[0])
+            return
+        with ThreadPoolExecutor(
+            max_workers=len(requests), thread_name_prefix="kalshi-warm-up"
+        ) as executor:
+            futures = [
+                executor.submit(self._request, "GET", endpoint, params)
+                for endpoint, params in requests
+            ]
+            for future in futures:
+                future.result()
+
+    def start_keepalive(self, interval: float, n_connections: int = 1) -> None:
+        """Keep the order path's connections open with a background heartbeat.
+
+        Whenever no ``/portfolio`` request has been sent for ``interval``
+        seconds, ``warm_up(n_connections)`` is called from a daemon thread, so
+        the first heartbeat goes out right away on a cold client. Failed
+        heartbeats are logged and retried after another interval. Without
+        ``config.trading_connections`` the shared pool drops connections after
+        five idle seconds, so ``interval`` should be shorter than that.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if n_connections < 1:
+            raise ValueError("n_connections must be at least 1")
+        self.stop_keepalive()
+        self._keepalive_stop.clear()
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive,
+            args=(interval, n_connections),
+            name="kalshi-keepalive",
+            daemon=True,
+        )
+        self._keepalive_thread.start()
+
+    def stop_keepalive(self, timeout: float | None = None) -> None:
+        self._keepalive_stop.set()
+        if self._keepalive_thread is not None:
+            self._keepalive_thread.join(timeout)
+            self._keepalive_thread = None
+
+    def _keepalive(self, interval: float, n_connections: int) -> None:
+        while True:
+            idle = time.monotonic() - self._trading_last_used
+            if idle < interval:
+                if self._keepalive_stop.wait(interval - idle):
+                    return
+                continue
+            try:
+                self.warm_up(n_connections)
+            except (KalshiAPIError, httpx.HTTPError) as e:
+                # A heartbeat refused before it was sent (e.g. by an open circuit
+                # breaker) leaves the order path idle, so wait before retrying
+                logger.warning("Keep-alive request failed: %s", e)
+                if self._keepalive_stop.wait(interval):
+                    return
+
     # Market Data Endpoints
-    def get_events(
+    @traced
+    def get_events(  # noqa: PLR0913 - one parameter per query field
         self,
         limit: int | None = None,
         cursor: str | None = None,
         status: str | None = None,
         series_ticker: str | None = None,
         with_nested_markets: bool | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
     ) -> ObjectList[Event]:
         params = {}
         if limit is not None:
@@ -118,21 +752,41 @@ class KalshiClient:
         if with_nested_markets is not None:
             params["with_nested_markets"] = with_nested_markets
 
-        response = self._request("GET", "/events", params=params)
-        data = response.json()
-        events = [Event(**event) for event in data.get("events", [])]
+        response = self._request(
+            "GET", "/events", params=params, timeout=timeout, deadline=deadline
+        )
+        if self.decoder is not None:
+            with trace_phase("decode"):
+                return self.decoder.decode("events", response.content, limit)
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            events = [Event(**event) for event in data.get("events", [])]
         return ObjectList(
             items=events,
             cursor=data.get("cursor"),
             has_more=len(events) == limit if limit else False
         )
 
-    def get_event(self, event_ticker: str) -> Event:
-        response = self._request("GET", f"/events/{event_ticker}")
-        data = response.json()
-        return Event(**data["event"])
+    @traced
+    def get_event(
+        self,
+        event_ticker: str,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> Event:
+        response = self._request(
+            "GET", f"/events/{event_ticker}", timeout=timeout, deadline=deadline
+        )
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            event = Event(**data["event"])
+        return event
 
-    def get_markets(
+    @traced
+    def get_markets(  # noqa: PLR0913, PLR0917 - one parameter per query field
         self,
         limit: int | None = None,
         cursor: str | None = None,
@@ -142,6 +796,9 @@ class KalshiClient:
         min_close_ts: int | None = None,
         status: str | None = None,
         tickers: list[str] | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
     ) -> ObjectList[Market]:
         params = {}
         if limit is not None:
@@ -161,37 +818,71 @@ class KalshiClient:
         if tickers is not None:
             params["tickers"] = ",".join(tickers)
 
-        response = self._request("GET", "/markets", params=params)
-        data = response.json()
-        markets = [Market(**market) for market in data.get("markets", [])]
+        response = self._request(
+            "GET", "/markets", params=params, timeout=timeout, deadline=deadline
+        )
+        if self.decoder is not None:
+            with trace_phase("decode"):
+                return self.decoder.decode("markets", response.content, limit)
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            markets = [Market(**market) for market in data.get("markets", [])]
         return ObjectList(
             items=markets,
             cursor=data.get("cursor"),
             has_more=len(markets) == limit if limit else False
         )
 
-    def get_market(self, ticker: str) -> Market:
-        response = self._request("GET", f"/markets/{ticker}")
-        data = response.json()
-        return Market(**data["market"])
+    @traced
+    def get_market(
+        self,
+        ticker: str,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> Market:
+        response = self._request("GET", f"/markets/{ticker}", timeout=timeout, deadline=deadline)
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            market = Market(**data["market"])
+        return market
 
-    def get_market_order_book(self, ticker: str, depth: int | None = None) -> OrderBook:
+    @traced
+    def get_market_order_book(
+        self,
+        ticker: str,
+        depth: int | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> OrderBook:
         params = {}
         if depth is not None:
             params["depth"] = depth
 
-        response = self._request("GET", f"/markets/{ticker}/orderbook", params=params)
-        data = response.json()
-        return OrderBook(**data["orderbook"])
+        response = self._request(
+            "GET", f"/markets/{ticker}/orderbook", params=params, timeout=timeout, deadline=deadline
+        )
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            orderbook = OrderBook(**data["orderbook"])
+        return orderbook
 
     # Trading Data Endpoints
-    def get_trades(
+    @traced
+    def get_trades(  # noqa: PLR0913 - one parameter per query field
         self,
         ticker: str | None = None,
         min_ts: int | None = None,
         max_ts: int | None = None,
         limit: int | None = None,
         cursor: str | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
     ) -> ObjectList[Trade]:
         params = {}
         if ticker is not None:
@@ -205,22 +896,105 @@ class KalshiClient:
         if cursor is not None:
             params["cursor"] = cursor
 
-        response = self._request("GET", "/markets/trades", params=params)
-        data = response.json()
-        trades = [Trade(**trade) for trade in data.get("trades", [])]
+        response = self._request(
+            "GET", "/markets/trades", params=params, timeout=timeout, deadline=deadline
+        )
+        if self.decoder is not None:
+            with trace_phase("decode"):
+                return self.decoder.decode("trades", response.content, limit)
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            trades = [Trade(**trade) for trade in data.get("trades", [])]
         return ObjectList(
             items=trades,
             cursor=data.get("cursor"),
             has_more=len(trades) == limit if limit else False
         )
 
+    def follow_trades(  # noqa: PLR0913 - the options after poll_interval are keyword-only
+        self,
+        tickers: Iterable[str] | None = None,
+        poll_interval: float = 1.0,
+        *,
+        min_interval: float = 0.1,
+        max_interval: float = 10.0,
+        since: datetime | None = None,
+        page_size: int = 1000,
+        dedupe_window: int = 10_000,
+    ) -> Iterator[Trade]:
+        """Yield public trades as they happen, oldest first, until the generator is closed.
+
+        Polls ``get_trades`` from a high-water mark per ticker, dropping the
+        overlap at the boundary and paging through bursts; the interval adapts
+        to the observed trade rate (see ``TradeFollower``). Timeouts, connection
+        errors, 5xx and 429 responses are logged and the poll is retried after
+        a doubled interval.
+
+        Args:
+            tickers: Markets to follow (the whole tape if None)
+            poll_interval: Interval before a trade rate has been observed, in seconds
+            min_interval: Shortest polling interval, in seconds
+            max_interval: Longest polling interval, in seconds
+            since: Oldest trade time to yield (now if None)
+            page_size: ``limit`` of each ``get_trades`` call
+            dedupe_window: Trade ids remembered for deduplication
+
+        Example:
+            for trade in client.follow_trades(["KXBTC-25DEC31"]):
+                print(trade.yes_price, trade.count)
+        """
+        follower = TradeFollower(
+            tickers,
+            poll_interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            since=since,
+            dedupe_window=dedupe_window,
+        )
+        while True:
+            started = time.monotonic()
+            try:
+                batches = {
+                    key: self._catch_up(follower, key, page_size) for key in follower.high_water
+                }
+            except TRANSIENT_ERRORS as e:
+                logger.warning("Trade poll failed: %s", e)
+                time.sleep(follower.backoff())
+                continue
+            for key, fresh in batches.items():
+                follower.commit(key, fresh)
+            trades = in_order(batches.values())
+            interval = follower.observe(len(trades))
+            yield from trades
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def _catch_up(self, follower: TradeFollower, key: str | None, page_size: int) -> list[Trade]:
+        fresh: list[Trade] = []
+        cursor = None
+        while True:
+            page = self.get_trades(limit=page_size, cursor=cursor, **follower.params(key))
+            new, caught_up = follower.sift(key, page)
+            fresh += new
+            if caught_up:
+                return fresh
+            cursor = page.cursor
+
     # Account Endpoints
-    def get_balance(self) -> int:
-        response = self._request("GET", "/portfolio/balance")
-        data = response.json()
+    @traced
+    def get_balance(
+        self,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> int:
+        response = self._request("GET", "/portfolio/balance", timeout=timeout, deadline=deadline)
+        with trace_phase("decode"):
+            data = response.json()
         return data["balance"]
 
-    def get_orders(
+    @traced
+    def get_orders(  # noqa: PLR0913, PLR0917 - one parameter per query field
         self,
         ticker: str | None = None,
         event_ticker: str | None = None,
@@ -229,6 +1003,9 @@ class KalshiClient:
         status: str | None = None,
         limit: int | None = None,
         cursor: str | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
     ) -> ObjectList[Order]:
         params = {}
         if ticker is not None:
@@ -246,16 +1023,21 @@ class KalshiClient:
         if cursor is not None:
             params["cursor"] = cursor
 
-        response = self._request("GET", "/portfolio/orders", params=params)
-        data = response.json()
-        orders = [Order(**order) for order in data.get("orders", [])]
+        response = self._request(
+            "GET", "/portfolio/orders", params=params, timeout=timeout, deadline=deadline
+        )
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            orders = [Order(**order) for order in data.get("orders", [])]
         return ObjectList(
             items=orders,
             cursor=data.get("cursor"),
             has_more=len(orders) == limit if limit else False
         )
 
-    def create_order(
+    @traced
+    def create_order(  # noqa: PLR0913, PLR0917 - one parameter per order field
         self,
         ticker: str,
         action: str,
@@ -273,6 +1055,10 @@ class KalshiClient:
         sell_position_capped: bool | None = None,
         sell_position_floor: int | None = None,
         time_in_force: str | None = None,
+        retries: int = 0,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
     ) -> OrderCreatedResponse:
         """Create a new order.
 
@@ -285,7 +1071,8 @@ class KalshiClient:
             yes_price: Price for yes side in cents (required for limit orders on yes side)
             no_price: Price for no side in cents (required for limit orders on no side)
             buy_max_cost: Maximum cost for buy orders in cents
-            client_order_id: Client-specified order ID
+            client_order_id: Client-specified order ID (generated when omitted and
+                ``config.generate_client_order_ids`` is set)
             expiration_ts: Order expiration timestamp
             order_group_id: Group ID for related orders
             post_only: Whether order should only add liquidity
@@ -293,10 +1080,20 @@ class KalshiClient:
             sell_position_capped: Whether sell is capped by position
             sell_position_floor: Floor for sell position
             time_in_force: Time in force ("gtc", "ioc", "fok")
+            retries: How many times to resubmit after a timeout, connection or
+                server error. Before each resubmission the client looks the order
+                up by ``client_order_id`` and returns it if it reached the exchange.
+            timeout: Per-request timeout (seconds or ``httpx.Timeout``) overriding
+                ``config.timeout``
+            deadline: ``time.monotonic()`` value bounding the whole call, retries
+                and order lookups included; see ``kalshi_client.deadlines``
 
         Returns:
             The created Order object
         """
+        if client_order_id is None and self.config.generate_client_order_ids:
+            client_order_id = new_client_order_id()
+
         data = {
             "ticker": ticker,
             "action": action,
@@ -329,18 +1126,131 @@ class KalshiClient:
         if time_in_force is not None:
             data["time_in_force"] = time_in_force
 
-        response = self._request("POST", "/portfolio/orders", json=data)
-        order_data = response.json()
-        order = Order(**order_data["order"])
-        return OrderCreatedResponse(
-            success=True,
-            message="Order created successfully",
-            status_code=response.status_code,
-            order_id=order.order_id if hasattr(order, 'order_id') else None
+        return self._submit_order(
+            ticker,
+            client_order_id,
+            retries,
+            send=lambda: self._request(
+                "POST", "/portfolio/orders", json=data, timeout=timeout, deadline=deadline
+            ),
+            parse_order_id=self._parse_order_id,
+            deadline=deadline,
         )
 
-    def cancel_order(self, order_id: str) -> OrderCancelledResponse:
-        response = self._request("DELETE", f"/portfolio/orders/{order_id}")
+    def _submit_order(  # noqa: PLR0913 - the callbacks are keyword-only
+        self,
+        ticker: str,
+        client_order_id: str | None,
+        retries: int,
+        *,
+        send: Callable[[], httpx.Response],
+        parse_order_id: Callable[[httpx.Response], str | None],
+        deadline: float | None = None,
+    ) -> OrderCreatedResponse:
+        """Send an order, resolving ambiguous failures through the order ledger.
+
+        A timeout, connection error or 5xx leaves it unknown whether the order
+        reached the exchange. With a ``client_order_id`` the order is looked up
+        by ticker (retrying briefly, as new orders can be slow to appear) before
+        being resent, so retries never create a duplicate; a resend rejected as
+        a duplicate ``client_order_id`` returns the order already created. Once
+        ``deadline`` has passed the order is left unknown in the ledger instead
+        of being looked up and resent.
+        """
+        if client_order_id is None:
+            response = send()
+            return self._order_created(response.status_code, parse_order_id(response), None)
+
+        entry = self.order_ledger.begin(client_order_id, ticker)
+        while True:
+            try:
+                response = send()
+            except (httpx.TransportError, KalshiServerError) as e:
+                if not self._may_resubmit(entry, retries, deadline, e):
+                    raise
+                order = self._lookup_order(entry, e, deadline)
+                if order is not None:
+                    self.order_ledger.resolve(client_order_id)
+                    return self._order_created(None, order.order_id, client_order_id)
+                self.order_ledger.begin(client_order_id, ticker)
+            except KalshiAPIError as e:
+                if self._is_resent_duplicate(entry, e):
+                    order = self._lookup_order(entry, e, deadline)
+                    if order is not None:
+                        self.order_ledger.resolve(client_order_id)
+                        return self._order_created(None, order.order_id, client_order_id)
+                    self.order_ledger.mark_unknown(client_order_id, e)
+                    raise
+                self.order_ledger.resolve(client_order_id)
+                raise
+            else:
+                self.order_ledger.resolve(client_order_id)
+                return self._order_created(
+                    response.status_code, parse_order_id(response), client_order_id
+                )
+
+    def _lookup_order(
+        self, entry: InFlightOrder, error: Exception, deadline: float | None
+    ) -> Order | None:
+        """Find an order whose submission failed with ``error``, retrying with backoff.
+
+        Raises ``error``, leaving the order unknown, if the lookups themselves fail.
+        """
+        lookup_error = None
+        for delay in self._order_lookup_delays(deadline):
+            time.sleep(delay)
+            try:
+                order = self._find_order(
+                    entry.ticker, entry.client_order_id, entry.submitted_at, deadline
+                )
+            except (httpx.TransportError, KalshiServerError) as e:
+                lookup_error = e
+                continue
+            except (KalshiAPIError, httpx.HTTPError) as e:
+                lookup_error = e
+                break
+            if order is not None:
+                return order
+            lookup_error = None
+        if lookup_error is not None:
+            self.order_ledger.mark_unknown(entry.client_order_id, error)
+            raise error from lookup_error
+        return None
+
+    def _find_order(
+        self, ticker: str, client_order_id: str, since: float, deadline: float | None = None
+    ) -> Order | None:
+        params = self._order_lookup_params(ticker, since)
+        for order in paginate(self.get_orders, deadline=deadline, **params):
+            if order.client_order_id == client_order_id:
+                return order
+        return None
+
+    def order_template(
+        self,
+        ticker: str,
+        action: str,
+        side: str,
+        type: str = "limit",
+        **static_fields: Any,
+    ) -> OrderTemplate:
+        """Pre-compile an order whose only per-order fields are price, count and client_order_id.
+
+        See ``OrderTemplate`` for details.
+        """
+        return OrderTemplate(self, ticker, action, side, type, **static_fields)
+
+    @traced
+    def cancel_order(
+        self,
+        order_id: str,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> OrderCancelledResponse:
+        response = self._request(
+            "DELETE", f"/portfolio/orders/{order_id}", timeout=timeout, deadline=deadline
+        )
         return OrderCancelledResponse(
             success=True,
             message=f"Order {order_id} cancelled successfully",
@@ -348,13 +1258,179 @@ class KalshiClient:
             order_id=order_id
         )
 
-    def get_positions(
+    def create_orders(
+        self, orders: Iterable[Mapping[str, Any]], *, deadline: float | None = None
+    ) -> list[OrderCreatedResponse | KalshiAPIError | httpx.HTTPError]:
+        """Create several orders concurrently.
+
+        Requests run on the client's worker pool, so they are bounded by
+        ``config.max_concurrency`` and the client's rate limiter. Called from
+        one of those workers (e.g. through ``submit``), the orders are sent one
+        after another on that thread instead, as waiting on the pool from
+        inside it could deadlock.
+
+        Args:
+            orders: Keyword arguments for ``create_order``, one mapping per order
+            deadline: Deadline for every order that does not set its own
+
+        Returns:
+            One entry per order in input order: the ``OrderCreatedResponse``, or the
+            exception raised for that order
+        """
+        if self.async_client is not None:
+            return self.engine.run(self.async_client.create_orders(orders, deadline=deadline))
+        return self._fan_out(
+            lambda order: self.create_order(**{"deadline": deadline, **order}), orders
+        )
+
+    def cancel_orders(
+        self,
+        order_ids: Iterable[str],
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> list[OrderCancelledResponse | KalshiAPIError | httpx.HTTPError]:
+        """Cancel several orders concurrently, reporting a result per order id.
+
+        Runs like ``create_orders``, inline when called from a worker thread.
+        """
+        if self.async_client is not None:
+            return self.engine.run(
+                self.async_client.cancel_orders(order_ids, timeout=timeout, deadline=deadline)
+            )
+        return self._fan_out(
+            lambda order_id: self.cancel_order(order_id, timeout=timeout, deadline=deadline),
+            order_ids,
+        )
+
+    def cancel_all_orders(
+        self,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
+    ) -> list[OrderCancelledResponse | KalshiAPIError | httpx.HTTPError]:
+        """Cancel every resting order, optionally restricted to a market or event.
+
+        ``deadline`` bounds the listing and the cancels together.
+        """
+        order_ids = [
+            order.order_id
+            for order in paginate(
+                self.get_orders,
+                ticker=ticker,
+                event_ticker=event_ticker,
+                status="resting",
+                limit=1000,
+                timeout=timeout,
+                deadline=deadline,
+            )
+        ]
+        return self.cancel_orders(order_ids, timeout=timeout, deadline=deadline)
+
+    def _fan_out[I, R](
+        self, func: Callable[[I], R], items: Iterable[I]
+    ) -> list[R | KalshiAPIError | httpx.HTTPError]:
+        def call(item: I) -> R | KalshiAPIError | httpx.HTTPError:
+            try:
+                return func(item)
+            except (KalshiAPIError, httpx.HTTPError) as e:
+                return e
+
+        items = list(items)
+        # On a worker thread (e.g. under ``submit``) waiting on the same bounded
+        # pool could deadlock, so the items run inline there
+        if len(items) <= 1 or getattr(self._worker, "active", False):
+            return [call(item) for item in items]
+        executor = self._get_executor()
+        futures = [executor.submit(contextvars.copy_context().run, call, item) for item in items]
+        return [future.result() for future in futures]
+
+    def submit[R](self, method: Callable[..., R], /, *args: Any, **kwargs: Any) -> Future[R]:
+        """Start ``method(*args, **kwargs)`` and return a future of its result.
+
+        ``method`` is an endpoint method of this client, e.g.
+        ``client.submit(client.get_market, ticker)``. With an engine it runs as
+        the ``AsyncKalshiClient`` method of the same name on the engine's loop;
+        otherwise, or for methods with no async counterpart, on the client's
+        worker pool.
+        """
+        counterpart = self._engine_method(method)
+        if counterpart is not None:
+            return self.engine.submit(counterpart(*args, **kwargs))
+        return self._get_executor().submit(contextvars.copy_context().run, method, *args, **kwargs)
+
+    def map[I, R](
+        self,
+        method: Callable[[I], R],
+        items: Iterable[I],
+        *,
+        return_exceptions: bool = False,
+    ) -> list[R | KalshiAPIError | httpx.HTTPError]:
+        """Call ``method`` on every item concurrently and return the results in input order.
+
+        Calls run as with ``submit``. Once all have finished, the first failed
+        call's error (in input order) is raised, or with ``return_exceptions``,
+        ``KalshiAPIError`` and ``httpx.HTTPError`` instances are returned in place
+        of their results.
+
+        Example:
+            markets = client.map(client.get_market, tickers)
+        """
+        counterpart = self._engine_method(method)
+        if counterpart is not None:
+            outcomes = self.engine.run_all(counterpart(item) for item in items)
+        else:
+            outcomes = _outcomes([self.submit(method, item) for item in items])
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not (
+                return_exceptions and isinstance(outcome, (KalshiAPIError, httpx.HTTPError))
+            ):
+                raise outcome
+        return outcomes
+
+    def _engine_method(self, method: Callable[..., Any]) -> Callable[..., Any] | None:
+        """The async counterpart of ``method`` when it can run on the engine."""
+        if self.async_client is None or getattr(method, "__self__", None) is not self:
+            return None
+        counterpart = getattr(self.async_client, method.__name__, None)
+        return counterpart if inspect.iscoroutinefunction(counterpart) else None
+
+    submit_get_events = _submitter("get_events")
+    submit_get_event = _submitter("get_event")
+    submit_get_markets = _submitter("get_markets")
+    submit_get_market = _submitter("get_market")
+    submit_get_market_order_book = _submitter("get_market_order_book")
+    submit_get_trades = _submitter("get_trades")
+    submit_get_balance = _submitter("get_balance")
+    submit_get_orders = _submitter("get_orders")
+    submit_get_positions = _submitter("get_positions")
+    submit_create_order = _submitter("create_order")
+    submit_cancel_order = _submitter("cancel_order")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_concurrency,
+                    thread_name_prefix="kalshi-client",
+                    initializer=_mark_worker,
+                    initargs=(self._worker,),
+                )
+            return self._executor
+
+    @traced
+    def get_positions(  # noqa: PLR0913 - one parameter per query field
         self,
         limit: int | None = None,
         cursor: str | None = None,
         settlement_status: str | None = None,
         ticker: str | None = None,
         event_ticker: str | None = None,
+        *,
+        timeout: TimeoutTypes = None,
+        deadline: float | None = None,
     ) -> ObjectList[Position]:
         params = {}
         if limit is not None:
@@ -368,9 +1444,13 @@ class KalshiClient:
         if event_ticker is not None:
             params["event_ticker"] = event_ticker
 
-        response = self._request("GET", "/portfolio/positions", params=params)
-        data = response.json()
-        positions = [Position(**position) for position in data.get("event_positions", [])]
+        response = self._request(
+            "GET", "/portfolio/positions", params=params, timeout=timeout, deadline=deadline
+        )
+        with trace_phase("decode"):
+            data = response.json()
+        with trace_phase("validate"):
+            positions = [Position(**position) for position in data.get("event_positions", [])]
         return ObjectList(
             items=positions,
             cursor=data.get("cursor"),
@@ -380,5 +1460,23 @@ class KalshiClient:
     def __enter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def close(self) -> None:
+        self.stop_keepalive()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=True)
+            self._hedge_executor = None
+        if self.async_client is not None and self.engine.running:
+            self.engine.run(self.async_client.aclose())
+        if self._owns_engine:
+            self.engine.close()
+        if self._owns_decoder:
+            self.decoder.close()
+        if self.trading_client is not None:
+            self.trading_client.close()
         self.client.close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
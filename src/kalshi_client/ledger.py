@@ -0,0 +1,75 @@
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal
+
+InFlightStatus = Literal["pending", "unknown"]
+
+
+def new_client_order_id() -> str:
+    return uuid.uuid4().hex
+
+
+@dataclass(slots=True)
+class InFlightOrder:
+    client_order_id: str
+    ticker: str
+    submitted_at: float
+    attempts: int = 0
+    status: InFlightStatus = "pending"
+    last_error: BaseException | None = field(default=None, repr=False)
+
+
+class OrderLedger:
+    """In-memory record of orders submitted but not yet acknowledged.
+
+    An entry is added before the first attempt and removed once the exchange
+    acknowledges or rejects the order. Entries left in ``"unknown"`` state are
+    orders whose outcome could not be determined (e.g. a timeout with no
+    retries left); they should be reconciled before the same quote is resent.
+    """
+
+    def __init__(self, wall_clock: Callable[[], float] = time.time):
+        self._wall_clock = wall_clock
+        self._orders: dict[str, InFlightOrder] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, client_order_id: str) -> bool:
+        return client_order_id in self._orders
+
+    def get(self, client_order_id: str) -> InFlightOrder | None:
+        return self._orders.get(client_order_id)
+
+    def begin(self, client_order_id: str, ticker: str) -> InFlightOrder:
+        with self._lock:
+            entry = self._orders.get(client_order_id)
+            if entry is None:
+                entry = InFlightOrder(client_order_id, ticker, self._wall_clock())
+                self._orders[client_order_id] = entry
+            entry.attempts += 1
+            entry.status = "pending"
+            return entry
+
+    def mark_unknown(self, client_order_id: str, error: BaseException) -> None:
+        with self._lock:
+            entry = self._orders.get(client_order_id)
+            if entry is not None:
+                entry.status = "unknown"
+                entry.last_error = error
+
+    def resolve(self, client_order_id: str) -> InFlightOrder | None:
+        with self._lock:
+            return self._orders.pop(client_order_id, None)
+
+    def in_flight(self) -> list[InFlightOrder]:
+        with self._lock:
+            return list(self._orders.values())
+
+    def unknown(self) -> list[InFlightOrder]:
+        with self._lock:
+            return [entry for entry in self._orders.values() if entry.status == "unknown"]
@@ -0,0 +1,256 @@
+import math
+import threading
+from functools import lru_cache
+from typing import Any
+
+# Path segments that are part of the API surface; any other segment is an identifier
+_STATIC_SEGMENTS = frozenset(
+    {"events", "markets", "trades", "orderbook", "portfolio", "orders", "positions", "balance"}
+)
+# Placeholder used for an identifier, keyed by the segment that precedes it
+_PLACEHOLDERS = {"events": "{event_ticker}", "markets": "{ticker}", "orders": "{order_id}"}
+
+
+@lru_cache(maxsize=4096)
+def normalize_endpoint(endpoint: str) -> str:
+    """Collapse identifiers in a path: ``/markets/X/orderbook`` -> ``/markets/{ticker}/orderbook``."""
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    normalized = []
+    previous = ""
+    for segment in segments:
+        if segment in _STATIC_SEGMENTS or not segment:
+            normalized.append(segment)
+        else:
+            normalized.append(_PLACEHOLDERS.get(previous, "{id}"))
+        previous = segment
+    return "/" + "/".join(normalized)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with fixed memory.
+
+    Bucket ``i`` covers ``[min_value * 2**(i / buckets_per_octave), ...)``, so
+    quantiles carry a relative error of about ``2**(1 / buckets_per_octave) - 1``
+    (9% at the default 8 buckets per octave) regardless of the sample count.
+    Values below ``min_value`` or above ``max_value`` are clamped into the
+    first and last buckets.
+
+    Args:
+        min_value: Smallest resolved value, in seconds
+        max_value: Largest resolved value, in seconds
+        buckets_per_octave: Buckets per doubling of the value
+    """
+
+    def __init__(
+        self, min_value: float = 1e-5, max_value: float = 120.0, buckets_per_octave: int = 8
+    ):
+        self.min_value = min_value
+        self.max_value = max_value
+        self.buckets_per_octave = buckets_per_octave
+        self.octaves = math.ceil(math.log2(max_value / min_value))
+        self.counts = [0] * (self.octaves * buckets_per_octave + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def bucket_index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        index = int(math.log2(value / self.min_value) * self.buckets_per_octave)
+        return min(index, len(self.counts) - 1)
+
+    def upper_bound(self, index: int) -> float:
+        return self.min_value * 2 ** ((index + 1) / self.buckets_per_octave)
+
+    def record(self, value: float) -> None:
+        self.counts[self.bucket_index(value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.upper_bound(index), self.max)
+        return self.max
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Cumulative counts at every octave boundary, for Prometheus ``le`` buckets."""
+        result = []
+        running = 0
+        for index, count in enumerate(self.counts):
+            running += count
+            if (index + 1) % self.buckets_per_octave == 0:
+                result.append((self.upper_bound(index), running))
+        return result
+
+
+class EndpointStats:
+    def __init__(self, histogram: LatencyHistogram):
+        self.requests = 0
+        self.errors: dict[str, int] = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = histogram
+
+
+class ClientMetrics:
+    """Request metrics per method and logical endpoint.
+
+    Tracks request and error counts (by exception class), bytes sent and
+    received, and a ``LatencyHistogram`` per endpoint. Memory is bounded by the
+    number of distinct normalized endpoints. Export with ``snapshot()`` or
+    ``to_prometheus()``.
+
+    Args:
+        namespace: Prefix of the exported Prometheus metric names
+        **histogram_options: Passed to every ``LatencyHistogram``
+    """
+
+    def __init__(self, namespace: str = "kalshi_client", **histogram_options: Any):
+        self.namespace = namespace
+        self._histogram_options = histogram_options
+        self._endpoints: dict[tuple[str, str], EndpointStats] = {}
+        self._gauges: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, method: str, endpoint: str) -> EndpointStats:
+        key = (method, endpoint)
+        stats = self._endpoints.get(key)
+        if stats is None:
+            stats = self._endpoints.setdefault(
+                key, EndpointStats(LatencyHistogram(**self._histogram_options))
+            )
+        return stats
+
+    def record(  # noqa: PLR0913, PLR0917 - called positionally once per request
+        self,
+        method: str,
+        endpoint: str,
+        duration: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record one request; ``endpoint`` may be a raw path and is normalized."""
+        stats = self._stats(method, normalize_endpoint(endpoint))
+        with self._lock:
+            stats.requests += 1
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            stats.latency.record(duration)
+            if error is not None:
+                name = type(error).__name__
+                stats.errors[name] = stats.errors.get(name, 0) + 1
+
+    def latency_quantile(self, method: str, endpoint: str, q: float) -> float | None:
+        stats = self._endpoints.get((method, normalize_endpoint(endpoint)))
+        if stats is None or stats.latency.count == 0:
+            return None
+        with self._lock:
+            return stats.latency.quantile(q)
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        with self._lock:
+            self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._gauges.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Plain-dict view keyed by ``"METHOD /normalized/endpoint"``."""
+        with self._lock:
+            endpoints = {
+                f"{method} {endpoint}": {
+                    "requests": stats.requests,
+                    "errors": dict(stats.errors),
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                    "latency": {
+                        "count": stats.latency.count,
+                        "sum": stats.latency.sum,
+                        "max": stats.latency.max,
+                        "p50": stats.latency.quantile(0.5),
+                        "p90": stats.latency.quantile(0.9),
+                        "p99": stats.latency.quantile(0.99),
+                        "p999": stats.latency.quantile(0.999),
+                    },
+                }
+                for (method, endpoint), stats in self._endpoints.items()
+            }
+            gauges = {
+                _series(name, dict(labels)): value for (name, labels), value in self._gauges.items()
+            }
+        return {"endpoints": endpoints, "gauges": gauges}
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        ns = self.namespace
+        lines = []
+        with self._lock:
+            items = sorted(self._endpoints.items())
+
+            def family(name: str, kind: str, help_text: str) -> None:
+                lines.append(f"# HELP {ns}_{name} {help_text}")
+                lines.append(f"# TYPE {ns}_{name} {kind}")
+
+            family("requests_total", "counter", "Requests sent, by endpoint.")
+            for (method, endpoint), stats in items:
+                labels = {"method": method, "endpoint": endpoint}
+                lines.append(f"{_series(f'{ns}_requests_total', labels)} {stats.requests}")
+
+            family("request_errors_total", "counter", "Failed requests, by exception class.")
+            for (method, endpoint), stats in items:
+                for error, count in sorted(stats.errors.items()):
+                    labels = {"method": method, "endpoint": endpoint, "error": error}
+                    lines.append(f"{_series(f'{ns}_request_errors_total', labels)} {count}")
+
+            family("request_bytes_total", "counter", "Request body bytes sent.")
+            for (method, endpoint), stats in items:
+                labels = {"method": method, "endpoint": endpoint}
+                lines.append(f"{_series(f'{ns}_request_bytes_total', labels)} {stats.bytes_sent}")
+
+            family("response_bytes_total", "counter", "Response body bytes received.")
+            for (method, endpoint), stats in items:
+                labels = {"method": method, "endpoint": endpoint}
+                lines.append(
+                    f"{_series(f'{ns}_response_bytes_total', labels)} {stats.bytes_received}"
+                )
+
+            family("request_duration_seconds", "histogram", "Request latency in seconds.")
+            for (method, endpoint), stats in items:
+                labels = {"method": method, "endpoint": endpoint}
+                name = f"{ns}_request_duration_seconds"
+                for bound, count in stats.latency.cumulative():
+                    bucket = _series(f"{name}_bucket", {**labels, "le": f"{bound:.6g}"})
+                    lines.append(f"{bucket} {count}")
+                bucket = _series(f"{name}_bucket", {**labels, "le": "+Inf"})
+                lines.append(f"{bucket} {stats.latency.count}")
+                lines.append(f"{_series(f'{name}_sum', labels)} {stats.latency.sum:.9g}")
+                lines.append(f"{_series(f'{name}_count', labels)} {stats.latency.count}")
+
+            gauge_names = sorted({name for name, _ in self._gauges})
+            for gauge in gauge_names:
+                lines.append(f"# TYPE {ns}_{gauge} gauge")
+                for (name, labels), value in sorted(self._gauges.items()):
+                    if name == gauge:
+                        lines.append(f"{_series(f'{ns}_{name}', dict(labels))} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _series(name: str, labels: dict[str, str]) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+    return f"{name}{{{rendered}}}"
@@ -1,26 +1,33 @@
-from .account import (
-    Balance,
-    BalanceResponse,
-    Order,
-    OrderResponse,
-    OrdersResponse,
-    Position,
-    PositionsResponse,
-)
-from .base import KalshiBaseModel, KalshiResponse, ObjectList
-from .market import (
-    Event,
-    EventResponse,
-    EventsResponse,
-    Market,
-    MarketResponse,
-    MarketsResponse,
-    OrderBook,
-    OrderBookLevel,
-    OrderBookResponse,
-)
-from .response import OperationResponse, OrderCancelledResponse, OrderCreatedResponse
-from .trade import Trade, TradesResponse
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public name -> submodule defining it, imported on first access
+_EXPORTS = {
+    "KalshiBaseModel": ".base",
+    "ObjectList": ".base",
+    "KalshiResponse": ".base",
+    "Event": ".market",
+    "EventResponse": ".market",
+    "EventsResponse": ".market",
+    "Market": ".market",
+    "MarketResponse": ".market",
+    "MarketsResponse": ".market",
+    "OrderBook": ".market",
+    "OrderBookLevel": ".market",
+    "OrderBookResponse": ".market",
+    "Trade": ".trade",
+    "TradesResponse": ".trade",
+    "Balance": ".account",
+    "BalanceResponse": ".account",
+    "Order": ".account",
+    "OrderResponse": ".account",
+    "OrdersResponse": ".account",
+    "Position": ".account",
+    "PositionsResponse": ".account",
+    "OrderCreatedResponse": ".response",
+    "OrderCancelledResponse": ".response",
+    "OperationResponse": ".response",
+}
 
 __all__ = [
     "KalshiBaseModel",
@@ -48,3 +55,41 @@ __all__ = [
     "OrderCancelledResponse",
     "OperationResponse",
 ]
+
+if TYPE_CHECKING:
+    from .account import (
+        Balance,
+        BalanceResponse,
+        Order,
+        OrderResponse,
+        OrdersResponse,
+        Position,
+        PositionsResponse,
+    )
+    from .base import KalshiBaseModel, KalshiResponse, ObjectList
+    from .market import (
+        Event,
+        EventResponse,
+        EventsResponse,
+        Market,
+        MarketResponse,
+        MarketsResponse,
+        OrderBook,
+        OrderBookLevel,
+        OrderBookResponse,
+    )
+    from .response import OperationResponse, OrderCancelledResponse, OrderCreatedResponse
+    from .trade import Trade, TradesResponse
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -14,6 +14,7 @@ class BalanceResponse(KalshiBaseModel):
 class Order(KalshiBaseModel):
     order_id: str
     user_id: str
+    client_order_id: str | None = None
     ticker: str
     status: str
     action: str
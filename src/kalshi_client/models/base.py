@@ -11,6 +11,8 @@ class KalshiBaseModel(BaseModel):
         populate_by_name=True,
         use_enum_values=True,
         validate_assignment=True,
+        # Build validators and serializers on first use rather than at import
+        defer_build=True,
     )
 
 
@@ -3,6 +3,7 @@ from .base import KalshiResponse
 
 class OrderCreatedResponse(KalshiResponse):
     order_id: str | None = None
+    client_order_id: str | None = None
 
 
 class OrderCancelledResponse(KalshiResponse):
@@ -0,0 +1,205 @@
+import json
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import KalshiValidationError
+from .ledger import new_client_order_id
+from .models import OrderCreatedResponse
+from .tracing import RequestTrace, traced
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .deadlines import TimeoutTypes
+    from .kalshi_client import KalshiClient
+
+MIN_PRICE = 1
+MAX_PRICE = 99
+
+# Field order of the create_order payload, so templates encode and sign identically
+ORDER_FIELDS = (
+    "ticker",
+    "action",
+    "side",
+    "type",
+    "count",
+    "yes_price",
+    "no_price",
+    "buy_max_cost",
+    "client_order_id",
+    "expiration_ts",
+    "order_group_id",
+    "post_only",
+    "self_trade_prevention_type",
+    "sell_position_capped",
+    "sell_position_floor",
+    "time_in_force",
+)
+
+_COUNT = "\x00count\x00"
+_PRICE = "\x00price\x00"
+_CLIENT_ORDER_ID = "\x00client_order_id\x00"
+
+
+def _split(text: str, placeholders: list[str]) -> list[str]:
+    parts = []
+    for placeholder in placeholders:
+        head, _, text = text.partition(placeholder)
+        parts.append(head)
+    parts.append(text)
+    return parts
+
+
+class OrderTemplate:
+    """Pre-compiled order for one market/side/action, for low-overhead requoting.
+
+    The static fields are encoded once. ``send`` only validates the price and
+    count locally and splices them (and an optional ``client_order_id``) into
+    the pre-encoded JSON body, skipping the payload dict, the optional-field
+    checks and the ``Order`` validation of ``create_order``.
+
+    Args:
+        client: Client used to send the orders
+        ticker: The market ticker symbol
+        action: Order action ("buy" or "sell")
+        side: Order side ("yes" or "no"); the price is sent as ``yes_price`` or ``no_price``
+        type: Order type ("market" or "limit")
+        **static_fields: Any other ``create_order`` field fixed for every order,
+            e.g. ``time_in_force`` or ``self_trade_prevention_type``
+    """
+
+    def __init__(
+        self,
+        client: "KalshiClient",
+        ticker: str,
+        action: str,
+        side: str,
+        type: str = "limit",
+        **static_fields: Any,
+    ):
+        unknown = set(static_fields) - set(ORDER_FIELDS)
+        dynamic = {"count", "yes_price", "no_price", "client_order_id"} & set(static_fields)
+        if unknown:
+            raise TypeError(f"Unknown order fields: {', '.join(sorted(unknown))}")
+        if dynamic:
+            raise TypeError(f"Fields set per order cannot be fixed: {', '.join(sorted(dynamic))}")
+        if side not in ("yes", "no"):
+            raise KalshiValidationError(f"Invalid side: {side}", field="side")
+
+        self.client = client
+        self.ticker = ticker
+        self.action = action
+        self.side = side
+        self.type = type
+        self.static_fields = {k: v for k, v in static_fields.items() if v is not None}
+        self._price_field = f"{side}_price"
+        self._compiled: dict[tuple[bool, bool], tuple[list[bytes], list[str]]] = {}
+
+    def _compile(self, has_price: bool, has_client_order_id: bool) -> tuple[list[bytes], list[str]]:
+        key = (has_price, has_client_order_id)
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            return compiled
+
+        values = {
+            "ticker": self.ticker,
+            "action": self.action,
+            "side": self.side,
+            "type": self.type,
+            "count": _COUNT,
+            self._price_field: _PRICE if has_price else None,
+            "client_order_id": _CLIENT_ORDER_ID if has_client_order_id else None,
+            **self.static_fields,
+        }
+        payload = {f: values[f] for f in ORDER_FIELDS if values.get(f) is not None}
+        placeholders = [p for p in (_COUNT, _PRICE, _CLIENT_ORDER_ID) if p in payload.values()]
+
+        body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        signed = str(payload)
+        compiled = (
+            [part.encode("utf-8") for part in _split(body, [json.dumps(p) for p in placeholders])],
+            _split(signed, [repr(p) for p in placeholders]),
+        )
+        self._compiled[key] = compiled
+        return compiled
+
+    @property
+    def trace_hooks(self) -> list["Callable[[RequestTrace], None]"]:
+        return self.client.trace_hooks
+
+    def validate(self, price: int | None, count: int) -> None:
+        if type(count) is not int or count <= 0:
+            raise KalshiValidationError(f"Invalid count: {count}", field="count")
+        if price is None:
+            if self.type != "market":
+                raise KalshiValidationError(
+                    f"{self._price_field} is required", field=self._price_field
+                )
+        elif type(price) is not int or not MIN_PRICE <= price <= MAX_PRICE:
+            raise KalshiValidationError(f"Invalid price: {price}", field=self._price_field)
+
+    def build(
+        self, price: int | None, count: int, client_order_id: str | None = None
+    ) -> tuple[bytes, str]:
+        """Return the encoded request body and the text it is signed as."""
+        self.validate(price, count)
+        body_parts, signed_parts = self._compile(price is not None, client_order_id is not None)
+
+        values = [(str(count), str(count))]
+        if price is not None:
+            values.append((str(price), str(price)))
+        if client_order_id is not None:
+            values.append((json.dumps(client_order_id, ensure_ascii=False), repr(client_order_id)))
+
+        body = [body_parts[0]]
+        signed = [signed_parts[0]]
+        for i, (encoded, signed_value) in enumerate(values, start=1):
+            body += (encoded.encode("utf-8"), body_parts[i])
+            signed += (signed_value, signed_parts[i])
+        return b"".join(body), "".join(signed)
+
+    @traced
+    def send(  # noqa: PLR0913 - timeout and deadline are keyword-only
+        self,
+        price: int | None,
+        count: int,
+        client_order_id: str | None = None,
+        retries: int = 0,
+        *,
+        timeout: "TimeoutTypes" = None,
+        deadline: float | None = None,
+    ) -> OrderCreatedResponse:
+        """Create an order from the template.
+
+        Args:
+            price: Price in cents for the template's side (1-99); omit for market orders
+            count: Number of contracts
+            client_order_id: Client-specified order ID (generated when omitted and
+                ``config.generate_client_order_ids`` is set)
+            retries: Safe resubmissions after an ambiguous failure, as in ``create_order``
+            timeout: Per-request timeout overriding ``config.timeout``
+            deadline: ``time.monotonic()`` value bounding the call, retries included
+
+        Returns:
+            OrderCreatedResponse for the created order
+
+        Raises:
+            KalshiValidationError: If price or count is invalid (raised before any request)
+        """
+        if client_order_id is None and self.client.config.generate_client_order_ids:
+            client_order_id = new_client_order_id()
+        body, signed_body = self.build(price, count, client_order_id)
+        return self.client._submit_order(
+            self.ticker,
+            client_order_id,
+            retries,
+            send=lambda: self.client._request(
+                "POST",
+                "/portfolio/orders",
+                content=body,
+                signed_body=signed_body,
+                timeout=timeout,
+                deadline=deadline,
+            ),
+            parse_order_id=lambda response: response.json()["order"].get("order_id"),
+            deadline=deadline,
+        )
@@ -0,0 +1,104 @@
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from .models import ObjectList
+
+if TYPE_CHECKING:
+    from .checkpoint import Checkpoint
+
+PageFetcher = Callable[..., ObjectList[Any]]
+AsyncPageFetcher = Callable[..., Awaitable[ObjectList[Any]]]
+
+
+def iter_pages(
+    fetch: PageFetcher,
+    *,
+    checkpoint: "Checkpoint | None" = None,
+    resume: bool = False,
+    checkpoint_key: str | None = None,
+    **params: Any,
+) -> Iterator[ObjectList[Any]]:
+    """Yield successive pages from a cursor-paginated endpoint method.
+
+    Args:
+        fetch: A client method returning an ``ObjectList``, e.g. ``client.get_markets``
+        checkpoint: Records progress after every page the caller has finished with
+            (see ``kalshi_client.checkpoint``)
+        resume: Continue after the last confirmed page in ``checkpoint``
+        checkpoint_key: Key of the crawl in ``checkpoint`` (derived from ``fetch``'s
+            name and the query parameters by default)
+        **params: Query parameters passed to every call; ``cursor`` sets the starting page.
+            A ``deadline`` is passed to every call too, so it bounds the whole walk.
+    """
+    cursor = params.pop("cursor", None)
+    progress = None
+    if checkpoint is not None:
+        # Only checkpointed walks need sqlite3 (and asyncio for the async walk)
+        from .checkpoint import PageProgress, query_key  # noqa: PLC0415
+
+        key = checkpoint_key or query_key(fetch, params)
+        progress = PageProgress(checkpoint, key, params, resume, cursor)
+        cursor = progress.cursor
+    while True:
+        page = fetch(cursor=cursor, **params)
+        yield page
+        cursor = page.cursor
+        last = not cursor or not page
+        if progress is not None:
+            progress.confirm(len(page), cursor, last)
+        if last:
+            return
+
+
+def paginate[T: BaseModel](fetch: Callable[..., ObjectList[T]], **params: Any) -> Iterator[T]:
+    """Yield every item across all pages of a cursor-paginated endpoint method.
+
+    Accepts the keyword arguments of ``iter_pages``; with a checkpoint, a page
+    is confirmed once all of its items have been consumed.
+    """
+    for page in iter_pages(fetch, **params):
+        yield from page
+
+
+async def aiter_pages(
+    fetch: AsyncPageFetcher,
+    *,
+    checkpoint: "Checkpoint | None" = None,
+    resume: bool = False,
+    checkpoint_key: str | None = None,
+    **params: Any,
+) -> AsyncIterator[ObjectList[Any]]:
+    """Async counterpart of ``iter_pages`` for ``AsyncKalshiClient`` methods.
+
+    Checkpoints are written from a worker thread, off the event loop.
+    """
+    cursor = params.pop("cursor", None)
+    progress = None
+    if checkpoint is not None:
+        import asyncio  # noqa: PLC0415
+
+        from .checkpoint import PageProgress, query_key  # noqa: PLC0415
+
+        key = checkpoint_key or query_key(fetch, params)
+        progress = await asyncio.to_thread(PageProgress, checkpoint, key, params, resume, cursor)
+        cursor = progress.cursor
+    while True:
+        page = await fetch(cursor=cursor, **params)
+        yield page
+        cursor = page.cursor
+        last = not cursor or not page
+        if progress is not None:
+            await asyncio.to_thread(progress.confirm, len(page), cursor, last)
+        if last:
+            return
+
+
+async def apaginate[T: BaseModel](
+    fetch: Callable[..., Awaitable[ObjectList[T]]], **params: Any
+) -> AsyncIterator[T]:
+    """Yield every item across all pages of an ``AsyncKalshiClient`` endpoint method."""
+    async for page in aiter_pages(fetch, **params):
+        for item in page:
+            yield item
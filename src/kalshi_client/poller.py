@@ -0,0 +1,248 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .diff import field_changes
+from .exceptions import KalshiAPIError
+from .models import Market
+from .rate_limit import RateLimiter, TokenBucket
+
+if TYPE_CHECKING:
+    from .kalshi_client import KalshiClient
+
+logger = logging.getLogger(__name__)
+
+MarketCallback = Callable[[Market, dict[str, tuple[Any, Any]]], None]
+
+# Errors of one batch that the run loop logs and survives
+POLL_ERRORS = (KalshiAPIError, httpx.HTTPError)
+
+
+@dataclass(slots=True)
+class _TickerState:
+    ticker: str
+    interval: float
+    next_due: float
+    market: Market | None = None
+    snapshot: dict[str, Any] | None = None
+
+
+class MarketPoller:
+    """Polls a watchlist of markets under a global request budget.
+
+    Each ticker carries its own polling interval. A market whose fields changed
+    on the last refresh, or that closes within ``close_horizon`` seconds, is
+    polled every ``min_interval``; a quiet market backs off geometrically up to
+    ``max_interval``. Due tickers are refreshed in batches through
+    ``get_markets(tickers=...)``, most active first, and every batch costs one
+    token from the request budget.
+
+    Args:
+        client: Client used to fetch markets
+        tickers: Initial watchlist
+        requests_per_second: Request budget shared by all batches
+        batch_size: Maximum tickers per ``get_markets`` call
+        min_interval: Polling interval for active or closing markets, in seconds
+        max_interval: Upper bound for idle markets, in seconds
+        backoff: Factor applied to the interval after an unchanged refresh
+        close_horizon: Markets closing within this many seconds stay at ``min_interval``
+        rate_limiter: Bucket to draw from instead of a private one
+    """
+
+    def __init__(  # noqa: PLR0913 - the options after tickers are keyword-only
+        self,
+        client: "KalshiClient",
+        tickers: Iterable[str] = (),
+        *,
+        requests_per_second: float = 2.0,
+        batch_size: int = 100,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        backoff: float = 2.0,
+        close_horizon: float = 900.0,
+        rate_limiter: RateLimiter | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("min_interval must be positive and not exceed max_interval")
+        self.client = client
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.close_horizon = close_horizon
+        self.rate_limiter = rate_limiter or TokenBucket(requests_per_second, clock=clock)
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._states: dict[str, _TickerState] = {}
+        self._callbacks: list[MarketCallback] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        for ticker in tickers:
+            self.add(ticker)
+
+    # Watchlist management
+    def add(self, ticker: str) -> None:
+        with self._lock:
+            if ticker not in self._states:
+                self._states[ticker] = _TickerState(
+                    ticker=ticker, interval=self.min_interval, next_due=self._clock()
+                )
+
+    def remove(self, ticker: str) -> None:
+        with self._lock:
+            self._states.pop(ticker, None)
+
+    @property
+    def tickers(self) -> list[str]:
+        with self._lock:
+            return list(self._states)
+
+    def get(self, ticker: str) -> Market | None:
+        with self._lock:
+            state = self._states.get(ticker)
+            return state.market if state else None
+
+    def interval(self, ticker: str) -> float:
+        with self._lock:
+            return self._states[ticker].interval
+
+    def subscribe(self, callback: MarketCallback) -> None:
+        """Register ``callback(market, changes)``, called when a market changes.
+
+        ``changes`` maps each changed field name to its ``(old, new)`` values.
+        """
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: MarketCallback) -> None:
+        self._callbacks.remove(callback)
+
+    # Scheduling
+    def due_tickers(self) -> list[str]:
+        """Tickers due for a refresh, most urgent first."""
+        now = self._clock()
+        with self._lock:
+            due = [s for s in self._states.values() if s.next_due <= now]
+        due.sort(key=lambda s: (s.interval, s.next_due))
+        return [s.ticker for s in due]
+
+    def next_wakeup(self) -> float:
+        """Seconds until the next batch could be sent."""
+        with self._lock:
+            if not self._states:
+                return self.max_interval
+            next_due = min(s.next_due for s in self._states.values())
+        due_in = max(0.0, next_due - self._clock())
+        return max(due_in, self.rate_limiter.time_until_available())
+
+    def poll_once(self) -> int:
+        """Refresh one batch of due tickers if the budget allows.
+
+        A batch that fails backs off as if it were unchanged, so it is not
+        retried every ``min_interval``, and the error is raised.
+
+        Returns:
+            The number of tickers refreshed (0 if nothing was due or the budget is spent)
+        """
+        batch = self.due_tickers()[: self.batch_size]
+        if not batch or not self.rate_limiter.try_acquire():
+            return 0
+
+        try:
+            markets = self.client.get_markets(tickers=batch, limit=len(batch))
+        except POLL_ERRORS:
+            self._defer(batch)
+            raise
+        self._apply(batch, markets)
+        return len(batch)
+
+    def _defer(self, batch: list[str]) -> None:
+        now = self._clock()
+        with self._lock:
+            for ticker in batch:
+                state = self._states.get(ticker)
+                if state is not None:
+                    state.interval = min(self.max_interval, state.interval * self.backoff)
+                    state.next_due = now + state.interval
+
+    def _apply(self, batch: list[str], markets: Iterable[Market]) -> None:
+        now = self._clock()
+        wall_now = self._wall_clock()
+        notifications: list[tuple[Market, dict[str, tuple[Any, Any]]]] = []
+        seen: set[str] = set()
+
+        with self._lock:
+            for market in markets:
+                state = self._states.get(market.ticker)
+                if state is None:
+                    continue
+                seen.add(market.ticker)
+                snapshot = market.model_dump()
+                previous = state.snapshot
+                state.market = market
+                state.snapshot = snapshot
+
+                if previous is None:
+                    interval = self.min_interval
+                else:
+                    changes = field_changes(previous, snapshot)
+                    if changes:
+                        interval = self.min_interval
+                        notifications.append((market, changes))
+                    else:
+                        interval = min(self.max_interval, state.interval * self.backoff)
+
+                time_to_close = market.close_time.timestamp() - wall_now
+                if 0 < time_to_close <= self.close_horizon:
+                    interval = self.min_interval
+
+                state.interval = interval
+                state.next_due = now + interval
+
+            for ticker in batch:
+                state = self._states.get(ticker)
+                if ticker not in seen and state is not None:
+                    state.interval = self.max_interval
+                    state.next_due = now + self.max_interval
+
+        for market, changes in notifications:
+            for callback in list(self._callbacks):
+                try:
+                    callback(market, changes)
+                except Exception:
+                    logger.exception("MarketPoller callback failed for %s", market.ticker)
+
+    # Run loop
+    def run(self, stop_event: threading.Event | None = None) -> None:
+        stop = stop_event or self._stop
+        while not stop.is_set():
+            try:
+                polled = self.poll_once()
+            except POLL_ERRORS:
+                logger.exception("MarketPoller batch failed")
+                polled = 0
+                stop.wait(self.min_interval)
+            if not polled:
+                stop.wait(min(self.next_wakeup(), self.max_interval))
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="kalshi-market-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
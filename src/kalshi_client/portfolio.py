@@ -0,0 +1,282 @@
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from .models import Order, OrderCancelledResponse, OrderCreatedResponse, Position
+from .pagination import paginate
+
+if TYPE_CHECKING:
+    from .kalshi_client import KalshiClient
+
+RESTING = "resting"
+# Time-in-force values for which an acknowledged order never rests on the book
+_NON_RESTING_TIME_IN_FORCE = {"ioc", "fok", "immediate_or_cancel", "fill_or_kill"}
+
+
+class PortfolioState:
+    """Local, incrementally synchronized view of resting orders and positions.
+
+    ``load()`` fetches the full set once. ``sync()`` then pulls only orders
+    created since the high-water mark and refreshes the positions of the tickers
+    they touched. An older order that fills or is cancelled does not appear in
+    that pull, so every ``reconcile_interval`` seconds ``sync()`` also lists the
+    resting orders and drops indexed ones that are gone. Orders placed or
+    cancelled through ``create_order`` and ``cancel_order`` are applied
+    optimistically as soon as the exchange acknowledges them. All reads are
+    in-memory dictionary lookups.
+
+    The high-water mark advances only with the exchange's order timestamps.
+    Until an order has been seen it starts ``clock_skew`` seconds before the
+    local time of ``load()``, so a local clock running ahead of the exchange
+    cannot skip orders.
+
+    Args:
+        client: Client used to fetch and place orders
+        page_size: Page size used when paginating orders and positions
+        overlap: Seconds subtracted from the high-water mark so that orders
+            sharing its timestamp are not missed (they are deduplicated by id)
+        clock_skew: Seconds the local clock may run ahead of the exchange's
+        reconcile_interval: Seconds between the resting-order checks of ``sync``
+            (None to leave them to explicit ``reconcile_orders`` calls)
+    """
+
+    def __init__(  # noqa: PLR0913 - the options after client are keyword-only
+        self,
+        client: "KalshiClient",
+        *,
+        page_size: int = 1000,
+        overlap: int = 1,
+        clock_skew: int = 300,
+        reconcile_interval: float | None = 60.0,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.client = client
+        self.page_size = page_size
+        self.overlap = overlap
+        self.clock_skew = clock_skew
+        self.reconcile_interval = reconcile_interval
+        self._wall_clock = wall_clock
+        self._lock = threading.RLock()
+        self._orders: dict[str, Order] = {}
+        self._orders_by_ticker: dict[str, dict[str, Order]] = {}
+        self._positions: dict[str, Position] = {}
+        self._positions_by_event: dict[str, dict[str, Position]] = {}
+        self.high_water_mark: int | None = None
+        self.loaded = False
+        self._reconciled = 0.0
+
+    # Synchronization
+    def load(self) -> None:
+        """Replace local state with a full snapshot of resting orders and positions."""
+        started = int(self._wall_clock())
+        orders = list(paginate(self.client.get_orders, status=RESTING, limit=self.page_size))
+        positions = list(paginate(self.client.get_positions, limit=self.page_size))
+
+        with self._lock:
+            self._orders.clear()
+            self._orders_by_ticker.clear()
+            self._positions.clear()
+            self._positions_by_event.clear()
+            for order in orders:
+                self._index_order(order)
+            for position in positions:
+                self._index_position(position)
+            self.high_water_mark = max(
+                [started - self.clock_skew, *(self._order_ts(o) for o in orders)]
+            )
+            self._reconciled = started
+            self.loaded = True
+
+    def sync(self) -> int:
+        """Pull orders created since the high-water mark and refresh touched positions.
+
+        Once ``reconcile_interval`` has passed since the last check, the resting
+        orders are listed as well, and indexed orders created before this sync
+        that are no longer resting are dropped.
+
+        Returns:
+            The number of orders whose state changed locally
+        """
+        if not self.loaded:
+            self.load()
+            return len(self._orders)
+
+        started = int(self._wall_clock())
+        min_ts = max(0, self.high_water_mark - self.overlap)
+        orders = list(paginate(self.client.get_orders, min_ts=min_ts, limit=self.page_size))
+        resting = None
+        if (
+            self.reconcile_interval is not None
+            and started - self._reconciled >= self.reconcile_interval
+        ):
+            # Listed after the deltas, so it is the newer view of any order in both
+            resting = list(paginate(self.client.get_orders, status=RESTING, limit=self.page_size))
+
+        changed = 0
+        touched: set[str] = set()
+        with self._lock:
+            for order in orders:
+                if self._apply_order(order):
+                    changed += 1
+                    touched.add(order.ticker)
+            if resting is not None:
+                for order in self._reconcile(resting, before=started):
+                    changed += 1
+                    touched.add(order.ticker)
+                self._reconciled = started
+            self.high_water_mark = max([self.high_water_mark, *(self._order_ts(o) for o in orders)])
+
+        self.refresh_positions(touched)
+        return changed
+
+    def reconcile_orders(self) -> None:
+        """Re-fetch all resting orders to drop ones that filled or were cancelled elsewhere."""
+        started = int(self._wall_clock())
+        orders = list(paginate(self.client.get_orders, status=RESTING, limit=self.page_size))
+        with self._lock:
+            self._orders.clear()
+            self._orders_by_ticker.clear()
+            for order in orders:
+                self._index_order(order)
+            self._reconciled = started
+
+    def refresh_positions(self, tickers: Iterable[str]) -> None:
+        for ticker in tickers:
+            positions = list(
+                paginate(self.client.get_positions, ticker=ticker, limit=self.page_size)
+            )
+            with self._lock:
+                self._drop_position(ticker)
+                for position in positions:
+                    self._index_position(position)
+
+    # Optimistic updates
+    def create_order(self, **order: Any) -> OrderCreatedResponse:
+        """Place an order through the client and index it as resting right away."""
+        response = self.client.create_order(**order)
+        self.apply_created(response, **order)
+        return response
+
+    def cancel_order(self, order_id: str) -> OrderCancelledResponse:
+        response = self.client.cancel_order(order_id)
+        self.apply_cancelled(response)
+        return response
+
+    def apply_created(self, response: OrderCreatedResponse, **order: Any) -> Order | None:
+        """Record an acknowledged order that is expected to rest on the book."""
+        if not response.success or response.order_id is None:
+            return None
+        if (
+            order.get("type") == "market"
+            or order.get("time_in_force") in _NON_RESTING_TIME_IN_FORCE
+        ):
+            return None
+
+        now = datetime.fromtimestamp(self._wall_clock(), UTC)
+        provisional = Order(
+            order_id=response.order_id,
+            user_id="",
+            client_order_id=response.client_order_id,
+            ticker=order["ticker"],
+            status=RESTING,
+            action=order["action"],
+            side=order["side"],
+            type=order["type"],
+            yes_price=order.get("yes_price"),
+            no_price=order.get("no_price"),
+            count=order["count"],
+            yes_filled_count=0,
+            no_filled_count=0,
+            created_time=now,
+            time_in_force=order.get("time_in_force"),
+        )
+        with self._lock:
+            self._index_order(provisional)
+        return provisional
+
+    def apply_cancelled(self, response: OrderCancelledResponse) -> None:
+        if response.success and response.order_id is not None:
+            with self._lock:
+                self._drop_order(response.order_id)
+
+    # Reads
+    def order(self, order_id: str) -> Order | None:
+        with self._lock:
+            return self._orders.get(order_id)
+
+    def resting_orders(self, ticker: str | None = None) -> list[Order]:
+        with self._lock:
+            if ticker is None:
+                return list(self._orders.values())
+            return list(self._orders_by_ticker.get(ticker, {}).values())
+
+    def position(self, ticker: str) -> Position | None:
+        with self._lock:
+            return self._positions.get(ticker)
+
+    def positions(self, event_ticker: str | None = None) -> list[Position]:
+        with self._lock:
+            if event_ticker is None:
+                return list(self._positions.values())
+            return list(self._positions_by_event.get(event_ticker, {}).values())
+
+    # Index maintenance (callers hold the lock)
+    @staticmethod
+    def _order_ts(order: Order) -> int:
+        return int((order.updated_time or order.created_time).timestamp())
+
+    def _apply_order(self, order: Order) -> bool:
+        current = self._orders.get(order.order_id)
+        if order.status == RESTING:
+            if current == order:
+                return False
+            self._index_order(order)
+            return True
+        return self._drop_order(order.order_id) is not None
+
+    def _reconcile(self, resting: list[Order], before: int) -> list[Order]:
+        """Match the index to ``resting`` and return the orders that changed.
+
+        Orders created since ``before`` are kept: the listing may predate them.
+        """
+        resting_ids = {order.order_id for order in resting}
+        changed = [
+            order
+            for order in list(self._orders.values())
+            if order.order_id not in resting_ids and order.created_time.timestamp() < before
+        ]
+        for order in changed:
+            self._drop_order(order.order_id)
+        changed.extend(order for order in resting if self._apply_order(order))
+        return changed
+
+    def _index_order(self, order: Order) -> None:
+        self._drop_order(order.order_id)
+        self._orders[order.order_id] = order
+        self._orders_by_ticker.setdefault(order.ticker, {})[order.order_id] = order
+
+    def _drop_order(self, order_id: str) -> Order | None:
+        order = self._orders.pop(order_id, None)
+        if order is not None:
+            by_ticker = self._orders_by_ticker.get(order.ticker)
+            if by_ticker is not None:
+                by_ticker.pop(order_id, None)
+                if not by_ticker:
+                    del self._orders_by_ticker[order.ticker]
+        return order
+
+    def _index_position(self, position: Position) -> None:
+        self._drop_position(position.ticker)
+        self._positions[position.ticker] = position
+        self._positions_by_event.setdefault(position.event_ticker, {})[position.ticker] = position
+
+    def _drop_position(self, ticker: str) -> None:
+        position = self._positions.pop(ticker, None)
+        if position is not None:
+            by_event = self._positions_by_event.get(position.event_ticker)
+            if by_event is not None:
+                by_event.pop(ticker, None)
+                if not by_event:
+                    del self._positions_by_event[position.event_ticker]
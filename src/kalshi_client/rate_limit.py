@@ -0,0 +1,244 @@
+import mmap
+import os
+import struct
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import Protocol
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class RateLimiter(Protocol):
+    """Request budget accepted as ``rate_limiter=`` by the clients, dispatchers and poller."""
+
+    @property
+    def tokens(self) -> float: ...
+
+    def time_until_available(self, tokens: float = 1.0) -> float: ...
+
+    def try_acquire(self, tokens: float = 1.0) -> bool: ...
+
+    def reserve(self, tokens: float = 1.0) -> float: ...
+
+    def acquire(self, tokens: float = 1.0, timeout: float | None = None) -> bool: ...
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to keep callers under a request budget.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum burst size (defaults to one second worth of tokens)
+        clock: Monotonic clock, injectable for tests
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def time_until_available(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            self._refill()
+            deficit = tokens - self._tokens
+            return 0.0 if deficit <= 0 else deficit / self.rate
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens unconditionally and return how long the caller must wait.
+
+        The bucket may go into debt, which keeps waiters in FIFO order without
+        a condition variable and lets async callers sleep on their own loop.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0, timeout: float | None = None) -> bool:
+        with self._lock:
+            self._refill()
+            wait = max(0.0, (tokens - self._tokens) / self.rate)
+            if timeout is not None and wait > timeout:
+                return False
+            self._tokens -= tokens
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
+# Shared bucket file: magic, rate, capacity, tokens, last refill (monotonic seconds)
+_MAGIC = b"KALSHIRL"
+_STATE = struct.Struct("<8sdddd")
+_LEVEL = struct.Struct("<dd")
+_LEVEL_OFFSET = _STATE.size - _LEVEL.size
+_open_buckets: "weakref.WeakSet[SharedTokenBucket]" = weakref.WeakSet()
+
+
+class SharedTokenBucket:
+    """Token bucket shared by every process on the host that opens the same file.
+
+    The bucket state lives in a small memory-mapped file. Each operation runs
+    under an exclusive ``flock`` on the file (and a thread lock within the
+    process), so a dozen worker processes of one account draw from one budget.
+    Opening the file sets its rate and capacity for every process that uses it.
+    The refill clock is ``time.monotonic``, which is shared by all processes on
+    a host. A bucket left over from before a reboot, whose clock is now behind,
+    refills from the time it is next used.
+
+    The bucket is safe to use across ``fork`` (the child reopens the file, so
+    parent and child lock separately). It pickles by path, so it can also be
+    passed to processes started with ``spawn``. POSIX only.
+
+    Args:
+        path: Bucket file, created if missing (e.g. ``/dev/shm/kalshi-<account>.bucket``)
+        rate: Tokens added per second
+        capacity: Maximum burst size (defaults to one second worth of tokens)
+        clock: Monotonic clock, injectable for tests
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if fcntl is None:
+            raise OSError("SharedTokenBucket needs fcntl.flock, which this platform lacks")
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        capacity = capacity if capacity is not None else max(1.0, rate)
+        self.path = os.fspath(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < _STATE.size:
+                os.ftruncate(self._fd, _STATE.size)
+            self._mmap = mmap.mmap(self._fd, _STATE.size)
+            magic, _, _, tokens, updated = _STATE.unpack_from(self._mmap)
+            if magic != _MAGIC:
+                tokens, updated = capacity, clock()
+            _STATE.pack_into(self._mmap, 0, _MAGIC, rate, capacity, min(tokens, capacity), updated)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        _open_buckets.add(self)
+
+    def __reduce__(self):
+        return type(self), (self.path, self.rate, self.capacity)
+
+    @property
+    def rate(self) -> float:
+        return _STATE.unpack_from(self._mmap)[1]
+
+    @property
+    def capacity(self) -> float:
+        return _STATE.unpack_from(self._mmap)[2]
+
+    def _update(self, take: Callable[[float, float], tuple[float, float]]) -> float:
+        """Refill, then apply ``take(tokens, rate) -> (tokens taken, result)`` atomically."""
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                _, rate, capacity, tokens, updated = _STATE.unpack_from(self._mmap)
+                now = self._clock()
+                if now > updated:
+                    tokens = min(capacity, tokens + (now - updated) * rate)
+                taken, result = take(tokens, rate)
+                _LEVEL.pack_into(self._mmap, _LEVEL_OFFSET, tokens - taken, now)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return result
+
+    @property
+    def tokens(self) -> float:
+        return self._update(lambda tokens, rate: (0.0, tokens))
+
+    def time_until_available(self, tokens: float = 1.0) -> float:
+        return self._update(lambda level, rate: (0.0, max(0.0, (tokens - level) / rate)))
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        return bool(self._update(lambda level, rate: (tokens, 1) if level >= tokens else (0.0, 0)))
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens unconditionally and return how long the caller must wait."""
+        return self._update(lambda level, rate: (tokens, max(0.0, (tokens - level) / rate)))
+
+    def acquire(self, tokens: float = 1.0, timeout: float | None = None) -> bool:
+        def take(level: float, rate: float) -> tuple[float, float]:
+            wait = max(0.0, (tokens - level) / rate)
+            if timeout is not None and wait > timeout:
+                return 0.0, -1.0
+            return tokens, wait
+
+        wait = self._update(take)
+        if wait < 0:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def close(self) -> None:
+        _open_buckets.discard(self)
+        self._mmap.close()
+        os.close(self._fd)
+
+    def _reopen(self) -> None:
+        # A forked child shares the parent's open file description, and with it
+        # the parent's flock; a fresh descriptor gives the child its own lock
+        self._lock = threading.Lock()
+        fd = os.open(self.path, os.O_RDWR)
+        os.close(self._fd)
+        self._fd = fd
+
+    def __enter__(self) -> "SharedTokenBucket":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _reopen_after_fork() -> None:
+    for bucket in list(_open_buckets):
+        bucket._reopen()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reopen_after_fork)
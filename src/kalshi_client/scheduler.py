@@ -0,0 +1,238 @@
+import contextlib
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator, Mapping
+from contextvars import ContextVar
+from enum import IntEnum
+
+from .exceptions import KalshiDeadlineExceededError, KalshiQueueFullError
+from .metrics import ClientMetrics
+from .rate_limit import RateLimiter
+
+
+class Priority(IntEnum):
+    """Request classes, most urgent first."""
+
+    CANCEL = 0
+    CREATE = 1
+    PORTFOLIO = 2
+    MARKET_DATA = 3
+    BULK = 4
+
+
+_override: ContextVar[Priority | None] = ContextVar("kalshi_request_priority", default=None)
+
+
+@contextlib.contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Send every request made inside the block at ``priority``.
+
+    Example:
+        with request_priority(Priority.BULK):
+            markets = list(paginate(client.get_markets, limit=1000))
+    """
+    token = _override.set(priority)
+    try:
+        yield
+    finally:
+        _override.reset(token)
+
+
+def classify(method: str, endpoint: str) -> Priority:
+    """Priority of a request, unless overridden with ``request_priority``.
+
+    Cancels and creates come first, then other ``/portfolio`` reads, market
+    data, and finally trade history (``/markets/trades``) as bulk.
+    """
+    override = _override.get()
+    if override is not None:
+        return override
+    if endpoint.startswith("/portfolio"):
+        if endpoint.startswith("/portfolio/orders"):
+            if method == "DELETE":
+                return Priority.CANCEL
+            if method == "POST":
+                return Priority.CREATE
+        return Priority.PORTFOLIO
+    if endpoint.startswith("/markets/trades"):
+        return Priority.BULK
+    return Priority.MARKET_DATA
+
+
+class DispatchState:
+    """Admission bookkeeping shared by the thread and asyncio dispatchers.
+
+    Callers must hold the dispatcher's lock around every method.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rate_limiter: RateLimiter | None = None,
+        *,
+        class_limits: Mapping[Priority, int] | None = None,
+        queue_limits: Mapping[Priority, int] | None = None,
+        metrics: ClientMetrics | None = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.class_limits = dict.fromkeys(Priority, max_concurrency)
+        self.class_limits.update(class_limits or {})
+        self.queue_limits = dict(queue_limits or {})
+        self.metrics = metrics
+        self._queues: dict[Priority, deque[object]] = {priority: deque() for priority in Priority}
+        self._in_flight = dict.fromkeys(Priority, 0)
+        self._total = 0
+        if metrics is not None:
+            for priority in Priority:
+                self._publish(priority)
+
+    def queue_depth(self, priority: Priority | None = None) -> int:
+        """Requests waiting for admission, in one class or in all of them."""
+        if priority is not None:
+            return len(self._queues[priority])
+        return sum(len(queue) for queue in self._queues.values())
+
+    def in_flight(self, priority: Priority | None = None) -> int:
+        if priority is not None:
+            return self._in_flight[priority]
+        return self._total
+
+    def _enqueue(self, priority: Priority) -> object:
+        queue = self._queues[priority]
+        limit = self.queue_limits.get(priority)
+        if limit is not None and len(queue) >= limit:
+            raise KalshiQueueFullError(
+                f"{priority.name.lower()} queue is full ({limit} requests waiting)"
+            )
+        ticket = object()
+        queue.append(ticket)
+        self._publish(priority)
+        return ticket
+
+    def _discard(self, priority: Priority, ticket: object) -> None:
+        self._queues[priority].remove(ticket)
+        self._publish(priority)
+
+    def _next(self) -> Priority | None:
+        if self._total >= self.max_concurrency:
+            return None
+        for priority, queue in self._queues.items():
+            if queue and self._in_flight[priority] < self.class_limits[priority]:
+                return priority
+        return None
+
+    def _try_admit(self, priority: Priority, ticket: object) -> tuple[bool, float | None]:
+        """Admit ``ticket`` if it is next in line; otherwise return how long to wait.
+
+        The wait is ``None`` (until notified) unless the ticket is next in line
+        and only short of a rate token.
+        """
+        if self._next() is not priority or self._queues[priority][0] is not ticket:
+            return False, None
+        if self.rate_limiter is not None and not self.rate_limiter.try_acquire():
+            return False, max(self.rate_limiter.time_until_available(), 1e-3)
+        self._queues[priority].popleft()
+        self._in_flight[priority] += 1
+        self._total += 1
+        self._publish(priority)
+        return True, None
+
+    @staticmethod
+    def _bounded_wait(wait: float | None, end: float | None) -> float | None:
+        """Cap a wait at ``end`` (a ``time.monotonic()`` value), raising once it has passed."""
+        if end is None:
+            return wait
+        left = end - time.monotonic()
+        if left <= 0:
+            raise KalshiDeadlineExceededError("Deadline exceeded while waiting for a request slot")
+        return left if wait is None else min(wait, left)
+
+    def _release(self, priority: Priority) -> None:
+        self._in_flight[priority] -= 1
+        self._total -= 1
+        self._publish(priority)
+
+    def _publish(self, priority: Priority) -> None:
+        if self.metrics is not None:
+            label = priority.name.lower()
+            self.metrics.set_gauge("queue_depth", len(self._queues[priority]), priority=label)
+            self.metrics.set_gauge("in_flight", self._in_flight[priority], priority=label)
+
+
+class PriorityDispatcher(DispatchState):
+    """Admits requests most urgent class first under a shared concurrency limit and rate budget.
+
+    A request waits until it is at the head of its class's queue, no more
+    urgent class has a request that could run, a slot is free both overall
+    and within its class's cap, and the rate limiter has a token. Rate tokens
+    are only taken at admission, so under a tight budget they go to cancels
+    before creates, creates before portfolio reads, and so on. Queue depth and
+    in-flight counts per class are exported as ``queue_depth`` and
+    ``in_flight`` gauges labelled by ``priority``.
+
+    Args:
+        max_concurrency: Requests in flight at once across all classes
+        rate_limiter: Budget drawn from at admission
+        class_limits: Maximum requests in flight per class (``max_concurrency``
+            by default); capping market data and bulk leaves slots for trading
+        queue_limits: Maximum waiting requests per class (unbounded by
+            default); a request beyond it raises ``KalshiQueueFullError``
+        metrics: Receives the queue gauges
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rate_limiter: RateLimiter | None = None,
+        *,
+        class_limits: Mapping[Priority, int] | None = None,
+        queue_limits: Mapping[Priority, int] | None = None,
+        metrics: ClientMetrics | None = None,
+    ):
+        super().__init__(
+            max_concurrency,
+            rate_limiter,
+            class_limits=class_limits,
+            queue_limits=queue_limits,
+            metrics=metrics,
+        )
+        self._cond = threading.Condition()
+
+    def acquire(self, priority: Priority, timeout: float | None = None) -> None:
+        """Block until a request of class ``priority`` may be sent.
+
+        Raises:
+            KalshiQueueFullError: If the class's queue is at its limit
+            KalshiDeadlineExceededError: If not admitted within ``timeout`` seconds
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            ticket = self._enqueue(priority)
+            try:
+                while True:
+                    admitted, wait = self._try_admit(priority, ticket)
+                    if admitted:
+                        break
+                    self._cond.wait(self._bounded_wait(wait, end))
+            except BaseException:
+                self._discard(priority, ticket)
+                self._cond.notify_all()
+                raise
+            self._cond.notify_all()
+
+    def release(self, priority: Priority) -> None:
+        with self._cond:
+            self._release(priority)
+            self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def slot(self, priority: Priority) -> Iterator[None]:
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
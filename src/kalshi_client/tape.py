@@ -0,0 +1,437 @@
+"""Fixed-width binary trade tape for fast replay.
+
+A tape file holds a 64-byte header, one 24-byte record per trade in time
+order, a JSON ticker dictionary, a sparse time index (the timestamp of
+every ``index_interval``-th record) and a ticker index (each ticker's record
+numbers, so reading one ticker skips the others' records). ``TradeTape``
+memory-maps it, so opening a tape reads only the header, dictionary and
+time index, and with NumPy installed (``pip install 'kalshi-client[tape]'``)
+``TradeTape.records`` returns a zero-copy structured array over the mapped
+records.
+
+Record layout (little-endian):
+    created time     int64   microseconds since the epoch
+    count            uint32  contracts
+    ticker id        uint32  position in the ticker dictionary
+    yes price        uint8   cents
+    no price         uint8   cents
+    taker side       uint8   0 for yes, 1 for no
+    (5 bytes reserved)
+
+The ticker index follows the time index: ``len(tickers) + 1`` int64 start
+positions, then the uint32 record numbers of each ticker in turn. Tapes
+written before it existed have no ``TICKER_INDEX`` flag in the header and
+are scanned instead.
+
+Trade ids are not stored.
+
+Example:
+    with TradeTapeWriter("trades.tape") as writer:
+        writer.write_pages(iter_pages(client.get_trades, ticker="X", limit=1000))
+    with TradeTape("trades.tape") as tape:
+        prices = tape.records(tape.time_slice(start, end))["yes_price"]
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .bars import TradeColumns
+from .models import ObjectList, Trade
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MAGIC = b"KALSHITP"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQIQQQQI")
+# Header flags
+TICKER_INDEX = 1
+RECORD = struct.Struct("<qIIBBB5x")
+TIME = struct.Struct("<q")
+TICKER_ID = struct.Struct("<12xI")
+ROW = struct.Struct("<I")
+SIDES = ("yes", "no")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_FLUSH_RECORDS = 65_536
+
+
+def to_micros(moment: datetime) -> int:
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def from_micros(micros: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def record_dtype() -> "np.dtype":
+    """NumPy dtype of a tape record."""
+    np = _numpy()
+    return np.dtype(
+        {
+            "names": ["time", "count", "ticker_id", "yes_price", "no_price", "taker_side"],
+            "formats": ["<i8", "<u4", "<u4", "u1", "u1", "u1"],
+            "offsets": [0, 8, 12, 16, 17, 18],
+            "itemsize": RECORD.size,
+        }
+    )
+
+
+def _numpy() -> Any:
+    try:
+        import numpy  # noqa: PLC0415 - optional, and slow to import
+    except ImportError as e:
+        raise ImportError(
+            "NumPy views of a trade tape need NumPy: pip install 'kalshi-client[tape]'"
+        ) from e
+    return numpy
+
+
+class TapeRecord(NamedTuple):
+    """One decoded tape record; ``time`` is in microseconds since the epoch."""
+
+    ticker: str
+    time: int
+    yes_price: int
+    no_price: int
+    count: int
+    taker_side: str
+
+    @property
+    def created_time(self) -> datetime:
+        return from_micros(self.time)
+
+
+class TradeTapeWriter:
+    """Writes trades to a tape file.
+
+    Records are written to ``<path>.tmp``, which replaces ``path`` on a clean
+    ``close``. Trades in time order are streamed straight to disk; trades out
+    of order (such as ``get_trades`` pages, which are newest first) are sorted
+    by time on ``close``, which loads the records into memory (through NumPy
+    when it is installed).
+
+    Args:
+        path: Tape file to create
+        index_interval: Records between time index entries
+    """
+
+    def __init__(self, path: str | os.PathLike[str], index_interval: int = 4096):
+        if index_interval < 1:
+            raise ValueError("index_interval must be at least 1")
+        self.path = Path(path)
+        self.index_interval = index_interval
+        self.count = 0
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._file = open(self._tmp_path, "wb")  # noqa: SIM115
+        self._file.write(bytes(HEADER.size))
+        self._buffer = bytearray()
+        self._ticker_ids: dict[str, int] = {}
+        self._index = array("q")
+        # Record numbers of each ticker, by ticker id
+        self._rows: list[array] = []
+        self._last_time: int | None = None
+        self._sorted = True
+
+    def write(self, trade: Trade) -> None:
+        ticker_id = self._ticker_ids.setdefault(trade.ticker, len(self._ticker_ids))
+        if ticker_id == len(self._rows):
+            self._rows.append(array("I"))
+        self._rows[ticker_id].append(self.count)
+        micros = to_micros(trade.created_time)
+        if self._last_time is not None and micros < self._last_time:
+            self._sorted = False
+        self._last_time = micros
+        if self.count % self.index_interval == 0:
+            self._index.append(micros)
+        self._buffer += RECORD.pack(
+            micros,
+            trade.count,
+            ticker_id,
+            trade.yes_price,
+            trade.no_price,
+            SIDES.index(trade.taker_side),
+        )
+        self.count += 1
+        if len(self._buffer) >= _FLUSH_RECORDS * RECORD.size:
+            self._flush()
+
+    def write_many(self, trades: Iterable[Trade]) -> int:
+        """Write ``trades`` and return how many were written."""
+        start = self.count
+        for trade in trades:
+            self.write(trade)
+        return self.count - start
+
+    def write_pages(self, pages: Iterable[ObjectList[Trade]]) -> int:
+        """Write every trade of ``pages``, e.g. from ``iter_pages(client.get_trades, ...)``."""
+        return sum(self.write_many(page) for page in pages)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._flush()
+        if not self._sorted:
+            self._sort()
+        tickers = json.dumps(list(self._ticker_ids)).encode()
+        tickers_offset = HEADER.size + self.count * RECORD.size
+        # The index follows the dictionary, aligned for 8-byte reads
+        index_offset = -(-(tickers_offset + len(tickers)) // TIME.size) * TIME.size
+        self._file.seek(tickers_offset)
+        self._file.write(tickers)
+        self._file.write(bytes(index_offset - tickers_offset - len(tickers)))
+        self._file.write(self._index.tobytes())
+        self._file.write(array("q", accumulate(map(len, self._rows), initial=0)).tobytes())
+        for rows in self._rows:
+            self._file.write(rows.tobytes())
+        self._file.seek(0)
+        self._file.write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                RECORD.size,
+                self.count,
+                self.index_interval,
+                tickers_offset,
+                len(tickers),
+                index_offset,
+                len(self._index),
+                TICKER_INDEX,
+            )
+        )
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard the tape being written."""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def _flush(self) -> None:
+        self._file.write(self._buffer)
+        self._buffer.clear()
+
+    def _sort(self) -> None:
+        self._file.flush()
+        with open(self._tmp_path, "rb") as f:
+            f.seek(HEADER.size)
+            data = f.read(self.count * RECORD.size)
+        try:
+            np = _numpy()
+        except ImportError:
+            ordered = b"".join(
+                RECORD.pack(*fields)
+                for fields in sorted(RECORD.iter_unpack(data), key=itemgetter(0))
+            )
+            self._rows = [array("I") for _ in self._rows]
+            for i, fields in enumerate(RECORD.iter_unpack(ordered)):
+                self._rows[fields[2]].append(i)
+        else:
+            records = np.frombuffer(data, dtype=record_dtype())
+            records = records[np.argsort(records["time"], kind="stable")]
+            ordered = records.tobytes()
+            # Record numbers grouped by ticker, ascending within each
+            grouped = np.argsort(records["ticker_id"], kind="stable").astype(np.uint32)
+            ends = np.cumsum(np.bincount(records["ticker_id"], minlength=len(self._rows)))
+            self._rows = [
+                array("I", part.tobytes()) for part in np.split(grouped, ends[:-1].tolist())
+            ]
+        self._file.seek(HEADER.size)
+        self._file.write(ordered)
+        self._index = array(
+            "q",
+            (
+                TIME.unpack_from(ordered, i * RECORD.size)[0]
+                for i in range(0, self.count, self.index_interval)
+            ),
+        )
+
+    def __enter__(self) -> "TradeTapeWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class _Times:
+    """Record timestamps as a lazy sequence, for bisecting the mapped records."""
+
+    def __init__(self, tape: "TradeTape"):
+        self._buffer = tape._mmap
+        self._offset = tape._records_offset
+
+    def __getitem__(self, i: int) -> int:
+        return TIME.unpack_from(self._buffer, self._offset + i * RECORD.size)[0]
+
+
+class TradeTape:
+    """Read-only, memory-mapped view of a tape written by ``TradeTapeWriter``.
+
+    Decoded access (iteration, ``iter``, ``columns``) works without NumPy;
+    ``records`` needs it.
+
+    Args:
+        path: Tape file to open
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            record_size,
+            self.count,
+            self.index_interval,
+            tickers_offset,
+            tickers_length,
+            index_offset,
+            index_count,
+            flags,
+        ) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} trade tape")
+        self._records_offset = HEADER.size
+        self.tickers: list[str] = json.loads(
+            self._mmap[tickers_offset : tickers_offset + tickers_length]
+        )
+        self._ticker_ids = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._index = array("q")
+        self._index.frombytes(self._mmap[index_offset : index_offset + index_count * TIME.size])
+        # Start of each ticker's record numbers, read on demand from after the starts
+        self._row_starts: array | None = None
+        if flags & TICKER_INDEX:
+            starts_offset = index_offset + index_count * TIME.size
+            self._row_starts = array("q")
+            self._row_starts.frombytes(
+                self._mmap[starts_offset : starts_offset + (len(self.tickers) + 1) * TIME.size]
+            )
+            self._rows_offset = starts_offset + len(self._row_starts) * TIME.size
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> TapeRecord:
+        if not -self.count <= i < self.count:
+            raise IndexError("tape record index out of range")
+        return self._decode(i % self.count)
+
+    def __iter__(self) -> Iterator[TapeRecord]:
+        return self.iter()
+
+    def search(self, moment: datetime) -> int:
+        """Index of the first record at or after ``moment``."""
+        micros = to_micros(moment)
+        # Last block starting before ``micros``; equal times may start in the block before
+        block = max(0, bisect.bisect_left(self._index, micros) - 1)
+        lo = block * self.index_interval
+        hi = min(self.count, lo + self.index_interval)
+        return bisect.bisect_left(_Times(self), micros, lo, hi)
+
+    def time_slice(self, start: datetime | None = None, end: datetime | None = None) -> slice:
+        """Records from ``start`` (inclusive) to ``end`` (exclusive), as a slice."""
+        lo = 0 if start is None else self.search(start)
+        hi = self.count if end is None else self.search(end)
+        return slice(lo, max(lo, hi))
+
+    def records(self, where: slice | None = None) -> "np.ndarray":
+        """Zero-copy NumPy structured array over the mapped records (see ``record_dtype``).
+
+        The array is read-only and must be released before ``close``.
+        """
+        np = _numpy()
+        records = np.frombuffer(
+            self._mmap, dtype=record_dtype(), count=self.count, offset=self._records_offset
+        )
+        return records if where is None else records[where]
+
+    def iter(
+        self,
+        ticker: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[TapeRecord]:
+        """Decode records in time order, optionally for one ticker and time range.
+
+        A ticker's records are found through the ticker index, so only they
+        are read; tapes without one are scanned over the time range.
+        """
+        span = self.time_slice(start, end)
+        rows = range(span.start, span.stop) if ticker is None else self._ticker_rows(ticker, span)
+        for i in rows:
+            yield self._decode(i)
+
+    def columns(
+        self, ticker: str, start: datetime | None = None, end: datetime | None = None
+    ) -> TradeColumns:
+        """One ticker's trades as ``TradeColumns``, for ``BarAggregator.update_batch``.
+
+        The columns are NumPy arrays when NumPy is installed.
+        """
+        rows = self._ticker_rows(ticker, self.time_slice(start, end))
+        try:
+            np = _numpy()
+        except ImportError:
+            records = [self._decode(i) for i in rows]
+            return TradeColumns(
+                [record.time / 1e6 for record in records],
+                [record.yes_price for record in records],
+                [record.count for record in records],
+            )
+        records = self.records()[np.asarray(rows, dtype=np.intp)]
+        return TradeColumns(
+            records["time"] / 1e6,
+            records["yes_price"].astype(np.int64),
+            records["count"].astype(np.int64),
+        )
+
+    def _ticker_rows(self, ticker: str, span: slice) -> Sequence[int]:
+        """Record numbers of ``ticker``'s trades within ``span``, ascending."""
+        ticker_id = self._ticker_ids.get(ticker)
+        if ticker_id is None:
+            return []
+        if self._row_starts is None:
+            return [
+                i
+                for i in range(span.start, span.stop)
+                if TICKER_ID.unpack_from(self._mmap, self._records_offset + i * RECORD.size)[0]
+                == ticker_id
+            ]
+        lo, hi = self._row_starts[ticker_id], self._row_starts[ticker_id + 1]
+        rows = array("I")
+        rows.frombytes(
+            self._mmap[self._rows_offset + lo * ROW.size : self._rows_offset + hi * ROW.size]
+        )
+        return rows[bisect.bisect_left(rows, span.start) : bisect.bisect_left(rows, span.stop)]
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def _decode(self, i: int) -> TapeRecord:
+        return self._record(RECORD.unpack_from(self._mmap, self._records_offset + i * RECORD.size))
+
+    def _record(self, fields: tuple[int, ...]) -> TapeRecord:
+        micros, count, ticker_id, yes_price, no_price, side = fields
+        return TapeRecord(self.tickers[ticker_id], micros, yes_price, no_price, count, SIDES[side])
+
+    def __enter__(self) -> "TradeTape":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,8 @@
+from .exchange import ExchangeError, SimulatedExchange
+from .server import LocalKalshiServer
+
+__all__ = [
+    "LocalKalshiServer",
+    "SimulatedExchange",
+    "ExchangeError",
+]
@@ -0,0 +1,54 @@
+"""Run the simulated Kalshi API server: python -m kalshi_client.testing [--port 8080]"""
+
+import argparse
+import time
+
+from .exchange import SimulatedExchange
+from .server import LocalKalshiServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulated Kalshi API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--markets-per-event", type=int, default=5)
+    parser.add_argument("--trades-per-market", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency")
+    parser.add_argument("--rate-limit", type=float, help="Requests per second before 429s")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 5xx answers")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--trade-rate", type=float, default=0.0, help="Simulated trades/s")
+    args = parser.parse_args()
+
+    exchange = SimulatedExchange(
+        events=args.events,
+        markets_per_event=args.markets_per_event,
+        trades_per_market=args.trades_per_market,
+        seed=args.seed,
+    )
+    latency = (args.latency, args.latency + args.jitter) if args.jitter else args.latency
+    server = LocalKalshiServer(
+        exchange,
+        host=args.host,
+        port=args.port,
+        latency=latency,
+        rate_limit=args.rate_limit,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        trade_rate=args.trade_rate,
+        seed=args.seed,
+    )
+    with server:
+        print(f"Serving {len(exchange.tickers)} markets at {server.url}", flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
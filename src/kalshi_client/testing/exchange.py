@@ -0,0 +1,685 @@
+import base64
+import binascii
+import itertools
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+USER_ID = "local-user"
+PAYOUT = 100  # cents a winning contract pays
+MAX_PRICE = PAYOUT - 1
+CATEGORIES = ("Economics", "Politics", "Financials", "Climate and Weather", "Sports")
+OPEN_STATUSES = {"open": "active", "active": "active"}
+
+
+class ExchangeError(Exception):
+    """A request the simulated exchange rejects, with the HTTP status to answer."""
+
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def encode_cursor(seq: int) -> str:
+    return base64.urlsafe_b64encode(str(seq).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, binascii.Error) as e:
+        raise ExchangeError(400, "invalid_cursor", f"Invalid cursor: {cursor!r}") from e
+
+
+def _page[T](
+    records: Iterable[T],
+    seq: Callable[[T], int],
+    limit: int | None,
+    cursor: str | None,
+    descending: bool = False,
+) -> tuple[list[T], str]:
+    """Keyset pagination: the cursor is the sequence number of the last item returned,
+    so pages stay consistent while new trades and orders are being added."""
+    limit = DEFAULT_PAGE_SIZE if limit is None else limit
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ExchangeError(400, "invalid_parameters", f"limit must be in 1..{MAX_PAGE_SIZE}")
+    if cursor:
+        after = decode_cursor(cursor)
+        if descending:
+            records = (r for r in records if seq(r) < after)
+        else:
+            records = (r for r in records if seq(r) > after)
+    page = list(itertools.islice(records, limit + 1))
+    if len(page) > limit:
+        page = page[:limit]
+        return page, encode_cursor(seq(page[-1]))
+    return page, ""
+
+
+@dataclass(slots=True)
+class _Resting:
+    order_id: str | None  # None for simulated third-party liquidity
+    quantity: int
+
+
+@dataclass(slots=True)
+class _MarketState:
+    market: dict[str, Any]
+    seq: int
+    # Resting bids per side ("yes"/"no"), by price in cents, in time priority
+    book: dict[str, dict[int, deque[_Resting]]] = field(
+        default_factory=lambda: {"yes": {}, "no": {}}
+    )
+
+
+@dataclass(slots=True)
+class _OrderState:
+    order: dict[str, Any]
+    seq: int
+    created: float
+    bid_side: str
+    bid_price: int
+    remaining: int
+
+
+@dataclass(slots=True)
+class _PositionState:
+    position: dict[str, Any]
+    seq: int
+
+
+class SimulatedExchange:
+    """In-memory exchange behind ``LocalKalshiServer``.
+
+    Generates a deterministic universe of series, events and markets with
+    resting third-party liquidity and a trade history, and runs a price-time
+    priority matching book for orders submitted through the portfolio
+    endpoints. A bid for YES at ``p`` crosses a bid for NO at ``q`` when
+    ``p + q >= 100``; sells are booked as bids on the other side. Fills happen
+    at the resting price.
+
+    Args:
+        events: Number of events to generate
+        markets_per_event: Markets per event
+        trades_per_market: Historical trades per market
+        book_depth: Price levels of third-party liquidity per side
+        balance: Starting account balance in cents
+        seed: Seed for the generated universe and simulated activity
+        wall_clock: Clock for timestamps, injectable for tests
+    """
+
+    def __init__(  # noqa: PLR0913 - the options are keyword-only
+        self,
+        *,
+        events: int = 20,
+        markets_per_event: int = 5,
+        trades_per_market: int = 20,
+        book_depth: int = 10,
+        balance: int = 10_000_000,
+        seed: int = 0,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self._rng = random.Random(seed)
+        self._wall_clock = wall_clock
+        self._lock = threading.RLock()
+        self._seq = itertools.count(1)
+        self.balance = balance
+        self._events: dict[str, dict[str, Any]] = {}
+        self._markets: dict[str, _MarketState] = {}
+        self._trades: list[dict[str, Any]] = []  # oldest first
+        self._trade_seq: dict[str, int] = {}
+        self._orders: dict[str, _OrderState] = {}
+        self._order_ids_by_client_id: dict[str, str] = {}
+        self._positions: dict[str, _PositionState] = {}
+        self._generate(events, markets_per_event, trades_per_market, book_depth)
+
+    # Universe generation
+
+    def _generate(
+        self, events: int, markets_per_event: int, trades_per_market: int, book_depth: int
+    ) -> None:
+        rng = self._rng
+        now = self._wall_clock()
+        for e in range(events):
+            series = f"SIM{e % max(1, events // 10):02d}"
+            event_ticker = f"{series}-{e:04d}"
+            open_ts = now - rng.randint(1, 90) * 86400
+            close_ts = now + rng.randint(1, 180) * 86400
+            self._events[event_ticker] = {
+                "event_ticker": event_ticker,
+                "series_ticker": series,
+                "sub_title": f"Simulated event {e}",
+                "title": f"Where will indicator {e} settle?",
+                "mutually_exclusive": rng.random() < 0.5,  # noqa: PLR2004 - a coin flip
+                "category": CATEGORIES[e % len(CATEGORIES)],
+                "status": "open",
+                "open_time": _iso(open_ts),
+                "close_time": _iso(close_ts),
+            }
+            for m in range(markets_per_event):
+                self._add_market(event_ticker, m, open_ts, close_ts, book_depth)
+
+        start = now - 3600
+        for ticker in self._markets:
+            for _ in range(trades_per_market):
+                ts = start + rng.random() * 3600
+                yes_price = rng.randint(1, MAX_PRICE)
+                taker_side = rng.choice(("yes", "no"))
+                self._trades.append(
+                    self._trade_record(ticker, taker_side, yes_price, rng.randint(1, 100), ts)
+                )
+        self._trades.sort(key=lambda trade: trade["created_time"])
+        for trade in self._trades:
+            self._trade_seq[trade["trade_id"]] = next(self._seq)
+
+    def _add_market(
+        self, event_ticker: str, index: int, open_ts: float, close_ts: float, depth: int
+    ) -> None:
+        rng = self._rng
+        ticker = f"{event_ticker}-T{index:02d}"
+        fair = rng.randint(5, 95)
+        state = _MarketState(
+            market={
+                "ticker": ticker,
+                "event_ticker": event_ticker,
+                "market_type": "binary",
+                "title": f"Above {index * 10} at close?",
+                "subtitle": f"Above {index * 10}",
+                "yes_sub_title": "Yes",
+                "no_sub_title": "No",
+                "open_time": _iso(open_ts),
+                "close_time": _iso(close_ts),
+                "expected_expiration_time": _iso(close_ts + 3600),
+                "expiration_time": _iso(close_ts + 86400),
+                "status": "active",
+                "response_price_cents": 0,
+                "can_close_early": True,
+                "category": self._events[event_ticker]["category"],
+                "risk_limit_cents": 2_500_000,
+                "strike_type": "greater",
+                "floor_strike": index * 10,
+                "last_price": fair,
+                "volume": rng.randint(0, 100_000),
+                "volume_24h": rng.randint(0, 10_000),
+                "liquidity": rng.randint(0, 1_000_000),
+                "open_interest": rng.randint(0, 50_000),
+                "previous_yes_price": fair,
+                "previous_price": fair,
+            },
+            seq=next(self._seq),
+        )
+        for i in range(depth):
+            for side, best in (("yes", fair - 1), ("no", MAX_PRICE - fair)):
+                price = best - i
+                if price >= 1:
+                    state.book[side][price] = deque([_Resting(None, rng.randint(1, 500))])
+        self._markets[ticker] = state
+        self._refresh_quotes(state)
+
+    def _trade_record(
+        self, ticker: str, taker_side: str, yes_price: int, count: int, ts: float
+    ) -> dict[str, Any]:
+        return {
+            "trade_id": f"{self._rng.getrandbits(128):032x}",
+            "ticker": ticker,
+            "taker_side": taker_side,
+            "yes_price": yes_price,
+            "no_price": PAYOUT - yes_price,
+            "count": count,
+            "created_time": _iso(ts),
+        }
+
+    # Lookups
+
+    def _market_state(self, ticker: str) -> _MarketState:
+        state = self._markets.get(ticker)
+        if state is None:
+            raise ExchangeError(404, "not_found", f"Market {ticker} not found")
+        return state
+
+    @property
+    def tickers(self) -> list[str]:
+        return list(self._markets)
+
+    @property
+    def event_tickers(self) -> list[str]:
+        return list(self._events)
+
+    # Market data endpoints
+
+    def list_events(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        status: str | None = None,
+        series_ticker: str | None = None,
+        with_nested_markets: bool = False,
+    ) -> dict[str, Any]:
+        with self._lock:
+            positions = {ticker: i for i, ticker in enumerate(self._events)}
+            events = (
+                event
+                for event in self._events.values()
+                if (status is None or event["status"] == status)
+                and (series_ticker is None or event["series_ticker"] == series_ticker)
+            )
+            page, next_cursor = _page(
+                events, lambda event: positions[event["event_ticker"]], limit, cursor
+            )
+            if with_nested_markets:
+                page = [{**event, "markets": self._event_markets(event)} for event in page]
+            return {"events": page, "cursor": next_cursor}
+
+    def _event_markets(self, event: dict[str, Any]) -> list[dict[str, Any]]:
+        return [
+            dict(state.market)
+            for state in self._markets.values()
+            if state.market["event_ticker"] == event["event_ticker"]
+        ]
+
+    def get_event(self, event_ticker: str) -> dict[str, Any]:
+        with self._lock:
+            event = self._events.get(event_ticker)
+            if event is None:
+                raise ExchangeError(404, "not_found", f"Event {event_ticker} not found")
+            return {"event": dict(event), "markets": self._event_markets(event)}
+
+    def list_markets(  # noqa: PLR0913 - one parameter per query field
+        self,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        event_ticker: str | None = None,
+        series_ticker: str | None = None,
+        max_close_ts: int | None = None,
+        min_close_ts: int | None = None,
+        status: str | None = None,
+        tickers: list[str] | None = None,
+    ) -> dict[str, Any]:
+        status = OPEN_STATUSES.get(status, status)
+        wanted = set(tickers) if tickers else None
+
+        def selected(state: _MarketState) -> bool:
+            market = state.market
+            if event_ticker is not None and market["event_ticker"] != event_ticker:
+                return False
+            if series_ticker is not None and (
+                self._events[market["event_ticker"]]["series_ticker"] != series_ticker
+            ):
+                return False
+            if status is not None and market["status"] != status:
+                return False
+            if wanted is not None and market["ticker"] not in wanted:
+                return False
+            close_ts = datetime.fromisoformat(market["close_time"]).timestamp()
+            if min_close_ts is not None and close_ts < min_close_ts:
+                return False
+            return max_close_ts is None or close_ts <= max_close_ts
+
+        with self._lock:
+            states = (state for state in self._markets.values() if selected(state))
+            page, next_cursor = _page(states, lambda state: state.seq, limit, cursor)
+            return {"markets": [dict(state.market) for state in page], "cursor": next_cursor}
+
+    def get_market(self, ticker: str) -> dict[str, Any]:
+        with self._lock:
+            return {"market": dict(self._market_state(ticker).market)}
+
+    def get_orderbook(self, ticker: str, depth: int | None = None) -> dict[str, Any]:
+        with self._lock:
+            state = self._market_state(ticker)
+            orderbook = {}
+            for side, levels in state.book.items():
+                prices = sorted(levels, reverse=True)[:depth] if depth else sorted(levels)
+                orderbook[side] = [
+                    {"price": price, "quantity": sum(r.quantity for r in levels[price])}
+                    for price in sorted(prices)
+                ]
+            return {"orderbook": orderbook}
+
+    def list_trades(
+        self,
+        ticker: str | None = None,
+        min_ts: int | None = None,
+        max_ts: int | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        with self._lock:
+            trades = (
+                trade
+                for trade in reversed(self._trades)
+                if (ticker is None or trade["ticker"] == ticker)
+                and self._in_window(trade["created_time"], min_ts, max_ts)
+            )
+            page, next_cursor = _page(
+                trades,
+                lambda trade: self._trade_seq[trade["trade_id"]],
+                limit,
+                cursor,
+                descending=True,
+            )
+            return {"trades": page, "cursor": next_cursor}
+
+    @staticmethod
+    def _in_window(created_time: str, min_ts: int | None, max_ts: int | None) -> bool:
+        if min_ts is None and max_ts is None:
+            return True
+        ts = datetime.fromisoformat(created_time).timestamp()
+        return (min_ts is None or ts >= min_ts) and (max_ts is None or ts <= max_ts)
+
+    # Portfolio endpoints
+
+    def get_balance(self) -> dict[str, Any]:
+        with self._lock:
+            return {"balance": self.balance}
+
+    def list_orders(  # noqa: PLR0913 - one parameter per query field
+        self,
+        *,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+        min_ts: int | None = None,
+        max_ts: int | None = None,
+        status: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        def selected(state: _OrderState) -> bool:
+            order = state.order
+            if ticker is not None and order["ticker"] != ticker:
+                return False
+            if event_ticker is not None and (
+                self._markets[order["ticker"]].market["event_ticker"] != event_ticker
+            ):
+                return False
+            if status is not None and order["status"] != status:
+                return False
+            return (min_ts is None or state.created >= min_ts) and (
+                max_ts is None or state.created <= max_ts
+            )
+
+        with self._lock:
+            states = (state for state in reversed(self._orders.values()) if selected(state))
+            page, next_cursor = _page(
+                states, lambda state: state.seq, limit, cursor, descending=True
+            )
+            return {"orders": [dict(state.order) for state in page], "cursor": next_cursor}
+
+    def list_positions(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        settlement_status: str | None = None,
+        ticker: str | None = None,
+        event_ticker: str | None = None,
+    ) -> dict[str, Any]:
+        with self._lock:
+            if settlement_status == "settled":
+                states: Iterator[_PositionState] = iter(())
+            else:
+                states = (
+                    state
+                    for state in self._positions.values()
+                    if (ticker is None or state.position["ticker"] == ticker)
+                    and (event_ticker is None or state.position["event_ticker"] == event_ticker)
+                )
+            page, next_cursor = _page(states, lambda state: state.seq, limit, cursor)
+            positions = [self._position_record(state.position) for state in page]
+            return {"event_positions": positions, "cursor": next_cursor}
+
+    def _position_record(self, position: dict[str, Any]) -> dict[str, Any]:
+        resting = sum(
+            1
+            for state in self._orders.values()
+            if state.order["ticker"] == position["ticker"] and state.order["status"] == "resting"
+        )
+        return {**position, "resting_order_count": resting}
+
+    @staticmethod
+    def _order_price(body: dict[str, Any]) -> int:
+        """Validate an order body and return its YES price in cents."""
+        action, side, type_ = body.get("action"), body.get("side"), body.get("type", "limit")
+        count = body.get("count")
+        if action not in ("buy", "sell") or side not in ("yes", "no"):
+            raise ExchangeError(400, "invalid_parameters", "action must be buy/sell, side yes/no")
+        if type_ not in ("limit", "market"):
+            raise ExchangeError(400, "invalid_parameters", "type must be limit or market")
+        if not isinstance(count, int) or count < 1:
+            raise ExchangeError(400, "invalid_parameters", "count must be a positive integer")
+
+        yes_price, no_price = body.get("yes_price"), body.get("no_price")
+        if type_ == "market":
+            yes_price = MAX_PRICE if (action == "buy") == (side == "yes") else 1
+        elif (yes_price is None) == (no_price is None):
+            raise ExchangeError(
+                400, "invalid_parameters", "limit orders need exactly one of yes_price, no_price"
+            )
+        elif yes_price is None:
+            yes_price = PAYOUT - no_price
+        if not isinstance(yes_price, int) or not 1 <= yes_price <= MAX_PRICE:
+            raise ExchangeError(400, "invalid_parameters", "price must be in 1..99 cents")
+        return yes_price
+
+    def create_order(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Validate, match and (for unfilled limit orders) rest an order."""
+        yes_price = self._order_price(body)
+        ticker, action, side, count = body["ticker"], body["action"], body["side"], body["count"]
+        type_ = body.get("type", "limit")
+
+        # Book every order as a bid: buying YES or selling NO bids on YES, and vice versa
+        bid_side = "yes" if (action == "buy") == (side == "yes") else "no"
+        bid_price = yes_price if bid_side == "yes" else PAYOUT - yes_price
+        time_in_force = body.get("time_in_force")
+        client_order_id = body.get("client_order_id")
+
+        with self._lock:
+            state = self._market_state(ticker)
+            if client_order_id is not None and client_order_id in self._order_ids_by_client_id:
+                raise ExchangeError(
+                    409, "order_already_exists", f"Duplicate client_order_id {client_order_id}"
+                )
+            if bid_price * count > self.balance:
+                raise ExchangeError(400, "insufficient_balance", "Insufficient balance")
+            crossable = self._crossable(state, bid_side, bid_price)
+            if body.get("post_only") and crossable:
+                raise ExchangeError(400, "post_only_cross", "Post-only order would cross")
+
+            now = self._wall_clock()
+            order_id = uuid.uuid4().hex
+            order = {
+                "order_id": order_id,
+                "user_id": USER_ID,
+                "client_order_id": client_order_id,
+                "ticker": ticker,
+                "status": "resting",
+                "action": action,
+                "side": side,
+                "type": type_,
+                "yes_price": yes_price,
+                "no_price": PAYOUT - yes_price,
+                "count": count,
+                "yes_filled_count": 0,
+                "no_filled_count": 0,
+                "created_time": _iso(now),
+                "updated_time": _iso(now),
+                "time_in_force": time_in_force,
+            }
+            order_state = _OrderState(order, next(self._seq), now, bid_side, bid_price, count)
+            self._orders[order_id] = order_state
+            if client_order_id is not None:
+                self._order_ids_by_client_id[client_order_id] = order_id
+
+            if time_in_force == "fok" and crossable < count:
+                order["status"] = "canceled"
+                return {"order": dict(order)}
+            self._match(state, bid_side, bid_price, count, order_state)
+            if order_state.remaining:
+                if type_ == "market" or time_in_force in ("ioc", "fok"):
+                    order["status"] = "canceled"
+                else:
+                    state.book[bid_side].setdefault(bid_price, deque()).append(
+                        _Resting(order_id, order_state.remaining)
+                    )
+            else:
+                order["status"] = "executed"
+            self._refresh_quotes(state)
+            return {"order": dict(order)}
+
+    def cancel_order(self, order_id: str) -> dict[str, Any]:
+        with self._lock:
+            order_state = self._orders.get(order_id)
+            if order_state is None:
+                raise ExchangeError(404, "not_found", f"Order {order_id} not found")
+            order = order_state.order
+            if order["status"] != "resting":
+                raise ExchangeError(400, "order_not_resting", f"Order {order_id} is not resting")
+            state = self._markets[order["ticker"]]
+            level = state.book[order_state.bid_side][order_state.bid_price]
+            for resting in level:
+                if resting.order_id == order_id:
+                    level.remove(resting)
+                    break
+            if not level:
+                del state.book[order_state.bid_side][order_state.bid_price]
+            reduced_by, order_state.remaining = order_state.remaining, 0
+            order["status"] = "canceled"
+            order["updated_time"] = _iso(self._wall_clock())
+            self._refresh_quotes(state)
+            return {"order": dict(order), "reduced_by": reduced_by}
+
+    # Matching
+
+    @staticmethod
+    def _crossable(state: _MarketState, bid_side: str, bid_price: int) -> int:
+        opposite = state.book["no" if bid_side == "yes" else "yes"]
+        return sum(
+            resting.quantity
+            for price, level in opposite.items()
+            if price + bid_price >= PAYOUT
+            for resting in level
+        )
+
+    def _match(
+        self,
+        state: _MarketState,
+        bid_side: str,
+        bid_price: int,
+        count: int,
+        taker: _OrderState | None = None,
+    ) -> int:
+        """Fill an incoming bid against the opposite side, best price first."""
+        opposite_side = "no" if bid_side == "yes" else "yes"
+        opposite = state.book[opposite_side]
+        filled = 0
+        for price in sorted(opposite, reverse=True):
+            if filled == count or price + bid_price < PAYOUT:
+                break
+            level = opposite[price]
+            while level and filled < count:
+                maker = level[0]
+                quantity = min(maker.quantity, count - filled)
+                maker.quantity -= quantity
+                filled += quantity
+                if not maker.quantity:
+                    level.popleft()
+                taker_price = PAYOUT - price  # fills happen at the resting price
+                yes_price = taker_price if bid_side == "yes" else price
+                self._record_trade(state, bid_side, yes_price, quantity)
+                if taker is not None:
+                    self._fill(taker, taker_price, quantity)
+                if maker.order_id is not None:
+                    self._fill(self._orders[maker.order_id], price, quantity)
+            if not level:
+                del opposite[price]
+        return filled
+
+    def _fill(self, order_state: _OrderState, price: int, quantity: int) -> None:
+        order = order_state.order
+        order_state.remaining -= quantity
+        order[f"{order['side']}_filled_count"] += quantity
+        order["updated_time"] = _iso(self._wall_clock())
+        if not order_state.remaining and order["status"] == "resting":
+            order["status"] = "executed"
+        self.balance -= price * quantity
+
+        ticker = order["ticker"]
+        position_state = self._positions.get(ticker)
+        if position_state is None:
+            position_state = _PositionState(
+                {
+                    "ticker": ticker,
+                    "event_ticker": self._markets[ticker].market["event_ticker"],
+                    "position": 0,
+                    "market_exposure": 0,
+                    "realized_pnl": 0,
+                    "total_traded": 0,
+                    "resting_order_count": 0,
+                    "fees_paid": 0,
+                },
+                next(self._seq),
+            )
+            self._positions[ticker] = position_state
+        position = position_state.position
+        position["position"] += quantity if order_state.bid_side == "yes" else -quantity
+        position["market_exposure"] += price * quantity
+        position["total_traded"] += price * quantity
+
+    def _record_trade(
+        self, state: _MarketState, taker_side: str, yes_price: int, count: int
+    ) -> None:
+        trade = self._trade_record(
+            state.market["ticker"], taker_side, yes_price, count, self._wall_clock()
+        )
+        self._trades.append(trade)
+        self._trade_seq[trade["trade_id"]] = next(self._seq)
+        market = state.market
+        market["previous_price"] = market["last_price"]
+        market["last_price"] = yes_price
+        market["volume"] += count
+        market["volume_24h"] += count
+        market["open_interest"] += count
+
+    @staticmethod
+    def _refresh_quotes(state: _MarketState) -> None:
+        yes_bid = max(state.book["yes"], default=0)
+        no_bid = max(state.book["no"], default=0)
+        state.market.update(
+            yes_bid=yes_bid, no_bid=no_bid, yes_ask=PAYOUT - no_bid, no_ask=PAYOUT - yes_bid
+        )
+
+    # Simulated activity
+
+    def step(self, events: int = 1) -> None:
+        """Simulate third-party activity: new liquidity and trades on random markets."""
+        with self._lock:
+            tickers = list(self._markets)
+            for _ in range(events):
+                state = self._markets[self._rng.choice(tickers)]
+                side = self._rng.choice(("yes", "no"))
+                opposite = state.book["no" if side == "yes" else "yes"]
+                if opposite and self._rng.random() < 0.5:  # noqa: PLR2004 - a coin flip
+                    self._match(state, side, PAYOUT - max(opposite), self._rng.randint(1, 20))
+                else:
+                    best = max(state.book[side], default=self._rng.randint(5, 50))
+                    ceiling = MAX_PRICE - max(opposite, default=0)
+                    price = min(ceiling, max(1, best + self._rng.randint(-3, 1)))
+                    if price >= 1:
+                        state.book[side].setdefault(price, deque()).append(
+                            _Resting(None, self._rng.randint(1, 500))
+                        )
+                self._refresh_quotes(state)
@@ -0,0 +1,320 @@
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from ..configs.kalshi_configs import KalshiConfig
+from ..metrics import normalize_endpoint
+from ..rate_limit import TokenBucket
+from .exchange import ExchangeError, SimulatedExchange
+
+API_PREFIX = "/trade-api/v2"
+
+Query = dict[str, str]
+Route = tuple[str, re.Pattern[str], Callable[..., dict[str, Any]]]
+
+
+def _int(query: Query, name: str) -> int | None:
+    value = query.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError as e:
+        raise ExchangeError(400, "invalid_parameters", f"{name} must be an integer") from e
+
+
+def _bool(query: Query, name: str) -> bool:
+    return query.get(name, "").lower() == "true"
+
+
+class LocalKalshiServer:
+    """Simulated Kalshi API on a local port, for load, pagination and chaos tests.
+
+    Serves ``/events``, ``/markets``, ``/markets/trades``,
+    ``/markets/{ticker}/orderbook`` and ``/portfolio/*`` from a
+    ``SimulatedExchange``, with or without the ``/trade-api/v2`` prefix.
+    Faults are applied to every request in this order: latency, rate
+    limiting (429), then injected server errors.
+
+    Example:
+        with LocalKalshiServer(latency=0.005, rate_limit=100, error_rate=0.01) as server:
+            client = KalshiClient(config=server.config())
+            markets = list(paginate(client.get_markets, limit=1000))
+
+    Args:
+        exchange: Exchange state to serve (a default-sized universe when omitted)
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+        latency: Seconds added to every response, or a ``(low, high)`` range
+        rate_limit: Requests per second before answering 429 (unlimited if None)
+        error_rate: Probability of answering ``error_status`` instead of the response
+        error_status: Status code of injected errors
+        trade_rate: Simulated third-party book updates and trades per second
+        seed: Seed for latency and error injection
+    """
+
+    def __init__(  # noqa: PLR0913 - the options after exchange are keyword-only
+        self,
+        exchange: SimulatedExchange | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float | tuple[float, float] = 0.0,
+        rate_limit: float | None = None,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        trade_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.exchange = exchange or SimulatedExchange()
+        self.latency = latency
+        self.rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.trade_rate = trade_rate
+        self.requests: Counter[str] = Counter()
+        self.responses: Counter[int] = Counter()
+        self.connections = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._forced: list[int] = []
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.simulator = self
+        self._routes: list[Route] = [
+            ("GET", re.compile(r"/events"), self._list_events),
+            ("GET", re.compile(r"/events/(?P<event_ticker>[^/]+)"), self._get_event),
+            ("GET", re.compile(r"/markets"), self._list_markets),
+            ("GET", re.compile(r"/markets/trades"), self._list_trades),
+            ("GET", re.compile(r"/markets/(?P<ticker>[^/]+)"), self._get_market),
+            ("GET", re.compile(r"/markets/(?P<ticker>[^/]+)/orderbook"), self._get_orderbook),
+            ("GET", re.compile(r"/portfolio/balance"), self._get_balance),
+            ("GET", re.compile(r"/portfolio/orders"), self._list_orders),
+            ("POST", re.compile(r"/portfolio/orders"), self._create_order),
+            ("DELETE", re.compile(r"/portfolio/orders/(?P<order_id>[^/]+)"), self._cancel_order),
+            ("GET", re.compile(r"/portfolio/positions"), self._list_positions),
+        ]
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def config(self, **overrides: Any) -> KalshiConfig:
+        """A ``KalshiConfig`` pointing at this server."""
+        return KalshiConfig(
+            **{"api_key": "local", "api_secret": "local", "base_url": self.url, **overrides}
+        )
+
+    def start(self) -> "LocalKalshiServer":
+        self._stopped.clear()
+        self._threads = [
+            threading.Thread(
+                target=self._httpd.serve_forever,
+                kwargs={"poll_interval": 0.05},
+                name="kalshi-local-server",
+                daemon=True,
+            )
+        ]
+        if self.trade_rate > 0:
+            self._threads.append(
+                threading.Thread(target=self._simulate, name="kalshi-local-activity", daemon=True)
+            )
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self) -> "LocalKalshiServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def fail_next(self, count: int = 1, status: int | None = None) -> None:
+        """Answer the next ``count`` requests with ``status`` (default ``error_status``)."""
+        with self._lock:
+            self._forced.extend([status or self.error_status] * count)
+
+    def _simulate(self) -> None:
+        interval = 1.0 / self.trade_rate
+        while not self._stopped.wait(interval):
+            self.exchange.step()
+
+    def handle(
+        self, method: str, target: str, body: bytes, headers: dict[str, str]
+    ) -> tuple[int, dict[str, Any] | None]:
+        """Answer one request; returns the status and JSON payload."""
+        parts = urlsplit(target)
+        path = parts.path.removeprefix(API_PREFIX).rstrip("/") or "/"
+        status, payload = self._respond(method, path, parts.query, body, headers)
+        with self._lock:
+            self.requests[f"{method} {normalize_endpoint(path)}"] += 1
+            self.responses[status] += 1
+        return status, payload
+
+    def _respond(
+        self, method: str, path: str, query_string: str, body: bytes, headers: dict[str, str]
+    ) -> tuple[int, dict[str, Any] | None]:
+        query = {name: values[-1] for name, values in parse_qs(query_string).items()}
+
+        latency = self.latency
+        if isinstance(latency, tuple):
+            with self._lock:
+                latency = self._rng.uniform(*latency)
+        if latency > 0:
+            time.sleep(latency)
+
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        if not headers.get("kalshi-api-key"):
+            return 401, {"error": {"code": "unauthorized", "message": "Missing API key"}}
+
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match is None or route_method != method:
+                continue
+            try:
+                payload = json.loads(body) if body else {}
+                status = 201 if method == "POST" else 200
+                return status, handler(query, payload, **match.groupdict())
+            except ExchangeError as e:
+                return e.status, {"error": {"code": e.code, "message": e.message}}
+            except json.JSONDecodeError:
+                return 400, {"error": {"code": "invalid_body", "message": "Body is not JSON"}}
+        return 404, {"error": {"code": "not_found", "message": f"No route for {method} {path}"}}
+
+    def _fault(self) -> tuple[int, dict[str, Any]] | None:
+        if self.rate_limiter is not None and not self.rate_limiter.try_acquire():
+            return 429, {"error": {"code": "too_many_requests", "message": "Rate limit exceeded"}}
+        with self._lock:
+            if self._forced:
+                status = self._forced.pop(0)
+            elif self.error_rate and self._rng.random() < self.error_rate:
+                status = self.error_status
+            else:
+                return None
+        return status, {"error": {"code": "internal", "message": "Injected server error"}}
+
+    # Routes
+
+    def _list_events(self, query: Query, body: dict) -> dict[str, Any]:
+        return self.exchange.list_events(
+            limit=_int(query, "limit"),
+            cursor=query.get("cursor"),
+            status=query.get("status"),
+            series_ticker=query.get("series_ticker"),
+            with_nested_markets=_bool(query, "with_nested_markets"),
+        )
+
+    def _get_event(self, query: Query, body: dict, event_ticker: str) -> dict[str, Any]:
+        return self.exchange.get_event(event_ticker)
+
+    def _list_markets(self, query: Query, body: dict) -> dict[str, Any]:
+        tickers = query.get("tickers")
+        return self.exchange.list_markets(
+            limit=_int(query, "limit"),
+            cursor=query.get("cursor"),
+            event_ticker=query.get("event_ticker"),
+            series_ticker=query.get("series_ticker"),
+            max_close_ts=_int(query, "max_close_ts"),
+            min_close_ts=_int(query, "min_close_ts"),
+            status=query.get("status"),
+            tickers=tickers.split(",") if tickers else None,
+        )
+
+    def _get_market(self, query: Query, body: dict, ticker: str) -> dict[str, Any]:
+        return self.exchange.get_market(ticker)
+
+    def _get_orderbook(self, query: Query, body: dict, ticker: str) -> dict[str, Any]:
+        return self.exchange.get_orderbook(ticker, depth=_int(query, "depth"))
+
+    def _list_trades(self, query: Query, body: dict) -> dict[str, Any]:
+        return self.exchange.list_trades(
+            ticker=query.get("ticker"),
+            min_ts=_int(query, "min_ts"),
+            max_ts=_int(query, "max_ts"),
+            limit=_int(query, "limit"),
+            cursor=query.get("cursor"),
+        )
+
+    def _get_balance(self, query: Query, body: dict) -> dict[str, Any]:
+        return self.exchange.get_balance()
+
+    def _list_orders(self, query: Query, body: dict) -> dict[str, Any]:
+        return self.exchange.list_orders(
+            ticker=query.get("ticker"),
+            event_ticker=query.get("event_ticker"),
+            min_ts=_int(query, "min_ts"),
+            max_ts=_int(query, "max_ts"),
+            status=query.get("status"),
+            limit=_int(query, "limit"),
+            cursor=query.get("cursor"),
+        )
+
+    def _create_order(self, query: Query, body: dict) -> dict[str, Any]:
+        return self.exchange.create_order(body)
+
+    def _cancel_order(self, query: Query, body: dict, order_id: str) -> dict[str, Any]:
+        return self.exchange.cancel_order(order_id)
+
+    def _list_positions(self, query: Query, body: dict) -> dict[str, Any]:
+        return self.exchange.list_positions(
+            limit=_int(query, "limit"),
+            cursor=query.get("cursor"),
+            settlement_status=query.get("settlement_status"),
+            ticker=query.get("ticker"),
+            event_ticker=query.get("event_ticker"),
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    disable_nagle_algorithm = True  # headers and body are separate writes
+
+    def setup(self) -> None:
+        super().setup()
+        simulator = self.server.simulator
+        with simulator._lock:
+            simulator.connections += 1
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        status, payload = self.server.simulator.handle(method, self.path, body, headers)
+        content = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
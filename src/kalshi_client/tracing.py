@@ -0,0 +1,269 @@
+import functools
+import inspect
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from .metrics import normalize_endpoint
+
+# Traces of the requests made by the endpoint call running in this context
+_scope: ContextVar[list["RequestTrace"] | None] = ContextVar("kalshi_trace_scope", default=None)
+
+# httpcore trace events (without the "http11."/"http2."/"connection." prefix) that
+# delimit the network phases: phase name -> (start event, end event)
+_NETWORK_PHASES = {
+    "connect": ("connect_tcp.started", "connect_tcp.complete"),
+    "tls": ("start_tls.started", "start_tls.complete"),
+    "send": ("send_request_headers.started", "send_request_body.complete"),
+    "ttfb": ("send_request_body.complete", "receive_response_headers.complete"),
+    "receive": ("receive_response_body.started", "receive_response_body.complete"),
+}
+
+
+@dataclass(slots=True)
+class TracePhase:
+    name: str
+    start: float  # seconds since the trace started
+    duration: float
+
+
+@dataclass(slots=True)
+class RequestTrace:
+    """Timing of one request through the client pipeline.
+
+    Phases, in order: ``rate_limit`` (waiting for the rate limiter), ``queue``
+    (waiting for a concurrency slot), ``sign`` (header construction),
+    ``connect``/``tls`` (only when a new connection was opened), ``send``,
+    ``ttfb`` (request sent to response headers received), ``receive``,
+    ``decode`` (``response.json()``) and ``validate`` (model construction).
+    The network phases come from httpcore trace events and are missing for
+    transports that do not emit them.
+    """
+
+    method: str
+    endpoint: str
+    start_ns: int = field(default_factory=time.time_ns)
+    started: float = field(default_factory=time.perf_counter)
+    phases: list[TracePhase] = field(default_factory=list)
+    status_code: int | None = None
+    error: str | None = None
+    duration: float = 0.0
+    _events: dict[str, float] = field(default_factory=dict, repr=False)
+
+    @property
+    def route(self) -> str:
+        return normalize_endpoint(self.endpoint)
+
+    @property
+    def durations(self) -> dict[str, float]:
+        totals: dict[str, float] = {}
+        for phase in self.phases:
+            totals[phase.name] = totals.get(phase.name, 0.0) + phase.duration
+        return totals
+
+    def add_phase(self, name: str, start: float, end: float) -> None:
+        self.phases.append(TracePhase(name, start - self.started, end - start))
+        self.duration = max(self.duration, end - self.started)
+
+    def on_httpcore_event(self, event_name: str, info: dict[str, Any]) -> None:
+        """Callback for httpx's ``trace`` request extension."""
+        self._events[event_name.split(".", 1)[1]] = time.perf_counter()
+
+    async def aon_httpcore_event(self, event_name: str, info: dict[str, Any]) -> None:
+        """``trace`` extension callback for async transports, which await it."""
+        self._events[event_name.split(".", 1)[1]] = time.perf_counter()
+
+    def finish_network(self) -> None:
+        for name, (start_event, end_event) in _NETWORK_PHASES.items():
+            start = self._events.get(start_event)
+            end = self._events.get(end_event)
+            if start is not None and end is not None:
+                self.add_phase(name, start, end)
+        self._events.clear()
+        self.phases.sort(key=lambda phase: phase.start)
+
+
+class _Phase:
+    __slots__ = ("name", "start", "trace")
+
+    def __init__(self, trace: RequestTrace, name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.trace.add_phase(self.name, self.start, time.perf_counter())
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+_NO_PHASE = _NoPhase()
+
+
+def trace_phase(name: str) -> _Phase | _NoPhase:
+    """Time a block as a phase of the current request, if it is being traced."""
+    scope = _scope.get()
+    if not scope:
+        return _NO_PHASE
+    return _Phase(scope[-1], name)
+
+
+def start_trace(method: str, endpoint: str) -> RequestTrace | None:
+    """Begin tracing a request if the surrounding endpoint call is traced."""
+    scope = _scope.get()
+    if scope is None:
+        return None
+    trace = RequestTrace(method.upper(), endpoint)
+    scope.append(trace)
+    return trace
+
+
+def attempt_scope() -> list[RequestTrace] | None:
+    """Own scope for one of several concurrent attempts of a request, if it is traced.
+
+    Attempts sharing the caller's scope would time phases into each other's traces.
+    """
+    return None if _scope.get() is None else []
+
+
+@contextmanager
+def use_scope(scope: list[RequestTrace] | None) -> Iterator[None]:
+    """Trace the requests of the block into ``scope`` (the current scope if None)."""
+    if scope is None:
+        yield
+        return
+    token = _scope.set(scope)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def adopt_attempts(
+    scopes: Iterable[list[RequestTrace] | None], used: list[RequestTrace] | None = None
+) -> None:
+    """Add the traces of concurrent attempts to the current scope, ``used`` last.
+
+    Phases timed after the call (``decode``, ``validate``) then go to the trace of
+    the attempt whose response was used.
+    """
+    parent = _scope.get()
+    if parent is None:
+        return
+    for scope in scopes:
+        if scope is not None and scope is not used:
+            parent.extend(scope)
+    if used is not None:
+        parent.extend(used)
+
+
+def traced[F: Callable[..., Any]](func: F) -> F:
+    """Deliver the traces of an endpoint method's requests to the client's trace hooks.
+
+    Works on both plain and ``async`` methods.
+    """
+
+    def emit(self, scope: list[RequestTrace]) -> None:
+        for trace in scope:
+            for hook in list(self.trace_hooks):
+                hook(trace)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if not self.trace_hooks:
+                return await func(self, *args, **kwargs)
+            scope: list[RequestTrace] = []
+            token = _scope.set(scope)
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                _scope.reset(token)
+                emit(self, scope)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not self.trace_hooks:
+            return func(self, *args, **kwargs)
+        scope: list[RequestTrace] = []
+        token = _scope.set(scope)
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            _scope.reset(token)
+            emit(self, scope)
+
+    return wrapper
+
+
+class TraceCollector:
+    """Trace hook that keeps every trace it receives."""
+
+    def __init__(self):
+        self.traces: list[RequestTrace] = []
+
+    def __call__(self, trace: RequestTrace) -> None:
+        self.traces.append(trace)
+
+    def __iter__(self) -> Iterator[RequestTrace]:
+        return iter(self.traces)
+
+    def __len__(self) -> int:
+        return len(self.traces)
+
+
+@contextmanager
+def collect_traces(hooks: list[Callable[[RequestTrace], None]]) -> Iterator[TraceCollector]:
+    collector = TraceCollector()
+    hooks.append(collector)
+    try:
+        yield collector
+    finally:
+        hooks.remove(collector)
+
+
+def opentelemetry_hook(tracer: Any = None) -> Callable[[RequestTrace], None]:
+    """Trace hook exporting each request as an OpenTelemetry span with one child per phase.
+
+    Requires the ``opentelemetry-api`` package.
+    """
+    try:
+        from opentelemetry import trace as otel_trace  # noqa: PLC0415 - optional
+    except ImportError as e:
+        raise ImportError("opentelemetry_hook requires the opentelemetry-api package") from e
+
+    tracer = tracer or otel_trace.get_tracer("kalshi_client")
+
+    def hook(trace: RequestTrace) -> None:
+        attributes = {"http.request.method": trace.method, "url.template": trace.route}
+        if trace.status_code is not None:
+            attributes["http.response.status_code"] = trace.status_code
+        if trace.error is not None:
+            attributes["error.type"] = trace.error
+        span = tracer.start_span(
+            f"{trace.method} {trace.route}", start_time=trace.start_ns, attributes=attributes
+        )
+        context = otel_trace.set_span_in_context(span)
+        for phase in trace.phases:
+            start_ns = trace.start_ns + int(phase.start * 1e9)
+            child = tracer.start_span(phase.name, context=context, start_time=start_ns)
+            child.end(end_time=start_ns + int(phase.duration * 1e9))
+        span.end(end_time=trace.start_ns + int(trace.duration * 1e9))
+
+    return hook
@@ -0,0 +1,273 @@
+import asyncio
+import base64
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Literal
+
+import httpx
+
+# Headers describing the wire encoding; recorded bodies are stored decoded
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class ReplayMissError(LookupError):
+    """A replayed client made a request that is not in the recording."""
+
+
+@dataclass(slots=True)
+class RecordedExchange:
+    """One request/response pair of a recording.
+
+    Attributes:
+        t: Seconds from the start of the recording to the request
+        elapsed: Seconds until the response body was fully received
+        method: HTTP method
+        path: URL path, e.g. ``/trade-api/v2/markets``
+        query: Encoded query string (without ``?``)
+        status: Response status code
+        headers: Response headers, minus wire-encoding ones
+        body: Decoded response body
+    """
+
+    t: float
+    elapsed: float
+    method: str
+    path: str
+    query: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return self.method, self.path, self.query
+
+    def to_json(self) -> str:
+        record = {
+            "t": round(self.t, 6),
+            "elapsed": round(self.elapsed, 6),
+            "method": self.method,
+            "path": self.path,
+            "query": self.query,
+            "status": self.status,
+            "headers": self.headers,
+        }
+        try:
+            record["body"] = self.body.decode()
+        except UnicodeDecodeError:
+            record["body_b64"] = base64.b64encode(self.body).decode()
+        return json.dumps(record, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> "RecordedExchange":
+        record = json.loads(line)
+        if "body_b64" in record:
+            body = base64.b64decode(record["body_b64"])
+        else:
+            body = record.get("body", "").encode()
+        return cls(
+            t=record["t"],
+            elapsed=record["elapsed"],
+            method=record["method"],
+            path=record["path"],
+            query=record["query"],
+            status=record["status"],
+            headers=record.get("headers", {}),
+            body=body,
+        )
+
+
+def _request_key(request: httpx.Request) -> tuple[str, str, str]:
+    return request.method, request.url.path, request.url.query.decode()
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def load_recording(path: str | Path) -> list[RecordedExchange]:
+    """Read a recording written by ``RecordingTransport``, in request order."""
+    with _open(Path(path), "r") as f:
+        return [RecordedExchange.from_json(line) for line in f if line.strip()]
+
+
+class _Recorder:
+    def __init__(self, path: str | Path):
+        self._file = _open(Path(path), "w")
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def now(self) -> float:
+        return time.perf_counter() - self._started
+
+    def record(
+        self, request: httpx.Request, response: httpx.Response, body: bytes, t: float
+    ) -> httpx.Response:
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _WIRE_HEADERS
+        }
+        method, path, query = _request_key(request)
+        exchange = RecordedExchange(
+            t, self.now() - t, method, path, query, response.status_code, headers, body
+        )
+        line = exchange.to_json()
+        with self._lock:
+            self._file.write(line + "\n")
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=body,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Transport that records every exchange to a JSON-lines log while passing it through.
+
+    The log is gzip-compressed when ``path`` ends in ``.gz``. Response bodies are
+    buffered, so streaming responses arrive in one piece.
+
+    Example:
+        transport = RecordingTransport("session.jsonl.gz")
+        with KalshiClient(transport=transport) as client:
+            list(paginate(client.get_markets, limit=1000))
+
+    Args:
+        path: Log file to create (overwritten if it exists)
+        transport: Transport that actually sends the requests
+    """
+
+    def __init__(self, path: str | Path, transport: httpx.BaseTransport | None = None):
+        self._transport = transport or httpx.HTTPTransport()
+        self._recorder = _Recorder(path)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        t = self._recorder.now()
+        response = self._transport.handle_request(request)
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        return self._recorder.record(request, response, body, t)
+
+    def close(self) -> None:
+        self._transport.close()
+        self._recorder.close()
+
+
+class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``RecordingTransport`` for ``AsyncKalshiClient``."""
+
+    def __init__(self, path: str | Path, transport: httpx.AsyncBaseTransport | None = None):
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._recorder = _Recorder(path)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        t = self._recorder.now()
+        response = await self._transport.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        return self._recorder.record(request, response, body, t)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+        self._recorder.close()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport that answers requests from a recording, for sync or async clients.
+
+    Requests are matched on method, path and query string, so paginated walks
+    replay page by page. Repeats of the same request get the recorded responses
+    in order; once those run out the last one is served again. Request bodies
+    are not compared.
+
+    Args:
+        recording: Log file written by a recording transport, or the exchanges themselves
+        timing: ``"fast"`` answers immediately. ``"original"`` holds each response for
+            its recorded latency, and no earlier than its offset in the recording,
+            so a client issuing the recorded traffic sees the original pacing.
+        speed: Playback speed multiplier for ``"original"`` timing
+
+    Raises:
+        ReplayMissError: From a request that never appears in the recording
+    """
+
+    def __init__(
+        self,
+        recording: str | Path | Iterable[RecordedExchange],
+        timing: Literal["fast", "original"] = "fast",
+        speed: float = 1.0,
+    ):
+        if timing not in ("fast", "original"):
+            raise ValueError(f"timing must be 'fast' or 'original', not {timing!r}")
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        if isinstance(recording, str | Path):
+            recording = load_recording(recording)
+        self.timing = timing
+        self.speed = speed
+        self._queues: dict[tuple[str, str, str], deque[RecordedExchange]] = {}
+        for exchange in recording:
+            self._queues.setdefault(exchange.key, deque()).append(exchange)
+        self._lock = threading.Lock()
+        self._started: float | None = None
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def __iter__(self) -> Iterator[RecordedExchange]:
+        for queue in self._queues.values():
+            yield from queue
+
+    def _next(self, request: httpx.Request) -> tuple[RecordedExchange, float]:
+        key = _request_key(request)
+        with self._lock:
+            now = time.perf_counter()
+            if self._started is None:
+                self._started = now
+            queue = self._queues.get(key)
+            if not queue:
+                method, path, query = key
+                raise ReplayMissError(f"No recorded response for {method} {path}?{query}")
+            exchange = queue.popleft() if len(queue) > 1 else queue[0]
+        delay = 0.0
+        if self.timing == "original":
+            due = (exchange.t + exchange.elapsed) / self.speed - (now - self._started)
+            delay = max(exchange.elapsed / self.speed, due)
+        return exchange, delay
+
+    @staticmethod
+    def _response(request: httpx.Request, exchange: RecordedExchange) -> httpx.Response:
+        return httpx.Response(
+            exchange.status, headers=exchange.headers, content=exchange.body, request=request
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        exchange, delay = self._next(request)
+        if delay > 0:
+            time.sleep(delay)
+        return self._response(request, exchange)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        exchange, delay = self._next(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._response(request, exchange)
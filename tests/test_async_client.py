@@ -0,0 +1,173 @@
+import json
+
+import httpx
+import pytest
+
+from kalshi_client import AsyncKalshiClient, ClientMetrics, KalshiConfig, apaginate
+from kalshi_client.exceptions import KalshiAuthError, KalshiServerError
+
+ORDER = {
+    "order_id": "order123",
+    "user_id": "user456",
+    "ticker": "ECON-GDP-24",
+    "status": "resting",
+    "action": "buy",
+    "side": "yes",
+    "type": "limit",
+    "yes_price": 60,
+    "count": 10,
+    "yes_filled_count": 0,
+    "no_filled_count": 0,
+    "created_time": "2024-01-01T00:00:00Z",
+}
+
+
+def make_client(handler, **kwargs) -> AsyncKalshiClient:
+    config = KalshiConfig(api_key="key", api_secret="secret", base_url="https://api.kalshi.com")
+    return AsyncKalshiClient(config=config, transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_signs_requests():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"balance": 42})
+
+    async with make_client(handler) as client:
+        assert await client.get_balance() == 42
+    assert seen[0].headers["KALSHI-API-KEY"] == "key"
+    assert "KALSHI-API-SIGNATURE" in seen[0].headers
+
+
+@pytest.mark.asyncio
+async def test_maps_error_status():
+    async with make_client(lambda request: httpx.Response(401)) as client:
+        with pytest.raises(KalshiAuthError):
+            await client.get_balance()
+
+
+@pytest.mark.asyncio
+async def test_apaginate_orders():
+    def handler(request):
+        if request.url.params.get("cursor") == "next":
+            return httpx.Response(200, json={"orders": [ORDER], "cursor": ""})
+        return httpx.Response(200, json={"orders": [ORDER, ORDER], "cursor": "next"})
+
+    async with make_client(handler) as client:
+        orders = [order async for order in apaginate(client.get_orders, limit=2)]
+    assert len(orders) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_order_sends_client_order_id():
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(201, json={"order": ORDER})
+
+    async with make_client(handler) as client:
+        result = await client.create_order(
+            ticker="ECON-GDP-24", action="buy", side="yes", type="limit", count=10, yes_price=60
+        )
+    assert result.order_id == "order123"
+    assert result.client_order_id == bodies[0]["client_order_id"]
+    assert "no_price" not in bodies[0]
+
+
+@pytest.mark.asyncio
+async def test_create_order_retry_finds_existing_order():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if request.method == "POST":
+            return httpx.Response(503)
+        client_order_id = bodies_seen[0]["client_order_id"]
+        return httpx.Response(
+            200, json={"orders": [{**ORDER, "client_order_id": client_order_id}], "cursor": ""}
+        )
+
+    bodies_seen = []
+
+    def recording_handler(request):
+        if request.method == "POST":
+            bodies_seen.append(json.loads(request.content))
+        return handler(request)
+
+    async with make_client(recording_handler) as client:
+        result = await client.create_order(
+            ticker="ECON-GDP-24",
+            action="buy",
+            side="yes",
+            type="limit",
+            count=10,
+            yes_price=60,
+            retries=1,
+        )
+        assert result.order_id == "order123"
+        assert not client.order_ledger.in_flight()
+    assert calls == ["POST", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_create_order_resend_conflict_finds_existing_order():
+    posts = []
+
+    def handler(request):
+        if request.method == "POST":
+            posts.append(json.loads(request.content)["client_order_id"])
+            return httpx.Response(503 if len(posts) == 1 else 409, text="order_already_exists")
+        orders = [{**ORDER, "client_order_id": posts[0]}] if len(posts) > 1 else []
+        return httpx.Response(200, json={"orders": orders, "cursor": ""})
+
+    async with make_client(handler) as client:
+        result = await client.create_order(
+            ticker="ECON-GDP-24",
+            action="buy",
+            side="yes",
+            type="limit",
+            count=10,
+            yes_price=60,
+            client_order_id="quote-1",
+            retries=1,
+        )
+        assert result.order_id == "order123"
+        assert not client.order_ledger.in_flight()
+    assert posts == ["quote-1", "quote-1"]
+
+
+@pytest.mark.asyncio
+async def test_create_order_without_retries_raises():
+    async with make_client(lambda request: httpx.Response(500)) as client:
+        with pytest.raises(KalshiServerError):
+            await client.create_order(
+                ticker="ECON-GDP-24", action="buy", side="yes", type="limit", count=1
+            )
+
+
+@pytest.mark.asyncio
+async def test_cancel_orders_reports_per_order():
+    def handler(request):
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404)
+        return httpx.Response(200)
+
+    async with make_client(handler) as client:
+        results = await client.cancel_orders(["a", "missing", "b"])
+    assert [getattr(r, "order_id", None) for r in results] == ["a", None, "b"]
+
+
+@pytest.mark.asyncio
+async def test_records_metrics_and_traces():
+    metrics = ClientMetrics()
+    async with make_client(
+        lambda request: httpx.Response(200, json={"balance": 1}), metrics=metrics
+    ) as client:
+        with client.trace() as traces:
+            await client.get_balance()
+    assert metrics.snapshot()["endpoints"]["GET /portfolio/balance"]["requests"] == 1
+    [trace] = traces.traces
+    assert {"queue", "sign", "decode"} <= set(trace.durations)
@@ -0,0 +1,137 @@
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from kalshi_client import Bar, TickBars, TimeBars, TradeColumns, VolumeBars
+from kalshi_client.bars import BarAggregator
+from kalshi_client.models import Trade
+
+T0 = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def trade(seconds: float, price: int, count: int = 1, ticker: str = "X") -> Trade:
+    return Trade(
+        trade_id=f"{ticker}-{seconds}-{price}",
+        ticker=ticker,
+        taker_side="yes",
+        yes_price=price,
+        no_price=100 - price,
+        count=count,
+        created_time=T0 + timedelta(seconds=seconds),
+    )
+
+
+def random_tape(n: int, seed: int = 3) -> list[Trade]:
+    rng = random.Random(seed)
+    seconds = 0.0
+    trades = []
+    for _ in range(n):
+        seconds += rng.expovariate(0.5)
+        trades.append(trade(seconds, rng.randint(1, 99), rng.randint(1, 50)))
+    return trades
+
+
+class TestTimeBars:
+    def test_candle_closes_on_next_period(self):
+        bars = TimeBars(timedelta(minutes=1))
+        assert bars.update(trade(1, 40, 2)) == []
+        assert bars.update(trade(10, 45, 1)) == []
+        assert bars.update(trade(30, 38, 3)) == []
+        [candle] = bars.update(trade(61, 50))
+        assert candle == Bar(
+            ticker="X",
+            start=T0,
+            end=T0 + timedelta(minutes=1),
+            open=40,
+            high=45,
+            low=38,
+            close=38,
+            volume=6,
+            trades=3,
+            notional=40 * 2 + 45 + 38 * 3,
+        )
+        assert candle.vwap == pytest.approx(239 / 6)
+        assert bars.current("X").open == 50
+
+    def test_tickers_are_independent(self):
+        bars = TimeBars(60)
+        bars.update(trade(1, 40, ticker="A"))
+        assert bars.update(trade(70, 41, ticker="B")) == []
+        assert [bar.ticker for bar in bars.flush()] == ["A", "B"]
+
+    def test_late_trade_joins_open_candle(self):
+        bars = TimeBars(60)
+        bars.update(trade(61, 50))
+        assert bars.update(trade(59, 20)) == []
+        assert bars.current("X").low == 20
+
+    def test_close_due(self):
+        bars = TimeBars(60)
+        bars.update(trade(1, 40))
+        assert bars.close_due(T0 + timedelta(seconds=59)) == []
+        [candle] = bars.close_due(T0 + timedelta(seconds=60))
+        assert candle.close == 40
+        assert bars.current("X") is None
+
+
+class TestVolumeAndTickBars:
+    def test_volume_bars(self):
+        bars = VolumeBars(10)
+        assert bars.update(trade(1, 40, 4)) == []
+        [bar] = bars.update(trade(2, 42, 8))
+        assert (bar.volume, bar.trades, bar.start, bar.end) == (
+            12,
+            2,
+            T0 + timedelta(seconds=1),
+            T0 + timedelta(seconds=2),
+        )
+        assert bars.current("X") is None
+
+    def test_tick_bars(self):
+        bars = TickBars(2)
+        closed = bars.update_many(trade(s, 40 + s) for s in range(5))
+        assert [(bar.open, bar.close) for bar in closed] == [(40, 41), (42, 43)]
+        assert bars.current("X").trades == 1
+
+    @pytest.mark.parametrize("size", [0, -1])
+    def test_size_must_be_positive(self, size):
+        with pytest.raises(ValueError):
+            VolumeBars(size)
+        with pytest.raises(ValueError):
+            TickBars(size)
+
+
+def test_base_aggregator_is_abstract():
+    with pytest.raises(TypeError):
+        BarAggregator()
+
+
+@pytest.fixture(params=["python", "numpy"])
+def batch_path(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("kalshi_client.bars._optional_numpy", lambda: None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "make", [lambda: TimeBars(30), lambda: VolumeBars(100), lambda: TickBars(7)]
+)
+def test_batch_matches_streaming(make, batch_path):
+    tape = random_tape(500)
+    streamed, batched = make(), make()
+    expected = streamed.update_many(tape[:200])
+    expected += streamed.update_many(tape[200:]) + streamed.flush()
+
+    # Split mid-bar so the second block continues the open bar
+    actual = batched.update_batch("X", TradeColumns.from_trades(tape[:200]))
+    actual += batched.update_batch("X", TradeColumns.from_trades(tape[200:])) + batched.flush()
+    assert actual == expected
+    assert sum(bar.volume for bar in actual) == sum(t.count for t in tape)
+
+
+def test_stream_yields_closed_bars():
+    bars = TickBars(2)
+    assert [bar.trades for bar in bars.stream(random_tape(5))] == [2, 2]
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from kalshi_client import bench
+from kalshi_client.testing import LocalKalshiServer, SimulatedExchange
+
+
+@pytest.fixture(scope="module")
+def server():
+    with LocalKalshiServer(SimulatedExchange(events=4, markets_per_event=5)) as server:
+        yield server
+
+
+def test_parse_mix():
+    assert bench.parse_mix("markets=2, orderbook") == {"markets": 2.0, "orderbook": 1.0}
+    with pytest.raises(ValueError, match="Unknown operation"):
+        bench.parse_mix("markets,nope")
+    with pytest.raises(ValueError):
+        bench.parse_mix("markets=0")
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_run_reports_each_endpoint(server, use_async):
+    report = bench.run(
+        server.config(max_concurrency=2),
+        workers=2,
+        duration=0.3,
+        warmup=0.05,
+        mix="markets=1,orderbook=1,order=1",
+        use_async=use_async,
+        page_size=10,
+    )
+    assert report.mode == ("async" if use_async else "threads")
+    assert set(report.endpoints) == {
+        "GET /markets",
+        "GET /markets/{ticker}/orderbook",
+        "POST /portfolio/orders",
+        "DELETE /portfolio/orders/{order_id}",
+    }
+    assert report.requests > 0
+    assert report.errors == 0
+    summary = report.to_dict()
+    latency = summary["endpoints"]["GET /markets"]["latency"]
+    assert 0 < latency["p50"] <= latency["p99"] <= latency["max"]
+    assert summary["cpu_seconds"] > 0
+
+
+def test_error_rate_in_report(server):
+    server.fail_next(2)
+    report = bench.run(
+        server.config(), workers=1, duration=0.2, warmup=0, mix="balance", tickers=["X"]
+    )
+    result = report.endpoints["GET /portfolio/balance"]
+    assert result.errors == {"KalshiServerError": 2}
+    assert result.requests > 2
+    assert "KalshiServerError=2" in report.format()
+
+
+def test_main_json(server, capsys):
+    assert (
+        bench.main(
+            [
+                "--url",
+                server.url,
+                "--workers",
+                "1",
+                "--duration",
+                "0.1",
+                "--warmup",
+                "0",
+                "--mix",
+                "trades",
+                "--json",
+            ]
+        )
+        == 0
+    )
+    output = json.loads(capsys.readouterr().out)
+    assert output["workers"] == 1
+    assert "GET /markets/trades" in output["endpoints"]
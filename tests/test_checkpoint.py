@@ -0,0 +1,161 @@
+import json
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from kalshi_client import FileCheckpoint, SQLiteCheckpoint, dedup_key
+from kalshi_client.checkpoint import query_key
+from kalshi_client.models import Market, ObjectList, Order, Trade
+from kalshi_client.pagination import apaginate, iter_pages, paginate
+
+PAGES = {
+    None: ([1, 2], "c1"),
+    "c1": ([3, 4], "c2"),
+    "c2": ([5, 6], "c3"),
+    "c3": ([7], None),
+}
+
+
+class Item(BaseModel):
+    id: int
+
+
+def make_fetch(pages=PAGES) -> Mock:
+    def fetch(cursor=None, **params):
+        ids, next_cursor = pages[cursor]
+        return ObjectList(items=[Item(id=i) for i in ids], cursor=next_cursor)
+
+    return Mock(side_effect=fetch)
+
+
+def make_async_fetch(pages=PAGES):
+    async def get_items(cursor=None, **params):
+        ids, next_cursor = pages[cursor]
+        return ObjectList(items=[Item(id=i) for i in ids], cursor=next_cursor)
+
+    return get_items
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def checkpoint(request, tmp_path):
+    if request.param == "file":
+        yield FileCheckpoint(tmp_path / "crawl.json")
+    else:
+        store = SQLiteCheckpoint(tmp_path / "crawl.db")
+        yield store
+        store.close()
+
+
+def crawl_until_crash(checkpoint, crash_at: int) -> list[int]:
+    seen = []
+    with pytest.raises(RuntimeError):
+        for item in paginate(make_fetch(), checkpoint=checkpoint, checkpoint_key="items"):
+            seen.append(item.id)
+            if item.id == crash_at:
+                raise RuntimeError("worker died")
+    return seen
+
+
+class TestStores:
+    def test_round_trip(self, checkpoint):
+        assert checkpoint.load("k") is None
+        checkpoint.save("k", {"cursor": "c1", "pages": 1})
+        checkpoint.save("other", {"cursor": "x"})
+        assert checkpoint.load("k") == {"cursor": "c1", "pages": 1}
+        checkpoint.clear("k")
+        assert checkpoint.load("k") is None
+        assert checkpoint.load("other") == {"cursor": "x"}
+
+    def test_file_save_is_atomic(self, tmp_path):
+        store = FileCheckpoint(tmp_path / "crawl.json")
+        store.save("k", {"cursor": "c1"})
+        store.save("k", {"cursor": "c2"})
+        assert [p.name for p in tmp_path.iterdir()] == ["crawl.json"]
+        assert json.loads((tmp_path / "crawl.json").read_text()) == {"k": {"cursor": "c2"}}
+
+    def test_sqlite_persists_across_connections(self, tmp_path):
+        SQLiteCheckpoint(tmp_path / "crawl.db").save("k", {"cursor": "c1"})
+        assert SQLiteCheckpoint(tmp_path / "crawl.db").load("k") == {"cursor": "c1"}
+        with pytest.raises(ValueError):
+            SQLiteCheckpoint(tmp_path / "crawl.db", table="x; DROP TABLE y")
+        rows = sqlite3.connect(tmp_path / "crawl.db").execute(
+            "SELECT key FROM pagination_checkpoints"
+        )
+        assert rows.fetchall() == [("k",)]
+
+
+class TestResume:
+    def test_resume_replays_unconfirmed_page(self, checkpoint):
+        # Crashes midway through the second page; only the first was confirmed
+        assert crawl_until_crash(checkpoint, crash_at=3) == [1, 2, 3]
+        assert checkpoint.load("items")["cursor"] == "c1"
+
+        fetch = make_fetch()
+        rest = paginate(fetch, checkpoint=checkpoint, checkpoint_key="items", resume=True)
+        assert [item.id for item in rest] == [3, 4, 5, 6, 7]
+        assert fetch.call_args_list[0].kwargs == {"cursor": "c1"}
+        assert checkpoint.load("items") is None
+
+    def test_page_is_confirmed_once_consumer_moves_on(self, checkpoint):
+        pages = iter_pages(make_fetch(), checkpoint=checkpoint, checkpoint_key="items")
+        next(pages)
+        assert checkpoint.load("items") is None
+        next(pages)
+        state = checkpoint.load("items")
+        assert (state["cursor"], state["pages"], state["items"]) == ("c1", 1, 2)
+        pages.close()
+        assert checkpoint.load("items")["cursor"] == "c1"
+
+    def test_without_resume_starts_over(self, checkpoint):
+        crawl_until_crash(checkpoint, crash_at=5)
+        items = paginate(make_fetch(), checkpoint=checkpoint, checkpoint_key="items")
+        assert [item.id for item in items] == [1, 2, 3, 4, 5, 6, 7]
+
+    def test_resume_without_checkpoint_state(self, checkpoint):
+        items = paginate(make_fetch(), checkpoint=checkpoint, checkpoint_key="items", resume=True)
+        assert [item.id for item in items] == [1, 2, 3, 4, 5, 6, 7]
+
+    @pytest.mark.asyncio
+    async def test_async_resume(self, checkpoint):
+        seen = []
+        with pytest.raises(RuntimeError):
+            async for item in apaginate(make_async_fetch(), checkpoint=checkpoint, limit=2):
+                seen.append(item.id)
+                if item.id == 5:
+                    raise RuntimeError("worker died")
+        key = query_key(make_async_fetch(), {"limit": 2})
+        assert checkpoint.load(key)["cursor"] == "c2"
+
+        rest = apaginate(make_async_fetch(), checkpoint=checkpoint, limit=2, resume=True)
+        assert [item.id async for item in rest] == [5, 6, 7]
+        assert checkpoint.load(key) is None
+
+
+def test_query_key_ignores_call_options():
+    def get_trades(**params):
+        raise AssertionError
+
+    key = query_key(get_trades, {"ticker": "X", "limit": 100})
+    assert key == query_key(get_trades, {"limit": 100, "ticker": "X", "deadline": 5.0})
+    assert key != query_key(get_trades, {"ticker": "Y", "limit": 100})
+    with pytest.raises(ValueError, match="checkpoint_key"):
+        query_key(Mock(), {})
+
+
+def test_dedup_key():
+    trade = Trade(
+        trade_id="t1",
+        ticker="X",
+        taker_side="yes",
+        yes_price=40,
+        no_price=60,
+        count=1,
+        created_time="2026-01-01T00:00:00Z",
+    )
+    assert dedup_key(trade) == "t1"
+    assert dedup_key(Market.model_construct(ticker="KXBTC")) == "KXBTC"
+    assert dedup_key(Order.model_construct(order_id="o1", ticker="KXBTC")) == "o1"
+    with pytest.raises(ValueError):
+        dedup_key(Item(id=1))
@@ -0,0 +1,198 @@
+import httpx
+import pytest
+
+from kalshi_client import (
+    AsyncKalshiClient,
+    CircuitBreakers,
+    ClientMetrics,
+    KalshiCircuitOpenError,
+    KalshiClient,
+    KalshiConfig,
+)
+from kalshi_client.circuit_breaker import CircuitBreaker, CircuitState, endpoint_group
+from kalshi_client.exceptions import (
+    KalshiNotFoundError,
+    KalshiQueueFullError,
+    KalshiServerError,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def breaker(clock, **options) -> CircuitBreaker:
+    options = {"min_requests": 4, "window": 10.0, "reset_timeout": 5.0, **options}
+    return CircuitBreaker("market_data", clock=clock, **options)
+
+
+def fail(breaker, count=1, duration=0.01):
+    for _ in range(count):
+        breaker.record(duration, KalshiServerError("boom"), breaker.allow())
+
+
+def succeed(breaker, count=1, duration=0.01):
+    for _ in range(count):
+        breaker.record(duration, None, breaker.allow())
+
+
+@pytest.mark.parametrize(
+    ("method", "endpoint", "group"),
+    [
+        ("POST", "/portfolio/orders", "orders"),
+        ("DELETE", "/portfolio/orders/abc", "orders"),
+        ("GET", "/portfolio/orders", "portfolio"),
+        ("GET", "/portfolio/balance", "portfolio"),
+        ("GET", "/markets/X/orderbook", "market_data"),
+    ],
+)
+def test_endpoint_group(method, endpoint, group):
+    assert endpoint_group(method, endpoint) == group
+
+
+class TestCircuitBreaker:
+    def test_opens_on_failure_ratio(self, clock):
+        cb = breaker(clock)
+        succeed(cb, 2)
+        fail(cb, 1)
+        assert cb.state is CircuitState.CLOSED
+        fail(cb, 1)
+        assert cb.state is CircuitState.OPEN
+        clock.now = 2.0
+        with pytest.raises(KalshiCircuitOpenError) as exc_info:
+            cb.allow()
+        assert exc_info.value.group == "market_data"
+        assert exc_info.value.retry_after == pytest.approx(3.0)
+        assert cb.rejected == 1
+
+    def test_needs_min_requests(self, clock):
+        cb = breaker(clock)
+        fail(cb, 3)
+        assert cb.state is CircuitState.CLOSED
+
+    def test_old_outcomes_leave_the_window(self, clock):
+        cb = breaker(clock)
+        fail(cb, 3)
+        clock.now = 11.0
+        succeed(cb, 1)
+        fail(cb, 1)
+        assert cb.state is CircuitState.CLOSED
+
+    def test_client_errors_are_not_failures(self, clock):
+        cb = breaker(clock)
+        for _ in range(10):
+            cb.record(0.01, KalshiNotFoundError("missing"), cb.allow())
+        assert cb.state is CircuitState.CLOSED
+
+    def test_slow_calls_open(self, clock):
+        cb = breaker(clock, slow_call_duration=1.0, slow_call_threshold=0.5)
+        succeed(cb, 2)
+        succeed(cb, 2, duration=2.0)
+        assert cb.state is CircuitState.OPEN
+
+    def test_half_open_probe_closes(self, clock):
+        cb = breaker(clock)
+        fail(cb, 4)
+        clock.now = 5.0
+        assert cb.state is CircuitState.HALF_OPEN
+        probe = cb.allow()
+        assert probe
+        with pytest.raises(KalshiCircuitOpenError):
+            cb.allow()
+        cb.record(0.01, None, probe)
+        assert cb.state is CircuitState.CLOSED
+        fail(cb, 3)
+        assert cb.state is CircuitState.CLOSED
+
+    def test_half_open_failure_reopens(self, clock):
+        cb = breaker(clock)
+        fail(cb, 4)
+        clock.now = 5.0
+        fail(cb, 1)
+        assert cb.state is CircuitState.OPEN
+        clock.now = 9.0
+        assert cb.state is CircuitState.OPEN
+        clock.now = 10.0
+        assert cb.state is CircuitState.HALF_OPEN
+
+    def test_ignored_probe_frees_its_slot(self, clock):
+        cb = breaker(clock)
+        fail(cb, 4)
+        clock.now = 5.0
+        cb.record(0.0, KalshiQueueFullError(), cb.allow())
+        assert cb.state is CircuitState.HALF_OPEN
+        succeed(cb, 1)
+        assert cb.state is CircuitState.CLOSED
+
+    def test_state_gauge(self, clock):
+        metrics = ClientMetrics()
+        breakers = CircuitBreakers(metrics, min_requests=1, clock=clock)
+        assert metrics.snapshot()["gauges"]['circuit_state{group="orders"}'] == 0
+        fail(breakers["orders"])
+        gauges = metrics.snapshot()["gauges"]
+        assert gauges['circuit_state{group="orders"}'] == 2
+        assert gauges['circuit_state{group="market_data"}'] == 0
+        breakers.reset()
+        assert breakers.states()["orders"] is CircuitState.CLOSED
+
+
+def handler(request):
+    if request.url.path.startswith("/markets"):
+        return httpx.Response(503)
+    return httpx.Response(200, json={"balance": 100})
+
+
+def config(**overrides) -> KalshiConfig:
+    return KalshiConfig(
+        api_key="key", api_secret="secret", base_url="https://api.kalshi.com", **overrides
+    )
+
+
+class TestClientIntegration:
+    def test_fails_fast_per_group(self, clock):
+        sent = []
+        client = KalshiClient(
+            config=config(),
+            transport=httpx.MockTransport(lambda request: sent.append(request) or handler(request)),
+            circuit_breakers=CircuitBreakers(min_requests=3, clock=clock),
+        )
+        for _ in range(3):
+            with pytest.raises(KalshiServerError):
+                client.get_market("X")
+        with pytest.raises(KalshiCircuitOpenError):
+            client.get_market("X")
+        assert len(sent) == 3
+        assert client.get_balance() == 100
+
+        clock.now = 10.0
+        with pytest.raises(KalshiServerError):
+            client.get_market("X")
+        assert client.circuit_breakers.states()["market_data"] is CircuitState.OPEN
+
+    def test_config_enables_breakers(self):
+        client = KalshiClient(config=config(circuit_breaker=True))
+        assert isinstance(client.circuit_breakers, CircuitBreakers)
+        assert KalshiClient(config=config()).circuit_breakers is None
+
+    @pytest.mark.asyncio
+    async def test_async_client(self, clock):
+        async with AsyncKalshiClient(
+            config=config(),
+            transport=httpx.MockTransport(handler),
+            circuit_breakers=CircuitBreakers(min_requests=2, clock=clock),
+        ) as client:
+            for _ in range(2):
+                with pytest.raises(KalshiServerError):
+                    await client.get_markets()
+            with pytest.raises(KalshiCircuitOpenError):
+                await client.get_markets()
+            assert await client.get_balance() == 100
@@ -1,3 +1,5 @@
+import time
+from contextvars import ContextVar
 from unittest.mock import Mock, patch
 
 import httpx
@@ -19,6 +21,8 @@ from kalshi_client.models import (
     OrderCreatedResponse,
 )
 
+request_tag: ContextVar[str | None] = ContextVar("request_tag", default=None)
+
 
 @pytest.fixture
 def mock_config():
@@ -576,3 +580,296 @@ class TestKalshiClient:
 
         with pytest.raises(KalshiServerError, match="Server error: 500 - Internal server error"):
             client.get_events()
+
+
+class TestBatchOrders:
+    @staticmethod
+    def _order_response(order_id: str) -> Mock:
+        response = Mock()
+        response.status_code = 201
+        response.json.return_value = {
+            "order": {
+                "order_id": order_id,
+                "user_id": "user456",
+                "ticker": "ECON-GDP-24",
+                "status": "resting",
+                "action": "buy",
+                "side": "yes",
+                "type": "limit",
+                "yes_price": 60,
+                "count": 10,
+                "yes_filled_count": 0,
+                "no_filled_count": 0,
+                "created_time": "2024-01-01T00:00:00Z",
+            }
+        }
+        return response
+
+    @patch("httpx.Client.request")
+    def test_create_orders_reports_partial_failures(self, mock_request, client):
+        rejected = Mock()
+        rejected.status_code = 400
+        rejected.text = "Invalid price"
+
+        def respond(method, url, headers, params, json):
+            if json["yes_price"] == 0:
+                return rejected
+            return self._order_response(f"order-{json['yes_price']}")
+
+        mock_request.side_effect = respond
+        orders = [
+            {
+                "ticker": "ECON-GDP-24",
+                "action": "buy",
+                "side": "yes",
+                "type": "limit",
+                "count": 1,
+                "yes_price": price,
+            }
+            for price in (10, 0, 30)
+        ]
+
+        results = client.create_orders(orders)
+
+        assert [type(r) for r in results] == [
+            OrderCreatedResponse,
+            KalshiValidationError,
+            OrderCreatedResponse,
+        ]
+        assert results[0].order_id == "order-10"
+        assert results[2].order_id == "order-30"
+        assert mock_request.call_count == 3
+
+    @patch("httpx.Client.request")
+    def test_cancel_orders(self, mock_request, client):
+        not_found = Mock()
+        not_found.status_code = 404
+        ok = Mock()
+        ok.status_code = 200
+        mock_request.side_effect = lambda method, url, **kwargs: (
+            not_found if url.endswith("missing") else ok
+        )
+
+        results = client.cancel_orders(["o1", "missing", "o3"])
+
+        assert isinstance(results[0], OrderCancelledResponse)
+        assert isinstance(results[1], KalshiNotFoundError)
+        assert results[2].order_id == "o3"
+
+    @patch("httpx.Client.request")
+    def test_fan_out_keeps_caller_context(self, mock_request, client):
+        seen = []
+        mock_request.side_effect = lambda method, url, **kwargs: (
+            seen.append(request_tag.get()) or Mock(status_code=200)
+        )
+
+        token = request_tag.set("batch")
+        try:
+            client.cancel_orders(["o1", "o2", "o3"])
+        finally:
+            request_tag.reset(token)
+            client.close()
+
+        assert seen == ["batch"] * 3
+
+    @patch("httpx.Client.request")
+    def test_fan_out_under_submit_runs_inline(self, mock_request, mock_config):
+        mock_request.return_value = Mock(status_code=200)
+        client = KalshiClient(config=mock_config.model_copy(update={"max_concurrency": 1}))
+
+        future = client.submit(client.cancel_orders, ["o1", "o2"])
+
+        assert [r.order_id for r in future.result(timeout=5)] == ["o1", "o2"]
+        client.close()
+
+    @patch("httpx.Client.request")
+    def test_cancel_all_orders_for_ticker(self, mock_request, client):
+        listing = Mock()
+        listing.status_code = 200
+        listing.json.return_value = {
+            "orders": [
+                self._order_response(order_id).json.return_value["order"]
+                for order_id in ("o1", "o2")
+            ],
+            "cursor": "",
+        }
+        cancelled = Mock()
+        cancelled.status_code = 200
+        mock_request.side_effect = lambda method, **kwargs: (
+            listing if method == "GET" else cancelled
+        )
+
+        results = client.cancel_all_orders(ticker="ECON-GDP-24")
+
+        assert sorted(r.order_id for r in results) == ["o1", "o2"]
+        list_call = mock_request.call_args_list[0]
+        assert list_call.kwargs["params"]["status"] == "resting"
+        assert list_call.kwargs["params"]["ticker"] == "ECON-GDP-24"
+
+    @patch("httpx.Client.request")
+    def test_requests_draw_from_rate_limiter(self, mock_request, mock_config):
+        limiter = Mock()
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"balance": 1}
+        mock_request.return_value = response
+
+        client = KalshiClient(config=mock_config, rate_limiter=limiter)
+        client.get_balance()
+
+        limiter.acquire.assert_called_once()
+
+
+class TestIdempotentOrders:
+    ORDER = {
+        "ticker": "ECON-GDP-24",
+        "action": "buy",
+        "side": "yes",
+        "type": "limit",
+        "count": 10,
+        "yes_price": 60,
+    }
+
+    @staticmethod
+    def _listing(client_order_id: str | None) -> Mock:
+        response = Mock()
+        response.status_code = 200
+        orders = []
+        if client_order_id is not None:
+            orders.append(
+                {
+                    "order_id": "order123",
+                    "user_id": "user456",
+                    "client_order_id": client_order_id,
+                    "ticker": "ECON-GDP-24",
+                    "status": "resting",
+                    "action": "buy",
+                    "side": "yes",
+                    "type": "limit",
+                    "yes_price": 60,
+                    "count": 10,
+                    "yes_filled_count": 0,
+                    "no_filled_count": 0,
+                    "created_time": "2024-01-01T00:00:00Z",
+                }
+            )
+        response.json.return_value = {"orders": orders, "cursor": ""}
+        return response
+
+    @patch("httpx.Client.request")
+    def test_generates_client_order_id(self, mock_request, client):
+        created = TestBatchOrders._order_response("order123")
+        mock_request.return_value = created
+
+        response = client.create_order(**self.ORDER)
+
+        sent_id = mock_request.call_args.kwargs["json"]["client_order_id"]
+        assert len(sent_id) == 32
+        assert response.client_order_id == sent_id
+        assert len(client.order_ledger) == 0
+
+    @patch("httpx.Client.request")
+    def test_timeout_resolved_by_lookup(self, mock_request, client):
+        def respond(method, url, **kwargs):
+            if method == "POST":
+                raise httpx.ReadTimeout("timed out")
+            return self._listing("quote-1")
+
+        mock_request.side_effect = respond
+
+        response = client.create_order(**self.ORDER, client_order_id="quote-1", retries=2)
+
+        assert response.order_id == "order123"
+        methods = [call.kwargs["method"] for call in mock_request.call_args_list]
+        assert methods == ["POST", "GET"]
+        assert mock_request.call_args.kwargs["params"]["ticker"] == "ECON-GDP-24"
+        assert "quote-1" not in client.order_ledger
+
+    @patch("httpx.Client.request")
+    def test_timeout_resubmits_when_order_missing(self, mock_request, client):
+        created = TestBatchOrders._order_response("order123")
+        posts = []
+
+        def respond(method, url, **kwargs):
+            if method == "GET":
+                return self._listing(None)
+            posts.append(kwargs["json"]["client_order_id"])
+            if len(posts) == 1:
+                raise httpx.ConnectTimeout("timed out")
+            return created
+
+        mock_request.side_effect = respond
+
+        response = client.create_order(**self.ORDER, retries=1)
+
+        assert response.order_id == "order123"
+        assert len(posts) == 2
+        assert posts[0] == posts[1]
+
+    @patch("httpx.Client.request")
+    def test_lookup_retried_before_resubmitting(self, mock_request, client):
+        lookups = []
+
+        def respond(method, url, **kwargs):
+            if method == "POST":
+                raise httpx.ReadTimeout("timed out")
+            lookups.append(kwargs["params"])
+            # The order shows up in the listing only on the second lookup
+            return self._listing("quote-4" if len(lookups) > 1 else None)
+
+        mock_request.side_effect = respond
+
+        response = client.create_order(**self.ORDER, client_order_id="quote-4", retries=2)
+
+        assert response.order_id == "order123"
+        methods = [call.kwargs["method"] for call in mock_request.call_args_list]
+        assert methods == ["POST", "GET", "GET"]
+        # The window tolerates a local clock minutes ahead of the exchange
+        assert lookups[0]["min_ts"] <= time.time() - 240
+
+    @patch("httpx.Client.request")
+    def test_duplicate_on_resend_returns_existing_order(self, mock_request, client):
+        posts = []
+
+        def respond(method, url, **kwargs):
+            if method == "POST":
+                posts.append(kwargs["json"]["client_order_id"])
+                if len(posts) == 1:
+                    raise httpx.ReadTimeout("timed out")
+                conflict = Mock()
+                conflict.status_code = 409
+                conflict.text = "order_already_exists"
+                return conflict
+            return self._listing("quote-5" if len(posts) > 1 else None)
+
+        mock_request.side_effect = respond
+
+        response = client.create_order(**self.ORDER, client_order_id="quote-5", retries=2)
+
+        assert response.order_id == "order123"
+        assert posts == ["quote-5", "quote-5"]
+        assert "quote-5" not in client.order_ledger
+
+    @patch("httpx.Client.request")
+    def test_exhausted_retries_leave_order_unknown(self, mock_request, client):
+        mock_request.side_effect = httpx.ReadTimeout("timed out")
+
+        with pytest.raises(httpx.ReadTimeout):
+            client.create_order(**self.ORDER, client_order_id="quote-2")
+
+        entry = client.order_ledger.get("quote-2")
+        assert entry.status == "unknown"
+        assert client.order_ledger.unknown() == [entry]
+
+    @patch("httpx.Client.request")
+    def test_rejection_clears_ledger(self, mock_request, client):
+        rejected = Mock()
+        rejected.status_code = 400
+        rejected.text = "Invalid price"
+        mock_request.return_value = rejected
+
+        with pytest.raises(KalshiValidationError):
+            client.create_order(**self.ORDER, client_order_id="quote-3", retries=3)
+
+        assert mock_request.call_count == 1
+        assert len(client.order_ledger) == 0
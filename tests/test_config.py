@@ -40,3 +40,8 @@ class TestKalshiConfig:
     def test_config_missing_required_fields(self):
         with pytest.raises(Exception):
             config = KalshiConfig()
+
+    def test_concurrency_and_rate_limit_defaults(self):
+        config = KalshiConfig(api_key="key", api_secret="secret")
+        assert config.max_concurrency == 10
+        assert config.rate_limit is None
@@ -0,0 +1,216 @@
+import time
+
+import httpx
+import pytest
+
+from kalshi_client import (
+    AsyncKalshiClient,
+    AsyncPriorityDispatcher,
+    CircuitBreakers,
+    KalshiClient,
+    KalshiConfig,
+    KalshiDeadlineExceededError,
+    Priority,
+    PriorityDispatcher,
+    TokenBucket,
+    apaginate,
+    paginate,
+)
+from kalshi_client.circuit_breaker import CircuitState
+from kalshi_client.deadlines import request_timeout, time_left
+from kalshi_client.exceptions import KalshiServerError
+from kalshi_client.testing import LocalKalshiServer
+
+# A deadline can pass between pages or cut the request in flight
+EXPIRED = (KalshiDeadlineExceededError, httpx.TimeoutException)
+
+
+def config(**overrides) -> KalshiConfig:
+    return KalshiConfig(
+        api_key="key", api_secret="secret", base_url="https://api.kalshi.com", **overrides
+    )
+
+
+def balance(request):
+    return httpx.Response(200, json={"balance": 100})
+
+
+class TestHelpers:
+    def test_no_timeout_or_deadline_keeps_client_default(self):
+        assert request_timeout(httpx.Timeout(30.0), None, None) is None
+
+    def test_per_call_timeout(self):
+        assert request_timeout(httpx.Timeout(30.0), 2.0, None) == httpx.Timeout(2.0)
+
+    def test_deadline_caps_every_phase(self):
+        timeout = request_timeout(httpx.Timeout(30.0, connect=0.1), None, time.monotonic() + 1.0)
+        assert timeout.connect == 0.1
+        assert 0.9 < timeout.read <= 1.0
+        assert timeout.pool == timeout.write == timeout.read
+
+    def test_passed_deadline_raises(self):
+        assert time_left(None) is None
+        with pytest.raises(KalshiDeadlineExceededError, match="the rate limiter"):
+            time_left(time.monotonic() - 1, "the rate limiter")
+
+
+class TestSyncClient:
+    def test_expired_deadline_sends_nothing(self):
+        sent = []
+        client = KalshiClient(
+            config=config(),
+            transport=httpx.MockTransport(lambda request: sent.append(request) or balance(request)),
+        )
+        with pytest.raises(KalshiDeadlineExceededError):
+            client.get_balance(deadline=time.monotonic() - 0.01)
+        assert sent == []
+
+    def test_timeouts_reach_the_transport(self):
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"])
+            return balance(request)
+
+        client = KalshiClient(config=config(timeout=30.0), transport=httpx.MockTransport(handler))
+        client.get_balance()
+        client.get_balance(timeout=1.5)
+        client.get_balance(deadline=time.monotonic() + 0.5)
+        assert timeouts[0]["read"] == 30.0
+        assert timeouts[1] == dict.fromkeys(("connect", "read", "write", "pool"), 1.5)
+        assert 0 < timeouts[2]["read"] <= 0.5
+
+    def test_deadline_cuts_a_slow_response(self):
+        with (
+            LocalKalshiServer(latency=0.5) as server,
+            KalshiClient(config=server.config()) as client,
+        ):
+            start = time.perf_counter()
+            with pytest.raises(httpx.ReadTimeout):
+                client.get_balance(deadline=time.monotonic() + 0.1)
+            assert time.perf_counter() - start < 0.4
+
+    def test_deadline_spans_pages(self):
+        markets = []
+        with (
+            LocalKalshiServer(latency=0.03) as server,
+            KalshiClient(config=server.config()) as client,
+            pytest.raises(EXPIRED),
+        ):
+            for market in paginate(client.get_markets, limit=1, deadline=time.monotonic() + 0.15):
+                markets.append(market)
+        assert 2 <= len(markets) <= 5
+
+    def test_rate_limit_wait_is_bounded(self):
+        breakers = CircuitBreakers(min_requests=1)
+        client = KalshiClient(
+            config=config(),
+            rate_limiter=TokenBucket(1, capacity=1),
+            transport=httpx.MockTransport(balance),
+            circuit_breakers=breakers,
+        )
+        client.get_balance()
+        start = time.perf_counter()
+        with pytest.raises(KalshiDeadlineExceededError, match="rate limiter"):
+            client.get_balance(deadline=time.monotonic() + 0.05)
+        assert time.perf_counter() - start < 0.5
+        assert breakers.states()["portfolio"] is CircuitState.CLOSED
+
+    def test_queue_wait_is_bounded(self):
+        client = KalshiClient(
+            config=config(max_concurrency=1), transport=httpx.MockTransport(balance)
+        )
+        client._concurrency.acquire()
+        with pytest.raises(KalshiDeadlineExceededError, match="request slot"):
+            client.get_balance(deadline=time.monotonic() + 0.05)
+        client._concurrency.release()
+        assert client.get_balance() == 100
+
+    def test_order_retries_stop_at_the_deadline(self):
+        sent = []
+
+        def handler(request):
+            sent.append(request.method)
+            time.sleep(0.06)
+            return httpx.Response(503)
+
+        client = KalshiClient(config=config(), transport=httpx.MockTransport(handler))
+        with pytest.raises(KalshiServerError):
+            client.create_order(
+                ticker="X",
+                action="buy",
+                side="yes",
+                type="limit",
+                count=1,
+                yes_price=40,
+                client_order_id="c1",
+                retries=5,
+                deadline=time.monotonic() + 0.05,
+            )
+        assert sent == ["POST"]
+        assert client.order_ledger.unknown()[0].client_order_id == "c1"
+
+    def test_batch_deadline(self):
+        client = KalshiClient(config=config(), transport=httpx.MockTransport(balance))
+        results = client.cancel_orders(["a", "b"], deadline=time.monotonic() - 1)
+        assert all(isinstance(result, KalshiDeadlineExceededError) for result in results)
+
+
+class TestDispatcher:
+    def test_acquire_timeout(self):
+        dispatcher = PriorityDispatcher(1)
+        dispatcher.acquire(Priority.CREATE)
+        with pytest.raises(KalshiDeadlineExceededError):
+            dispatcher.acquire(Priority.CANCEL, timeout=0.05)
+        assert dispatcher.queue_depth() == 0
+        dispatcher.release(Priority.CREATE)
+        dispatcher.acquire(Priority.CANCEL, timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_async_acquire_timeout(self):
+        dispatcher = AsyncPriorityDispatcher(1)
+        await dispatcher.acquire(Priority.CREATE)
+        with pytest.raises(KalshiDeadlineExceededError):
+            await dispatcher.acquire(Priority.CANCEL, timeout=0.05)
+        assert dispatcher.queue_depth() == 0
+
+
+class TestAsyncClient:
+    @pytest.mark.asyncio
+    async def test_timeouts_and_expired_deadline(self):
+        timeouts = []
+
+        async def handler(request):
+            timeouts.append(request.extensions["timeout"])
+            return balance(request)
+
+        async with AsyncKalshiClient(
+            config=config(), transport=httpx.MockTransport(handler)
+        ) as client:
+            await client.get_balance(timeout=2.0)
+            with pytest.raises(KalshiDeadlineExceededError):
+                await client.get_balance(deadline=time.monotonic() - 0.01)
+        assert timeouts == [dict.fromkeys(("connect", "read", "write", "pool"), 2.0)]
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_is_bounded(self):
+        async with AsyncKalshiClient(
+            config=config(max_concurrency=1), transport=httpx.MockTransport(balance)
+        ) as client:
+            await client._concurrency.acquire()
+            with pytest.raises(KalshiDeadlineExceededError, match="request slot"):
+                await client.get_balance(deadline=time.monotonic() + 0.05)
+            client._concurrency.release()
+            assert await client.get_balance() == 100
+
+    @pytest.mark.asyncio
+    async def test_deadline_spans_pages(self):
+        markets = []
+        with LocalKalshiServer(latency=0.03) as server:
+            async with AsyncKalshiClient(config=server.config()) as client:
+                with pytest.raises(EXPIRED):
+                    async for market in apaginate(
+                        client.get_markets, limit=1, deadline=time.monotonic() + 0.15
+                    ):
+                        markets.append(market)
+        assert 2 <= len(markets) <= 5
@@ -0,0 +1,132 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from kalshi_client import (
+    AsyncKalshiClient,
+    DecodeExecutor,
+    KalshiClient,
+    aiter_column_pages,
+    iter_column_pages,
+    paginate,
+)
+from kalshi_client.decode import decode_page
+from kalshi_client.testing import LocalKalshiServer, SimulatedExchange
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(2)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def exchange():
+    return SimulatedExchange(events=6, markets_per_event=5, trades_per_market=10, seed=11)
+
+
+@pytest.fixture(scope="module")
+def server(exchange):
+    with LocalKalshiServer(exchange) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def process_decoder():
+    with DecodeExecutor(2, min_size=0) as decoder:
+        yield decoder
+
+
+@pytest.fixture
+def counting():
+    with CountingExecutor() as executor:
+        yield executor
+
+
+def test_decode_page_inline(server):
+    with KalshiClient(config=server.config()) as client:
+        content = client._request("GET", "/markets", params={"limit": 3}).content
+    markets, cursor = decode_page("markets", content)
+    assert cursor == json.loads(content)["cursor"]
+    columns, _ = decode_page("markets", content, ("ticker", "yes_bid"))
+    assert columns == {
+        "ticker": [market.ticker for market in markets],
+        "yes_bid": [market.yes_bid for market in markets],
+    }
+
+
+def test_process_pool_matches_inline_decoding(server, process_decoder):
+    with (
+        KalshiClient(config=server.config()) as plain,
+        KalshiClient(config=server.config(), decoder=process_decoder) as pooled,
+    ):
+        for method, params in [
+            ("get_markets", {"limit": 10}),
+            ("get_events", {"limit": 4}),
+            ("get_trades", {"limit": 25}),
+        ]:
+            expected = getattr(plain, method)(**params)
+            page = getattr(pooled, method)(**params)
+            assert list(page) == list(expected)
+            assert (page.cursor, page.has_more) == (expected.cursor, expected.has_more)
+
+
+def test_small_responses_are_decoded_inline(server, counting):
+    decoder = DecodeExecutor(min_size=1_000_000, executor=counting)
+    with KalshiClient(config=server.config(), decoder=decoder) as client:
+        assert len(client.get_markets(limit=5)) == 5
+    assert counting.submitted == 0
+    decoder.min_size = 0
+    with KalshiClient(config=server.config(), decoder=decoder) as client:
+        assert len(client.get_markets(limit=5)) == 5
+    assert counting.submitted == 1
+    # A shared executor outlives the decoder
+    decoder.close()
+    assert counting.submit(len, "x").result() == 1
+
+
+def test_column_pages(server, exchange, process_decoder):
+    with KalshiClient(config=server.config(), decoder=process_decoder) as client:
+        pages = list(iter_column_pages(client, "markets", ("ticker", "volume"), limit=7))
+        markets = list(paginate(client.get_markets, limit=7))
+    assert [len(page) for page in pages] == [7, 7, 7, 7, 2]
+    rows = [row for page in pages for row in page.rows()]
+    assert rows == [{"ticker": m.ticker, "volume": m.volume} for m in markets]
+    assert [row["ticker"] for row in rows] == exchange.tickers
+
+
+def test_column_pages_without_decoder(server, exchange):
+    with KalshiClient(config=server.config()) as client:
+        [page] = iter_column_pages(client, "events", limit=100)
+    assert page.columns["event_ticker"] == exchange.event_tickers
+    with pytest.raises(ValueError, match="no fields"):
+        next(iter_column_pages(client, "markets", ("ticker", "nope")))
+
+
+def test_owned_decoder_closes_with_client(server):
+    with KalshiClient(config=server.config(decode_workers=1)) as client:
+        decoder = client.decoder
+        assert decoder.workers == 1
+    with pytest.raises(RuntimeError):
+        decoder.executor.submit(len, "x")
+
+
+def test_rejects_no_workers():
+    with pytest.raises(ValueError):
+        DecodeExecutor(0)
+
+
+@pytest.mark.asyncio
+async def test_async_client(server, exchange, counting):
+    decoder = DecodeExecutor(min_size=0, executor=counting)
+    async with AsyncKalshiClient(config=server.config(), decoder=decoder) as client:
+        markets = await client.get_markets(limit=100)
+        assert [market.ticker for market in markets] == exchange.tickers
+        pages = [page async for page in aiter_column_pages(client, "trades", ("count",), limit=100)]
+    assert sum(len(page) for page in pages) == len(exchange.tickers) * 10
+    assert counting.submitted == 1 + len(pages)
@@ -0,0 +1,153 @@
+import json
+from datetime import datetime
+
+from kalshi_client.diff import (
+    SnapshotDelta,
+    SnapshotDiffer,
+    apply_delta,
+    diff_market,
+    diff_order_book,
+    diff_position,
+    field_changes,
+)
+from kalshi_client.models import Market, OrderBook, OrderBookLevel, Position
+
+
+def make_market(**overrides) -> Market:
+    fields = {
+        "ticker": "ECON-GDP-24",
+        "event_ticker": "ECON-2024",
+        "market_type": "binary",
+        "title": "GDP Growth",
+        "subtitle": "Will GDP grow?",
+        "open_time": datetime(2024, 1, 1),
+        "close_time": datetime(2024, 12, 31),
+        "status": "open",
+        "can_close_early": False,
+        "category": "Economics",
+        "risk_limit_cents": 100000,
+        "strike_type": "yesno",
+        "volume": 1000,
+        "volume_24h": 500,
+        "liquidity": 10000,
+        "open_interest": 5000,
+        "yes_bid": 50,
+    }
+    fields.update(overrides)
+    return Market(**fields)
+
+
+def make_book(yes: dict[int, int], no: dict[int, int]) -> OrderBook:
+    return OrderBook(
+        yes=[OrderBookLevel(price=p, quantity=q) for p, q in yes.items()],
+        no=[OrderBookLevel(price=p, quantity=q) for p, q in no.items()],
+    )
+
+
+def make_position(**overrides) -> Position:
+    fields = {
+        "ticker": "ECON-GDP-24",
+        "event_ticker": "ECON-2024",
+        "market_exposure": 1000,
+        "realized_pnl": 0,
+        "total_traded": 5000,
+        "resting_order_count": 2,
+        "fees_paid": 50,
+    }
+    fields.update(overrides)
+    return Position(**fields)
+
+
+class TestFieldDiffs:
+    def test_field_changes(self):
+        assert field_changes({"a": 1, "b": 2}, {"a": 1, "b": 3}) == {"b": (2, 3)}
+        assert field_changes({"a": 1}, {"b": 1}) == {"a": (1, None), "b": (None, 1)}
+
+    def test_diff_market(self):
+        old = make_market()
+        assert diff_market(old, make_market()) is None
+
+        delta = diff_market(old, make_market(yes_bid=55, volume=1010))
+        assert delta.op == "update"
+        assert delta.changes == {"yes_bid": 55, "volume": 1010}
+
+    def test_diff_market_new(self):
+        delta = diff_market(None, make_market())
+        assert delta.op == "new"
+        assert delta.changes["ticker"] == "ECON-GDP-24"
+
+    def test_diff_position(self):
+        delta = diff_position(make_position(), make_position(realized_pnl=-20))
+        assert delta.kind == "position"
+        assert delta.changes == {"realized_pnl": -20}
+
+    def test_diff_order_book_levels(self):
+        old = make_book({60: 100, 59: 200}, {41: 150})
+        new = make_book({60: 80, 58: 10}, {41: 150})
+
+        delta = diff_order_book("ECON-GDP-24", old, new)
+        assert delta.changes == {"yes": {60: 80, 59: 0, 58: 10}}
+        assert diff_order_book("ECON-GDP-24", old, old) is None
+
+
+class TestSnapshotDiffer:
+    def test_first_snapshot_is_new(self):
+        differ = SnapshotDiffer("market")
+        deltas = differ.diff([make_market()])
+        assert [d.op for d in deltas] == ["new"]
+        assert "ECON-GDP-24" in differ
+
+    def test_unchanged_records_skipped(self):
+        differ = SnapshotDiffer("market")
+        differ.diff([make_market()])
+        assert differ.diff([make_market()]) == []
+
+        deltas = differ.diff([make_market(status="closed")])
+        assert deltas == [
+            SnapshotDelta(
+                kind="market", key="ECON-GDP-24", op="update", changes={"status": "closed"}
+            )
+        ]
+
+    def test_raw_fast_path_skips_validation(self, mocker):
+        differ = SnapshotDiffer("position")
+        payload = make_position().model_dump_json().encode()
+        differ.update_raw("ECON-GDP-24", payload)
+
+        validate = mocker.spy(Position, "model_validate_json")
+        assert differ.diff_raw({"ECON-GDP-24": payload}) == []
+        validate.assert_not_called()
+
+        changed = make_position(fees_paid=60).model_dump_json().encode()
+        assert differ.diff_raw({"ECON-GDP-24": changed})[0].changes == {"fees_paid": 60}
+
+    def test_order_book_differ(self):
+        differ = SnapshotDiffer("orderbook")
+        differ.update("A", make_book({60: 100}, {40: 5}))
+        delta = differ.update("A", make_book({60: 100}, {}))
+        assert delta.changes == {"no": {40: 0}}
+
+    def test_remove(self):
+        differ = SnapshotDiffer("market")
+        differ.diff([make_market()])
+        assert differ.remove("ECON-GDP-24").op == "delete"
+        assert differ.remove("ECON-GDP-24") is None
+
+    def test_replica_round_trip_through_json(self):
+        differ = SnapshotDiffer("orderbook")
+        replica = None
+        for book in (
+            make_book({60: 100, 59: 200}, {41: 150}),
+            make_book({60: 90}, {41: 150, 42: 5}),
+            make_book({}, {42: 5}),
+        ):
+            delta = differ.update("A", book)
+            wire = SnapshotDelta(**json.loads(delta.model_dump_json()))
+            replica = apply_delta(replica, wire)
+            assert replica == differ.snapshot("A")
+
+    def test_market_replica(self):
+        differ = SnapshotDiffer("market")
+        replica = apply_delta(None, differ.update("ECON-GDP-24", make_market()))
+        replica = apply_delta(replica, differ.update("ECON-GDP-24", make_market(yes_bid=70)))
+        assert replica == make_market(yes_bid=70).model_dump(mode="json")
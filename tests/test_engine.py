@@ -0,0 +1,155 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from kalshi_client import AsyncEngine, KalshiClient, PriorityDispatcher
+from kalshi_client.exceptions import KalshiNotFoundError
+from kalshi_client.testing import LocalKalshiServer, SimulatedExchange
+
+
+@pytest.fixture
+def exchange():
+    return SimulatedExchange(events=4, markets_per_event=5, trades_per_market=5, seed=3)
+
+
+@pytest.fixture
+def server(exchange):
+    with LocalKalshiServer(exchange, latency=0.02) as server:
+        yield server
+
+
+@pytest.fixture
+def engine():
+    with AsyncEngine() as engine:
+        yield engine
+
+
+@pytest.fixture
+def client(server, engine):
+    with KalshiClient(config=server.config(enable_metrics=True), engine=engine) as client:
+        yield client
+
+
+class TestAsyncEngine:
+    def test_runs_coroutines_on_its_thread(self, engine):
+        async def where():
+            await asyncio.sleep(0)
+            return threading.current_thread().name
+
+        assert engine.run(where()) == "kalshi-engine"
+        assert engine.submit(where()).result() == "kalshi-engine"
+
+    def test_blocking_call_from_loop_thread_fails(self, engine):
+        async def nested():
+            return engine.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError, match="own event loop"):
+            engine.run(nested())
+
+    def test_run_all_returns_outcomes_in_order(self, engine):
+        async def value(n):
+            await asyncio.sleep(0.01 * (3 - n))
+            if n == 1:
+                raise ValueError(n)
+            return n
+
+        outcomes = engine.run_all(value(n) for n in range(3))
+        assert outcomes[0] == 0
+        assert isinstance(outcomes[1], ValueError)
+        assert outcomes[2] == 2
+
+    def test_close_cancels_pending_work(self):
+        started = threading.Event()
+
+        async def hang():
+            started.set()
+            await asyncio.sleep(60)
+
+        engine = AsyncEngine()
+        future = engine.submit(hang())
+        started.wait()
+        engine.close()
+        assert future.cancelled()
+        assert not engine.running
+        with pytest.raises(RuntimeError, match="closed"):
+            engine.submit(asyncio.sleep(0))
+
+
+class TestEngineClient:
+    def test_blocking_methods(self, client, exchange):
+        ticker = exchange.tickers[0]
+        assert client.get_market(ticker).ticker == ticker
+        assert len(client.get_markets(limit=7)) == 7
+        assert client.metrics.snapshot()["endpoints"]["GET /markets/{ticker}"]["requests"] == 1
+
+    def test_submit_returns_futures(self, client, exchange):
+        futures = [client.submit_get_market(ticker) for ticker in exchange.tickers[:5]]
+        assert all(isinstance(future, Future) for future in futures)
+        assert [future.result().ticker for future in futures] == exchange.tickers[:5]
+        book = client.submit(client.get_market_order_book, exchange.tickers[0], depth=2)
+        assert len(book.result().yes) == 2
+
+    def test_map_runs_concurrently(self, client, server, exchange):
+        markets = client.map(client.get_market, exchange.tickers)
+        assert [market.ticker for market in markets] == exchange.tickers
+        # All calls share the async client's pool, bounded by max_concurrency
+        assert server.connections <= client.config.max_concurrency
+
+    def test_map_errors(self, client, exchange):
+        tickers = [exchange.tickers[0], "MISSING"]
+        with pytest.raises(KalshiNotFoundError):
+            client.map(client.get_market, tickers)
+        market, error = client.map(client.get_market, tickers, return_exceptions=True)
+        assert market.ticker == tickers[0]
+        assert isinstance(error, KalshiNotFoundError)
+
+    def test_orders_share_the_ledger(self, client, exchange):
+        ticker = exchange.tickers[0]
+        created = client.submit_create_order(
+            ticker=ticker, action="buy", side="yes", type="limit", count=1, yes_price=1
+        ).result()
+        template = client.order_template(ticker, "buy", "yes")
+        templated = template.send(price=1, count=1)
+        assert len(client.get_orders(status="resting")) == 2
+        results = client.cancel_orders([created.order_id, templated.order_id])
+        assert all(result.success for result in results)
+        assert len(client.order_ledger) == 0
+
+    def test_many_threads_share_the_engine(self, client, exchange):
+        with ThreadPoolExecutor(8) as pool:
+            markets = list(pool.map(client.get_market, exchange.tickers))
+        assert [market.ticker for market in markets] == exchange.tickers
+
+    def test_traces_follow_the_caller(self, client, exchange):
+        with client.trace() as traces:
+            client.map(client.get_market, exchange.tickers[:3])
+        assert len(traces.traces) == 3
+
+    def test_owned_engine_closes_with_client(self, server):
+        with KalshiClient(config=server.config(async_engine=True)) as client:
+            engine = client.engine
+            assert client.get_balance() >= 0
+        assert not engine.running
+
+    def test_shared_engine_outlives_client(self, server, engine):
+        with KalshiClient(config=server.config(), engine=engine) as client:
+            client.get_balance()
+        assert engine.running
+
+    def test_rejects_sync_dispatcher(self, server, engine):
+        with pytest.raises(ValueError, match="priority_scheduling"):
+            KalshiClient(config=server.config(), engine=engine, dispatcher=PriorityDispatcher(2))
+
+
+class TestWithoutEngine:
+    def test_submit_and_map_use_worker_pool(self, server, exchange):
+        with KalshiClient(config=server.config()) as client:
+            assert client.engine is None
+            future = client.submit_get_market(exchange.tickers[0])
+            assert future.result().ticker == exchange.tickers[0]
+            markets = client.map(client.get_market, exchange.tickers[:4])
+            assert [market.ticker for market in markets] == exchange.tickers[:4]
+            [error] = client.map(client.get_market, ["MISSING"], return_exceptions=True)
+            assert isinstance(error, KalshiNotFoundError)
@@ -0,0 +1,185 @@
+import asyncio
+import itertools
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+from kalshi_client import AsyncKalshiClient, KalshiClient, KalshiConfig
+from kalshi_client.follow import TradeFollower, in_order
+from kalshi_client.models import ObjectList, Trade
+
+T0 = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def trade(n: int, seconds: float, ticker: str = "X") -> dict:
+    return {
+        "trade_id": f"t{n}",
+        "ticker": ticker,
+        "taker_side": "yes",
+        "yes_price": 40,
+        "no_price": 60,
+        "count": 1,
+        "created_time": (T0 + timedelta(seconds=seconds)).isoformat(),
+    }
+
+
+class FakeTape:
+    """Serves ``/markets/trades`` newest first, with ``min_ts`` and offset cursors."""
+
+    def __init__(self, trades=(), fail=0):
+        self.trades = list(trades)
+        self.queries = []
+        self.fail = fail
+
+    def add(self, *trades):
+        self.trades.extend(trades)
+
+    def __call__(self, request):
+        if self.fail:
+            self.fail -= 1
+            return httpx.Response(503)
+        query = dict(request.url.params)
+        self.queries.append(query)
+        matching = [
+            t
+            for t in reversed(self.trades)
+            if datetime.fromisoformat(t["created_time"]).timestamp() >= int(query["min_ts"])
+            and t["ticker"] == query.get("ticker", t["ticker"])
+        ]
+        offset = int(query.get("cursor", 0))
+        limit = int(query["limit"])
+        page = matching[offset : offset + limit]
+        more = offset + limit < len(matching)
+        return httpx.Response(
+            200, json={"trades": page, "cursor": str(offset + limit) if more else ""}
+        )
+
+
+def config() -> KalshiConfig:
+    return KalshiConfig(api_key="key", api_secret="secret", base_url="https://api.kalshi.com")
+
+
+def ids(trades) -> list[str]:
+    return [t.trade_id for t in trades]
+
+
+def page(*trades, cursor=None) -> ObjectList[Trade]:
+    return ObjectList([Trade(**t) for t in trades], cursor=cursor)
+
+
+class TestTradeFollower:
+    def test_boundary_overlap_is_dropped(self):
+        follower = TradeFollower(since=T0)
+        assert follower.params(None) == {"min_ts": int(T0.timestamp())}
+        fresh, caught_up = follower.sift(None, page(trade(2, 0.5), trade(1, 0.2)))
+        assert ids(fresh) == ["t2", "t1"] and caught_up
+        follower.commit(None, fresh)
+        assert follower.high_water[None] == T0 + timedelta(seconds=0.5)
+
+        fresh, caught_up = follower.sift(None, page(trade(3, 0.7), trade(2, 0.5), trade(1, 0.2)))
+        assert ids(fresh) == ["t3"] and caught_up
+
+    def test_trades_before_since_are_skipped(self):
+        follower = TradeFollower(["X"], since=T0 + timedelta(seconds=0.5))
+        fresh, caught_up = follower.sift("X", page(trade(2, 0.6), trade(1, 0.2), cursor="c"))
+        assert ids(fresh) == ["t2"] and caught_up
+        assert follower.params("X")["ticker"] == "X"
+
+    def test_full_page_is_not_caught_up(self):
+        follower = TradeFollower(since=T0)
+        _, caught_up = follower.sift(None, page(trade(2, 1), trade(1, 0), cursor="c"))
+        assert not caught_up
+
+    def test_dedupe_window_is_bounded(self):
+        follower = TradeFollower(since=T0, dedupe_window=2)
+        follower.commit(None, [Trade(**trade(n, 0)) for n in range(3)])
+        fresh, _ = follower.sift(None, page(trade(0, 0)))
+        assert ids(fresh) == ["t0"]
+
+    def test_interval_follows_trade_rate(self):
+        now = itertools.count()
+        follower = TradeFollower(
+            poll_interval=1.0, min_interval=0.1, max_interval=8.0, clock=lambda: next(now)
+        )
+        assert follower.observe(0) == 1.0
+        assert follower.observe(20) == 0.1
+        for _ in range(20):
+            interval = follower.observe(0)
+        assert interval == 8.0
+        assert follower.backoff() == 8.0
+
+    def test_in_order(self):
+        a = [Trade(**trade(3, 3)), Trade(**trade(1, 1))]
+        b = [Trade(**trade(2, 2, "Y"))]
+        assert ids(in_order([a, b])) == ["t1", "t2", "t3"]
+
+
+class TestFollowTrades:
+    def test_yields_new_trades_once_in_order(self):
+        tape = FakeTape([trade(0, -5), *(trade(n, 0.1 * n) for n in range(1, 6))])
+        client = KalshiClient(config=config(), transport=httpx.MockTransport(tape))
+        trades = client.follow_trades(min_interval=0.001, since=T0, page_size=2)
+        assert ids(itertools.islice(trades, 5)) == ["t1", "t2", "t3", "t4", "t5"]
+        assert len(tape.queries) == 3
+
+        tape.add(trade(6, 0.9), trade(7, 1.5), trade(8, 2.5))
+        assert ids(itertools.islice(trades, 3)) == ["t6", "t7", "t8"]
+        # The poll stopped at the first known trade instead of re-reading t1-t4
+        assert len(tape.queries) == 5
+        trades.close()
+
+    def test_follows_several_tickers(self):
+        tape = FakeTape([trade(1, 1, "A"), trade(2, 2, "B"), trade(3, 3, "C")])
+        client = KalshiClient(config=config(), transport=httpx.MockTransport(tape))
+        trades = client.follow_trades(["A", "B"], min_interval=0.001, since=T0)
+        assert ids(itertools.islice(trades, 2)) == ["t1", "t2"]
+        assert {q["ticker"] for q in tape.queries} == {"A", "B"}
+
+    def test_rides_out_server_errors(self):
+        tape = FakeTape([trade(1, 1)], fail=1)
+        client = KalshiClient(config=config(), transport=httpx.MockTransport(tape))
+        trades = client.follow_trades(None, 0.001, min_interval=0.001, max_interval=0.01, since=T0)
+        assert ids(itertools.islice(trades, 1)) == ["t1"]
+
+    @pytest.mark.asyncio
+    async def test_async(self):
+        tape = FakeTape([trade(n, n, "A" if n % 2 else "B") for n in range(1, 5)])
+        async with AsyncKalshiClient(
+            config=config(), transport=httpx.MockTransport(tape)
+        ) as client:
+            trades = client.follow_trades(["A", "B"], min_interval=0.001, since=T0, page_size=1)
+            seen = [(await anext(trades)).trade_id for _ in range(4)]
+            tape.add(trade(5, 5, "A"))
+            seen.append((await anext(trades)).trade_id)
+            await trades.aclose()
+        assert seen == ["t1", "t2", "t3", "t4", "t5"]
+
+    @pytest.mark.asyncio
+    async def test_async_failed_poll_cancels_siblings(self):
+        tape = FakeTape([trade(1, 1, "A")])
+        calls = {"A": 0, "B": 0}
+        cancelled = []
+
+        async def handler(request):
+            ticker = request.url.params["ticker"]
+            calls[ticker] += 1
+            if ticker == "A" and calls["A"] == 1:
+                return httpx.Response(503)
+            if ticker == "B" and calls["B"] == 1:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(ticker)
+                    raise
+            return tape(request)
+
+        async with AsyncKalshiClient(
+            config=config(), transport=httpx.MockTransport(handler)
+        ) as client:
+            trades = client.follow_trades(
+                ["A", "B"], min_interval=0.001, max_interval=0.01, since=T0
+            )
+            assert (await anext(trades)).trade_id == "t1"
+            await trades.aclose()
+        assert cancelled == ["B"]
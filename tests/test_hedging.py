@@ -0,0 +1,229 @@
+import asyncio
+import itertools
+import threading
+import time
+
+import httpx
+import pytest
+
+from kalshi_client import (
+    AsyncKalshiClient,
+    ClientMetrics,
+    HedgePolicy,
+    KalshiClient,
+    KalshiConfig,
+    TokenBucket,
+)
+
+BOOK = {"orderbook": {"yes": [{"price": 40, "quantity": 5}], "no": []}}
+
+
+def config(**overrides) -> KalshiConfig:
+    return KalshiConfig(
+        api_key="key", api_secret="secret", base_url="https://api.kalshi.com", **overrides
+    )
+
+
+def slow_first(delay=0.5):
+    """Handler whose first response takes ``delay`` seconds and the rest are instant."""
+    calls = itertools.count()
+
+    def handler(request):
+        if next(calls) == 0:
+            time.sleep(delay)
+        return httpx.Response(200, json=BOOK)
+
+    return handler
+
+
+class TestHedgePolicy:
+    def test_fixed_delay(self):
+        policy = HedgePolicy(0.05)
+        assert policy.begin("/markets/X/orderbook") == 0.05
+        assert policy.applies("/markets/X/orderbook")
+        assert policy.applies("/markets/X")
+        assert not policy.applies("/markets")
+
+    def test_derived_delay_needs_samples(self):
+        policy = HedgePolicy(quantile=0.9, min_samples=10, window=10)
+        for ms in range(1, 10):
+            policy.record("/markets/A", ms / 1000)
+        assert policy.begin("/markets/B") is None
+        for ms in range(100, 110):
+            policy.record("/markets/B", ms / 1000)
+        assert policy.begin("/markets/A") == pytest.approx(0.109)
+
+    def test_credit_bounds_hedges(self):
+        policy = HedgePolicy(0.01, max_ratio=0.5, burst=1)
+        assert policy.try_hedge()
+        assert not policy.try_hedge()
+        policy.begin("/markets/X")
+        assert not policy.try_hedge()
+        policy.begin("/markets/X")
+        assert policy.try_hedge()
+        assert policy.hedges == 2
+
+    def test_no_hedge_without_spare_rate_token(self):
+        bucket = TokenBucket(1, capacity=1)
+        bucket.try_acquire()
+        assert not HedgePolicy(0.01).try_hedge(bucket)
+
+
+class TestSyncHedging:
+    def test_hedge_beats_slow_primary(self):
+        policy = HedgePolicy(0.02)
+        client = KalshiClient(
+            config=config(), transport=httpx.MockTransport(slow_first()), hedge_policy=policy
+        )
+        start = time.perf_counter()
+        book = client.get_market_order_book("X")
+        elapsed = time.perf_counter() - start
+        client.close()
+        assert book.yes[0].price == 40
+        assert elapsed < 0.3
+        assert (policy.requests, policy.hedges, policy.wins) == (1, 1, 1)
+
+    def test_fast_response_is_not_hedged(self):
+        policy = HedgePolicy(0.2)
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            return httpx.Response(200, json=BOOK)
+
+        with KalshiClient(
+            config=config(), transport=httpx.MockTransport(handler), hedge_policy=policy
+        ) as client:
+            client.get_market_order_book("X")
+        assert len(sent) == 1
+        assert policy.hedges == 0
+
+    def test_other_endpoints_are_not_hedged(self):
+        policy = HedgePolicy(0.0)
+        with KalshiClient(
+            config=config(),
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"balance": 1})),
+            hedge_policy=policy,
+        ) as client:
+            assert client.get_balance() == 1
+        assert policy.requests == 0
+
+    def test_hedges_are_metered_and_rate_limited(self):
+        metrics = ClientMetrics()
+        client = KalshiClient(
+            config=config(),
+            rate_limiter=TokenBucket(1000, capacity=10, clock=lambda: 0.0),
+            metrics=metrics,
+            transport=httpx.MockTransport(slow_first(0.2)),
+            hedge_policy=HedgePolicy(0.02),
+        )
+        client.get_market_order_book("X")
+        client.close()
+        stats = metrics.snapshot()["endpoints"]["GET /markets/{ticker}/orderbook"]
+        assert stats["requests"] == 2
+        assert client.rate_limiter.tokens == 8
+
+    def test_dry_rate_budget_skips_hedge(self):
+        policy = HedgePolicy(0.02)
+        client = KalshiClient(
+            config=config(),
+            rate_limiter=TokenBucket(1, capacity=1),
+            transport=httpx.MockTransport(slow_first(0.1)),
+            hedge_policy=policy,
+        )
+        client.get_market_order_book("X")
+        client.close()
+        assert policy.hedges == 0
+
+    def test_config_enables_hedging(self):
+        client = KalshiClient(config=config(hedge_quantile=0.99))
+        assert client.hedge_policy.delay is None
+        assert client.hedge_policy.quantile == 0.99
+
+    def test_attempts_are_traced_separately(self):
+        calls = itertools.count()
+
+        def handler(request):
+            # The primary answers after the hedge has started, but before it
+            time.sleep(0.05 if next(calls) == 0 else 0.3)
+            return httpx.Response(200, json=BOOK)
+
+        policy = HedgePolicy(0.01)
+        with (
+            KalshiClient(
+                config=config(), transport=httpx.MockTransport(handler), hedge_policy=policy
+            ) as client,
+            client.trace() as traces,
+        ):
+            client.get_market_order_book("X")
+        assert_attempts_traced(traces.traces)
+
+
+def assert_attempts_traced(traces):
+    primary, hedge = sorted(traces, key=lambda trace: trace.start_ns)
+    for trace in traces:
+        assert [phase.name for phase in trace.phases].count("sign") == 1
+    # Decoding is timed into the attempt whose response was used
+    assert {"decode", "validate"} <= set(primary.durations)
+    assert "decode" not in hedge.durations
+
+
+class TestAsyncHedging:
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_primary_is_cancelled(self):
+        calls = itertools.count()
+        cancelled = threading.Event()
+
+        async def handler(request):
+            if next(calls) == 0:
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return httpx.Response(200, json=BOOK)
+
+        policy = HedgePolicy(0.02)
+        async with AsyncKalshiClient(
+            config=config(), transport=httpx.MockTransport(handler), hedge_policy=policy
+        ) as client:
+            start = time.perf_counter()
+            book = await client.get_market_order_book("X")
+            assert time.perf_counter() - start < 0.5
+            await asyncio.sleep(0.01)
+        assert book.yes[0].quantity == 5
+        assert (policy.hedges, policy.wins) == (1, 1)
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_primary_error_falls_back_to_hedge(self):
+        calls = itertools.count()
+
+        async def handler(request):
+            if next(calls) == 0:
+                await asyncio.sleep(0.05)
+                return httpx.Response(503)
+            return httpx.Response(200, json=BOOK)
+
+        policy = HedgePolicy(0.01)
+        async with AsyncKalshiClient(
+            config=config(), transport=httpx.MockTransport(handler), hedge_policy=policy
+        ) as client:
+            book = await client.get_market_order_book("X")
+        assert book.yes[0].price == 40
+
+    @pytest.mark.asyncio
+    async def test_attempts_are_traced_separately(self):
+        calls = itertools.count()
+
+        async def handler(request):
+            await asyncio.sleep(0.05 if next(calls) == 0 else 0.3)
+            return httpx.Response(200, json=BOOK)
+
+        policy = HedgePolicy(0.01)
+        async with AsyncKalshiClient(
+            config=config(), transport=httpx.MockTransport(handler), hedge_policy=policy
+        ) as client:
+            with client.trace() as traces:
+                await client.get_market_order_book("X")
+        assert_attempts_traced(traces.traces)
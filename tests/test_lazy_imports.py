@@ -0,0 +1,64 @@
+import subprocess
+import sys
+
+import pytest
+
+import kalshi_client
+from kalshi_client import models
+
+
+def imported_modules(statement: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize("statement", ["import kalshi_client", "import kalshi_client.models"])
+def test_package_import_skips_heavy_dependencies(statement):
+    modules = imported_modules(statement)
+    assert not modules & {"httpx", "pydantic", "pydantic_settings", "dotenv", "asyncio"}
+
+
+def test_client_import_skips_async_and_optional_modules():
+    modules = imported_modules("from kalshi_client import KalshiClient")
+    assert "httpx" in modules
+    assert not modules & {
+        "kalshi_client.async_client",
+        "kalshi_client.poller",
+        "kalshi_client.transport",
+        "kalshi_client.engine",
+        "kalshi_client.checkpoint",
+        "asyncio",
+        "sqlite3",
+    }
+
+
+def test_async_client_import_skips_decode_workers():
+    modules = imported_modules("from kalshi_client import AsyncKalshiClient")
+    assert "kalshi_client.async_client" in modules
+    assert not modules & {"kalshi_client.decode", "concurrent.futures.process"}
+
+
+@pytest.mark.parametrize("package", [kalshi_client, models])
+def test_every_export_resolves(package):
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+    assert set(package.__all__) <= set(dir(package))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        kalshi_client.NotAThing  # noqa: B018
+    with pytest.raises(AttributeError):
+        models.NotAModel  # noqa: B018
+
+
+def test_deferred_model_builds_on_first_use():
+    order_book = models.OrderBook.model_validate({"yes": [{"price": 1, "quantity": 2}], "no": []})
+    assert order_book.__pydantic_serializer__.to_json(order_book) == (
+        b'{"yes":[{"price":1,"quantity":2}],"no":[]}'
+    )
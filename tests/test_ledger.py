@@ -0,0 +1,30 @@
+from kalshi_client.ledger import OrderLedger, new_client_order_id
+
+
+class TestOrderLedger:
+    def test_begin_and_resolve(self):
+        ledger = OrderLedger(wall_clock=lambda: 100.0)
+
+        entry = ledger.begin("c1", "ECON-GDP-24")
+        assert entry.attempts == 1
+        assert entry.submitted_at == 100.0
+        assert "c1" in ledger
+
+        assert ledger.begin("c1", "ECON-GDP-24").attempts == 2
+        assert ledger.resolve("c1") is entry
+        assert len(ledger) == 0
+
+    def test_mark_unknown(self):
+        ledger = OrderLedger()
+        ledger.begin("c1", "ECON-GDP-24")
+        ledger.begin("c2", "ECON-GDP-24")
+        error = TimeoutError()
+
+        ledger.mark_unknown("c1", error)
+
+        assert [e.client_order_id for e in ledger.unknown()] == ["c1"]
+        assert ledger.get("c1").last_error is error
+        assert len(ledger.in_flight()) == 2
+
+    def test_new_client_order_id_unique(self):
+        assert new_client_order_id() != new_client_order_id()
@@ -0,0 +1,264 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from kalshi_client import (
+    AsyncKalshiClient,
+    CircuitBreakers,
+    KalshiAPIError,
+    KalshiClient,
+    paginate,
+)
+from kalshi_client.exceptions import (
+    KalshiDeadlineExceededError,
+    KalshiRateLimitError,
+    KalshiServerError,
+    KalshiValidationError,
+)
+from kalshi_client.testing import LocalKalshiServer, SimulatedExchange
+
+
+@pytest.fixture
+def exchange():
+    return SimulatedExchange(events=6, markets_per_event=5, trades_per_market=10, seed=7)
+
+
+@pytest.fixture
+def server(exchange):
+    with LocalKalshiServer(exchange) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with KalshiClient(config=server.config()) as client:
+        yield client
+
+
+def open_portfolio_breaker() -> CircuitBreakers:
+    breakers = CircuitBreakers(min_requests=1, reset_timeout=60)
+    breakers["portfolio"].record(0.0, KalshiServerError("down"))
+    return breakers
+
+
+def buy_yes(client, ticker, price, count=5, **kwargs):
+    return client.create_order(
+        ticker=ticker,
+        action="buy",
+        side="yes",
+        type="limit",
+        count=count,
+        yes_price=price,
+        **kwargs,
+    )
+
+
+class TestMarketData:
+    def test_paginates_whole_universe(self, client, exchange):
+        markets = list(paginate(client.get_markets, limit=7))
+        assert [market.ticker for market in markets] == exchange.tickers
+
+    def test_trade_pages_stay_consistent_while_trading(self, client, exchange):
+        first = client.get_trades(limit=25)
+        exchange.step(50)
+        rest = list(paginate(client.get_trades, cursor=first.cursor, limit=25))
+        trade_ids = [trade.trade_id for trade in [*first, *rest]]
+        assert len(trade_ids) == len(set(trade_ids)) == 300
+
+    def test_filters(self, client, exchange):
+        event_ticker = exchange.event_tickers[0]
+        markets = client.get_markets(event_ticker=event_ticker, limit=100)
+        assert {market.event_ticker for market in markets} == {event_ticker}
+        assert len(markets) == 5
+        ticker = markets[0].ticker
+        assert {trade.ticker for trade in client.get_trades(ticker=ticker, limit=100)} == {ticker}
+
+    def test_orderbook_depth(self, client, exchange):
+        book = client.get_market_order_book(exchange.tickers[0], depth=3)
+        assert len(book.yes) == 3
+        assert book.yes == sorted(book.yes, key=lambda level: level.price)
+
+    def test_rejects_oversized_page(self, client):
+        with pytest.raises(KalshiValidationError):
+            client.get_markets(limit=5000)
+
+
+class TestOrders:
+    def test_crossing_order_fills_and_trades(self, client, exchange):
+        market = client.get_market(exchange.tickers[0])
+        balance = client.get_balance()
+        buy_yes(client, market.ticker, market.yes_ask)
+
+        [order] = client.get_orders(ticker=market.ticker)
+        assert (order.status, order.yes_filled_count) == ("executed", 5)
+        assert client.get_balance() == balance - 5 * market.yes_ask
+        [position] = client.get_positions(ticker=market.ticker)
+        assert position.total_traded == 5 * market.yes_ask
+        [trade] = client.get_trades(ticker=market.ticker, limit=1)
+        assert (trade.taker_side, trade.yes_price, trade.count) == ("yes", market.yes_ask, 5)
+
+    def test_resting_order_updates_book_and_cancels(self, client, exchange):
+        market = client.get_market(exchange.tickers[0])
+        created = buy_yes(client, market.ticker, market.yes_bid + 1)
+        assert client.get_market(market.ticker).yes_bid == market.yes_bid + 1
+        assert [order.order_id for order in client.get_orders(status="resting")] == [
+            created.order_id
+        ]
+
+        client.cancel_order(created.order_id)
+        assert client.get_market(market.ticker).yes_bid == market.yes_bid
+        with pytest.raises(KalshiValidationError):
+            client.cancel_order(created.order_id)
+
+    def test_fok_without_liquidity_is_cancelled(self, client, exchange):
+        market = client.get_market(exchange.tickers[0])
+        buy_yes(client, market.ticker, market.yes_ask, count=100_000, time_in_force="fok")
+        [order] = client.get_orders(ticker=market.ticker)
+        assert (order.status, order.yes_filled_count) == ("canceled", 0)
+
+    def test_duplicate_client_order_id_conflicts(self, client, exchange):
+        ticker = exchange.tickers[0]
+        buy_yes(client, ticker, 1, client_order_id="abc")
+        with pytest.raises(KalshiAPIError) as exc_info:
+            buy_yes(client, ticker, 1, client_order_id="abc")
+        assert exc_info.value.status_code == 409
+
+
+class TestFaults:
+    def test_injected_errors_and_retry(self, server, client, exchange):
+        server.fail_next(1)
+        created = buy_yes(client, exchange.tickers[0], 1, retries=1)
+        assert [order.order_id for order in client.get_orders()] == [created.order_id]
+
+        server.fail_next(1, status=500)
+        with pytest.raises(KalshiServerError):
+            client.get_balance()
+        assert server.responses[500] == 1
+
+    def test_error_rate(self, exchange):
+        with LocalKalshiServer(exchange, error_rate=1.0) as server:
+            client = KalshiClient(config=server.config())
+            with pytest.raises(KalshiServerError):
+                client.get_balance()
+
+    def test_rate_limit(self, exchange):
+        with LocalKalshiServer(exchange, rate_limit=2) as server:
+            client = KalshiClient(config=server.config())
+            client.get_balance()
+            client.get_balance()
+            with pytest.raises(KalshiRateLimitError):
+                client.get_balance()
+
+    def test_latency(self, exchange):
+        with LocalKalshiServer(exchange, latency=0.05) as server:
+            client = KalshiClient(config=server.config())
+            start = time.perf_counter()
+            client.get_balance()
+            assert time.perf_counter() - start >= 0.05
+
+    def test_requires_api_key(self, server):
+        response = httpx.get(f"{server.url}/portfolio/balance")
+        assert response.status_code == 401
+        assert server.requests["GET /portfolio/balance"] == 1
+
+
+class TestConnectionPools:
+    def test_warm_up_opens_trading_connections(self, exchange):
+        with (
+            LocalKalshiServer(exchange, latency=0.05) as server,
+            KalshiClient(config=server.config(trading_connections=3)) as client,
+        ):
+            client.warm_up(3)
+            assert server.connections == 3
+            assert server.requests["GET /portfolio/balance"] == 3
+            buy_yes(client, exchange.tickers[0], 1)
+            assert server.connections == 3
+
+    def test_warm_up_market_data_pool(self, exchange):
+        with (
+            LocalKalshiServer(exchange, latency=0.05) as server,
+            KalshiClient(config=server.config(trading_connections=2)) as client,
+        ):
+            client.warm_up(2, market_data=True)
+            assert server.connections == 4
+            assert server.requests["GET /markets"] == 2
+
+    def test_dispatcher_keeps_trading_cap(self, server):
+        config = server.config(priority_scheduling=True, trading_connections=1)
+        with KalshiClient(config=config) as client:
+            client._trading_concurrency.acquire()
+            with pytest.raises(KalshiDeadlineExceededError, match="request slot"):
+                client.get_balance(deadline=time.monotonic() + 0.05)
+            client._trading_concurrency.release()
+            assert client.get_balance() >= 0
+            assert client.dispatcher.in_flight() == 0
+
+    def test_warm_up_rejects_zero(self, client):
+        with pytest.raises(ValueError):
+            client.warm_up(0)
+
+    def test_orders_skip_market_data_queue(self, exchange):
+        with LocalKalshiServer(exchange, latency=0.1) as server:
+            config = server.config(max_concurrency=1, trading_connections=1)
+            with KalshiClient(config=config) as client:
+                burst = threading.Thread(
+                    target=lambda: [client.get_markets(limit=1) for _ in range(4)]
+                )
+                burst.start()
+                time.sleep(0.02)
+                start = time.perf_counter()
+                client.get_balance()
+                elapsed = time.perf_counter() - start
+                burst.join()
+        assert elapsed < 0.3
+
+    def test_keepalive_heartbeat(self, server):
+        with KalshiClient(config=server.config(keepalive_interval=0.05)):
+            time.sleep(0.22)
+        heartbeats = server.requests["GET /portfolio/balance"]
+        assert heartbeats >= 2
+        time.sleep(0.1)
+        assert server.requests["GET /portfolio/balance"] == heartbeats
+
+    def test_keepalive_waits_for_idle_order_path(self, server, client):
+        client.get_balance()
+        client.start_keepalive(0.1)
+        for _ in range(4):
+            time.sleep(0.04)
+            client.get_balance()
+        client.stop_keepalive()
+        assert server.requests["GET /portfolio/balance"] == 5
+
+    def test_keepalive_waits_while_breaker_is_open(self, server):
+        breakers = open_portfolio_breaker()
+        client = KalshiClient(config=server.config(), circuit_breakers=breakers)
+        client.start_keepalive(0.05)
+        time.sleep(0.2)
+        client.stop_keepalive(timeout=1)
+        assert client._keepalive_thread is None
+        assert 1 <= breakers["portfolio"].rejected <= 6
+        assert server.requests["GET /portfolio/balance"] == 0
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_keepalive_waits_while_breaker_is_open(self, server):
+        breakers = open_portfolio_breaker()
+        async with AsyncKalshiClient(config=server.config(), circuit_breakers=breakers) as client:
+            client.start_keepalive(0.05)
+            await asyncio.sleep(0.2)
+            await client.stop_keepalive()
+        assert 1 <= breakers["portfolio"].rejected <= 6
+
+    @pytest.mark.asyncio
+    async def test_async_pools_and_keepalive(self, exchange):
+        with LocalKalshiServer(exchange, latency=0.02) as server:
+            config = server.config(trading_connections=2, keepalive_interval=0.05)
+            async with AsyncKalshiClient(config=config) as client:
+                assert client.trading_client is not None
+                await client.warm_up(2)
+                assert server.connections == 2
+                await asyncio.sleep(0.2)
+            assert server.requests["GET /portfolio/balance"] >= 3
@@ -0,0 +1,102 @@
+import httpx
+import pytest
+
+from kalshi_client import KalshiClient, KalshiConfig
+from kalshi_client.exceptions import KalshiNotFoundError
+from kalshi_client.metrics import ClientMetrics, LatencyHistogram, normalize_endpoint
+
+
+class TestNormalizeEndpoint:
+    @pytest.mark.parametrize(
+        ("endpoint", "expected"),
+        [
+            ("/markets", "/markets"),
+            ("/markets/ECON-GDP-24", "/markets/{ticker}"),
+            ("/markets/ECON-GDP-24/orderbook", "/markets/{ticker}/orderbook"),
+            ("/markets/trades", "/markets/trades"),
+            ("/events/ECON-2024", "/events/{event_ticker}"),
+            ("/portfolio/orders/abc123", "/portfolio/orders/{order_id}"),
+            ("/portfolio/balance", "/portfolio/balance"),
+        ],
+    )
+    def test_normalize(self, endpoint, expected):
+        assert normalize_endpoint(endpoint) == expected
+
+
+class TestLatencyHistogram:
+    def test_quantiles_within_bucket_error(self):
+        histogram = LatencyHistogram(buckets_per_octave=8)
+        for i in range(1, 1001):
+            histogram.record(i / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.quantile(0.5) == pytest.approx(0.5, rel=0.1)
+        assert histogram.quantile(0.99) == pytest.approx(0.99, rel=0.1)
+        assert histogram.quantile(1.0) == pytest.approx(1.0)
+
+    def test_memory_is_bounded(self):
+        histogram = LatencyHistogram()
+        buckets = len(histogram.counts)
+        for i in range(10000):
+            histogram.record(i * 1e-4)
+        histogram.record(1e6)
+        histogram.record(0)
+        assert len(histogram.counts) == buckets
+
+    def test_cumulative_is_monotonic(self):
+        histogram = LatencyHistogram()
+        for value in (0.001, 0.002, 0.5, 3.0):
+            histogram.record(value)
+        counts = [count for _, count in histogram.cumulative()]
+        assert counts == sorted(counts)
+        assert counts[-1] == 4
+
+
+class TestClientMetrics:
+    def test_snapshot_groups_by_normalized_endpoint(self):
+        metrics = ClientMetrics()
+        metrics.record("GET", "/markets/A", 0.01, bytes_received=100)
+        metrics.record("GET", "/markets/B", 0.02, bytes_received=50)
+        metrics.record("GET", "/markets/C", 0.5, error=KalshiNotFoundError())
+
+        stats = metrics.snapshot()["endpoints"]["GET /markets/{ticker}"]
+        assert stats["requests"] == 3
+        assert stats["errors"] == {"KalshiNotFoundError": 1}
+        assert stats["bytes_received"] == 150
+        assert stats["latency"]["max"] == 0.5
+
+    def test_prometheus_export(self):
+        metrics = ClientMetrics()
+        metrics.record("POST", "/portfolio/orders", 0.004, bytes_sent=120)
+        metrics.set_gauge("queue_depth", 3, priority="cancel")
+
+        text = metrics.to_prometheus()
+
+        labels = 'method="POST",endpoint="/portfolio/orders"'
+        assert f"kalshi_client_requests_total{{{labels}}} 1" in text
+        assert f"kalshi_client_request_bytes_total{{{labels}}} 120" in text
+        assert f'kalshi_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f"kalshi_client_request_duration_seconds_count{{{labels}}} 1" in text
+        assert 'kalshi_client_queue_depth{priority="cancel"} 3' in text
+
+
+class TestClientIntegration:
+    def test_request_path_records_metrics(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404)
+            return httpx.Response(200, json={"balance": 100})
+
+        client = KalshiClient(
+            config=KalshiConfig(api_key="key", api_secret="secret", enable_metrics=True)
+        )
+        client.client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        client.get_balance()
+        with pytest.raises(KalshiNotFoundError):
+            client.get_market("missing")
+
+        endpoints = client.metrics.snapshot()["endpoints"]
+        assert endpoints["GET /portfolio/balance"]["requests"] == 1
+        assert endpoints["GET /portfolio/balance"]["bytes_received"] > 0
+        assert endpoints["GET /markets/{ticker}"]["errors"] == {"KalshiNotFoundError": 1}
@@ -0,0 +1,100 @@
+import json
+
+import httpx
+import pytest
+
+from kalshi_client import KalshiClient, KalshiConfig
+from kalshi_client.exceptions import KalshiValidationError
+from kalshi_client.models import OrderCreatedResponse
+from kalshi_client.order_template import OrderTemplate
+
+
+@pytest.fixture
+def sent():
+    return []
+
+
+@pytest.fixture
+def client(sent):
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(201, json={"order": {"order_id": "order123"}})
+
+    client = KalshiClient(config=KalshiConfig(api_key="test_api_key", api_secret="test_api_secret"))
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestOrderTemplate:
+    def test_send_patches_dynamic_fields(self, client, sent):
+        template = client.order_template(
+            "ECON-GDP-24",
+            "buy",
+            "yes",
+            time_in_force="gtc",
+            self_trade_prevention_type="cancel_resting",
+        )
+
+        response = template.send(60, 10, client_order_id="client123")
+
+        assert isinstance(response, OrderCreatedResponse)
+        assert response.order_id == "order123"
+        assert response.status_code == 201
+        assert sent[0].method == "POST"
+        assert sent[0].url.path.endswith("/portfolio/orders")
+        assert json.loads(sent[0].content) == {
+            "ticker": "ECON-GDP-24",
+            "action": "buy",
+            "side": "yes",
+            "type": "limit",
+            "count": 10,
+            "yes_price": 60,
+            "client_order_id": "client123",
+            "self_trade_prevention_type": "cancel_resting",
+            "time_in_force": "gtc",
+        }
+
+    def test_body_and_signature_match_create_order(self, client):
+        template = OrderTemplate(client, "ECON-GDP-24", "sell", "no", post_only=True)
+        payload = {
+            "ticker": "ECON-GDP-24",
+            "action": "sell",
+            "side": "no",
+            "type": "limit",
+            "count": 3,
+            "no_price": 41,
+            "client_order_id": 'quote"1',
+            "post_only": True,
+        }
+
+        body, signed = template.build(41, 3, 'quote"1')
+
+        assert json.loads(body) == payload
+        assert signed == str(payload)
+
+    def test_market_order_without_price(self, client):
+        body, _ = client.order_template("ECON-GDP-24", "buy", "yes", "market").build(None, 1)
+        assert "yes_price" not in json.loads(body)
+
+    @pytest.mark.parametrize(
+        ("price", "count", "field"),
+        [
+            (0, 1, "yes_price"),
+            (100, 1, "yes_price"),
+            (None, 1, "yes_price"),
+            (50, 0, "count"),
+            (50, 1.5, "count"),
+        ],
+    )
+    def test_local_validation(self, client, sent, price, count, field):
+        template = client.order_template("ECON-GDP-24", "buy", "yes")
+        with pytest.raises(KalshiValidationError) as exc_info:
+            template.send(price, count)
+        assert exc_info.value.field == field
+        assert sent == []
+
+    def test_rejects_per_order_static_fields(self, client):
+        with pytest.raises(TypeError):
+            OrderTemplate(client, "ECON-GDP-24", "buy", "yes", count=1)
+        with pytest.raises(TypeError):
+            OrderTemplate(client, "ECON-GDP-24", "buy", "yes", not_a_field=1)
@@ -0,0 +1,38 @@
+from unittest.mock import Mock
+
+from pydantic import BaseModel
+
+from kalshi_client.models import ObjectList
+from kalshi_client.pagination import iter_pages, paginate
+
+
+class Item(BaseModel):
+    id: int
+
+
+def make_fetch(pages: dict[str | None, tuple[list[int], str | None]]) -> Mock:
+    def fetch(cursor=None, **params):
+        ids, next_cursor = pages[cursor]
+        return ObjectList(items=[Item(id=i) for i in ids], cursor=next_cursor)
+
+    return Mock(side_effect=fetch)
+
+
+class TestPagination:
+    def test_follows_cursor_until_exhausted(self):
+        fetch = make_fetch({None: ([1, 2], "c1"), "c1": ([3, 4], "c2"), "c2": ([5], "")})
+
+        assert [item.id for item in paginate(fetch, limit=2)] == [1, 2, 3, 4, 5]
+        assert fetch.call_count == 3
+        assert fetch.call_args_list[1].kwargs == {"cursor": "c1", "limit": 2}
+
+    def test_stops_on_empty_page(self):
+        fetch = make_fetch({None: ([1], "c1"), "c1": ([], "c2")})
+
+        pages = list(iter_pages(fetch))
+        assert len(pages) == 2
+        assert fetch.call_count == 2
+
+    def test_starts_from_cursor(self):
+        fetch = make_fetch({"c1": ([3], None)})
+        assert [item.id for item in paginate(fetch, cursor="c1")] == [3]
@@ -0,0 +1,176 @@
+import threading
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from kalshi_client.models import Market, ObjectList
+from kalshi_client.poller import MarketPoller
+from kalshi_client.rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_market(ticker: str, yes_bid: int = 50, close_in: timedelta = timedelta(days=30)) -> Market:
+    now = datetime.now(UTC)
+    return Market(
+        ticker=ticker,
+        event_ticker="ECON-2024",
+        market_type="binary",
+        title=ticker,
+        subtitle="",
+        open_time=now - timedelta(days=1),
+        close_time=now + close_in,
+        status="open",
+        can_close_early=False,
+        category="Economics",
+        risk_limit_cents=100000,
+        strike_type="yesno",
+        volume=0,
+        volume_24h=0,
+        liquidity=0,
+        open_interest=0,
+        yes_bid=yes_bid,
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client.markets = {}
+
+    def get_markets(tickers=None, limit=None):
+        return ObjectList(items=[client.markets[t] for t in tickers if t in client.markets])
+
+    client.get_markets.side_effect = get_markets
+    return client
+
+
+def make_poller(client, clock, tickers, **kwargs):
+    kwargs.setdefault("rate_limiter", TokenBucket(rate=100.0, capacity=100.0, clock=clock))
+    return MarketPoller(client, tickers, min_interval=1.0, max_interval=8.0, clock=clock, **kwargs)
+
+
+class TestMarketPoller:
+    def test_batches_due_tickers(self, client, clock):
+        client.markets = {t: make_market(t) for t in ("A", "B", "C")}
+        poller = make_poller(client, clock, ["A", "B", "C"], batch_size=2)
+
+        assert poller.poll_once() == 2
+        assert poller.poll_once() == 1
+        assert poller.poll_once() == 0
+        assert client.get_markets.call_count == 2
+        assert client.get_markets.call_args_list[0].kwargs["limit"] == 2
+
+    def test_callback_only_on_change(self, client, clock):
+        client.markets = {"A": make_market("A", yes_bid=50)}
+        poller = make_poller(client, clock, ["A"])
+        events = []
+        poller.subscribe(lambda market, changes: events.append(changes))
+
+        poller.poll_once()
+        clock.now += 1.0
+        poller.poll_once()
+        assert events == []
+
+        client.markets["A"] = client.markets["A"].model_copy(update={"yes_bid": 55})
+        clock.now += 2.0
+        poller.poll_once()
+        assert events == [{"yes_bid": (50, 55)}]
+        assert poller.get("A").yes_bid == 55
+
+    def test_idle_markets_back_off_and_active_reset(self, client, clock):
+        client.markets = {"A": make_market("A")}
+        poller = make_poller(client, clock, ["A"])
+
+        poller.poll_once()
+        assert poller.interval("A") == 1.0
+        for expected in (2.0, 4.0, 8.0, 8.0):
+            clock.now += poller.interval("A")
+            poller.poll_once()
+            assert poller.interval("A") == expected
+
+        client.markets["A"] = client.markets["A"].model_copy(update={"yes_bid": 1})
+        clock.now += 8.0
+        poller.poll_once()
+        assert poller.interval("A") == 1.0
+
+    def test_closing_markets_stay_hot(self, client, clock):
+        client.markets = {"A": make_market("A", close_in=timedelta(minutes=5))}
+        poller = make_poller(client, clock, ["A"])
+
+        for _ in range(4):
+            poller.poll_once()
+            clock.now += 1.0
+        assert poller.interval("A") == 1.0
+
+    def test_active_markets_prioritised(self, client, clock):
+        client.markets = {t: make_market(t) for t in ("IDLE", "HOT")}
+        poller = make_poller(client, clock, ["IDLE", "HOT"])
+        poller.poll_once()
+
+        client.markets["HOT"] = client.markets["HOT"].model_copy(update={"yes_bid": 60})
+        clock.now += 1.0
+        poller.poll_once()
+
+        clock.now += 10.0
+        assert poller.due_tickers() == ["HOT", "IDLE"]
+
+    def test_budget_limits_requests(self, client, clock):
+        client.markets = {"A": make_market("A")}
+        bucket = TokenBucket(rate=1.0, capacity=1.0, clock=clock)
+        poller = make_poller(client, clock, ["A"], rate_limiter=bucket)
+
+        assert poller.poll_once() == 1
+        clock.now += 0.5
+        poller.remove("A")
+        poller.add("A")
+        assert poller.poll_once() == 0
+        clock.now += 0.5
+        assert poller.poll_once() == 1
+
+    def test_missing_market_backs_off(self, client, clock):
+        poller = make_poller(client, clock, ["GONE"])
+        poller.poll_once()
+        assert poller.interval("GONE") == 8.0
+
+    def test_failed_batch_backs_off(self, client, clock):
+        client.markets = {"A": make_market("A")}
+        poller = make_poller(client, clock, ["A"])
+        client.get_markets.side_effect = httpx.ConnectError("down")
+
+        with pytest.raises(httpx.ConnectError):
+            poller.poll_once()
+        assert poller.interval("A") == 2.0
+        clock.now += 1.0
+        assert poller.due_tickers() == []
+
+    def test_run_survives_transport_errors(self, client):
+        client.markets = {"A": make_market("A")}
+        stop = threading.Event()
+        calls = []
+
+        def get_markets(tickers=None, limit=None):
+            calls.append(tickers)
+            if len(calls) == 1:
+                raise httpx.ReadTimeout("slow")
+            stop.set()
+            return ObjectList(items=[client.markets[t] for t in tickers])
+
+        client.get_markets.side_effect = get_markets
+        poller = MarketPoller(client, ["A"], min_interval=0.01, max_interval=0.05)
+        poller.run(stop)
+        assert len(calls) == 2
+        assert poller.get("A") is not None
@@ -0,0 +1,183 @@
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from kalshi_client.models import (
+    ObjectList,
+    Order,
+    OrderCancelledResponse,
+    OrderCreatedResponse,
+    Position,
+)
+from kalshi_client.portfolio import PortfolioState
+
+
+def make_order(order_id: str, ticker: str = "ECON-GDP-24", status: str = "resting", ts: int = 1000):
+    return Order(
+        order_id=order_id,
+        user_id="user456",
+        ticker=ticker,
+        status=status,
+        action="buy",
+        side="yes",
+        type="limit",
+        yes_price=60,
+        count=10,
+        yes_filled_count=0,
+        no_filled_count=0,
+        created_time=datetime.fromtimestamp(ts, UTC),
+    )
+
+
+def make_position(ticker: str, event_ticker: str = "ECON-2024", exposure: int = 1000):
+    return Position(
+        ticker=ticker,
+        event_ticker=event_ticker,
+        market_exposure=exposure,
+        realized_pnl=0,
+        total_traded=0,
+        resting_order_count=1,
+        fees_paid=0,
+    )
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client.get_orders.return_value = ObjectList(
+        items=[make_order("o1"), make_order("o2", ticker="ECON-CPI-24")]
+    )
+    client.get_positions.return_value = ObjectList(
+        items=[make_position("ECON-GDP-24"), make_position("ECON-CPI-24")]
+    )
+    return client
+
+
+@pytest.fixture
+def state(client):
+    state = PortfolioState(client, wall_clock=lambda: 2000.0)
+    state.load()
+    return state
+
+
+class TestPortfolioState:
+    def test_load_indexes_orders_and_positions(self, state, client):
+        assert client.get_orders.call_args.kwargs["status"] == "resting"
+        assert state.order("o1").ticker == "ECON-GDP-24"
+        assert [o.order_id for o in state.resting_orders("ECON-CPI-24")] == ["o2"]
+        assert len(state.resting_orders()) == 2
+        assert state.position("ECON-GDP-24").market_exposure == 1000
+        assert len(state.positions(event_ticker="ECON-2024")) == 2
+        assert state.high_water_mark == 1700
+
+    def test_sync_pulls_deltas_since_high_water_mark(self, state, client):
+        client.get_orders.reset_mock()
+        client.get_orders.return_value = ObjectList(
+            items=[
+                make_order("o1", status="executed", ts=2100),
+                make_order("o3", ticker="ECON-CPI-24", ts=2101),
+            ]
+        )
+        client.get_positions.return_value = ObjectList(
+            items=[make_position("ECON-CPI-24", exposure=3000)]
+        )
+
+        assert state.sync() == 2
+        assert client.get_orders.call_args.kwargs["min_ts"] == 1699
+        assert state.order("o1") is None
+        assert state.resting_orders("ECON-GDP-24") == []
+        assert {o.order_id for o in state.resting_orders("ECON-CPI-24")} == {"o2", "o3"}
+        assert state.high_water_mark == 2101
+        assert state.position("ECON-CPI-24").market_exposure == 3000
+
+    def test_high_water_mark_follows_exchange_time(self, client):
+        # The local clock runs two minutes ahead of the exchange
+        now = [2120.0]
+        state = PortfolioState(client, wall_clock=lambda: now[0])
+        state.load()
+        assert state.high_water_mark == 1820
+
+        client.get_orders.return_value = ObjectList(items=[make_order("o3", ts=2010)])
+        now[0] = 2150.0
+        assert state.sync() == 1
+        assert client.get_orders.call_args.kwargs["min_ts"] == 1819
+        # Not the local 2150, which would skip orders the exchange stamps before it
+        assert state.high_water_mark == 2010
+        state.sync()
+        assert client.get_orders.call_args.kwargs["min_ts"] == 2009
+
+    def test_sync_ignores_unchanged_overlap(self, state, client):
+        client.get_orders.return_value = ObjectList(items=[make_order("o1")])
+        assert state.sync() == 0
+        client.get_positions.assert_called_once()
+
+    def test_optimistic_create_and_cancel(self, state, client):
+        client.create_order.return_value = OrderCreatedResponse(order_id="o9")
+        client.cancel_order.return_value = OrderCancelledResponse(order_id="o1")
+
+        state.create_order(
+            ticker="ECON-GDP-24", action="buy", side="yes", type="limit", count=5, yes_price=40
+        )
+        assert state.order("o9").count == 5
+        assert len(state.resting_orders("ECON-GDP-24")) == 2
+
+        state.cancel_order("o1")
+        assert [o.order_id for o in state.resting_orders("ECON-GDP-24")] == ["o9"]
+
+    def test_immediate_orders_not_indexed(self, state):
+        response = OrderCreatedResponse(order_id="o9")
+        assert (
+            state.apply_created(
+                response, ticker="X", action="buy", side="yes", type="market", count=1
+            )
+            is None
+        )
+        assert (
+            state.apply_created(
+                response,
+                ticker="X",
+                action="buy",
+                side="yes",
+                type="limit",
+                count=1,
+                time_in_force="ioc",
+            )
+            is None
+        )
+        assert state.order("o9") is None
+
+    def test_reconcile_drops_stale_orders(self, state, client):
+        client.get_orders.return_value = ObjectList(items=[make_order("o2", ticker="ECON-CPI-24")])
+        state.reconcile_orders()
+        assert [o.order_id for o in state.resting_orders()] == ["o2"]
+
+    def test_sync_reconciles_resting_orders_on_interval(self, client):
+        now = [2000.0]
+        state = PortfolioState(client, reconcile_interval=60, wall_clock=lambda: now[0])
+        state.load()
+        # o1 fills without showing up in the incremental pull
+        resting = [make_order("o2", ticker="ECON-CPI-24")]
+        client.get_orders.side_effect = lambda **kwargs: ObjectList(
+            items=resting if kwargs.get("status") == "resting" else []
+        )
+
+        now[0] = 2030.0
+        assert state.sync() == 0
+        assert state.order("o1") is not None
+
+        # o9 is placed while the sync runs, after the resting listing was taken
+        now[0] = 2060.0
+        state.apply_created(
+            OrderCreatedResponse(order_id="o9"),
+            ticker="ECON-GDP-24",
+            action="buy",
+            side="yes",
+            type="limit",
+            count=1,
+        )
+        client.get_positions.reset_mock()
+        assert state.sync() == 1
+        assert state.order("o1") is None
+        assert state.order("o9") is not None
+        assert client.get_positions.call_args.kwargs["ticker"] == "ECON-GDP-24"
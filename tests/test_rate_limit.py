@@ -0,0 +1,140 @@
+import multiprocessing
+import pickle
+
+import pytest
+
+from kalshi_client import KalshiClient, KalshiConfig
+from kalshi_client.rate_limit import SharedTokenBucket, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_burst_then_empty(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock)
+
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+
+    def test_refill_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock)
+        bucket.try_acquire(2.0)
+
+        clock.now = 0.5
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+        assert bucket.time_until_available() == pytest.approx(0.5)
+
+    def test_refill_capped_at_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, capacity=3.0, clock=clock)
+        clock.now = 100.0
+        assert bucket.tokens == 3.0
+
+    def test_reserve_goes_into_debt(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=1.0, clock=clock)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+        assert bucket.reserve() == pytest.approx(2.0)
+
+    def test_acquire_timeout(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=1.0, clock=clock)
+        bucket.try_acquire()
+
+        assert bucket.acquire(timeout=0.1) is False
+        assert bucket.tokens == pytest.approx(0.0)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+def drain(bucket: SharedTokenBucket, attempts: int, results) -> None:
+    results.put(sum(bucket.try_acquire() for _ in range(attempts)))
+
+
+class TestSharedTokenBucket:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return tmp_path / "account.bucket"
+
+    def test_instances_share_one_budget(self, path):
+        clock = FakeClock()
+        first = SharedTokenBucket(path, rate=2.0, capacity=2.0, clock=clock)
+        second = SharedTokenBucket(path, rate=2.0, capacity=2.0, clock=clock)
+
+        assert first.try_acquire() is True
+        assert second.try_acquire() is True
+        assert first.try_acquire() is False
+        assert second.time_until_available() == pytest.approx(0.5)
+        clock.now = 0.5
+        assert second.try_acquire() is True
+        assert first.tokens == pytest.approx(0.0)
+
+    def test_reserve_and_acquire_timeout(self, path):
+        clock = FakeClock()
+        bucket = SharedTokenBucket(path, rate=1.0, capacity=1.0, clock=clock)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+        assert bucket.acquire(timeout=0.1) is False
+        assert bucket.tokens == pytest.approx(-1.0)
+
+    def test_last_opener_sets_rate(self, path):
+        clock = FakeClock()
+        first = SharedTokenBucket(path, rate=1.0, clock=clock)
+        SharedTokenBucket(path, rate=5.0, capacity=2.0, clock=clock)
+        assert (first.rate, first.capacity) == (5.0, 2.0)
+        assert first.tokens == pytest.approx(1.0)
+
+    def test_clock_behind_bucket_restarts_refill(self, path):
+        clock = FakeClock()
+        clock.now = 1000.0
+        SharedTokenBucket(path, rate=1.0, capacity=1.0, clock=clock).try_acquire()
+        clock.now = 5.0  # e.g. the host rebooted
+        bucket = SharedTokenBucket(path, rate=1.0, capacity=1.0, clock=clock)
+        assert bucket.try_acquire() is False
+        clock.now = 6.0
+        assert bucket.try_acquire() is True
+
+    def test_pickles_by_path(self, path):
+        bucket = SharedTokenBucket(path, rate=1.0, capacity=3.0)
+        bucket.try_acquire(3.0)
+        copy = pickle.loads(pickle.dumps(bucket))
+        assert copy.path == bucket.path
+        assert copy.try_acquire() is False
+
+    @pytest.mark.parametrize("method", ["fork", "spawn"])
+    def test_processes_never_overspend(self, path, method):
+        context = multiprocessing.get_context(method)
+        # Negligible refill: 40 tokens between four processes trying 25 times each
+        bucket = SharedTokenBucket(path, rate=1e-6, capacity=40.0)
+        results = context.Queue()
+        workers = [context.Process(target=drain, args=(bucket, 25, results)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        acquired = sum(results.get(timeout=60) for _ in workers)
+        for worker in workers:
+            worker.join()
+        assert acquired == 40
+        assert bucket.try_acquire() is False
+
+    def test_client_uses_shared_bucket(self, path):
+        config = KalshiConfig(
+            api_key="k", api_secret="s", rate_limit=5.0, rate_limit_file=str(path)
+        )
+        with KalshiClient(config=config) as client:
+            assert isinstance(client.rate_limiter, SharedTokenBucket)
+            assert client.rate_limiter.rate == 5.0
@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kalshi_client import (
+    AsyncKalshiClient,
+    AsyncPriorityDispatcher,
+    ClientMetrics,
+    KalshiClient,
+    Priority,
+    PriorityDispatcher,
+    TokenBucket,
+    request_priority,
+)
+from kalshi_client.exceptions import KalshiQueueFullError
+from kalshi_client.scheduler import classify
+from kalshi_client.testing import LocalKalshiServer, SimulatedExchange
+
+
+def wait_for_depth(dispatcher, depth):
+    deadline = time.monotonic() + 2
+    while dispatcher.queue_depth() < depth:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def start_waiters(dispatcher, priorities, admitted):
+    def request(priority):
+        with dispatcher.slot(priority):
+            admitted.append(priority)
+
+    threads = []
+    for priority in priorities:
+        thread = threading.Thread(target=request, args=(priority,))
+        thread.start()
+        threads.append(thread)
+        wait_for_depth(dispatcher, len(threads))
+    return threads
+
+
+class TestClassify:
+    @pytest.mark.parametrize(
+        ("method", "endpoint", "priority"),
+        [
+            ("DELETE", "/portfolio/orders/abc", Priority.CANCEL),
+            ("POST", "/portfolio/orders", Priority.CREATE),
+            ("GET", "/portfolio/orders", Priority.PORTFOLIO),
+            ("GET", "/portfolio/balance", Priority.PORTFOLIO),
+            ("GET", "/markets/X/orderbook", Priority.MARKET_DATA),
+            ("GET", "/events", Priority.MARKET_DATA),
+            ("GET", "/markets/trades", Priority.BULK),
+        ],
+    )
+    def test_default_classes(self, method, endpoint, priority):
+        assert classify(method, endpoint) is priority
+
+    def test_override(self):
+        with request_priority(Priority.BULK):
+            assert classify("GET", "/markets") is Priority.BULK
+        assert classify("GET", "/markets") is Priority.MARKET_DATA
+
+
+class TestPriorityDispatcher:
+    def test_admits_most_urgent_first(self):
+        dispatcher = PriorityDispatcher(1)
+        dispatcher.acquire(Priority.MARKET_DATA)
+        admitted = []
+        threads = start_waiters(
+            dispatcher,
+            [Priority.BULK, Priority.MARKET_DATA, Priority.CREATE, Priority.CANCEL],
+            admitted,
+        )
+        dispatcher.release(Priority.MARKET_DATA)
+        for thread in threads:
+            thread.join()
+        assert admitted == [Priority.CANCEL, Priority.CREATE, Priority.MARKET_DATA, Priority.BULK]
+
+    def test_class_limit_leaves_room_for_trading(self):
+        dispatcher = PriorityDispatcher(3, class_limits={Priority.MARKET_DATA: 1})
+        dispatcher.acquire(Priority.MARKET_DATA)
+        admitted = []
+        [waiter] = start_waiters(dispatcher, [Priority.MARKET_DATA], admitted)
+        dispatcher.acquire(Priority.CREATE)
+        assert admitted == []
+        assert dispatcher.in_flight() == 2
+        dispatcher.release(Priority.MARKET_DATA)
+        waiter.join()
+        assert admitted == [Priority.MARKET_DATA]
+
+    def test_queue_limit(self):
+        dispatcher = PriorityDispatcher(1, queue_limits={Priority.BULK: 1})
+        dispatcher.acquire(Priority.CANCEL)
+        [waiter] = start_waiters(dispatcher, [Priority.BULK], [])
+        with pytest.raises(KalshiQueueFullError):
+            dispatcher.acquire(Priority.BULK)
+        assert dispatcher.queue_depth(Priority.BULK) == 1
+        dispatcher.release(Priority.CANCEL)
+        waiter.join()
+
+    def test_rate_tokens_go_to_most_urgent(self):
+        bucket = TokenBucket(20, capacity=1)
+        bucket.try_acquire()
+        dispatcher = PriorityDispatcher(10, bucket)
+        admitted = []
+        threads = start_waiters(dispatcher, [Priority.BULK, Priority.CANCEL], admitted)
+        for thread in threads:
+            thread.join()
+        assert admitted == [Priority.CANCEL, Priority.BULK]
+
+    def test_queue_gauges(self):
+        metrics = ClientMetrics()
+        dispatcher = PriorityDispatcher(1, metrics=metrics)
+        with dispatcher.slot(Priority.CANCEL):
+            [waiter] = start_waiters(dispatcher, [Priority.BULK], [])
+            gauges = metrics.snapshot()["gauges"]
+            assert gauges['queue_depth{priority="bulk"}'] == 1
+            assert gauges['in_flight{priority="cancel"}'] == 1
+        waiter.join()
+        assert metrics.snapshot()["gauges"]['queue_depth{priority="bulk"}'] == 0
+        assert "kalshi_client_queue_depth" in metrics.to_prometheus()
+
+
+class TestAsyncPriorityDispatcher:
+    @pytest.mark.asyncio
+    async def test_admits_most_urgent_first(self):
+        dispatcher = AsyncPriorityDispatcher(1)
+        await dispatcher.acquire(Priority.BULK)
+        admitted = []
+
+        async def request(priority):
+            async with dispatcher.slot(priority):
+                admitted.append(priority)
+
+        tasks = []
+        for priority in [Priority.BULK, Priority.PORTFOLIO, Priority.CANCEL]:
+            tasks.append(asyncio.create_task(request(priority)))
+            await asyncio.sleep(0)
+        await dispatcher.release(Priority.BULK)
+        await asyncio.gather(*tasks)
+        assert admitted == [Priority.CANCEL, Priority.PORTFOLIO, Priority.BULK]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        dispatcher = AsyncPriorityDispatcher(1)
+        await dispatcher.acquire(Priority.CREATE)
+        task = asyncio.create_task(dispatcher.acquire(Priority.BULK))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert dispatcher.queue_depth() == 0
+
+
+class TestClientScheduling:
+    @pytest.fixture
+    def server(self):
+        exchange = SimulatedExchange(events=2, markets_per_event=2)
+        with LocalKalshiServer(exchange, latency=0.05) as server:
+            yield server
+
+    def test_balance_jumps_market_data_queue(self, server):
+        config = server.config(max_concurrency=1, priority_scheduling=True, enable_metrics=True)
+        with KalshiClient(config=config) as client:
+            assert isinstance(client.dispatcher, PriorityDispatcher)
+            crawl = [
+                threading.Thread(target=client.get_markets, kwargs={"limit": 1}) for _ in range(6)
+            ]
+            for thread in crawl:
+                thread.start()
+            wait_for_depth(client.dispatcher, 5)
+            start = time.perf_counter()
+            client.get_balance()
+            elapsed = time.perf_counter() - start
+            for thread in crawl:
+                thread.join()
+            gauges = client.metrics.snapshot()["gauges"]
+        assert elapsed < 0.2
+        assert gauges['queue_depth{priority="market_data"}'] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_dispatcher(self, server):
+        config = server.config(priority_scheduling=True)
+        async with AsyncKalshiClient(config=config) as client:
+            assert isinstance(client.dispatcher, AsyncPriorityDispatcher)
+            await asyncio.gather(client.get_balance(), client.get_markets(limit=1))
+            assert client.dispatcher.in_flight() == 0
@@ -0,0 +1,175 @@
+import random
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from kalshi_client import TimeBars, TradeTape, TradeTapeWriter
+from kalshi_client.bars import TradeColumns
+from kalshi_client.models import ObjectList, Trade
+from kalshi_client.tape import HEADER, RECORD, from_micros, to_micros
+
+T0 = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def make_trades(n: int, seed: int = 5) -> list[Trade]:
+    rng = random.Random(seed)
+    trades = []
+    for i in range(n):
+        price = rng.randint(1, 99)
+        trades.append(
+            Trade(
+                trade_id=f"t{i}",
+                ticker=rng.choice(("A", "B", "C")),
+                taker_side=rng.choice(("yes", "no")),
+                yes_price=price,
+                no_price=100 - price,
+                count=rng.randint(1, 500),
+                # Whole seconds, so several trades share a timestamp
+                created_time=T0 + timedelta(seconds=i // 3),
+            )
+        )
+    return trades
+
+
+@pytest.fixture
+def trades():
+    return make_trades(1000)
+
+
+@pytest.fixture
+def tape_path(tmp_path, trades):
+    path = tmp_path / "trades.tape"
+    with TradeTapeWriter(path, index_interval=64) as writer:
+        writer.write_many(trades)
+    return path
+
+
+def as_tuple(trade: Trade) -> tuple:
+    return (
+        trade.ticker,
+        to_micros(trade.created_time),
+        trade.yes_price,
+        trade.no_price,
+        trade.count,
+        trade.taker_side,
+    )
+
+
+def test_micros_round_trip():
+    moment = datetime(2026, 3, 4, 5, 6, 7, 891011, tzinfo=UTC)
+    assert from_micros(to_micros(moment)) == moment
+
+
+def test_round_trip(tape_path, trades):
+    assert tape_path.stat().st_size > len(trades) * RECORD.size
+    with TradeTape(tape_path) as tape:
+        assert len(tape) == len(trades)
+        assert sorted(tape.tickers) == ["A", "B", "C"]
+        assert [tuple(record) for record in tape] == [as_tuple(t) for t in trades]
+        assert tape[-1].created_time == trades[-1].created_time
+
+
+def test_time_slices(tape_path, trades):
+    start, end = T0 + timedelta(seconds=100), T0 + timedelta(seconds=200)
+    expected = [as_tuple(t) for t in trades if start <= t.created_time < end]
+    with TradeTape(tape_path) as tape:
+        span = tape.time_slice(start, end)
+        assert span.stop - span.start == len(expected) == 300
+        assert [tuple(r) for r in tape.iter(start=start, end=end)] == expected
+        assert tape.search(T0 - timedelta(days=1)) == 0
+        assert tape.search(T0 + timedelta(days=1)) == len(trades)
+        # Every record of a timestamp that straddles an index block is found
+        for seconds in range(0, 334, 7):
+            moment = T0 + timedelta(seconds=seconds)
+            assert tape.search(moment) == next(
+                i for i, t in enumerate(trades) if t.created_time >= moment
+            )
+
+
+def test_per_ticker_iteration_and_columns(tape_path, trades):
+    a_trades = [t for t in trades if t.ticker == "A"]
+    with TradeTape(tape_path) as tape:
+        assert [tuple(r) for r in tape.iter("A")] == [as_tuple(t) for t in a_trades]
+        assert list(tape.iter("missing")) == []
+        columns = tape.columns("A")
+    assert TimeBars(60).update_batch("A", columns) == TimeBars(60).update_batch(
+        "A", TradeColumns.from_trades(a_trades)
+    )
+
+
+def test_out_of_order_pages_are_sorted(tmp_path, trades):
+    # get_trades pages arrive newest first
+    newest_first = trades[::-1]
+    pages = [ObjectList(newest_first[i : i + 100]) for i in range(0, len(trades), 100)]
+    path = tmp_path / "pages.tape"
+    with TradeTapeWriter(path, index_interval=50) as writer:
+        assert writer.write_pages(pages) == len(trades)
+    with TradeTape(path) as tape:
+        times = [record.time for record in tape]
+        assert times == sorted(times)
+        assert tape.search(T0 + timedelta(seconds=150)) == 450
+
+
+@pytest.mark.parametrize("with_numpy", [False, True])
+def test_ticker_index_after_sorting(tmp_path, trades, monkeypatch, with_numpy):
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("kalshi_client.tape._numpy", Mock(side_effect=ImportError))
+    path = tmp_path / "pages.tape"
+    with TradeTapeWriter(path) as writer:
+        writer.write_many(trades[::-1])
+    start, end = T0 + timedelta(seconds=100), T0 + timedelta(seconds=200)
+    with TradeTape(path) as tape:
+        assert tape._row_starts is not None
+        for ticker in tape.tickers:
+            expected = [as_tuple(t) for t in trades if t.ticker == ticker]
+            # Records sharing a timestamp come out in reverse, as they went in
+            assert sorted(tuple(r) for r in tape.iter(ticker)) == sorted(expected)
+            in_window = [r.created_time for r in tape.iter(ticker, start, end)]
+            assert in_window == sorted(
+                t.created_time
+                for t in trades
+                if t.ticker == ticker and start <= t.created_time < end
+            )
+            assert len(tape.columns(ticker, start, end)) == len(in_window)
+
+
+def test_tape_without_ticker_index_is_scanned(tape_path, trades):
+    # Tapes written before the ticker index have no flag for it
+    data = bytearray(tape_path.read_bytes())
+    data[HEADER.size - 4 : HEADER.size] = bytes(4)
+    tape_path.write_bytes(data)
+    with TradeTape(tape_path) as tape:
+        assert [tuple(r) for r in tape.iter("B")] == [
+            as_tuple(t) for t in trades if t.ticker == "B"
+        ]
+        assert len(tape.columns("B")) == sum(t.ticker == "B" for t in trades)
+
+
+def test_failed_write_leaves_no_tape(tmp_path, trades):
+    path = tmp_path / "failed.tape"
+    with pytest.raises(RuntimeError), TradeTapeWriter(path) as writer:
+        writer.write_many(trades[:10])
+        raise RuntimeError("download failed")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not.tape"
+    path.write_bytes(bytes(128))
+    with pytest.raises(ValueError, match="not a version 1 trade tape"):
+        TradeTape(path)
+
+
+def test_numpy_views(tape_path, trades):
+    np = pytest.importorskip("numpy")
+    with TradeTape(tape_path) as tape:
+        records = tape.records()
+        assert not records.flags.writeable
+        assert records["count"].sum() == sum(t.count for t in trades)
+        window = tape.records(tape.time_slice(T0 + timedelta(seconds=10)))
+        assert np.shares_memory(window, records)
+        assert len(window) == len(trades) - 30
+        del records, window
@@ -0,0 +1,145 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from kalshi_client import KalshiClient, KalshiConfig
+from kalshi_client.exceptions import KalshiServerError
+
+if TYPE_CHECKING:
+    from kalshi_client.tracing import RequestTrace
+
+MARKET = {
+    "ticker": "ECON-GDP-24",
+    "event_ticker": "ECON-2024",
+    "market_type": "binary",
+    "title": "GDP Growth",
+    "subtitle": "Will GDP grow?",
+    "open_time": "2024-01-01T00:00:00Z",
+    "close_time": "2024-12-31T23:59:59Z",
+    "status": "open",
+    "can_close_early": False,
+    "category": "Economics",
+    "risk_limit_cents": 100000,
+    "strike_type": "yesno",
+    "volume": 1000,
+    "volume_24h": 500,
+    "liquidity": 10000,
+    "open_interest": 5000,
+}
+
+ORDER = {
+    "order_id": "order123",
+    "user_id": "user456",
+    "ticker": "A",
+    "status": "resting",
+    "action": "buy",
+    "side": "yes",
+    "type": "limit",
+    "yes_price": 50,
+    "count": 1,
+    "yes_filled_count": 0,
+    "no_filled_count": 0,
+    "created_time": "2024-01-01T00:00:00Z",
+}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/broken"):
+        return httpx.Response(503, text="unavailable")
+    if request.method == "POST":
+        return httpx.Response(201, json={"order": ORDER})
+    return httpx.Response(200, json={"market": MARKET})
+
+
+@pytest.fixture
+def client():
+    client = KalshiClient(config=KalshiConfig(api_key="key", api_secret="secret"))
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+class _MarketHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"market": MARKET}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestTracing:
+    def test_no_traces_without_hooks(self, client):
+        assert client.get_market("ECON-GDP-24").ticker == "ECON-GDP-24"
+
+    def test_trace_context_manager(self, client):
+        with client.trace() as traces:
+            client.get_market("ECON-GDP-24")
+
+        assert len(traces) == 1
+        trace = traces.traces[0]
+        assert trace.method == "GET"
+        assert trace.route == "/markets/{ticker}"
+        assert trace.status_code == 200
+        assert {"queue", "sign", "decode", "validate"} <= set(trace.durations)
+        assert trace.duration >= sum(trace.durations.values()) * 0.99
+        assert client.trace_hooks == []
+
+    def test_hook_receives_failed_requests(self, client):
+        received: list[RequestTrace] = []
+        client.add_trace_hook(received.append)
+
+        with pytest.raises(KalshiServerError):
+            client.get_market("broken")
+
+        assert received[0].error == "KalshiServerError"
+        assert received[0].status_code == 503
+        assert "decode" not in received[0].durations
+
+    def test_one_trace_per_request(self, client):
+        with client.trace() as traces:
+            client.create_orders(
+                [
+                    {
+                        "ticker": "A",
+                        "action": "buy",
+                        "side": "yes",
+                        "type": "limit",
+                        "count": 1,
+                        "yes_price": 50,
+                    },
+                ]
+            )
+            client.order_template("A", "buy", "yes").send(50, 1)
+
+        assert [t.method for t in traces] == ["POST", "POST"]
+
+    def test_network_phases_over_real_connection(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _MarketHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            config = KalshiConfig(
+                api_key="key",
+                api_secret="secret",
+                base_url=f"http://127.0.0.1:{server.server_port}",
+            )
+            with KalshiClient(config=config) as client, client.trace() as traces:
+                client.get_market("ECON-GDP-24")
+                client.get_market("ECON-GDP-24")
+        finally:
+            server.shutdown()
+
+        first, second = traces.traces
+        assert {"connect", "send", "ttfb", "receive"} <= set(first.durations)
+        assert "connect" not in second.durations
+        assert [p.start for p in first.phases] == sorted(p.start for p in first.phases)
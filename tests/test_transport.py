@@ -0,0 +1,162 @@
+import json
+import time
+
+import httpx
+import pytest
+
+from kalshi_client import (
+    AsyncKalshiClient,
+    AsyncRecordingTransport,
+    KalshiClient,
+    KalshiConfig,
+    RecordingTransport,
+    ReplayTransport,
+    paginate,
+)
+from kalshi_client.exceptions import KalshiNotFoundError
+from kalshi_client.transport import RecordedExchange, ReplayMissError, load_recording
+
+MARKET = {
+    "ticker": "ECON-GDP-24",
+    "event_ticker": "ECON-24",
+    "market_type": "binary",
+    "title": "GDP Growth Above 2%",
+    "subtitle": "Q4 2024",
+    "yes_sub_title": "Yes",
+    "no_sub_title": "No",
+    "open_time": "2024-01-01T00:00:00Z",
+    "close_time": "2024-12-31T23:59:59Z",
+    "expected_expiration_time": "2025-01-15T00:00:00Z",
+    "expiration_time": "2025-01-15T00:00:00Z",
+    "status": "active",
+    "response_price_cents": 0,
+    "can_close_early": False,
+    "category": "Economics",
+    "risk_limit_cents": 1000000,
+    "strike_type": "greater",
+    "last_price": 50,
+    "volume": 1000,
+    "volume_24h": 100,
+    "liquidity": 5000,
+    "open_interest": 500,
+    "previous_yes_price": 48,
+    "previous_price": 48,
+    "yes_bid": 49,
+    "yes_ask": 51,
+    "no_bid": 49,
+    "no_ask": 51,
+}
+
+
+def markets_page(request: httpx.Request) -> httpx.Response:
+    cursor = request.url.params.get("cursor")
+    if request.url.path.endswith("/balance"):
+        return httpx.Response(200, json={"balance": 1000})
+    if cursor is None:
+        return httpx.Response(200, json={"markets": [MARKET, MARKET], "cursor": "page2"})
+    if cursor == "page2":
+        return httpx.Response(200, json={"markets": [MARKET], "cursor": ""})
+    return httpx.Response(404)
+
+
+@pytest.fixture
+def config():
+    return KalshiConfig(api_key="key", api_secret="secret", base_url="https://api.kalshi.com")
+
+
+@pytest.fixture
+def recording(tmp_path, config):
+    path = tmp_path / "session.jsonl.gz"
+    transport = RecordingTransport(path, transport=httpx.MockTransport(markets_page))
+    with KalshiClient(config=config, transport=transport) as client:
+        assert len(list(paginate(client.get_markets, limit=2))) == 3
+        assert client.get_balance() == 1000
+    return path
+
+
+class TestRecordingTransport:
+    def test_records_each_exchange(self, recording):
+        exchanges = load_recording(recording)
+        assert [(e.method, e.path, e.query) for e in exchanges] == [
+            ("GET", "/markets", "limit=2"),
+            ("GET", "/markets", "limit=2&cursor=page2"),
+            ("GET", "/portfolio/balance", ""),
+        ]
+        assert all(e.status == 200 for e in exchanges)
+        assert json.loads(exchanges[1].body)["cursor"] == ""
+        assert exchanges[0].t <= exchanges[1].t <= exchanges[2].t
+        assert all(e.elapsed >= 0 for e in exchanges)
+
+    def test_round_trips_binary_bodies(self):
+        exchange = RecordedExchange(0.0, 0.1, "GET", "/x", "", 200, {}, b"\xff\x00")
+        assert RecordedExchange.from_json(exchange.to_json()) == exchange
+
+    @pytest.mark.asyncio
+    async def test_async_recording(self, tmp_path, config):
+        path = tmp_path / "session.jsonl"
+        transport = AsyncRecordingTransport(path, transport=httpx.MockTransport(markets_page))
+        async with AsyncKalshiClient(config=config, transport=transport) as client:
+            assert await client.get_balance() == 1000
+        await transport.aclose()
+        [exchange] = load_recording(path)
+        assert exchange.path == "/portfolio/balance"
+
+
+class TestReplayTransport:
+    def test_replays_paginated_walk(self, recording, config):
+        client = KalshiClient(config=config, transport=ReplayTransport(recording))
+        markets = list(paginate(client.get_markets, limit=2))
+        assert [m.ticker for m in markets] == ["ECON-GDP-24"] * 3
+        assert client.get_balance() == 1000
+
+    def test_repeats_last_response_once_exhausted(self, recording, config):
+        client = KalshiClient(config=config, transport=ReplayTransport(recording))
+        assert client.get_balance() == 1000
+        assert client.get_balance() == 1000
+
+    def test_unrecorded_request_raises(self, recording, config):
+        client = KalshiClient(config=config, transport=ReplayTransport(recording))
+        with pytest.raises(ReplayMissError):
+            client.get_markets(limit=5)
+
+    def test_replays_error_status(self, config):
+        exchange = RecordedExchange(0.0, 0.0, "GET", "/markets/NOPE", "", 404, {}, b"")
+        client = KalshiClient(config=config, transport=ReplayTransport([exchange]))
+        with pytest.raises(KalshiNotFoundError):
+            client.get_market("NOPE")
+
+    def test_original_timing_holds_recorded_latency(self, config):
+        exchange = RecordedExchange(
+            0.0,
+            0.05,
+            "GET",
+            "/portfolio/balance",
+            "",
+            200,
+            {},
+            b'{"balance": 5}',
+        )
+        client = KalshiClient(
+            config=config, transport=ReplayTransport([exchange], timing="original")
+        )
+        start = time.perf_counter()
+        assert client.get_balance() == 5
+        assert time.perf_counter() - start >= 0.05
+
+        fast = KalshiClient(
+            config=config, transport=ReplayTransport([exchange], timing="original", speed=100)
+        )
+        start = time.perf_counter()
+        fast.get_balance()
+        assert time.perf_counter() - start < 0.05
+
+    def test_rejects_unknown_timing(self):
+        with pytest.raises(ValueError):
+            ReplayTransport([], timing="slow")
+
+    @pytest.mark.asyncio
+    async def test_async_replay(self, recording, config):
+        async with AsyncKalshiClient(config=config, transport=ReplayTransport(recording)) as client:
+            page = await client.get_markets(limit=2)
+            assert page.cursor == "page2"
+            assert await client.get_balance() == 1000